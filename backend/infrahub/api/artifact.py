@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Body, Depends, Request, Response
+from fastapi import APIRouter, Body, Depends, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import BranchParams, get_branch_params, get_current_user, get_db
@@ -31,15 +32,15 @@ async def get_artifact(
     db: InfrahubDatabase = Depends(get_db),
     branch_params: BranchParams = Depends(get_branch_params),
     _: str = Depends(get_current_user),
-) -> Response:
+) -> StreamingResponse:
     artifact = await registry.manager.get_one(db=db, id=artifact_id, branch=branch_params.branch, at=branch_params.at)
     if not artifact:
         raise NodeNotFoundError(
             branch_name=branch_params.branch.name, node_type=InfrahubKind.ARTIFACT, identifier=artifact_id
         )
 
-    return Response(
-        content=registry.storage.retrieve(identifier=artifact.storage_id.value),
+    return StreamingResponse(
+        content=registry.storage.stream(identifier=artifact.storage_id.value),
         headers={"Content-Type": artifact.content_type.value.value},
     )
 
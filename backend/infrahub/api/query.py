@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Body, Depends, Path, Query, Request
-from graphql import graphql
 from pydantic import BaseModel, Field
 
 from infrahub.api.dependencies import BranchParams, get_branch_params, get_current_user, get_db
@@ -11,6 +10,7 @@ from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.protocols import CoreGraphQLQuery
 from infrahub.database import InfrahubDatabase  # noqa: TCH001
+from infrahub.exceptions import GraphQLQueryError
 from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
 from infrahub.graphql.api.dependencies import build_graphql_query_permission_checker
 from infrahub.graphql.initialization import prepare_graphql_params
@@ -42,6 +42,15 @@ class QueryPayload(BaseModel):
     variables: dict[str, str] = Field(default_factory=dict)
 
 
+class QueryBatchItem(BaseModel):
+    variables: dict[str, str] = Field(default_factory=dict)
+    subscribers: list[str] = Field(default_factory=list)
+
+
+class QueryBatchPayload(BaseModel):
+    items: list[QueryBatchItem] = Field(default_factory=list)
+
+
 async def execute_query(
     db: InfrahubDatabase,
     request: Request,
@@ -57,13 +66,41 @@ async def execute_query(
         db=db, id=query_id, kind=CoreGraphQLQuery, branch=branch_params.branch, at=branch_params.at
     )
 
+    return await _execute_graphql_query(
+        db=db,
+        request=request,
+        branch_params=branch_params,
+        gql_query=gql_query,
+        query_id=query_id,
+        params=params,
+        update_group=update_group,
+        subscribers=subscribers,
+        permission_checker=permission_checker,
+        account_session=account_session,
+    )
+
+
+async def _execute_graphql_query(
+    db: InfrahubDatabase,
+    request: Request,
+    branch_params: BranchParams,
+    gql_query: CoreGraphQLQuery,
+    query_id: str,
+    params: dict[str, str],
+    update_group: bool,
+    subscribers: list[str],
+    permission_checker: GraphQLQueryPermissionChecker,
+    account_session: AccountSession,
+) -> dict[str, Any]:
     gql_params = prepare_graphql_params(
         db=db, branch=branch_params.branch, at=branch_params.at, account_session=account_session
     )
     analyzed_query = InfrahubGraphQLQueryAnalyzer(
         query=gql_query.query.value,
+        query_variables=params,
         schema=gql_params.schema,
         branch=branch_params.branch,
+        schema_hash=gql_params.schema_hash,
     )
     await permission_checker.check(
         db=db,
@@ -82,13 +119,7 @@ async def execute_query(
     }
 
     with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-        result = await graphql(
-            schema=gql_params.schema,
-            source=gql_query.query.value,
-            context_value=gql_params.context,
-            root_value=None,
-            variable_values=params,
-        )
+        result = await analyzed_query.execute(context_value=gql_params.context)
 
     data = extract_data(query_name=gql_query.name.value, result=result)
 
@@ -152,6 +183,53 @@ async def graphql_query_post(
     )
 
 
+@router.post("/{query_id}/batch")
+async def graphql_query_batch_post(
+    request: Request,
+    payload: QueryBatchPayload = Body(
+        QueryBatchPayload(),
+        description="Payload of the request, must be used to provide the variables of each execution",
+    ),
+    query_id: str = Path(description="ID or Name of the GraphQL query to execute"),
+    update_group: bool = Query(
+        False,
+        description=f"When True create or update a {InfrahubKind.GRAPHQLQUERYGROUP} with all nodes related to each execution.",
+    ),
+    db: InfrahubDatabase = Depends(get_db),
+    branch_params: BranchParams = Depends(get_branch_params),
+    account_session: AccountSession = Depends(get_current_user),
+    permission_checker: GraphQLQueryPermissionChecker = Depends(build_graphql_query_permission_checker),
+) -> dict:
+    """Execute a GraphQL query once per item of the payload, each with its own variables and subscribers.
+
+    The results are returned in the order of the items, an item whose execution failed contains the errors instead of the data.
+    """
+    gql_query = await registry.manager.get_one_by_id_or_default_filter(
+        db=db, id=query_id, kind=CoreGraphQLQuery, branch=branch_params.branch, at=branch_params.at
+    )
+
+    results: list[dict[str, Any]] = []
+    for item in payload.items:
+        try:
+            result = await _execute_graphql_query(
+                db=db,
+                request=request,
+                branch_params=branch_params,
+                gql_query=gql_query,
+                query_id=query_id,
+                params=item.variables,
+                update_group=update_group,
+                subscribers=item.subscribers,
+                permission_checker=permission_checker,
+                account_session=account_session,
+            )
+        except GraphQLQueryError as exc:
+            result = {"errors": exc.errors}
+        results.append(result)
+
+    return {"results": results}
+
+
 @router.get("/{query_id}")
 async def graphql_query_get(
     request: Request,
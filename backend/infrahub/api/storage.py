@@ -1,7 +1,7 @@
 import hashlib
 
-from fastapi import APIRouter, Depends, File, Response, UploadFile
-from infrahub_sdk.uuidt import UUIDT
+from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from infrahub.api.dependencies import get_current_user
@@ -25,9 +25,8 @@ class UploadContentPayload(BaseModel):
 def get_file(
     identifier: str,
     _: str = Depends(get_current_user),
-) -> Response:
-    content = registry.storage.retrieve(identifier=identifier)
-    return Response(content=content)
+) -> StreamingResponse:
+    return StreamingResponse(content=registry.storage.stream(identifier=identifier))
 
 
 @router.post("/upload/content")
@@ -40,10 +39,8 @@ def upload_content(
     # https://stackoverflow.com/questions/63048825/how-to-upload-file-using-fastapi
 
     file_content = bytes(item.content, encoding="utf-8")
-    identifier = str(UUIDT())
-
     checksum = hashlib.md5(file_content, usedforsecurity=False).hexdigest()
-    registry.storage.store(identifier=identifier, content=file_content)
+    identifier = registry.storage.store_content(content=file_content)
     return UploadResponse(identifier=identifier, checksum=checksum)
 
 
@@ -57,8 +54,6 @@ def upload_file(
     # https://stackoverflow.com/questions/63048825/how-to-upload-file-using-fastapi
 
     file_content = file.file.read()
-    identifier = str(UUIDT())
-
     checksum = hashlib.md5(file_content, usedforsecurity=False).hexdigest()
-    registry.storage.store(identifier=identifier, content=file_content)
+    identifier = registry.storage.store_content(content=file_content)
     return UploadResponse(identifier=identifier, checksum=checksum)
@@ -17,6 +17,7 @@ from infrahub.core.node import Node
 from infrahub.core.protocols import CoreAccount, CoreAccountGroup
 from infrahub.core.registry import registry
 from infrahub.exceptions import AuthorizationError, NodeNotFoundError
+from infrahub.permissions.cache import invalidate_permissions_cache
 
 if TYPE_CHECKING:
     from infrahub.core.protocols import CoreGenericAccount
@@ -130,10 +131,12 @@ async def create_fresh_access_token(
 async def signin_sso_account(db: InfrahubDatabase, account_name: str, sso_groups: list[str]) -> models.UserToken:
     account = await NodeManager.get_one_by_default_filter(db=db, id=account_name, kind=InfrahubKind.ACCOUNT)
 
+    permissions_changed = False
     if not account:
         account = await Node.init(db=db, schema=InfrahubKind.ACCOUNT)
         await account.new(db=db, name=account_name, account_type="User", role="admin", password=str(uuid.uuid4()))
         await account.save(db=db)
+        permissions_changed = True
 
     if sso_groups:
         infrahub_groups = await NodeManager.query(
@@ -147,6 +150,10 @@ async def signin_sso_account(db: InfrahubDatabase, account_name: str, sso_groups
             if account.id not in members:
                 await group.members.add(db=db, data=account)
                 await group.members.save(db=db)
+                permissions_changed = True
+
+    if permissions_changed:
+        await invalidate_permissions_cache()
 
     now = datetime.now(tz=timezone.utc)
     refresh_expires = now + timedelta(seconds=config.SETTINGS.security.refresh_token_lifetime)
@@ -271,6 +278,7 @@ def _validate_update_account(account_session: AccountSession, node_id: str, fiel
 def validate_mutation_permissions(operation: str, account_session: AccountSession) -> None:
     validation_map: dict[str, Callable[[AccountSession], None]] = {
         f"{InfrahubKind.ACCOUNT}Create": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}CreateMany": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Delete": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Upsert": _validate_is_admin,
     }
@@ -32,6 +32,7 @@ from infrahub.core.initialization import (
     initialization,
     initialize_registry,
 )
+from infrahub.core.ipam.utilization import rebuild_prefix_utilization
 from infrahub.core.manager import NodeManager
 from infrahub.core.migrations.graph import get_graph_migrations
 from infrahub.core.migrations.schema.models import SchemaApplyMigrationData
@@ -42,6 +43,7 @@ from infrahub.core.utils import delete_all_nodes
 from infrahub.core.validators.models.validate_migration import SchemaValidateMigrationData
 from infrahub.database import DatabaseType
 from infrahub.log import get_logger
+from infrahub.permissions.cache import invalidate_permissions_cache
 from infrahub.services import InfrahubServices
 from infrahub.services.adapters.message_bus.local import BusSimulator
 from infrahub.services.adapters.workflow.local import WorkflowLocalExecution
@@ -403,6 +405,26 @@ async def index(
     await dbdriver.close()
 
 
+@app.command()
+async def rebuild_prefix_utilization_summaries(
+    ctx: typer.Context,
+    batch_size: int = typer.Option(1000, help="Number of prefixes to process at a time."),
+    config_file: str = typer.Argument("infrahub.toml", envvar="INFRAHUB_CONFIG"),
+) -> None:
+    """Compute again the stored utilization of all the IP prefixes"""
+    config.load_and_exit(config_file_name=config_file)
+
+    context: CliContext = ctx.obj
+    dbdriver = await context.get_db(retry=1)
+    async with dbdriver.start_transaction() as db:
+        await initialize_registry(db=db)
+        nbr_prefixes = await rebuild_prefix_utilization(db=db, batch_size=batch_size)
+
+    rprint(f"Utilization of {nbr_prefixes} IP prefixes rebuilt [green]SUCCESS[/green]")
+
+    await dbdriver.close()
+
+
 async def create_defaults(db: InfrahubDatabase) -> None:
     """Create and assign default objects."""
     existing_permissions = await NodeManager.query(
@@ -435,3 +457,5 @@ async def setup_permissions(db: InfrahubDatabase) -> None:
 
     if config.SETTINGS.main.allow_anonymous_access:
         await create_anonymous_role(db=db)
+
+    await invalidate_permissions_cache()
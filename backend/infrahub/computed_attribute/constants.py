@@ -3,3 +3,6 @@ QUERY_AUTOMATION_NAME_PREFIX = "Computed-attribute-query"
 
 PROCESS_AUTOMATION_NAME = PROCESS_AUTOMATION_NAME_PREFIX + "::{identifier}::{scope}"
 QUERY_AUTOMATION_NAME = QUERY_AUTOMATION_NAME_PREFIX + "::{identifier}::{scope}"
+
+# Number of nodes queried and updated per request when processing a jinja2 computed attribute
+JINJA2_BATCH_SIZE = 500
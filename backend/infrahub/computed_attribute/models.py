@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
 
+from infrahub_sdk.graphql import Query
 from prefect.events.schemas.automations import Automation  # noqa: TCH002
 from pydantic import BaseModel, Field
 from typing_extensions import Self
@@ -59,3 +60,56 @@ class PythonTransformComputedAttribute:
 class PythonTransformTarget:
     kind: str
     object_id: str
+
+
+@dataclass
+class Jinja2ComputedAttributeQuery:
+    """Query a page of nodes with only the values of the variables used by the template of a computed attribute."""
+
+    kind: str
+    attribute_name: str
+    variables: list[str]
+    filters: dict[str, list[str]] = field(default_factory=dict)
+
+    def _get_fields(self) -> dict[str, Any]:
+        fields: dict[str, Any] = {"id": None, self.attribute_name: {"value": None}}
+        for variable in self.variables:
+            components = variable.split("__")
+            if len(components) == 2:
+                fields.setdefault(components[0], {})[components[1]] = None
+            elif len(components) == 3:
+                peer_fields = fields.setdefault(components[0], {}).setdefault("node", {})
+                peer_fields.setdefault(components[1], {})[components[2]] = None
+        return fields
+
+    def render(self) -> str:
+        query = Query(
+            name="ComputedAttributeJinja2Variables",
+            query={
+                self.kind: {
+                    "@filters": {"offset": "$offset", "limit": "$limit", **self.filters},
+                    "count": None,
+                    "edges": {"node": self._get_fields()},
+                }
+            },
+            variables={"offset": int, "limit": int},
+        )
+        return query.render()
+
+    def get_variable_values(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Extract the values of the variables of the template from a node returned by the query."""
+        values: dict[str, Any] = {}
+        for variable in self.variables:
+            components = variable.split("__")
+            if len(components) == 2:
+                values[variable] = (node.get(components[0]) or {}).get(components[1])
+            elif len(components) == 3:
+                peer: Optional[dict[str, Any]] = (node.get(components[0]) or {}).get("node")
+                if not peer:
+                    values[variable] = ""
+                    continue
+                values[variable] = (peer.get(components[1]) or {}).get(components[2])
+        return values
+
+    def get_current_value(self, node: dict[str, Any]) -> Any:
+        return (node.get(self.attribute_name) or {}).get("value")
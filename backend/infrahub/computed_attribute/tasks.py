@@ -1,6 +1,7 @@
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from infrahub_sdk import InfrahubClient
 from prefect import flow
 from prefect.automations import AutomationCore
 from prefect.client.orchestration import get_client
@@ -14,6 +15,7 @@ from prefect.logging import get_run_logger
 
 from infrahub.core.constants import ComputedAttributeKind, InfrahubKind
 from infrahub.core.registry import registry
+from infrahub.core.schema.schema_branch_computed import ComputedAttributeTarget
 from infrahub.git.repository import get_initialized_repo
 from infrahub.services import services
 from infrahub.support.macro import MacroDefinition
@@ -27,12 +29,18 @@ from infrahub.workflows.catalogue import (
 from infrahub.workflows.utils import add_branch_tag, wait_for_schema_to_converge
 
 from .constants import (
+    JINJA2_BATCH_SIZE,
     PROCESS_AUTOMATION_NAME,
     PROCESS_AUTOMATION_NAME_PREFIX,
     QUERY_AUTOMATION_NAME,
     QUERY_AUTOMATION_NAME_PREFIX,
 )
-from .models import ComputedAttributeAutomations, PythonTransformComputedAttribute, PythonTransformTarget
+from .models import (
+    ComputedAttributeAutomations,
+    Jinja2ComputedAttributeQuery,
+    PythonTransformComputedAttribute,
+    PythonTransformTarget,
+)
 
 if TYPE_CHECKING:
     from infrahub.core.schema.computed_attribute import ComputedAttribute
@@ -156,6 +164,87 @@ async def trigger_update_python_computed_attributes(
         )
 
 
+def _render_update_attributes_mutation(
+    kind: str, attribute_name: str, values: dict[str, str]
+) -> tuple[str, dict[str, str]]:
+    """Generate a single mutation to update the value of a computed attribute on multiple nodes."""
+    variables: dict[str, str] = {"kind": kind, "attribute": attribute_name}
+    definitions = ["$kind: String!", "$attribute: String!"]
+    mutations = []
+    for index, (node_id, value) in enumerate(values.items()):
+        variables[f"id{index}"] = node_id
+        variables[f"value{index}"] = value
+        definitions.append(f"$id{index}: String!, $value{index}: String!")
+        mutations.append(
+            f"  update{index}: InfrahubUpdateComputedAttribute("
+            f"data: {{id: $id{index}, attribute: $attribute, value: $value{index}, kind: $kind}}) {{ ok }}"
+        )
+
+    query = "mutation UpdateAttributes(%s) {\n%s\n}" % (", ".join(definitions), "\n".join(mutations))
+    return query, variables
+
+
+async def update_jinja2_computed_attribute(
+    client: InfrahubClient,
+    branch_name: str,
+    computed_macro: ComputedAttributeTarget,
+    filters: dict[str, list[str]] | None = None,
+    batch_size: int = JINJA2_BATCH_SIZE,
+) -> int:
+    """Render a jinja2 computed attribute for all the nodes matching the filters and update the ones that changed.
+
+    The nodes are queried by page with only the variables required by the template,
+    the updates are then sent with one mutation per page. Return the number of nodes updated.
+    """
+    log = get_run_logger()
+
+    template_string = "n/a"
+    if computed_macro.attribute.computed_attribute and computed_macro.attribute.computed_attribute.jinja2_template:
+        template_string = computed_macro.attribute.computed_attribute.jinja2_template
+    macro_definition = MacroDefinition(macro=template_string)
+
+    query = Jinja2ComputedAttributeQuery(
+        kind=computed_macro.kind,
+        attribute_name=computed_macro.attribute.name,
+        variables=macro_definition.variables,
+        filters=filters or {},
+    )
+    rendered_query = query.render()
+
+    # Gather all the values before updating any node, the updates could change the order of the pages
+    values: dict[str, str] = {}
+    offset = 0
+    while True:
+        response = await client.execute_graphql(
+            query=rendered_query, variables={"offset": offset, "limit": batch_size}, branch_name=branch_name
+        )
+        for edge in response[computed_macro.kind]["edges"]:
+            node = edge["node"]
+            value = macro_definition.render(variables=query.get_variable_values(node=node))
+            if value != query.get_current_value(node=node):
+                values[node["id"]] = value
+
+        offset += batch_size
+        if offset >= response[computed_macro.kind]["count"]:
+            break
+
+    if not values:
+        log.debug(f"No nodes found that requires updates on {computed_macro.key_name}")
+        return 0
+
+    node_ids = list(values.keys())
+    for start in range(0, len(node_ids), batch_size):
+        mutation, variables = _render_update_attributes_mutation(
+            kind=computed_macro.kind,
+            attribute_name=computed_macro.attribute.name,
+            values={node_id: values[node_id] for node_id in node_ids[start : start + batch_size]},
+        )
+        await client.execute_graphql(query=mutation, variables=variables, branch_name=branch_name)
+
+    log.info(f"Updated computed attribute {computed_macro.kind}.{computed_macro.attribute.name} on {len(values)} nodes")
+    return len(values)
+
+
 @flow(
     name="process_computed_attribute_jinja2",
     flow_run_name="Process computed attribute on branch {branch_name} for {computed_attribute_kind}.{computed_attribute_name}",
@@ -169,7 +258,6 @@ async def process_jinja2(
     updated_fields: list[str] | None = None,
 ) -> None:
     """Request to the creation of git branches in available repositories."""
-    log = get_run_logger()
     service = services.service
     schema_branch = registry.schema.get_schema_branch(name=branch_name)
 
@@ -181,59 +269,12 @@ async def process_jinja2(
         if attrib.kind == computed_attribute_kind and attrib.attribute.name == computed_attribute_name
     ]
     for computed_macro in computed_macros:
-        found = []
         for id_filter in computed_macro.node_filters:
-            filters = {id_filter: object_id}
-            nodes = await service.client.filters(
-                kind=computed_macro.kind, prefetch_relationships=True, populate_store=True, **filters
-            )
-            found.extend(nodes)
-
-        if not found:
-            log.debug("No nodes found that requires updates")
-
-        template_string = "n/a"
-        if computed_macro.attribute.computed_attribute and computed_macro.attribute.computed_attribute.jinja2_template:
-            template_string = computed_macro.attribute.computed_attribute.jinja2_template
-        macro_definition = MacroDefinition(macro=template_string)
-        for node in found:
-            my_filter = {}
-            for variable in macro_definition.variables:
-                components = variable.split("__")
-                if len(components) == 2:
-                    property_name = components[0]
-                    property_value = components[1]
-                    attribute_property = getattr(node, property_name)
-                    my_filter[variable] = getattr(attribute_property, property_value)
-                elif len(components) == 3:
-                    relationship_name = components[0]
-                    property_name = components[1]
-                    property_value = components[2]
-                    relationship = getattr(node, relationship_name)
-                    try:
-                        attribute_property = getattr(relationship.peer, property_name)
-                        my_filter[variable] = getattr(attribute_property, property_value)
-                    except ValueError:
-                        my_filter[variable] = ""
-
-            value = macro_definition.render(variables=my_filter)
-            existing_value = getattr(node, computed_macro.attribute.name).value
-            if value == existing_value:
-                log.debug(f"Ignoring to update {node} with existing value on {computed_macro.attribute.name}={value}")
-                continue
-
-            await service.client.execute_graphql(
-                query=UPDATE_ATTRIBUTE,
-                variables={
-                    "id": node.id,
-                    "kind": computed_macro.kind,
-                    "attribute": computed_macro.attribute.name,
-                    "value": value,
-                },
+            await update_jinja2_computed_attribute(
+                client=service.client,
                 branch_name=branch_name,
-            )
-            log.info(
-                f"Updating computed attribute {computed_attribute_kind}.{computed_attribute_name}='{value}' ({node.id})"
+                computed_macro=computed_macro,
+                filters={id_filter: [object_id]},
             )
 
 
@@ -247,19 +288,16 @@ async def trigger_update_jinja2_computed_attributes(
     computed_attribute_kind: str,
 ) -> None:
     service = services.service
-    nodes = await service.client.all(kind=computed_attribute_kind, branch=branch_name)
-
-    for node in nodes:
-        await service.workflow.submit_workflow(
-            workflow=PROCESS_COMPUTED_MACRO,
-            parameters={
-                "branch_name": branch_name,
-                "computed_attribute_name": computed_attribute_name,
-                "computed_attribute_kind": computed_attribute_kind,
-                "node_kind": computed_attribute_kind,
-                "object_id": node.id,
-            },
-        )
+    schema_branch = registry.schema.get_schema_branch(name=branch_name)
+    node_schema = schema_branch.get_node(name=computed_attribute_kind, duplicate=False)
+
+    await update_jinja2_computed_attribute(
+        client=service.client,
+        branch_name=branch_name,
+        computed_macro=ComputedAttributeTarget(
+            kind=computed_attribute_kind, attribute=node_schema.get_attribute(name=computed_attribute_name)
+        ),
+    )
 
 
 @flow(name="computed-attribute-setup", flow_run_name="Setup computed attributes in task-manager")
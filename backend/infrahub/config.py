@@ -185,6 +185,17 @@ class StorageSettings(BaseSettings):
     driver: StorageDriver = StorageDriver.FileSystemStorage
     local: FileSystemStorageSettings = FileSystemStorageSettings()
     s3: S3StorageSettings = S3StorageSettings()
+    cache_memory_size: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Maximum size in bytes of the objects kept in memory to serve them without reading the storage",
+    )
+    cache_path: Optional[str] = Field(
+        default=None, description="Local directory used to cache the objects downloaded from a remote storage"
+    )
+    cache_disk_size: int = Field(
+        default=1024 * 1024 * 1024, ge=0, description="Maximum size in bytes of the objects kept in the cache directory"
+    )
 
 
 class DatabaseSettings(BaseSettings):
@@ -205,13 +216,19 @@ class DatabaseSettings(BaseSettings):
         default=5_000,
         ge=1,
         le=20_000,
-        description="The max number of records to fetch in a single query before performing internal pagination.",
+        description="The max number of records to hold in memory at once while reading the results of a query.",
     )
     max_depth_search_hierarchy: int = Field(
         default=5,
         le=20,
         description="Maximum number of level to search in a hierarchy.",
     )
+    diff_merge_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=20_000,
+        description="The number of nodes of a diff to read and merge at once when merging a branch.",
+    )
     retry_limit: int = Field(
         default=3, description="Maximum number of times a transient issue in a transaction should be retried."
     )
@@ -326,6 +343,11 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    graphql_stream_page_size: int = Field(
+        default=500,
+        ge=1,
+        description="The number of nodes to query at once when streaming the response of a paginated GraphQL query.",
+    )
 
 
 class GitSettings(BaseSettings):
@@ -337,6 +359,19 @@ class GitSettings(BaseSettings):
         description="Time (in seconds) between git repositories synchronizations",
         deprecated="This setting is deprecated and not currently in use.",
     )
+    sync_concurrency: int = Field(
+        default=5, ge=1, description="Number of git repositories fetched in parallel during a synchronization"
+    )
+    artifact_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of targets of an artifact definition to generate within the same workflow, 1 generates each artifact in its own workflow",
+    )
+    transform_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Number of processes used to render the Jinja2 and Python transforms of the artifacts, 0 renders them within the worker",
+    )
 
 
 class HTTPSettings(BaseSettings):
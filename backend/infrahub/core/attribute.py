@@ -16,13 +16,8 @@ from infrahub import config
 from infrahub.core import registry
 from infrahub.core.constants import NULL_VALUE, AttributeDBNodeType, BranchSupportType, RelationshipStatus
 from infrahub.core.property import FlagPropertyMixin, NodePropertyData, NodePropertyMixin
-from infrahub.core.query.attribute import (
-    AttributeGetQuery,
-    AttributeUpdateFlagQuery,
-    AttributeUpdateNodePropertyQuery,
-    AttributeUpdateValueQuery,
-)
-from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery
+from infrahub.core.query.attribute import AttributeGetQuery
+from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery, NodeUpdateAllQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import add_relationship, convert_ip_to_binary_str, update_relationships_to
 from infrahub.exceptions import ValidationError
@@ -34,6 +29,8 @@ from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSH
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.node.read_only import ReadOnlyAttribute
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -75,6 +72,99 @@ class AttributeCreateData(BaseModel):
     node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
 
 
+class AttributeUpdateData(BaseModel):
+    uuid: str
+    name: str
+    branch: str
+    branch_level: int
+    node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
+    content: Optional[dict[str, Any]] = Field(default=None, description="New content of the value, if it has changed")
+    flag_properties: dict[str, bool] = Field(default_factory=dict)
+    node_properties: dict[str, str] = Field(default_factory=dict)
+    rel_ids_to_update: list[str] = Field(
+        default_factory=list, description="IDs of the existing edges, on the same branch, that must be closed"
+    )
+
+    @property
+    def has_changes(self) -> bool:
+        return self.content is not None or bool(self.flag_properties) or bool(self.node_properties)
+
+
+async def attribute_to_graphql(
+    attr: Union[BaseAttribute, ReadOnlyAttribute],
+    db: InfrahubDatabase,
+    fields: Optional[dict] = None,
+    related_node_ids: Optional[set] = None,
+    filter_sensitive: bool = False,
+    permissions: Optional[dict] = None,
+) -> dict:
+    """Generate the GraphQL Payload of an attribute, shared by the attributes and their read-only projections."""
+    # pylint: disable=too-many-branches
+
+    response: dict[str, Any] = {"id": attr.id}
+
+    if fields and isinstance(fields, dict):
+        field_names = fields.keys()
+    else:
+        # REMOVED updated_at for now, need to investigate further how it's being used today
+        field_names = ["__typename", "value"] + attr._node_properties + attr._flag_properties
+
+    for field_name in field_names:
+        if field_name == "updated_at":
+            if attr.updated_at:
+                response[field_name] = await attr.updated_at.to_graphql()
+            else:
+                response[field_name] = None
+            continue
+
+        if field_name == "__typename":
+            response[field_name] = attr.get_kind()
+            continue
+
+        if field_name == "permissions":
+            response[field_name] = {"update_value": permissions["update"]} if permissions else None
+            continue
+
+        if field_name in ["source", "owner"]:
+            node_attr_getter = getattr(attr, f"get_{field_name}")
+            node_attr = await node_attr_getter(db=db)
+            if not node_attr:
+                response[field_name] = None
+            elif fields and isinstance(fields, dict):
+                response[field_name] = await node_attr.to_graphql(
+                    db=db, fields=fields[field_name], related_node_ids=related_node_ids
+                )
+            else:
+                response[field_name] = await node_attr.to_graphql(
+                    db=db,
+                    fields={"id": None, "display_label": None, "__typename": None},
+                    related_node_ids=related_node_ids,
+                )
+            continue
+
+        if field_name.startswith("_"):
+            field = getattr(attr, field_name[1:])
+        else:
+            field = getattr(attr, field_name)
+
+        if field_name == "value" and isinstance(field, Enum):
+            if config.SETTINGS.experimental_features.graphql_enums:
+                field = field.name
+            else:
+                field = field.value
+        if isinstance(field, str):
+            if filter_sensitive and attr.schema.kind in ["HashedPassword", "Password"]:
+                field = "***"
+            response[field_name] = field
+        elif isinstance(field, (int, bool, dict, list)):
+            response[field_name] = field
+
+        if related_node_ids and attr.is_from_profile and getattr(attr, "source_id"):
+            related_node_ids.add(getattr(attr, "source_id"))
+
+    return response
+
+
 class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
     type: Optional[Union[type, tuple[type]]] = None
 
@@ -109,6 +199,9 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         self.is_from_profile = is_from_profile
         self.from_pool: Optional[dict] = None
 
+        # Last known state of the attribute in the database, used to identify if the attribute has changed
+        self._db_data: Optional[AttributeFromDB] = None
+
         self._init_node_property_mixin(kwargs)
         self._init_flag_property_mixin(kwargs)
 
@@ -303,6 +396,9 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if not self.updated_at and data.updated_at:
             self.updated_at = Timestamp(data.updated_at)
 
+        # The data of an attribute inherited from a profile doesn't reflect the content of the database
+        self._db_data = data if not data.is_from_profile else None
+
     def value_from_db(self, data: AttributeFromDB) -> Any:
         if data.value == NULL_VALUE:
             return None
@@ -380,6 +476,111 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         return True
 
+    def has_changed(self) -> bool:
+        """Indicate if the attribute has been modified since it has been loaded from the database.
+
+        An attribute that hasn't been loaded from the database is always considered as changed.
+        The comparison is done with the state at load time, not with the current content of the database:
+        an attribute set back to its loaded value isn't considered as changed, even if another writer
+        has modified it in the meantime.
+        """
+        if self._db_data is None:
+            return True
+
+        value_changed, flags_changed, properties_changed = self._get_changes(current=self._db_data)
+        return value_changed or bool(flags_changed) or bool(properties_changed)
+
+    def reset_tracked_state(self) -> None:
+        """Forget the last known state of the attribute in the database, the next save will compare it with the database."""
+        self._db_data = None
+
+    def _get_is_default(self) -> bool:
+        """Indicate if the current value is still the default one."""
+        if not self.is_default:
+            return False
+
+        if isinstance(self.value, Enum):
+            has_default_value = self.schema.default_value == self.value.value
+        else:
+            has_default_value = self.schema.default_value == self.value
+        return not (
+            (self.schema.default_value is not None and not has_default_value)
+            or (self.schema.default_value is None and self.value is not None)
+        )
+
+    def _refresh_is_default(self) -> None:
+        """Check if the current value is still the default one."""
+        self.is_default = self._get_is_default()
+
+    def _get_changes(self, current: AttributeFromDB) -> tuple[bool, list[str], list[str]]:
+        """Compare the attribute with its state in the database.
+
+        Returns:
+            tuple[bool, list[str], list[str]]: If the value has changed, the names of the flags and the names of the node properties that have changed
+        """
+        value_changed = current.content != {**self.to_db(), "is_default": self._get_is_default()}
+
+        flags_changed = [
+            flag_name
+            for flag_name in self._flag_properties
+            if current.flag_properties.get(flag_name) != getattr(self, flag_name)
+        ]
+
+        properties_changed = [
+            prop_name
+            for prop_name in self._node_properties
+            if getattr(self, f"{prop_name}_id")
+            and not (
+                prop_name in current.node_properties
+                and current.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
+            )
+        ]
+
+        return value_changed, flags_changed, properties_changed
+
+    def get_update_data(self, current_data: AttributeFromDB, current_result: QueryResult) -> AttributeUpdateData:
+        """Generate the list of changes to apply to the database to update this attribute.
+
+        Args:
+            current_data (AttributeFromDB): current state of the attribute in the database
+            current_result (QueryResult): result of the NodeListGetAttributeQuery used to generate current_data
+        """
+        # Validate if the value is still correct, will raise a ValidationError if not
+        self.validate(value=self.value, name=self.name, schema=self.schema)
+        self._refresh_is_default()
+
+        branch = self.get_branch_based_on_support_type()
+        data = AttributeUpdateData(
+            uuid=self.id,
+            name=self.name,
+            branch=branch.name,
+            branch_level=branch.hierarchy_level,
+            node_type=self.get_db_node_type(),
+        )
+
+        value_changed, flags_changed, properties_changed = self._get_changes(current=current_data)
+
+        if value_changed:
+            data.content = self.to_db()
+            rel = current_result.get_rel("r2")
+            if rel.get("branch") == branch.name:
+                data.rel_ids_to_update.append(rel.element_id)
+
+        flag_rel_names = {"is_visible": "rel_isv", "is_protected": "rel_isp"}
+        for flag_name in flags_changed:
+            data.flag_properties[flag_name] = getattr(self, flag_name)
+            rel = current_result.get(flag_rel_names[flag_name])
+            if rel.get("branch") == branch.name:
+                data.rel_ids_to_update.append(rel.element_id)
+
+        for prop_name in properties_changed:
+            data.node_properties[prop_name] = getattr(self, f"{prop_name}_id")
+            rel = current_result.get(f"rel_{prop_name}")
+            if rel and rel.get("branch") == branch.name:
+                data.rel_ids_to_update.append(rel.element_id)
+
+        return data
+
     async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> bool:
         """Update the attribute in the database.
 
@@ -392,20 +593,6 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         update_at = Timestamp(at)
 
-        # Validate if the value is still correct, will raise a ValidationError if not
-        self.validate(value=self.value, name=self.name, schema=self.schema)
-
-        # Check if the current value is still the default one
-        if self.is_default:
-            if isinstance(self.value, Enum):
-                has_default_value = self.schema.default_value == self.value.value
-            else:
-                has_default_value = self.schema.default_value == self.value
-            if (self.schema.default_value is not None and not has_default_value) or (
-                self.schema.default_value is None and self.value is not None
-            ):
-                self.is_default = False
-
         query = await NodeListGetAttributeQuery.init(
             db=db,
             ids=[self.node.id],
@@ -418,48 +605,12 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         await query.execute(db=db)
         current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
 
-        branch = self.get_branch_based_on_support_type()
-
-        # ---------- Update the Value ----------
-        if current_attr_data.content != self.to_db():
-            # Create the new AttributeValue and update the existing relationship
-            query = await AttributeUpdateValueQuery.init(db=db, attr=self, at=update_at)
+        update_data = self.get_update_data(current_data=current_attr_data, current_result=current_attr_result)
+        if update_data.has_changes:
+            query = await NodeUpdateAllQuery.init(db=db, node=self.node, attributes=[update_data], at=update_at)
             await query.execute(db=db)
 
-            # TODO check that everything went well
-            rel = current_attr_result.get_rel("r2")
-            if rel.get("branch") == branch.name:
-                await update_relationships_to([rel.element_id], to=update_at, db=db)
-
-        # ---------- Update the Flags ----------
-        SUPPORTED_FLAGS = (
-            ("is_visible", "isv", "rel_isv"),
-            ("is_protected", "isp", "rel_isp"),
-        )
-
-        for flag_name, _, rel_name in SUPPORTED_FLAGS:
-            if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
-                await query.execute(db=db)
-
-                rel = current_attr_result.get(rel_name)
-                if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
-
-        # ---------- Update the Node Properties ----------
-        for prop_name in self._node_properties:
-            if getattr(self, f"{prop_name}_id") and not (
-                prop_name in current_attr_data.node_properties
-                and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
-            ):
-                query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
-                )
-                await query.execute(db=db)
-
-                rel = current_attr_result.get(f"rel_{prop_name}")
-                if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+        self.reset_tracked_state()
 
         return True
 
@@ -472,74 +623,14 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         permissions: Optional[dict] = None,
     ) -> dict:
         """Generate GraphQL Payload for this attribute."""
-        # pylint: disable=too-many-branches
-
-        response: dict[str, Any] = {"id": self.id}
-
-        if fields and isinstance(fields, dict):
-            field_names = fields.keys()
-        else:
-            # REMOVED updated_at for now, need to investigate further how it's being used today
-            field_names = ["__typename", "value"] + self._node_properties + self._flag_properties
-
-        for field_name in field_names:
-            if field_name == "updated_at":
-                if self.updated_at:
-                    response[field_name] = await self.updated_at.to_graphql()
-                else:
-                    response[field_name] = None
-                continue
-
-            if field_name == "__typename":
-                response[field_name] = self.get_kind()
-                continue
-
-            if field_name == "permissions":
-                response[field_name] = {"update_value": permissions["update"]} if permissions else None
-                continue
-
-            if field_name in ["source", "owner"]:
-                node_attr_getter = getattr(self, f"get_{field_name}")
-                node_attr = await node_attr_getter(db=db)
-                if not node_attr:
-                    response[field_name] = None
-                elif fields and isinstance(fields, dict):
-                    response[field_name] = await node_attr.to_graphql(
-                        db=db, fields=fields[field_name], related_node_ids=related_node_ids
-                    )
-                else:
-                    response[field_name] = await node_attr.to_graphql(
-                        db=db,
-                        fields={"id": None, "display_label": None, "__typename": None},
-                        related_node_ids=related_node_ids,
-                    )
-                continue
-
-            if field_name.startswith("_"):
-                field = getattr(self, field_name[1:])
-            else:
-                field = getattr(self, field_name)
-
-            if field_name == "value" and isinstance(field, Enum):
-                if config.SETTINGS.experimental_features.graphql_enums:
-                    field = field.name
-                else:
-                    field = field.value
-            if isinstance(field, str):
-                response[field_name] = self._filter_sensitive(value=field, filter_sensitive=filter_sensitive)
-            elif isinstance(field, (int, bool, dict, list)):
-                response[field_name] = field
-
-            if related_node_ids and self.is_from_profile and getattr(self, "source_id"):
-                related_node_ids.add(getattr(self, "source_id"))
-
-        return response
-
-    def _filter_sensitive(self, value: str, filter_sensitive: bool) -> str:
-        if filter_sensitive and self.schema.kind in ["HashedPassword", "Password"]:
-            return "***"
-
-        return value
+        return await attribute_to_graphql(
+            attr=self,
+            db=db,
+            fields=fields,
+            related_node_ids=related_node_ids,
+            filter_sensitive=filter_sensitive,
+            permissions=permissions,
+        )
 
     async def from_graphql(self, data: dict, db: InfrahubDatabase) -> bool:
         """Update attr from GraphQL payload"""
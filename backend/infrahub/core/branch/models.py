@@ -8,6 +8,7 @@ from pydantic import Field, field_validator
 from infrahub.core.constants import (
     GLOBAL_BRANCH_NAME,
 )
+from infrahub.core.diff.query.changed_nodes import DiffChangedNodesDeleteQuery
 from infrahub.core.models import SchemaBranchHash  # noqa: TCH001
 from infrahub.core.node.standard import StandardNode
 from infrahub.core.query.branch import (
@@ -16,6 +17,7 @@ from infrahub.core.query.branch import (
     RebaseBranchDeleteRelationshipQuery,
     RebaseBranchUpdateRelationshipQuery,
 )
+from infrahub.core.query.ipam import PrefixUtilizationDeleteBranchQuery
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, InitializationError, ValidationError
@@ -250,6 +252,10 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         await super().delete(db=db)
         query = await DeleteBranchRelationshipsQuery.init(db=db, branch_name=self.name)
         await query.execute(db=db)
+        changed_nodes_query = await DiffChangedNodesDeleteQuery.init(db=db, branch=self)
+        await changed_nodes_query.execute(db=db)
+        utilization_query = await PrefixUtilizationDeleteBranchQuery.init(db=db, branch=self)
+        await utilization_query.execute(db=db)
 
     def get_query_filter_relationships(
         self, rel_labels: list, at: Optional[Union[Timestamp, str]] = None, include_outside_parentheses: bool = False
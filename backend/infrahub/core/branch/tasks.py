@@ -27,6 +27,7 @@ from infrahub.exceptions import BranchNotFoundError, MergeFailedError, Validatio
 from infrahub.graphql.mutations.models import BranchCreateModel  # noqa: TCH001
 from infrahub.log import get_log_data
 from infrahub.message_bus import Meta, messages
+from infrahub.permissions.cache import invalidate_permissions_cache
 from infrahub.services import services
 from infrahub.worker import WORKER_IDENTITY
 from infrahub.workflows.catalogue import BRANCH_CANCEL_PROPOSED_CHANGES, IPAM_RECONCILIATION
@@ -85,6 +86,9 @@ async def rebase_branch(branch: str) -> None:
             await obj.rebase(db=dbt)
             log.info("Branch successfully rebased")
 
+        # The accounts, roles or permissions of the branch might have changed with the data of main
+        await invalidate_permissions_cache()
+
         if obj.has_schema_changes:
             # NOTE there is a bit additional work in order to calculate a proper diff that will
             # allow us to pull only the part of the schema that has changed, for now the safest option is to pull
@@ -174,6 +178,9 @@ async def merge_branch(branch: str) -> None:
                 raise MergeFailedError(branch_name=branch) from exc
             await merger.update_schema()
 
+        # Accounts, roles or permissions might have been modified in the branch
+        await invalidate_permissions_cache()
+
         if merger and merger.migrations:
             errors = await schema_apply_migrations(
                 message=SchemaApplyMigrationData(
@@ -224,6 +231,8 @@ async def delete_branch(branch: str) -> None:
     obj = await Branch.get_by_name(db=service.database, name=str(branch))
     event = BranchDeleteEvent(branch=branch, branch_id=obj.get_id(), sync_with_git=obj.sync_with_git)
     await obj.delete(db=service.database)
+    # A new branch with the same name mustn't reuse the permissions cached for this one
+    await invalidate_permissions_cache()
 
     await service.workflow.submit_workflow(workflow=BRANCH_CANCEL_PROPOSED_CHANGES, parameters={"branch_name": branch})
 
@@ -1,14 +1,12 @@
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
 from infrahub.core.node.constraints.interface import NodeConstraintInterface
 from infrahub.core.relationship.constraints.interface import RelationshipManagerConstraintInterface
+from infrahub.core.relationship.model import RelationshipManager
 from infrahub.database import InfrahubDatabase
 
-if TYPE_CHECKING:
-    from infrahub.core.relationship.model import RelationshipManager
-
 
 class NodeConstraintRunner:
     def __init__(
@@ -36,3 +34,27 @@ class NodeConstraintRunner:
             await relationship_manager.fetch_relationship_ids(db=self.db, force_refresh=True)
             for relationship_constraint in self.relationship_manager_constraints:
                 await relationship_constraint.check(relm=relationship_manager, node_schema=node.get_schema())
+
+    async def check_many(self, nodes: list[Node], field_filters: Optional[list[str]] = None) -> None:
+        """Validate multiple nodes of the same kind, each constraint is checked for the whole list at once."""
+        if not nodes:
+            return
+        kinds = {node.get_kind() for node in nodes}
+        if len(kinds) > 1:
+            raise ValueError(f"All the nodes must be of the same kind, found {', '.join(sorted(kinds))}")
+
+        # Only the peers provided with an hfid or allocated from a pool require a query to be resolved
+        for node in nodes:
+            await node.resolve_relationships(db=self.db)
+
+        for node_constraint in self.node_constraints:
+            await node_constraint.check_many(nodes, filters=field_filters)
+
+        node_schema = nodes[0].get_schema()
+        for relationship_name in node_schema.relationship_names:
+            if field_filters and relationship_name not in field_filters:
+                continue
+            relationship_managers: list[RelationshipManager] = [getattr(node, relationship_name) for node in nodes]
+            await RelationshipManager.fetch_relationship_ids_many(db=self.db, relms=relationship_managers)
+            for relationship_constraint in self.relationship_manager_constraints:
+                await relationship_constraint.check_many(relms=relationship_managers, node_schema=node_schema)
@@ -1,5 +1,6 @@
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.diff.query.changed_nodes import DiffChangedNodesGetQuery
 from infrahub.core.diff.query_parser import DiffQueryParser
 from infrahub.core.query.diff import DiffAllPathsQuery
 from infrahub.core.timestamp import Timestamp
@@ -12,6 +13,21 @@ class DiffCalculator:
     def __init__(self, db: InfrahubDatabase) -> None:
         self.db = db
 
+    async def get_changed_node_uuids(self, diff_branch: Branch, from_time: Timestamp) -> set[str] | None:
+        """Return the UUIDs of the nodes modified on the branch since from_time, based on the changed-node log.
+
+        None is returned if the log can't be trusted for this timeframe: the default branch is not tracked
+        and the migrations triggered by a schema change update the nodes without going through the log.
+        """
+        if diff_branch.is_default or diff_branch.is_global:
+            return None
+        if diff_branch.schema_changed_at and Timestamp(diff_branch.schema_changed_at) >= from_time:
+            return None
+
+        query = await DiffChangedNodesGetQuery.init(db=self.db, branch=diff_branch, from_time=from_time)
+        await query.execute(db=self.db)
+        return query.get_node_uuids()
+
     async def calculate_diff(
         self,
         base_branch: Branch,
@@ -20,6 +36,7 @@ class DiffCalculator:
         to_time: Timestamp,
         include_unchanged: bool = True,
         previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
+        changed_node_uuids: set[str] | None = None,
     ) -> CalculatedDiffs:
         if diff_branch.name == registry.default_branch:
             diff_branch_from_time = from_time
@@ -39,9 +56,9 @@ class DiffCalculator:
             diff_branch_from_time=diff_branch_from_time,
             diff_from=from_time,
             diff_to=to_time,
+            changed_node_uuids=sorted(changed_node_uuids) if changed_node_uuids is not None else None,
         )
-        await branch_diff_query.execute(db=self.db)
-        for query_result in branch_diff_query.get_results():
+        async for query_result in branch_diff_query.stream(db=self.db):
             diff_parser.read_result(query_result=query_result)
 
         if base_branch.name != diff_branch.name:
@@ -60,8 +77,7 @@ class DiffCalculator:
                 ],
                 new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
             )
-            await base_diff_query.execute(db=self.db)
-            for query_result in base_diff_query.get_results():
+            async for query_result in base_diff_query.stream(db=self.db):
                 diff_parser.read_result(query_result=query_result)
         diff_parser.parse(include_unchanged=include_unchanged)
         return CalculatedDiffs(
@@ -43,6 +43,7 @@ class EnrichedDiffRequest:
     from_time: Timestamp
     to_time: Timestamp
     node_field_specifiers: set[NodeFieldSpecifier] = field(default_factory=set)
+    changed_node_uuids: set[str] | None = None
 
 
 class DiffCoordinator:
@@ -283,18 +284,24 @@ class DiffCoordinator:
                     end_time = remaining_diffs[0].diff_branch_diff.from_time
                 else:
                     end_time = diff_request.to_time
+                changed_node_uuids: set[str] | None = None
                 if previous_diffs is None:
                     node_field_specifiers = set()
                 else:
                     node_field_specifiers = self._get_node_field_specifiers(
                         enriched_diff=previous_diffs.diff_branch_diff
                     )
+                    # only the nodes modified since the end of the previous diff need to be included on the branch
+                    changed_node_uuids = await self.diff_calculator.get_changed_node_uuids(
+                        diff_branch=diff_request.diff_branch, from_time=current_time
+                    )
                 inner_diff_request = EnrichedDiffRequest(
                     base_branch=diff_request.base_branch,
                     diff_branch=diff_request.diff_branch,
                     from_time=current_time,
                     to_time=end_time,
                     node_field_specifiers=node_field_specifiers,
+                    changed_node_uuids=changed_node_uuids,
                 )
                 is_incremental_diff = current_time != diff_request.from_time
                 current_diffs = await self._get_enriched_diff(
@@ -322,6 +329,7 @@ class DiffCoordinator:
             to_time=diff_request.to_time,
             include_unchanged=is_incremental_diff,
             previous_node_specifiers=diff_request.node_field_specifiers,
+            changed_node_uuids=diff_request.changed_node_uuids,
         )
         enriched_diff_pair = await self.diff_enricher.enrich(calculated_diffs=calculated_diff_pair)
         return enriched_diff_pair
@@ -41,10 +41,16 @@ class DiffMerger:
                 latest_diff = diff
         if latest_diff is None:
             raise RuntimeError(f"Missing diff for branch {self.source_branch.name}")
-        enriched_diff = await self.diff_repository.get_one(
-            diff_branch_name=self.source_branch.name, diff_id=latest_diff.uuid
+        cardinality_one_conflicts = await self.diff_repository.get_cardinality_one_conflicts(diff_id=latest_diff.uuid)
+        diff_batches = self.diff_repository.get_one_in_batches(
+            diff_branch_name=self.source_branch.name,
+            diff_id=latest_diff.uuid,
+            batch_size=self.serializer.max_batch_size,
+            base_branch_name=self.destination_branch.name,
         )
-        async for node_diff_dicts, property_diff_dicts in self.serializer.serialize_diff(diff=enriched_diff):
+        async for node_diff_dicts, property_diff_dicts in self.serializer.serialize_diff_batches(
+            diff_batches=diff_batches, cardinality_one_conflicts=cardinality_one_conflicts
+        ):
             merge_query = await DiffMergeQuery.init(
                 db=self.db,
                 branch=self.source_branch,
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
 from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.constants.database import DatabaseEdgeType
@@ -8,9 +8,11 @@ from infrahub.exceptions import SchemaNotFoundError
 from infrahub.types import ATTRIBUTE_PYTHON_TYPES
 
 from ..model.path import (
+    CardinalityOneConflict,
     ConflictSelection,
     EnrichedDiffAttribute,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffProperty,
     EnrichedDiffRoot,
     EnrichedDiffSingleRelationship,
@@ -121,6 +123,12 @@ class DiffMergeSerializer:
             return value_type(raw_value)
         return raw_value
 
+    def _initialize(self, diff: EnrichedDiffRoot) -> None:
+        self._reset_caches()
+        self._conflicted_cardinality_one_relationships = set()
+        self._source_branch_name = diff.diff_branch_name
+        self._target_branch_name = diff.base_branch_name
+
     def _cache_conflicted_cardinality_one_relationships(self, diff: EnrichedDiffRoot) -> None:
         for node in diff.nodes:
             for rel in node.relationships:
@@ -132,66 +140,110 @@ class DiffMergeSerializer:
                     for prop in element.properties:
                         if prop.property_type is not DatabaseEdgeType.IS_RELATED:
                             continue
-                        relationship_identifier = self._get_relationship_identifier(
-                            schema_kind=node.kind, relationship_name=rel.name
-                        )
-                        if prop.previous_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.previous_value)
-                            )
-                        if prop.new_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.new_value)
+                        self._add_conflicted_cardinality_one_relationship(
+                            conflict=CardinalityOneConflict(
+                                node_uuid=node.uuid,
+                                node_kind=node.kind,
+                                relationship_name=rel.name,
+                                peer_ids={peer_id for peer_id in (prop.previous_value, prop.new_value) if peer_id},
                             )
+                        )
+
+    def _add_conflicted_cardinality_one_relationship(self, conflict: CardinalityOneConflict) -> None:
+        relationship_identifier = self._get_relationship_identifier(
+            schema_kind=conflict.node_kind, relationship_name=conflict.relationship_name
+        )
+        for peer_id in conflict.peer_ids:
+            self._conflicted_cardinality_one_relationships.add((conflict.node_uuid, relationship_identifier, peer_id))
 
     async def serialize_diff(
         self, diff: EnrichedDiffRoot
     ) -> AsyncGenerator[
         tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]], None
     ]:
-        self._reset_caches()
-        self._source_branch_name = diff.diff_branch_name
-        self._target_branch_name = diff.base_branch_name
+        self._initialize(diff=diff)
         self._cache_conflicted_cardinality_one_relationships(diff=diff)
         serialized_node_diffs = []
         serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
         for node in diff.nodes:
-            node_action = self._get_action(action=node.action, conflict=node.conflict)
-            serial_attr_diffs = []
-            for attr_diff in node.attributes:
-                serial_attr_diff, attribute_property_diff = self._serialize_attribute(
-                    attribute_diff=attr_diff, node_uuid=node.uuid, node_kind=node.kind
-                )
-                if serial_attr_diff:
-                    serial_attr_diffs.append(serial_attr_diff)
-                serialized_property_diffs.append(attribute_property_diff)
-            relationship_diffs = []
-            for rel_diff in node.relationships:
-                relationship_identifier = self._get_relationship_identifier(
-                    schema_kind=node.kind, relationship_name=rel_diff.name
-                )
-                for relationship_element_diff in rel_diff.relationships:
-                    element_diffs, relationship_property_diffs = self._serialize_relationship_element(
-                        relationship_diff=relationship_element_diff,
-                        relationship_identifier=relationship_identifier,
-                        node_uuid=node.uuid,
-                    )
-                    relationship_diffs.extend(element_diffs)
-                    serialized_property_diffs.extend(relationship_property_diffs)
-            if node_action in (DiffAction.ADDED, DiffAction.REMOVED) or serial_attr_diffs or relationship_diffs:
-                serialized_node_diffs.append(
-                    NodeMergeDict(
-                        uuid=node.uuid,
-                        action=self._to_action_str(action=node_action),
-                        attributes=serial_attr_diffs,
-                        relationships=relationship_diffs,
-                    )
-                )
+            serialized_node_diff, node_property_diffs = self._serialize_node(node=node)
+            if serialized_node_diff:
+                serialized_node_diffs.append(serialized_node_diff)
+            serialized_property_diffs.extend(node_property_diffs)
             if len(serialized_node_diffs) == self.max_batch_size:
                 yield (serialized_node_diffs, serialized_property_diffs)
                 serialized_node_diffs, serialized_property_diffs = [], []
         yield (serialized_node_diffs, serialized_property_diffs)
 
+    async def serialize_diff_batches(
+        self,
+        diff_batches: AsyncIterator[EnrichedDiffRoot],
+        cardinality_one_conflicts: list[CardinalityOneConflict],
+    ) -> AsyncGenerator[
+        tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]], None
+    ]:
+        """Serialize a diff that is read batch by batch, to only keep one batch of nodes in memory at a time.
+
+        The conflicts of the relationships of cardinality one must be provided upfront because
+        they impact how the peers of these relationships are serialized.
+        """
+        is_initialized = False
+        serialized_node_diffs = []
+        serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
+        async for diff in diff_batches:
+            if not is_initialized:
+                self._initialize(diff=diff)
+                for conflict in cardinality_one_conflicts:
+                    self._add_conflicted_cardinality_one_relationship(conflict=conflict)
+                is_initialized = True
+            for node in diff.nodes:
+                serialized_node_diff, node_property_diffs = self._serialize_node(node=node)
+                if serialized_node_diff:
+                    serialized_node_diffs.append(serialized_node_diff)
+                serialized_property_diffs.extend(node_property_diffs)
+                if len(serialized_node_diffs) == self.max_batch_size:
+                    yield (serialized_node_diffs, serialized_property_diffs)
+                    serialized_node_diffs, serialized_property_diffs = [], []
+        yield (serialized_node_diffs, serialized_property_diffs)
+
+    def _serialize_node(
+        self, node: EnrichedDiffNode
+    ) -> tuple[NodeMergeDict | None, list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]]:
+        node_action = self._get_action(action=node.action, conflict=node.conflict)
+        serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
+        serial_attr_diffs = []
+        for attr_diff in node.attributes:
+            serial_attr_diff, attribute_property_diff = self._serialize_attribute(
+                attribute_diff=attr_diff, node_uuid=node.uuid, node_kind=node.kind
+            )
+            if serial_attr_diff:
+                serial_attr_diffs.append(serial_attr_diff)
+            serialized_property_diffs.append(attribute_property_diff)
+        relationship_diffs = []
+        for rel_diff in node.relationships:
+            relationship_identifier = self._get_relationship_identifier(
+                schema_kind=node.kind, relationship_name=rel_diff.name
+            )
+            for relationship_element_diff in rel_diff.relationships:
+                element_diffs, relationship_property_diffs = self._serialize_relationship_element(
+                    relationship_diff=relationship_element_diff,
+                    relationship_identifier=relationship_identifier,
+                    node_uuid=node.uuid,
+                )
+                relationship_diffs.extend(element_diffs)
+                serialized_property_diffs.extend(relationship_property_diffs)
+        if node_action in (DiffAction.ADDED, DiffAction.REMOVED) or serial_attr_diffs or relationship_diffs:
+            return (
+                NodeMergeDict(
+                    uuid=node.uuid,
+                    action=self._to_action_str(action=node_action),
+                    attributes=serial_attr_diffs,
+                    relationships=relationship_diffs,
+                ),
+                serialized_property_diffs,
+            )
+        return None, serialized_property_diffs
+
     def _get_property_actions_and_values(
         self, property_diff: EnrichedDiffProperty, python_value_type: type
     ) -> list[tuple[DiffAction, Primitives]]:
@@ -89,6 +89,16 @@ class NodeFieldSpecifier:
         return hash(f"{self.node_uuid}:{self.field_name}")
 
 
+@dataclass
+class CardinalityOneConflict:
+    """Peers of a conflicting element of a relationship of cardinality one"""
+
+    node_uuid: str
+    node_kind: str
+    relationship_name: str
+    peer_ids: set[str] = field(default_factory=set)
+
+
 @dataclass
 class NodeDiffFieldSummary:
     kind: str
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from infrahub.core.query import Query, QueryType
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.timestamp import Timestamp
+    from infrahub.database import InfrahubDatabase
+
+
+class DiffChangedNodesTrackQuery(Query):
+    """Record the last time each node has been modified on a branch."""
+
+    name = "diff_changed_nodes_track"
+    type = QueryType.WRITE
+    insert_return = False
+
+    def __init__(self, node_ids: list[str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.node_ids = node_ids
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {"branch_name": self.branch.name, "node_ids": self.node_ids, "at": self.at.to_string()}
+        query = """
+        UNWIND $node_ids AS node_id
+        MERGE (changed:DiffChangedNode {branch: $branch_name, node_uuid: node_id})
+        ON CREATE SET changed.changed_at = $at
+        ON MATCH SET changed.changed_at = CASE WHEN changed.changed_at < $at THEN $at ELSE changed.changed_at END
+        """
+        self.add_to_query(query=query)
+
+
+class DiffChangedNodesGetQuery(Query):
+    """Get the UUIDs of the nodes modified on a branch at or after a given time."""
+
+    name = "diff_changed_nodes_get"
+    type = QueryType.READ
+
+    def __init__(self, from_time: Timestamp, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.from_time = from_time
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {"branch_name": self.branch.name, "from_time": self.from_time.to_string()}
+        query = """
+        MATCH (changed:DiffChangedNode {branch: $branch_name})
+        WHERE changed.changed_at >= $from_time
+        WITH DISTINCT changed.node_uuid AS node_uuid
+        """
+        self.return_labels = ["node_uuid"]
+        self.add_to_query(query=query)
+
+    def get_node_uuids(self) -> set[str]:
+        return {result.get_as_type("node_uuid", return_type=str) for result in self.get_results()}
+
+
+class DiffChangedNodesDeleteQuery(Query):
+    name = "diff_changed_nodes_delete"
+    type = QueryType.WRITE
+    insert_return = False
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {"branch_name": self.branch.name}
+        query = """
+        MATCH (changed:DiffChangedNode {branch: $branch_name})
+        DELETE changed
+        """
+        self.add_to_query(query=query)
+
+
+async def track_changed_nodes(
+    db: InfrahubDatabase, branch: Branch, node_ids: Iterable[Optional[str]], at: Timestamp
+) -> None:
+    """Record that some nodes have been modified on a branch, to limit the scope of the next incremental diff.
+
+    Nothing is recorded for the default and the global branches, the diff of a branch only considers its own changes.
+    """
+    if branch.is_default or branch.is_global:
+        return
+
+    unique_node_ids = sorted({node_id for node_id in node_ids if node_id})
+    if not unique_node_ids:
+        return
+
+    query = await DiffChangedNodesTrackQuery.init(db=db, branch=branch, node_ids=unique_node_ids, at=at)
+    await query.execute(db=db)
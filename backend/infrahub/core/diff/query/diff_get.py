@@ -90,8 +90,8 @@ class EnrichedDiffGetQuery(Query):
             RETURN diff_node.label AS latest_node_label
             LIMIT 1
         }
-        WITH diff_node_kind, node_root_tuples, latest_node_label
-        ORDER BY diff_node_kind, latest_node_label
+        WITH diff_node_uuid, diff_node_kind, node_root_tuples, latest_node_label
+        ORDER BY diff_node_kind, latest_node_label, diff_node_uuid
         SKIP COALESCE($offset, 0)
         LIMIT $limit
         UNWIND node_root_tuples AS nrt
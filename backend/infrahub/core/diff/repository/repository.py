@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from infrahub import config
 from infrahub.core import registry
@@ -8,6 +8,7 @@ from infrahub.database import InfrahubDatabase, retry_db_transaction
 from infrahub.exceptions import ResourceNotFoundError
 
 from ..model.path import (
+    CardinalityOneConflict,
     ConflictSelection,
     EnrichedDiffConflict,
     EnrichedDiffRoot,
@@ -22,7 +23,7 @@ from ..query.diff_get import EnrichedDiffGetQuery
 from ..query.diff_summary import DiffSummaryCounters, DiffSummaryQuery
 from ..query.empty_roots import EnrichedDiffEmptyRootsQuery
 from ..query.filters import EnrichedDiffQueryFilters
-from ..query.get_conflict_query import EnrichedDiffConflictQuery
+from ..query.get_conflict_query import EnrichedDiffCardinalityOneConflictsQuery, EnrichedDiffConflictQuery
 from ..query.save import EnrichedDiffRootsCreateQuery, EnrichedNodeBatchCreateQuery, EnrichedNodesLinkQuery
 from ..query.time_range_query import EnrichedDiffTimeRangeQuery
 from ..query.update_conflict_query import EnrichedDiffConflictUpdateQuery
@@ -144,6 +145,43 @@ class DiffRepository:
             raise ResourceNotFoundError(f"Multiple diffs for {error_str}")
         return enriched_diffs[0]
 
+    async def get_one_in_batches(
+        self,
+        diff_branch_name: str,
+        diff_id: str,
+        batch_size: int,
+        base_branch_name: str | None = None,
+    ) -> AsyncGenerator[EnrichedDiffRoot, None]:
+        """Read a diff batch by batch, each EnrichedDiffRoot includes at most batch_size nodes and no parents.
+
+        Only one batch is held in memory at a time, regardless of the size of the diff.
+        """
+        offset = 0
+        while True:
+            enriched_diffs = await self.get(
+                base_branch_name=base_branch_name or registry.default_branch,
+                diff_branch_names=[diff_branch_name],
+                diff_ids=[diff_id],
+                include_parents=False,
+                include_empty=True,
+                limit=batch_size,
+                offset=offset,
+            )
+            if not enriched_diffs:
+                if offset == 0:
+                    raise ResourceNotFoundError(f"Cannot find diff for branch {diff_branch_name} with ID {diff_id}")
+                return
+            enriched_diff = enriched_diffs[0]
+            yield enriched_diff
+            if len(enriched_diff.nodes) < batch_size:
+                return
+            offset += batch_size
+
+    async def get_cardinality_one_conflicts(self, diff_id: str) -> list[CardinalityOneConflict]:
+        query = await EnrichedDiffCardinalityOneConflictsQuery.init(db=self.db, diff_id=diff_id)
+        await query.execute(db=self.db)
+        return query.get_conflicts()
+
     def _get_node_create_request_batch(
         self, enriched_diffs: EnrichedDiffs
     ) -> Generator[list[EnrichedNodeCreateRequest], None, None]:
@@ -12,6 +12,8 @@ node_indexes: list[IndexItem] = [
     IndexItem(name="attr_iphost_bin", label="AttributeIPHost", properties=["binary_address"], type=IndexType.RANGE),
     IndexItem(name="rel_uuid", label="Relationship", properties=["uuid"], type=IndexType.RANGE),
     IndexItem(name="rel_identifier", label="Relationship", properties=["name"], type=IndexType.RANGE),
+    IndexItem(name="diff_changed_node", label="DiffChangedNode", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="prefix_utilization", label="PrefixUtilization", properties=["prefix_uuid"], type=IndexType.RANGE),
 ]
 
 rel_indexes: list[IndexItem] = [
@@ -32,6 +32,7 @@ from infrahub.log import get_logger
 from infrahub.menu.menu import default_menu
 from infrahub.menu.utils import create_menu_children
 from infrahub.permissions import PermissionBackend
+from infrahub.permissions.cache import invalidate_permissions_cache
 from infrahub.storage import InfrahubObjectStorage
 
 log = get_logger()
@@ -518,6 +519,7 @@ async def first_time_initialization(db: InfrahubDatabase) -> None:
     await create_default_roles(db=db)
     if config.SETTINGS.main.allow_anonymous_access:
         await create_anonymous_role(db=db)
+    await invalidate_permissions_cache()
 
     # --------------------------------------------------
     # Create Default IPAM Namespace
@@ -3,14 +3,25 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
+from infrahub.core.diff.query.changed_nodes import track_changed_nodes
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.ipam import IPPrefixReconcileQuery
+from infrahub.core.query.ipam import (
+    IPNamespaceTreeQuery,
+    IPNodeParentUpdate,
+    IPNodeParentUpdateQuery,
+    IPPrefixReconcileQuery,
+    PrefixUtilizationData,
+)
+from infrahub.core.schema import NodeSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
 
-from .constants import AllIPTypes
+from .constants import AllIPTypes, IPNetworkType
+from .model import IpamNodeDetails
+from .tree import IPPrefixTree
+from .utilization import add_child_to_summary, update_prefix_utilization
 
 if TYPE_CHECKING:
     from infrahub.core.relationship.model import RelationshipManager
@@ -84,6 +95,11 @@ class IpamReconciler:
         self.db = db
         self.branch = branch
         self.at: Optional[Timestamp] = None
+        # Prefixes whose utilization summary must be computed again, because the value of a child might have changed
+        self._changed_prefix_uuids: set[str] = set()
+        self._deleted_prefix_uuids: set[str] = set()
+        # Space gained or released by the prefixes whose children have only been moved, created or deleted
+        self._utilization_deltas: dict[str, PrefixUtilizationData] = {}
 
     async def reconcile(
         self,
@@ -94,6 +110,9 @@ class IpamReconciler:
         at: Optional[Timestamp] = None,
     ) -> Optional[Node]:
         self.at = Timestamp(at)
+        self._changed_prefix_uuids = set()
+        self._deleted_prefix_uuids = set()
+        self._utilization_deltas = {}
 
         query = await IPPrefixReconcileQuery.init(
             db=self.db, branch=self.branch, ip_value=ip_value, namespace=namespace, node_uuid=node_uuid, at=self.at
@@ -144,24 +163,191 @@ class IpamReconciler:
             await node.save(db=self.db, at=self.at)
 
         if is_delete:
+            if current_parent_uuid:
+                self._add_utilization_delta(prefix_uuid=current_parent_uuid, ip_value=ip_value, count=-1)
+            if isinstance(ip_value, IPNetworkType):
+                self._add_deleted_prefix(prefix_uuid=ip_node_uuid)
             try:
                 await reconcile_nodes.node.delete(db=self.db, at=self.at)
             except KeyError:
+                await self._update_prefix_utilization()
                 return None
 
+        await self._update_prefix_utilization()
         return reconcile_nodes.node
 
-    async def _update_node_parent(self, node: Node, new_parent_uuid: Optional[str]) -> None:
+    async def reconcile_many(self, ipam_node_details: list[IpamNodeDetails], at: Optional[Timestamp] = None) -> None:
+        """Reconcile multiple IP nodes at once, with a single query per namespace.
+
+        The tree of each namespace is computed in memory, only the nodes to reconcile and the nodes whose parent
+        was or should be one of them are updated.
+        """
+        self.at = Timestamp(at)
+        self._changed_prefix_uuids = set()
+        self._deleted_prefix_uuids = set()
+        self._utilization_deltas = {}
+
+        details_per_namespace: dict[str, list[IpamNodeDetails]] = {}
+        for ipam_node_detail in ipam_node_details:
+            details_per_namespace.setdefault(ipam_node_detail.namespace_id, []).append(ipam_node_detail)
+
+        for namespace_id, namespace_details in details_per_namespace.items():
+            await self._reconcile_namespace(namespace_id=namespace_id, ipam_node_details=namespace_details)
+
+        await self._update_prefix_utilization()
+
+    async def _reconcile_namespace(self, namespace_id: str, ipam_node_details: list[IpamNodeDetails]) -> None:
+        query = await IPNamespaceTreeQuery.init(db=self.db, branch=self.branch, namespace=namespace_id, at=self.at)
+        tree_nodes = {tree_node.id: tree_node async for tree_node in query.stream_nodes(db=self.db)}
+
+        reconciled_uuids = {detail.node_uuid for detail in ipam_node_details}
+        deleted_uuids = {detail.node_uuid for detail in ipam_node_details if detail.is_delete}
+        for detail in ipam_node_details:
+            if detail.node_uuid not in tree_nodes and not detail.is_delete:
+                node_type = InfrahubKind.IPADDRESS if detail.is_address else InfrahubKind.IPPREFIX
+                raise NodeNotFoundError(node_type=node_type, identifier=detail.ip_value)
+
+        tree = IPPrefixTree()
+        for tree_node in tree_nodes.values():
+            if tree_node.id not in deleted_uuids and isinstance(
+                tree_node.ip_value, (ipaddress.IPv4Network, ipaddress.IPv6Network)
+            ):
+                tree.add(node_uuid=tree_node.id, prefix=tree_node.ip_value)
+
+        new_parent_uuids: dict[str, Optional[str]] = {}
+        for tree_node in tree_nodes.values():
+            if tree_node.id in deleted_uuids:
+                continue
+            calculated_parent_uuid = tree.get_parent(ip_value=tree_node.ip_value)
+            if tree_node.id in reconciled_uuids or (
+                calculated_parent_uuid != tree_node.current_parent_id
+                and (tree_node.current_parent_id in reconciled_uuids or calculated_parent_uuid in reconciled_uuids)
+            ):
+                new_parent_uuids[tree_node.id] = calculated_parent_uuid
+
+        parent_updates_per_kind: dict[str, list[IPNodeParentUpdate]] = {}
+        for node_uuid, new_parent_uuid in new_parent_uuids.items():
+            tree_node = tree_nodes[node_uuid]
+            current_parent_uuids = {tree_node.current_parent_id} if tree_node.current_parent_id else set()
+            self._add_parent_change(
+                current_parent_uuids=current_parent_uuids,
+                new_parent_uuid=new_parent_uuid,
+                ip_value=tree_node.ip_value,
+                is_reconciled=node_uuid in reconciled_uuids,
+            )
+            parent_updates_per_kind.setdefault(tree_node.kind, []).append(
+                IPNodeParentUpdate(
+                    node_id=node_uuid, current_parent_id=tree_node.current_parent_id, new_parent_id=new_parent_uuid
+                )
+            )
+        await self._update_parents(parent_updates_per_kind=parent_updates_per_kind)
+
+        deleted_nodes = await NodeManager.get_many(
+            db=self.db, branch=self.branch, ids=list(deleted_uuids & tree_nodes.keys())
+        )
+        for deleted_node in deleted_nodes.values():
+            await deleted_node.delete(db=self.db, at=self.at)
+
+        for detail in ipam_node_details:
+            if not detail.is_delete:
+                continue
+            tree_node = tree_nodes.get(detail.node_uuid)
+            if tree_node and tree_node.current_parent_id:
+                self._add_utilization_delta(
+                    prefix_uuid=tree_node.current_parent_id, ip_value=tree_node.ip_value, count=-1
+                )
+            if not detail.is_address:
+                self._add_deleted_prefix(prefix_uuid=detail.node_uuid)
+
+    async def _update_parents(self, parent_updates_per_kind: dict[str, list[IPNodeParentUpdate]]) -> None:
+        """Write the new parent of the IP nodes with a single query per kind."""
+        changed_node_uuids: list[Optional[str]] = []
+        for kind, parent_updates in parent_updates_per_kind.items():
+            node_schema = self.db.schema.get(name=kind, branch=self.branch, duplicate=False)
+            is_prefix = isinstance(node_schema, NodeSchema) and node_schema.is_ip_prefix()
+            rel_schema = node_schema.get_relationship(name="parent" if is_prefix else "ip_prefix")
+            query = await IPNodeParentUpdateQuery.init(
+                db=self.db,
+                branch=self.branch,
+                at=self.at,
+                rel_schema=rel_schema,
+                updates=parent_updates,
+                is_prefix=is_prefix,
+            )
+            await query.execute(db=self.db)
+
+            for parent_update in parent_updates:
+                changed_node_uuids.append(parent_update.node_id)
+                if parent_update.current_parent_id != parent_update.new_parent_id:
+                    changed_node_uuids.extend([parent_update.current_parent_id, parent_update.new_parent_id])
+
+        await track_changed_nodes(db=self.db, branch=self.branch, node_ids=changed_node_uuids, at=self.at)
+
+    def _add_deleted_prefix(self, prefix_uuid: str) -> None:
+        # The summary of a prefix accounts for the children of all the branches, it is only removed
+        # when the prefix is deleted from the default branch, otherwise it is kept for the other branches
+        if self.branch.is_default:
+            self._deleted_prefix_uuids.add(prefix_uuid)
+
+    def _add_utilization_delta(self, prefix_uuid: str, ip_value: AllIPTypes, count: int) -> None:
+        if not self.branch.is_default:
+            # The children of a branch are accounted in the bucket of the deepest branch of their path,
+            # which can't be deduced from the change alone
+            self._changed_prefix_uuids.add(prefix_uuid)
+            return
+        delta = self._utilization_deltas.setdefault(
+            prefix_uuid, PrefixUtilizationData(prefix_id=prefix_uuid, used_prefix_space={}, used_addresses={})
+        )
+        add_child_to_summary(summary=delta, branch_name=self.branch.name, ip_value=ip_value, count=count)
+
+    async def _update_prefix_utilization(self) -> None:
+        await update_prefix_utilization(
+            db=self.db,
+            prefix_ids=self._changed_prefix_uuids,
+            deleted_prefix_ids=self._deleted_prefix_uuids,
+            deltas=self._utilization_deltas.values(),
+            at=self.at,
+        )
+
+    def _add_parent_change(
+        self,
+        current_parent_uuids: set[str],
+        new_parent_uuid: Optional[str],
+        ip_value: AllIPTypes,
+        is_reconciled: bool,
+    ) -> None:
+        for current_parent_uuid in current_parent_uuids:
+            if is_reconciled:
+                # The value of a reconciled node might have changed, the space it used to take is unknown
+                self._changed_prefix_uuids.add(current_parent_uuid)
+            else:
+                self._add_utilization_delta(prefix_uuid=current_parent_uuid, ip_value=ip_value, count=-1)
+        if new_parent_uuid:
+            self._add_utilization_delta(prefix_uuid=new_parent_uuid, ip_value=ip_value, count=1)
+
+    async def _update_node_parent(
+        self, node: Node, new_parent_uuid: Optional[str], is_reconciled: bool = False
+    ) -> None:
         node_kinds = {node.get_kind()} | set(node.get_schema().inherit_from)
         is_prefix = False
         if InfrahubKind.IPADDRESS in node_kinds:
             rel_manager: RelationshipManager = node.ip_prefix  # type: ignore[attr-defined]
+            ip_value: AllIPTypes = node.address.obj  # type: ignore[attr-defined]
         elif InfrahubKind.IPPREFIX in node_kinds:
             rel_manager = node.parent  # type: ignore[attr-defined]
+            ip_value = node.prefix.obj  # type: ignore[attr-defined]
             is_prefix = True
         else:
             return
 
+        current_parent_rels = await rel_manager.get_relationships(db=self.db)
+        self._add_parent_change(
+            current_parent_uuids={rel.get_peer_id() for rel in current_parent_rels},
+            new_parent_uuid=new_parent_uuid,
+            ip_value=ip_value,
+            is_reconciled=is_reconciled,
+        )
+
         await rel_manager.update(db=self.db, data=new_parent_uuid)
         if not is_prefix:
             return
@@ -169,7 +355,7 @@ class IpamReconciler:
 
     async def update_node(self, reconcile_nodes: IPNodesToReconcile) -> set[str]:
         await self._update_node_parent(
-            node=reconcile_nodes.node, new_parent_uuid=reconcile_nodes.calculated_parent_uuid
+            node=reconcile_nodes.node, new_parent_uuid=reconcile_nodes.calculated_parent_uuid, is_reconciled=True
         )
         return {reconcile_nodes.node.get_id()}
 
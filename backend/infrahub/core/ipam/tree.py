@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import bisect
+import ipaddress
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .constants import AllIPTypes, IPNetworkType
+
+
+class IPPrefixTree:
+    """In memory index of the prefixes of a namespace, to find the most specific prefix containing a prefix or an address.
+
+    The prefixes are indexed by IP version, prefix length and network address, the prefix lengths in use are kept
+    sorted so that a lookup only checks the lengths that exist, starting with the most specific one.
+    """
+
+    def __init__(self) -> None:
+        self._prefixes: dict[tuple[int, int], dict[int, set[str]]] = {}
+        self._prefixlens: dict[int, list[int]] = {}
+
+    @staticmethod
+    def _get_network_address(address: int, prefixlen: int, max_prefixlen: int) -> int:
+        host_bits = max_prefixlen - prefixlen
+        return (address >> host_bits) << host_bits
+
+    def add(self, node_uuid: str, prefix: IPNetworkType) -> None:
+        key = (prefix.version, prefix.prefixlen)
+        if key not in self._prefixes:
+            self._prefixes[key] = {}
+            bisect.insort(self._prefixlens.setdefault(prefix.version, []), prefix.prefixlen)
+        self._prefixes[key].setdefault(int(prefix.network_address), set()).add(node_uuid)
+
+    def get_parent(self, ip_value: AllIPTypes) -> Optional[str]:
+        """Return the UUID of the most specific prefix containing this prefix or address.
+
+        A prefix can't be the parent of an identical prefix, but an address can belong to a prefix of the same length.
+        """
+        if isinstance(ip_value, (ipaddress.IPv4Interface, ipaddress.IPv6Interface)):
+            network = ip_value.network
+            max_parent_prefixlen = network.prefixlen
+        else:
+            network = ip_value
+            max_parent_prefixlen = network.prefixlen - 1
+
+        prefixlens = self._prefixlens.get(network.version, [])
+        address = int(network.network_address)
+        for index in range(bisect.bisect_right(prefixlens, max_parent_prefixlen) - 1, -1, -1):
+            prefixlen = prefixlens[index]
+            network_address = self._get_network_address(
+                address=address, prefixlen=prefixlen, max_prefixlen=network.max_prefixlen
+            )
+            node_uuids = self._prefixes[network.version, prefixlen].get(network_address)
+            if node_uuids:
+                return min(node_uuids)
+
+        return None
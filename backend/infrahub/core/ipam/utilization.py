@@ -1,13 +1,21 @@
+import ipaddress
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.node import Node
-from infrahub.core.query.ipam import IPPrefixUtilization
+from infrahub.core.query.ipam import (
+    IPPrefixGetUuidsQuery,
+    IPPrefixUtilization,
+    PrefixUtilizationData,
+    PrefixUtilizationDeleteQuery,
+    PrefixUtilizationGetQuery,
+    PrefixUtilizationSetQuery,
+)
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
-from .constants import PrefixMemberType
+from .constants import AllIPTypes, IPNetworkType, PrefixMemberType
 from .size import get_prefix_space
 
 
@@ -18,7 +26,142 @@ class PrefixChildDetails:
     ip_value: str
 
 
+async def get_children_details(
+    db: InfrahubDatabase, prefix_ids: list[str], at: Optional[Union[Timestamp, str]] = None
+) -> dict[str, dict[str, list[PrefixChildDetails]]]:
+    """Return the details of the children of some prefixes, per prefix ID and per branch of the children."""
+    results_by_prefix_id: dict[str, dict[str, list[PrefixChildDetails]]] = {}
+    query = await IPPrefixUtilization.init(db=db, at=at, ip_prefixes=prefix_ids)
+    async for result in query.stream(db=db):
+        prefix_node = result.get_node("pfx")
+        prefix_id = str(prefix_node.get("uuid"))
+        branch_name = str(result.get("branch"))
+        child_node = result.get_node("child")
+        if InfrahubKind.IPADDRESS in child_node.labels:
+            child_type = PrefixMemberType.ADDRESS
+        else:
+            child_type = PrefixMemberType.PREFIX
+        child_value_node = result.get_node("av")
+        child_prefixlen = child_value_node.get("prefixlen")
+        child_ip_value = child_value_node.get("value")
+
+        if prefix_id not in results_by_prefix_id:
+            results_by_prefix_id[prefix_id] = {}
+        if branch_name not in results_by_prefix_id[prefix_id]:
+            results_by_prefix_id[prefix_id][branch_name] = []
+        results_by_prefix_id[prefix_id][branch_name].append(
+            PrefixChildDetails(child_type=child_type, prefixlen=child_prefixlen, ip_value=child_ip_value)
+        )
+
+    return results_by_prefix_id
+
+
+def summarize_children(
+    prefix_id: str, children_by_branch: dict[str, list[PrefixChildDetails]]
+) -> PrefixUtilizationData:
+    summary = PrefixUtilizationData(prefix_id=prefix_id, used_prefix_space={}, used_addresses={})
+    for branch_name, children in children_by_branch.items():
+        used_prefix_space, used_addresses = 0, 0
+        for child in children:
+            if child.child_type == PrefixMemberType.ADDRESS:
+                used_addresses += 1
+            else:
+                max_prefixlen = ipaddress.ip_interface(child.ip_value).max_prefixlen
+                used_prefix_space += 2 ** (max_prefixlen - child.prefixlen)
+        summary.used_prefix_space[branch_name] = used_prefix_space
+        summary.used_addresses[branch_name] = used_addresses
+    return summary
+
+
+def add_child_to_summary(summary: PrefixUtilizationData, branch_name: str, ip_value: AllIPTypes, count: int) -> None:
+    """Add the space used by a child to the summary of its parent, a negative count removes it."""
+    if isinstance(ip_value, IPNetworkType):
+        used_prefix_space = summary.used_prefix_space.get(branch_name, 0) + count * ip_value.num_addresses
+        summary.used_prefix_space[branch_name] = used_prefix_space
+    else:
+        summary.used_addresses[branch_name] = summary.used_addresses.get(branch_name, 0) + count
+
+
+def apply_summary_delta(summary: PrefixUtilizationData, delta: PrefixUtilizationData) -> None:
+    """Add the used space of a delta to a summary, branch by branch."""
+    for branch_name, used_prefix_space in delta.used_prefix_space.items():
+        summary.used_prefix_space[branch_name] = summary.used_prefix_space.get(branch_name, 0) + used_prefix_space
+    for branch_name, used_addresses in delta.used_addresses.items():
+        summary.used_addresses[branch_name] = summary.used_addresses.get(branch_name, 0) + used_addresses
+
+
+async def update_prefix_utilization(
+    db: InfrahubDatabase,
+    prefix_ids: Iterable[str] = (),
+    deleted_prefix_ids: Iterable[str] = (),
+    deltas: Iterable[PrefixUtilizationData] = (),
+    at: Optional[Union[Timestamp, str]] = None,
+) -> None:
+    """Update the stored utilization summaries of some prefixes.
+
+    The summaries of `prefix_ids` are computed again from their children, for all the branches, and the ones of
+    the deleted prefixes are removed. The `deltas` are added to the stored summaries of the other prefixes, a prefix
+    without summary yet is computed from its children instead.
+    """
+    deleted_ids = set(deleted_prefix_ids)
+    if deleted_ids:
+        delete_query = await PrefixUtilizationDeleteQuery.init(db=db, prefix_ids=sorted(deleted_ids))
+        await delete_query.execute(db=db)
+
+    ids = set(prefix_ids) - deleted_ids
+    deltas_by_prefix_id = {
+        delta.prefix_id: delta for delta in deltas if delta.prefix_id not in ids and delta.prefix_id not in deleted_ids
+    }
+
+    summaries: list[PrefixUtilizationData] = []
+    if deltas_by_prefix_id:
+        get_query = await PrefixUtilizationGetQuery.init(db=db, prefix_ids=sorted(deltas_by_prefix_id.keys()))
+        await get_query.execute(db=db)
+        stored_summaries = get_query.get_summaries()
+        for prefix_id, delta in deltas_by_prefix_id.items():
+            summary = stored_summaries.get(prefix_id)
+            if not summary:
+                ids.add(prefix_id)
+                continue
+            apply_summary_delta(summary=summary, delta=delta)
+            summaries.append(summary)
+
+    if ids:
+        children_details = await get_children_details(db=db, prefix_ids=sorted(ids), at=at)
+        summaries.extend(
+            summarize_children(prefix_id=prefix_id, children_by_branch=children_details.get(prefix_id, {}))
+            for prefix_id in sorted(ids)
+        )
+
+    if not summaries:
+        return
+    set_query = await PrefixUtilizationSetQuery.init(db=db, at=at, summaries=summaries)
+    await set_query.execute(db=db)
+
+
+async def rebuild_prefix_utilization(db: InfrahubDatabase, batch_size: int = 1000) -> int:
+    """Delete all the stored utilization summaries and compute them again for all the prefixes."""
+    delete_query = await PrefixUtilizationDeleteQuery.init(db=db)
+    await delete_query.execute(db=db)
+
+    uuids_query = await IPPrefixGetUuidsQuery.init(db=db)
+    await uuids_query.execute(db=db)
+    prefix_ids = uuids_query.get_prefix_uuids()
+
+    at = Timestamp()
+    for offset in range(0, len(prefix_ids), batch_size):
+        await update_prefix_utilization(db=db, prefix_ids=prefix_ids[offset : offset + batch_size], at=at)
+
+    return len(prefix_ids)
+
+
 class PrefixUtilizationGetter:
+    """Compute the utilization of some prefixes.
+
+    The percentage of use of the prefixes is read from the summaries maintained by the IPAM reconciler, unless a
+    specific time is requested or a prefix has no summary, in which case it is computed from the children.
+    """
+
     def __init__(
         self, db: InfrahubDatabase, ip_prefixes: list[Node], at: Optional[Union[Timestamp, str]] = None
     ) -> None:
@@ -27,6 +170,7 @@ class PrefixUtilizationGetter:
         self.at = at
         self._has_data = False
         self._results_by_prefix_id: dict[str, dict[str, list[PrefixChildDetails]]] = {}
+        self._summaries: Optional[dict[str, PrefixUtilizationData]] = None
 
     async def _fetch_data(self) -> None:
         if self._has_data is False:
@@ -34,30 +178,20 @@ class PrefixUtilizationGetter:
         self._has_data = True
 
     async def _run_and_parse_query(self) -> None:
-        self._results_by_prefix_id = {}
-        query = await IPPrefixUtilization.init(db=self.db, at=self.at, ip_prefixes=self.ip_prefixes)
-        await query.execute(db=self.db)
-
-        for result in query.get_results():
-            prefix_node = result.get_node("pfx")
-            prefix_id = str(prefix_node.get("uuid"))
-            branch_name = str(result.get("branch"))
-            child_node = result.get_node("child")
-            if InfrahubKind.IPADDRESS in child_node.labels:
-                child_type = PrefixMemberType.ADDRESS
-            else:
-                child_type = PrefixMemberType.PREFIX
-            child_value_node = result.get_node("av")
-            child_prefixlen = child_value_node.get("prefixlen")
-            child_ip_value = child_value_node.get("value")
-
-            if prefix_id not in self._results_by_prefix_id:
-                self._results_by_prefix_id[prefix_id] = {}
-            if branch_name not in self._results_by_prefix_id[prefix_id]:
-                self._results_by_prefix_id[prefix_id][branch_name] = []
-            self._results_by_prefix_id[prefix_id][branch_name].append(
-                PrefixChildDetails(child_type=child_type, prefixlen=child_prefixlen, ip_value=child_ip_value)
-            )
+        self._results_by_prefix_id = await get_children_details(
+            db=self.db, prefix_ids=[prefix.get_id() for prefix in self.ip_prefixes], at=self.at
+        )
+
+    async def _get_summaries(self) -> dict[str, PrefixUtilizationData]:
+        if self._summaries is None:
+            self._summaries = {}
+            if self.at is None:
+                query = await PrefixUtilizationGetQuery.init(
+                    db=self.db, prefix_ids=[prefix.get_id() for prefix in self.ip_prefixes]
+                )
+                await query.execute(db=self.db)
+                self._summaries = query.get_summaries()
+        return self._summaries
 
     async def get_children(
         self,
@@ -101,8 +235,14 @@ class PrefixUtilizationGetter:
         total_used_space = 0
         if ip_prefixes is None:
             ip_prefixes = self.ip_prefixes
+        summaries = await self._get_summaries()
         for ip_prefix in ip_prefixes:
             total_prefix_space += get_prefix_space(ip_prefix=ip_prefix)
+            summary = summaries.get(ip_prefix.get_id())
+            if summary:
+                for branch_name in branch_names or list(summary.used_prefix_space.keys()):
+                    total_used_space += summary.used_prefix_space.get(branch_name, 0)
+                continue
             max_prefixlen = ip_prefix.prefix.obj.max_prefixlen  # type: ignore[attr-defined]
             children = await self.get_children(
                 ip_prefixes=[ip_prefix], prefix_member_type=PrefixMemberType.PREFIX, branch_names=branch_names
@@ -115,13 +255,25 @@ class PrefixUtilizationGetter:
         self, ip_prefixes: Optional[list[Node]] = None, branch_names: Optional[list[str]] = None
     ) -> tuple[int, int]:
         total_prefix_space = 0
+        total_used_space = 0
         if ip_prefixes is None:
             ip_prefixes = self.ip_prefixes
+        summaries = await self._get_summaries()
+        prefixes_without_summary = []
         for ip_prefix in ip_prefixes:
             total_prefix_space += get_prefix_space(ip_prefix=ip_prefix)
-        total_used_space = await self.get_num_children_in_use(
-            ip_prefixes=ip_prefixes, prefix_member_type=PrefixMemberType.ADDRESS, branch_names=branch_names
-        )
+            summary = summaries.get(ip_prefix.get_id())
+            if not summary:
+                prefixes_without_summary.append(ip_prefix)
+                continue
+            for branch_name in branch_names or list(summary.used_addresses.keys()):
+                total_used_space += summary.used_addresses.get(branch_name, 0)
+        if prefixes_without_summary:
+            total_used_space += await self.get_num_children_in_use(
+                ip_prefixes=prefixes_without_summary,
+                prefix_member_type=PrefixMemberType.ADDRESS,
+                branch_names=branch_names,
+            )
         return total_used_space, total_prefix_space
 
     async def get_use_percentage(
@@ -5,14 +5,18 @@ from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, overlo
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub.core.diff.query.changed_nodes import track_changed_nodes
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
+from infrahub.core.node.read_only import ReadOnlyNode, supports_read_only
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
+    NodeGetListWithInfoQuery,
     NodeListGetAttributeQuery,
     NodeListGetInfoQuery,
     NodeListGetRelationshipsQuery,
@@ -57,9 +61,9 @@ def get_schema(
     db: InfrahubDatabase, branch: Branch, node_schema: type[SchemaProtocol] | MainSchemaTypes | str
 ) -> MainSchemaTypes:
     if isinstance(node_schema, str):
-        return db.schema.get(name=node_schema, branch=branch.name)
+        return db.schema.get(name=node_schema, branch=branch.name, duplicate=False)
     if hasattr(node_schema, "_is_runtime_protocol") and getattr(node_schema, "_is_runtime_protocol"):
-        return db.schema.get(name=node_schema.__name__, branch=branch.name)
+        return db.schema.get(name=node_schema.__name__, branch=branch.name, duplicate=False)
     if not isinstance(node_schema, (MainSchemaTypes)):
         raise ValueError(f"Invalid schema provided {node_schema}")
 
@@ -178,6 +182,7 @@ class NodeManager:
         account=None,
         partial_match: bool = False,
         branch_agnostic: bool = False,
+        read_only: bool = False,
     ) -> list[Any]:
         """Query one or multiple nodes of a given type based on filter arguments.
 
@@ -188,11 +193,99 @@ class NodeManager:
             limit (int, optional): Maximum numbers of nodes to return. Defaults to 100.
             at (Timestamp or Str, optional): Timestamp for the query. Defaults to None.
             branch (Branch or Str, optional): Branch to query. Defaults to None.
+            read_only (bool, optional): Return a ReadOnlyNode instead of a Node when the requested fields allow it,
+                the nodes can then only be used to generate a GraphQL payload. Defaults to False.
 
         Returns:
             list[Node]: List of Node object
         """
 
+        nodes, _ = await cls._query(
+            db=db,
+            schema=schema,
+            filters=filters,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            partial_match=partial_match,
+            branch_agnostic=branch_agnostic,
+            read_only=read_only,
+        )
+        return nodes
+
+    @classmethod
+    async def query_with_count(
+        cls,
+        db: InfrahubDatabase,
+        schema: type[SchemaProtocol] | MainSchemaTypes | str,
+        filters: dict | None = None,
+        fields: dict | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        at: Union[Timestamp, str] | None = None,
+        branch: Union[Branch, str] | None = None,
+        include_source: bool = False,
+        include_owner: bool = False,
+        prefetch_relationships: bool = False,
+        account=None,
+        partial_match: bool = False,
+        branch_agnostic: bool = False,
+        read_only: bool = False,
+    ) -> tuple[list[Any], int]:
+        """Query a page of nodes of a given type and the total number of nodes matching the filters.
+
+        The filters are evaluated by a single query returning both the count and the IDs of the nodes of the page,
+        instead of one query for the page and another one for the count.
+
+        Returns:
+            tuple[list[Node], int]: List of Node object and total number of nodes matching the filters
+        """
+        nodes, count = await cls._query(
+            db=db,
+            schema=schema,
+            filters=filters,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            partial_match=partial_match,
+            branch_agnostic=branch_agnostic,
+            include_count=True,
+            read_only=read_only,
+        )
+        return nodes, count if count is not None else len(nodes)
+
+    @classmethod
+    async def _query(
+        cls,
+        db: InfrahubDatabase,
+        schema: type[SchemaProtocol] | MainSchemaTypes | str,
+        filters: dict | None,
+        fields: dict | None,
+        offset: int | None,
+        limit: int | None,
+        at: Union[Timestamp, str] | None,
+        branch: Union[Branch, str] | None,
+        include_source: bool,
+        include_owner: bool,
+        prefetch_relationships: bool,
+        account: Any,
+        partial_match: bool,
+        branch_agnostic: bool,
+        include_count: bool = False,
+        read_only: bool = False,
+    ) -> tuple[list[Any], Optional[int]]:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
 
@@ -212,10 +305,10 @@ class NodeManager:
                 account=account,
                 branch_agnostic=branch_agnostic,
             )
-            return [node] if node else []
+            return ([node] if node else []), None
 
-        # Query the list of nodes matching this Query
-        query = await NodeGetListQuery.init(
+        # Query the page of nodes matching this Query along with the information to load them
+        query = await NodeGetListWithInfoQuery.init(
             db=db,
             schema=node_schema,
             branch=branch,
@@ -225,9 +318,12 @@ class NodeManager:
             at=at,
             partial_match=partial_match,
             branch_agnostic=branch_agnostic,
+            include_count=include_count,
         )
         await query.execute(db=db)
-        node_ids = query.get_node_ids()
+        nodes_info_by_id: dict[str, NodeToProcess] = {node.node_uuid: node async for node in query.get_nodes(db=db)}
+        node_ids = list(nodes_info_by_id.keys())
+        count = query.get_count() if include_count else None
 
         # if display_label or hfid has been requested we need to ensure we are querying the right fields
         if fields and "display_label" in fields:
@@ -241,20 +337,23 @@ class NodeManager:
             if hfid_fields:
                 fields = deep_merge_dict(dicta=fields, dictb=hfid_fields)
 
-        response = await cls.get_many(
+        response = await cls._load_many(
+            db=db,
             ids=node_ids,
+            nodes_info_by_id=nodes_info_by_id,
+            profile_ids_by_node_id=query.get_profile_ids_by_node_id(),
             fields=fields,
-            branch=branch,
-            account=account,
             at=at,
+            branch=branch,
             include_source=include_source,
             include_owner=include_owner,
-            db=db,
             prefetch_relationships=prefetch_relationships,
+            account=account,
             branch_agnostic=branch_agnostic,
+            read_only=read_only,
         )
 
-        return list(response.values()) if node_ids else []
+        return (list(response.values()) if node_ids else []), count
 
     @classmethod
     async def count(
@@ -1076,7 +1175,7 @@ class NodeManager:
         return node
 
     @classmethod
-    async def get_many(  # pylint: disable=too-many-branches,too-many-statements
+    async def get_many(
         cls,
         db: InfrahubDatabase,
         ids: list[str],
@@ -1100,7 +1199,43 @@ class NodeManager:
         )
         await query.execute(db=db)
         nodes_info_by_id: dict[str, NodeToProcess] = {node.node_uuid: node async for node in query.get_nodes(db=db)}
-        profile_ids_by_node_id = query.get_profile_ids_by_node_id()
+
+        return await cls._load_many(
+            db=db,
+            ids=ids,
+            nodes_info_by_id=nodes_info_by_id,
+            profile_ids_by_node_id=query.get_profile_ids_by_node_id(),
+            fields=fields,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            branch_agnostic=branch_agnostic,
+        )
+
+    @classmethod
+    async def _load_many(  # pylint: disable=too-many-branches,too-many-statements
+        cls,
+        db: InfrahubDatabase,
+        ids: list[str],
+        nodes_info_by_id: dict[str, NodeToProcess],
+        profile_ids_by_node_id: dict[str, list[str]],
+        fields: Optional[dict],
+        at: Timestamp,
+        branch: Branch,
+        include_source: bool,
+        include_owner: bool,
+        prefetch_relationships: bool,
+        account: Any,
+        branch_agnostic: bool,
+        read_only: bool = False,
+    ) -> dict[str, Any]:
+        """Load the nodes from their information, querying their attributes and optionally their peers.
+
+        With read_only, the nodes whose requested fields are all supported are loaded as a ReadOnlyNode.
+        """
         all_profile_ids = reduce(
             lambda all_ids, these_ids: all_ids | set(these_ids), profile_ids_by_node_id.values(), set()
         )
@@ -1205,6 +1340,21 @@ class NodeManager:
             new_node_data_with_profile_overrides = profile_index.apply_profiles(new_node_data)
             node_class = identify_node_class(node=node)
             node_branch = await registry.get_branch(db=db, branch=node.branch)
+            if read_only and not prefetch_relationships and supports_read_only(node.schema, node_class, fields):
+                nodes[node_id] = ReadOnlyNode(
+                    schema=node.schema,
+                    branch=node_branch,
+                    at=at,
+                    id=node_id,
+                    db_id=node.node_id,
+                    updated_at=node.updated_at,
+                    attributes={
+                        name: value
+                        for name, value in new_node_data_with_profile_overrides.items()
+                        if isinstance(value, AttributeFromDB)
+                    },
+                )
+                continue
             item = await node_class.init(schema=node.schema, branch=node_branch, at=at, db=db)
             await item.load(**new_node_data_with_profile_overrides, db=db)
 
@@ -1212,6 +1362,41 @@ class NodeManager:
 
         return nodes
 
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+    ) -> list[Node]:
+        """Create multiple new nodes in the database with a single query per kind.
+
+        The nodes must have been initialized with `new()` and validated beforehand,
+        no constraint is checked at this point.
+        """
+        create_at = Timestamp(at)
+
+        nodes_per_kind: dict[str, list[Node]] = {}
+        for node in nodes:
+            if node._existing:
+                raise ValueError(f"{node.get_kind()} {node.get_id()} already exists in the database")
+            nodes_per_kind.setdefault(node.get_kind(), []).append(node)
+
+        for kind_nodes in nodes_per_kind.values():
+            query = await NodeCreateManyQuery.init(db=db, nodes=kind_nodes, at=create_at)
+            await query.execute(db=db)
+            ids_per_node = query.get_ids_per_node()
+            for node in kind_nodes:
+                db_id, new_ids = ids_per_node[node.get_id()]
+                node._set_created(db_id=db_id, new_ids=new_ids, at=create_at)
+
+            changed_node_ids = []
+            for node in kind_nodes:
+                changed_node_ids.extend([node.get_id(), *node.get_peer_ids()])
+            await track_changed_nodes(db=db, branch=kind_nodes[0]._branch, node_ids=changed_node_ids, at=create_at)
+
+        return nodes
+
     @classmethod
     async def delete(
         cls,
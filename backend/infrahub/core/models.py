@@ -315,10 +315,39 @@ class HashableModel(BaseModel):
 
     _exclude_from_hash: list[str] = []
     _sort_by: list[str] = []
+    _frozen: bool = False
 
     def __hash__(self) -> int:
         return hash(self.get_hash())
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen and not name.startswith("_"):
+            raise TypeError(
+                f"{self.__class__.__name__} is read-only, use mutable_copy() to get an object that can be modified"
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> Self:
+        """Make the object and all the HashableModel it contains read-only.
+
+        A frozen object can be shared safely between multiple consumers, its hash will never change.
+        """
+        self._set_frozen(frozen=True)
+        return self
+
+    def _set_frozen(self, frozen: bool) -> None:
+        self._frozen = frozen
+        for field_name in self.model_fields:
+            value = getattr(self, field_name)
+            items = value if isinstance(value, list) else [value]
+            for item in items:
+                if isinstance(item, HashableModel):
+                    item._set_frozen(frozen=frozen)
+
     def get_hash(self, display_values: bool = False) -> str:
         """Generate a hash for the object.
 
@@ -403,9 +432,15 @@ class HashableModel(BaseModel):
         self_sort_keys, other_sort_keys = self._sorting_keys(other)
         return tuple(self_sort_keys) >= tuple(other_sort_keys)
 
+    def mutable_copy(self) -> Self:
+        """Return a deep copy of the object that can be modified, even if the current object is frozen."""
+        new_obj = self.model_copy(deep=True)
+        new_obj._set_frozen(frozen=False)
+        return new_obj
+
     def duplicate(self) -> Self:
         """Duplicate the current object by doing a deep copy of everything and recreating a new object."""
-        return self.model_copy(deep=True)
+        return self.mutable_copy()
 
     @staticmethod
     def is_list_composed_of_hashable_model(items: list[Any]) -> bool:
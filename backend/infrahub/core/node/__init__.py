@@ -9,8 +9,16 @@ from infrahub_sdk.uuidt import UUIDT
 from infrahub.core import registry
 from infrahub.core.constants import BranchSupportType, ComputedAttributeKind, InfrahubKind, RelationshipCardinality
 from infrahub.core.constants.schema import SchemaElementPathType
+from infrahub.core.diff.query.changed_nodes import track_changed_nodes
 from infrahub.core.protocols import CoreNumberPool
-from infrahub.core.query.node import NodeCheckIDQuery, NodeCreateAllQuery, NodeDeleteQuery, NodeGetListQuery
+from infrahub.core.query.node import (
+    NodeCheckIDQuery,
+    NodeCreateAllQuery,
+    NodeDeleteQuery,
+    NodeGetListQuery,
+    NodeListGetAttributeQuery,
+    NodeUpdateAllQuery,
+)
 from infrahub.core.schema import AttributeSchema, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, NodeNotFoundError, PoolExhaustedError, ValidationError
@@ -29,6 +37,7 @@ if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
 
     from ..attribute import BaseAttribute
+    from .read_only import ReadOnlyAttribute, ReadOnlyNode
 
 SchemaProtocol = TypeVar("SchemaProtocol")
 
@@ -207,9 +216,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = db.schema.get(name=schema, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema, branch=branch, duplicate=False)
         elif hasattr(schema, "_is_runtime_protocol") and getattr(schema, "_is_runtime_protocol"):
-            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch, duplicate=False)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -529,18 +538,30 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created(db_id=db_id, new_ids=query.get_ids(), at=create_at)
+        await track_changed_nodes(db=db, branch=self._branch, node_ids=[self.id, *self.get_peer_ids()], at=create_at)
+
+    def get_peer_ids(self) -> list[str]:
+        """Return the IDs of all the peers currently assigned to the relationships of the node."""
+        peer_ids = []
+        for name in self._relationships:
+            relm: RelationshipManager = getattr(self, name)
+            peer_ids.extend(rel.peer_id for rel in relm._relationships if rel.peer_id)
+        return peer_ids
 
-        new_ids = query.get_ids()
+    def _set_created(self, db_id: str, new_ids: dict[str, tuple[str, str]], at: Timestamp) -> None:
+        """Update the node, its attributes and its relationships with the IDs assigned by the database during the creation."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -550,29 +571,67 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
                 rel.id, rel.db_id = new_ids[identifier]
 
     async def _update(
-        self, db: InfrahubDatabase, at: Optional[Timestamp] = None, fields: list[str] | None = None
+        self,
+        db: InfrahubDatabase,
+        at: Optional[Timestamp] = None,
+        fields: list[str] | None = None,
     ) -> None:
-        """Update the node in the database if needed."""
+        """Update the node in the database if needed.
+
+        Only the attributes and the relationships that have changed since the node was loaded are considered,
+        restricted to `fields` if provided, and all the changes on the attributes are written with a single query.
+
+        The changes are detected against the state of the node at load time, the attributes and relationships
+        modified locally are written with their current value, overwriting the changes made by another writer
+        since the node was loaded. The other ones are left untouched.
+        """
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
+        attributes: list[BaseAttribute] = []
         for name in self._attributes:
-            if fields and name in fields:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
-            else:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
+            if fields and name not in fields:
+                continue
+            attr: BaseAttribute = getattr(self, name)
+            if attr.id and not attr.is_from_profile and attr.has_changed():
+                attributes.append(attr)
+
+        if attributes:
+            query = await NodeListGetAttributeQuery.init(
+                db=db,
+                ids=[self.id],
+                fields={attr.name: True for attr in attributes},
+                branch=self._branch,
+                at=update_at,
+                include_source=True,
+                include_owner=True,
+            )
+            await query.execute(db=db)
+            current_attributes = query.get_results_by_attribute_name(node_id=self.id)
+
+            updates = []
+            for attr in attributes:
+                if attr.name not in current_attributes:
+                    raise IndexError(f"Unable to find the result with ID: {self.id} and NAME: {attr.name}")
+                current_data, current_result = current_attributes[attr.name]
+                update_data = attr.get_update_data(current_data=current_data, current_result=current_result)
+                if update_data.has_changes:
+                    updates.append(update_data)
+
+            if updates:
+                query = await NodeUpdateAllQuery.init(db=db, node=self, attributes=updates, at=update_at)
+                await query.execute(db=db)
+                await track_changed_nodes(db=db, branch=self._branch, node_ids=[self.id], at=update_at)
+
+            for attr in attributes:
+                attr.reset_tracked_state()
 
-        # Go over the list of relationships and update them one by one
         for name in self._relationships:
-            if fields and name in fields:
-                rel: RelationshipManager = getattr(self, name)
+            if fields and name not in fields:
+                continue
+            rel: RelationshipManager = getattr(self, name)
+            if rel.has_changed():
                 await rel.save(at=update_at, db=db)
-            else:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
 
     async def save(self, db: InfrahubDatabase, at: Optional[Timestamp] = None, fields: list[str] | None = None) -> Self:
         """Create or Update the Node in the database."""
@@ -617,6 +676,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
 
         query = await NodeDeleteQuery.init(db=db, node=self, at=delete_at)
         await query.execute(db=db)
+        await track_changed_nodes(db=db, branch=self._branch, node_ids=[self.id], at=delete_at)
 
     async def to_graphql(
         self,
@@ -631,60 +691,14 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         Returns:
             (dict): Return GraphQL Payload
         """
-
-        response: dict[str, Any] = {"id": self.id, KIND_GRAPHQL_FIELD_NAME: self.get_kind()}
-
-        if related_node_ids is not None:
-            related_node_ids.add(self.id)
-
-        FIELD_NAME_TO_EXCLUDE = ["id"] + self._schema.relationship_names
-
-        if fields and isinstance(fields, dict):
-            field_names = [field_name for field_name in fields.keys() if field_name not in FIELD_NAME_TO_EXCLUDE]
-        else:
-            field_names = self._schema.attribute_names + ["__typename", "display_label"]
-
-        for field_name in field_names:
-            if field_name == "__typename":
-                # Note we already store kind within KIND_GRAPHQL_FIELD_NAME.
-                response[field_name] = self.get_kind()
-                continue
-
-            if field_name == "display_label":
-                response[field_name] = await self.render_display_label(db=db)
-                continue
-
-            if field_name == "hfid":
-                response[field_name] = await self.get_hfid(db=db)
-                continue
-
-            if field_name == "_updated_at":
-                if self._updated_at:
-                    response[field_name] = await self._updated_at.to_graphql()
-                else:
-                    response[field_name] = None
-                continue
-
-            field: Optional[BaseAttribute] = getattr(self, field_name, None)
-
-            if not field:
-                response[field_name] = None
-                continue
-
-            if fields and isinstance(fields, dict):
-                response[field_name] = await field.to_graphql(
-                    db=db,
-                    fields=fields.get(field_name),
-                    related_node_ids=related_node_ids,
-                    filter_sensitive=filter_sensitive,
-                    permissions=permissions,
-                )
-            else:
-                response[field_name] = await field.to_graphql(
-                    db=db, filter_sensitive=filter_sensitive, permissions=permissions
-                )
-
-        return response
+        return await node_to_graphql(
+            node=self,
+            db=db,
+            fields=fields,
+            related_node_ids=related_node_ids,
+            filter_sensitive=filter_sensitive,
+            permissions=permissions,
+        )
 
     async def from_graphql(self, data: dict, db: InfrahubDatabase) -> bool:
         """Update object from a GraphQL payload."""
@@ -703,28 +717,100 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         return changed
 
     async def render_display_label(self, db: Optional[InfrahubDatabase] = None) -> str:  # pylint: disable=unused-argument
-        if not self._schema.display_labels:
-            return repr(self)
-
-        display_elements = []
-        for item in self._schema.display_labels:
-            item_elements = item.split("__")
-            if len(item_elements) != 2:
-                raise ValidationError("Display Label can only have one level")
-
-            if item_elements[0] not in self._schema.attribute_names:
-                raise ValidationError("Only Attribute can be used in Display Label")
-
-            attr = getattr(self, item_elements[0])
-            attr_value = getattr(attr, item_elements[1])
-            if isinstance(attr_value, Enum):
-                display_elements.append(attr_value.value)
+        return build_display_label(node=self)
+
+
+async def node_to_graphql(
+    node: Union[Node, ReadOnlyNode],
+    db: InfrahubDatabase,
+    fields: Optional[dict] = None,
+    related_node_ids: Optional[set] = None,
+    filter_sensitive: bool = False,
+    permissions: Optional[dict] = None,
+) -> dict:
+    """Generate the GraphQL Payload of the attributes of a node, shared by the nodes and their read-only projections."""
+    response: dict[str, Any] = {"id": node.id, KIND_GRAPHQL_FIELD_NAME: node.get_kind()}
+
+    if related_node_ids is not None:
+        related_node_ids.add(node.id)
+
+    schema = node.get_schema()
+    FIELD_NAME_TO_EXCLUDE = ["id"] + schema.relationship_names
+
+    if fields and isinstance(fields, dict):
+        field_names = [field_name for field_name in fields.keys() if field_name not in FIELD_NAME_TO_EXCLUDE]
+    else:
+        field_names = schema.attribute_names + ["__typename", "display_label"]
+
+    for field_name in field_names:
+        if field_name == "__typename":
+            # Note we already store kind within KIND_GRAPHQL_FIELD_NAME.
+            response[field_name] = node.get_kind()
+            continue
+
+        if field_name == "display_label":
+            response[field_name] = await node.render_display_label(db=db)
+            continue
+
+        if field_name == "hfid":
+            response[field_name] = await node.get_hfid(db=db)
+            continue
+
+        if field_name == "_updated_at":
+            updated_at = node.get_updated_at()
+            if updated_at:
+                response[field_name] = await updated_at.to_graphql()
             else:
-                display_elements.append(attr_value)
-
-        if not display_elements or all(de is None for de in display_elements):
-            return ""
-        display_label = " ".join([str(de) for de in display_elements])
-        if not display_label.strip():
-            return repr(self)
-        return display_label.strip()
+                response[field_name] = None
+            continue
+
+        field: Optional[Union[BaseAttribute, ReadOnlyAttribute]] = getattr(node, field_name, None)
+
+        if not field:
+            response[field_name] = None
+            continue
+
+        if fields and isinstance(fields, dict):
+            response[field_name] = await field.to_graphql(
+                db=db,
+                fields=fields.get(field_name),
+                related_node_ids=related_node_ids,
+                filter_sensitive=filter_sensitive,
+                permissions=permissions,
+            )
+        else:
+            response[field_name] = await field.to_graphql(
+                db=db, filter_sensitive=filter_sensitive, permissions=permissions
+            )
+
+    return response
+
+
+def build_display_label(node: Union[Node, ReadOnlyNode]) -> str:
+    """Build the display label of a node from its attributes, shared by the nodes and their read-only projections."""
+    schema = node.get_schema()
+    if not schema.display_labels:
+        return repr(node)
+
+    display_elements = []
+    for item in schema.display_labels:
+        item_elements = item.split("__")
+        if len(item_elements) != 2:
+            raise ValidationError("Display Label can only have one level")
+
+        if item_elements[0] not in schema.attribute_names:
+            raise ValidationError("Only Attribute can be used in Display Label")
+
+        attr = getattr(node, item_elements[0])
+        attr_value = getattr(attr, item_elements[1])
+        if isinstance(attr_value, Enum):
+            display_elements.append(attr_value.value)
+        else:
+            display_elements.append(attr_value)
+
+    if not display_elements or all(de is None for de in display_elements):
+        return ""
+    display_label = " ".join([str(de) for de in display_elements])
+    if not display_label.strip():
+        return repr(node)
+    return display_label.strip()
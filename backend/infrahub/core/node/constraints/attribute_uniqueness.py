@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
@@ -10,7 +10,7 @@ from infrahub.exceptions import ValidationError
 from .interface import NodeConstraintInterface
 
 if TYPE_CHECKING:
-    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.core.schema import AttributeSchema, MainSchemaTypes
 
 
 class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
@@ -18,6 +18,19 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
         self.db = db
         self.branch = branch
 
+    def _get_comparison_schema(
+        self, node_schema: "MainSchemaTypes", unique_attr: "AttributeSchema"
+    ) -> "MainSchemaTypes":
+        if unique_attr.inherited:
+            for generic_parent_schema_name in node_schema.inherit_from:
+                generic_parent_schema = self.db.schema.get(generic_parent_schema_name, branch=self.branch)
+                parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
+                if parent_attr is None:
+                    continue
+                if parent_attr.unique is True:
+                    return generic_parent_schema
+        return node_schema
+
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None:
         at = Timestamp(at)
         node_schema = node.get_schema()
@@ -25,17 +38,8 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
             if filters and unique_attr.name not in filters:
                 continue
 
-            comparison_schema: MainSchemaTypes = node_schema
+            comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
             attr = getattr(node, unique_attr.name)
-            if unique_attr.inherited:
-                for generic_parent_schema_name in node_schema.inherit_from:
-                    generic_parent_schema = self.db.schema.get(generic_parent_schema_name, branch=self.branch)
-                    parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
-                    if parent_attr is None:
-                        continue
-                    if parent_attr.unique is True:
-                        comparison_schema = generic_parent_schema
-                        break
             nodes = await registry.manager.query(
                 schema=comparison_schema,
                 filters={f"{unique_attr.name}__value": attr.value},
@@ -49,3 +53,53 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
                 raise ValidationError(
                     {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {attr.value}"}
                 )
+
+    async def check_many(
+        self, nodes: list[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Validate multiple nodes of the same kind with a single query per unique attribute.
+
+        The nodes are also validated against each other to detect duplicated values within the list.
+        """
+        if not nodes:
+            return
+
+        at = Timestamp(at)
+        node_schema = nodes[0].get_schema()
+        node_ids = {node.get_id() for node in nodes}
+        for unique_attr in node_schema.unique_attributes:
+            if filters and unique_attr.name not in filters:
+                continue
+
+            values: set[Any] = set()
+            for node in nodes:
+                value = getattr(node, unique_attr.name).value
+                if value is None:
+                    continue
+                if value in values:
+                    raise ValidationError(
+                        {unique_attr.name: f"Multiple objects are using the same value: {unique_attr.name}: {value}"}
+                    )
+                values.add(value)
+
+            if not values:
+                continue
+
+            existing_nodes = await registry.manager.query(
+                schema=self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr),
+                filters={f"{unique_attr.name}__values": list(values)},
+                fields={unique_attr.name: None},
+                db=self.db,
+                branch=self.branch,
+                at=at,
+            )
+
+            for existing_node in existing_nodes:
+                if existing_node.get_id() in node_ids:
+                    continue
+                value = getattr(existing_node, unique_attr.name).value
+                if value not in values:
+                    continue
+                raise ValidationError(
+                    {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {value}"}
+                )
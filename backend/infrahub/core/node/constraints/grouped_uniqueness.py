@@ -111,6 +111,10 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
         matching_node_ids = results_index.get_node_ids_for_value_group(schema_attribute_path_values)
         if not matching_node_ids:
             return
+        self._raise_violation(schema_attribute_path_values=schema_attribute_path_values)
+
+    @staticmethod
+    def _raise_violation(schema_attribute_path_values: list[SchemaAttributePathValue]) -> None:
         uniqueness_constraint_fields = []
         for sapv in schema_attribute_path_values:
             if sapv.relationship_schema:
@@ -159,13 +163,70 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
         await query.execute(db=self.db)
         await self._check_results(updated_node=node, path_groups=path_groups, query_results=query.get_results())
 
-    async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None:
-        node_schema = node.get_schema()
+    async def _check_many_one_schema(
+        self,
+        nodes: list[Node],
+        node_schema: MainSchemaTypes,
+        at: Optional[Timestamp] = None,
+        filters: Optional[list[str]] = None,
+    ) -> None:
+        schema_branch = self.db.schema.get_schema_branch(name=self.branch.name)
+        path_groups = node_schema.get_unique_constraint_schema_attribute_paths(schema_branch=schema_branch)
+        query_request = NodeUniquenessQueryRequest(kind=node_schema.kind)
+        for node in nodes:
+            node_query_request = self._build_query_request(
+                updated_node=node, node_schema=node_schema, path_groups=path_groups, filters=filters
+            )
+            query_request.unique_attribute_paths |= node_query_request.unique_attribute_paths
+            query_request.relationship_attribute_paths |= node_query_request.relationship_attribute_paths
+        if not query_request:
+            return
+        query = await NodeUniqueAttributeConstraintQuery.init(
+            db=self.db, branch=self.branch, at=at, query_request=query_request, min_count_required=0
+        )
+        await query.execute(db=self.db)
+        results_index = UniquenessQueryResultsIndex(
+            query_results=query.get_results(), exclude_node_ids={node.get_id() for node in nodes}
+        )
+
+        # The values of each constraint group are also compared between the nodes being validated
+        values_in_use: set[tuple[int, tuple[str, ...]]] = set()
+        for node in nodes:
+            for group_index, path_group in enumerate(path_groups):
+                schema_attribute_path_values = await self._get_node_attribute_path_values(
+                    updated_node=node, path_group=path_group
+                )
+                self._check_one_constraint_group(
+                    schema_attribute_path_values=schema_attribute_path_values, results_index=results_index
+                )
+                if any(sapv.value is None for sapv in schema_attribute_path_values):
+                    continue
+                values_key = (group_index, tuple(str(sapv.value) for sapv in schema_attribute_path_values))
+                if values_key in values_in_use:
+                    self._raise_violation(schema_attribute_path_values=schema_attribute_path_values)
+                values_in_use.add(values_key)
+
+    def _get_schemas_to_check(self, node_schema: MainSchemaTypes) -> list[MainSchemaTypes]:
         schemas_to_check: list[MainSchemaTypes] = [node_schema]
         if node_schema.inherit_from:
             for parent_schema_name in node_schema.inherit_from:
                 parent_schema = self.schema_branch.get(name=parent_schema_name, duplicate=False)
                 if parent_schema.uniqueness_constraints:
                     schemas_to_check.append(parent_schema)
-        for schema in schemas_to_check:
+        return schemas_to_check
+
+    async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None:
+        for schema in self._get_schemas_to_check(node_schema=node.get_schema()):
             await self._check_one_schema(node=node, node_schema=schema, at=at, filters=filters)
+
+    async def check_many(
+        self, nodes: list[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Validate multiple nodes of the same kind with a single query per schema.
+
+        The nodes are also validated against each other to detect duplicates within the list.
+        """
+        if not nodes:
+            return
+        for schema in self._get_schemas_to_check(node_schema=nodes[0].get_schema()):
+            await self._check_many_one_schema(nodes=nodes, node_schema=schema, at=at, filters=filters)
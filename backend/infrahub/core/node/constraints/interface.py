@@ -8,3 +8,10 @@ from infrahub.core.timestamp import Timestamp
 class NodeConstraintInterface(ABC):
     @abstractmethod
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None: ...
+
+    async def check_many(
+        self, nodes: list[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Validate multiple nodes of the same kind, by default the nodes are validated one by one."""
+        for node in nodes:
+            await self.check(node, at=at, filters=filters)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from infrahub.core.attribute import attribute_to_graphql
+from infrahub.core.constants import NULL_VALUE
+from infrahub.core.node import Node, build_display_label, node_to_graphql
+from infrahub.core.property import FlagPropertyMixin, NodePropertyMixin
+from infrahub.core.registry import registry
+from infrahub.core.timestamp import Timestamp
+from infrahub.types import ATTRIBUTE_TYPES
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.query.node import AttributeFromDB
+    from infrahub.core.schema import AttributeSchema, MainSchemaTypes, NodeSchema, ProfileSchema
+    from infrahub.database import InfrahubDatabase
+
+NODE_FIELDS = {"id", "__typename", "display_label", "hfid", "_updated_at"}
+ATTRIBUTE_FIELDS = {
+    "__typename",
+    "id",
+    "value",
+    "is_default",
+    "is_from_profile",
+    "is_visible",
+    "is_protected",
+    "updated_at",
+    "permissions",
+    "source",
+    "owner",
+}
+
+
+def supports_read_only(schema: MainSchemaTypes, node_class: type[Node], fields: Optional[dict]) -> bool:
+    """Indicate if the requested fields of a node can be generated from a ReadOnlyNode.
+
+    Only the nodes without a specific class are supported, and only the fields derived from the data stored in the
+    database. The other fields, like the properties computed by some attribute classes or an hfid built from the
+    attributes of the peers, require a complete Node.
+    """
+    if node_class is not Node or not fields:
+        return False
+
+    for field_name, field_value in fields.items():
+        if field_name in schema.relationship_names:
+            continue
+        if field_name == "hfid":
+            if any(item.split("__")[0] not in schema.attribute_names for item in schema.human_friendly_id or []):
+                return False
+            continue
+        if field_name in NODE_FIELDS:
+            continue
+        if field_name not in schema.attribute_names:
+            return False
+        if isinstance(field_value, dict) and not set(field_value.keys()) <= ATTRIBUTE_FIELDS:
+            return False
+
+    return True
+
+
+class ReadOnlyAttribute:
+    """Attribute of a ReadOnlyNode, with the values loaded from the database and no validation."""
+
+    __slots__ = (
+        "_owner",
+        "_source",
+        "at",
+        "branch",
+        "id",
+        "is_default",
+        "is_from_profile",
+        "is_protected",
+        "is_visible",
+        "name",
+        "owner_id",
+        "schema",
+        "source_id",
+        "updated_at",
+        "value",
+    )
+
+    _flag_properties = FlagPropertyMixin._flag_properties
+    _node_properties = NodePropertyMixin._node_properties
+
+    def __init__(
+        self,
+        name: str,
+        schema: AttributeSchema,
+        branch: Branch,
+        at: Timestamp,
+        data: Optional[AttributeFromDB] = None,
+    ) -> None:
+        self.name = name
+        self.schema = schema
+        self.branch = branch
+        self.at = at
+        self.id: Optional[str] = None
+        self.value: Any = None
+        self.is_default = True
+        self.is_from_profile = False
+        self.is_visible = True
+        self.is_protected = False
+        self.source_id: Optional[str] = None
+        self.owner_id: Optional[str] = None
+        self._source: Optional[Node] = None
+        self._owner: Optional[Node] = None
+        self.updated_at: Optional[Timestamp] = None
+
+        if data:
+            self._load(data=data)
+
+        if self.value is None and self.schema.default_value is not None:
+            self.value = self.schema.default_value
+            self.is_default = True
+
+        if self.schema.enum and self.value:
+            self.value = self.schema.convert_value_to_enum(self.value)
+
+    def _load(self, data: AttributeFromDB) -> None:
+        if data.value != NULL_VALUE:
+            # The deserialization of the attribute classes only depends on the data coming from the database
+            attr_class = ATTRIBUTE_TYPES[self.schema.kind].get_infrahub_class()
+            self.value = attr_class.deserialize_value(self, data=data)  # type: ignore[arg-type]
+        self.is_default = data.is_default
+        self.is_from_profile = data.is_from_profile
+        self.id = data.attr_uuid
+        self.is_visible = data.flag_properties.get("is_visible", True)
+        self.is_protected = data.flag_properties.get("is_protected", False) or False
+        if "source" in data.node_properties:
+            self.source_id = data.node_properties["source"].uuid
+        if "owner" in data.node_properties:
+            self.owner_id = data.node_properties["owner"].uuid
+        if data.updated_at:
+            self.updated_at = Timestamp(data.updated_at)
+
+    def get_kind(self) -> str:
+        return self.schema.kind
+
+    async def get_source(self, db: InfrahubDatabase) -> Optional[Node]:
+        if self._source is None and self.source_id:
+            self._source = await registry.manager.get_one(db=db, id=self.source_id, branch=self.branch, at=self.at)
+        return self._source
+
+    async def get_owner(self, db: InfrahubDatabase) -> Optional[Node]:
+        if self._owner is None and self.owner_id:
+            self._owner = await registry.manager.get_one(db=db, id=self.owner_id, branch=self.branch, at=self.at)
+        return self._owner
+
+    async def to_graphql(
+        self,
+        db: InfrahubDatabase,
+        fields: Optional[dict] = None,
+        related_node_ids: Optional[set] = None,
+        filter_sensitive: bool = False,
+        permissions: Optional[dict] = None,
+    ) -> dict:
+        return await attribute_to_graphql(
+            attr=self,
+            db=db,
+            fields=fields,
+            related_node_ids=related_node_ids,
+            filter_sensitive=filter_sensitive,
+            permissions=permissions,
+        )
+
+
+class ReadOnlyNode:
+    """Lightweight projection of a node to generate its GraphQL payload.
+
+    The attributes are loaded without validation and the relationships are not initialized,
+    it must only be used to return the result of a query.
+    """
+
+    __slots__ = ("_at", "_attributes", "_branch", "_schema", "_updated_at", "db_id", "id")
+
+    def __init__(
+        self,
+        schema: Union[NodeSchema, ProfileSchema],
+        branch: Branch,
+        at: Timestamp,
+        id: str,
+        db_id: Optional[str] = None,
+        updated_at: Optional[Union[Timestamp, str]] = None,
+        attributes: Optional[dict[str, AttributeFromDB]] = None,
+    ) -> None:
+        self._schema = schema
+        self._branch = branch
+        self._at = at
+        self.id = id
+        self.db_id = db_id
+        self._updated_at = Timestamp(updated_at) if updated_at else None
+        attributes = attributes or {}
+        self._attributes = {
+            attr_schema.name: ReadOnlyAttribute(
+                name=attr_schema.name,
+                schema=attr_schema,
+                branch=branch,
+                at=at,
+                data=attributes.get(attr_schema.name),
+            )
+            for attr_schema in schema.attributes
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.get_kind()}(ID: {str(self.id)})"
+
+    def __getattr__(self, name: str) -> ReadOnlyAttribute:
+        try:
+            return self._attributes[name]
+        except KeyError as exc:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {name!r}") from exc
+
+    def get_id(self) -> str:
+        return self.id
+
+    def get_kind(self) -> str:
+        return self._schema.kind
+
+    def get_schema(self) -> Union[NodeSchema, ProfileSchema]:
+        return self._schema
+
+    def get_updated_at(self) -> Optional[Timestamp]:
+        return self._updated_at
+
+    def get_branch_based_on_support_type(self) -> Branch:
+        return self._branch
+
+    async def render_display_label(self, db: Optional[InfrahubDatabase] = None) -> str:  # pylint: disable=unused-argument
+        return build_display_label(node=self)
+
+    async def get_hfid(self, db: InfrahubDatabase, include_kind: bool = False) -> Optional[list[str]]:  # pylint: disable=unused-argument
+        if not self._schema.human_friendly_id:
+            return None
+
+        hfid = []
+        for item in self._schema.human_friendly_id:
+            attr_name, property_name = item.split("__")
+            hfid.append(getattr(self._attributes[attr_name], property_name))
+        if include_kind:
+            return [self.get_kind()] + hfid
+        return hfid
+
+    async def to_graphql(
+        self,
+        db: InfrahubDatabase,
+        fields: Optional[dict] = None,
+        related_node_ids: Optional[set] = None,
+        filter_sensitive: bool = False,
+        permissions: Optional[dict] = None,
+    ) -> dict:
+        return await node_to_graphql(
+            node=self,
+            db=db,
+            fields=fields,
+            related_node_ids=related_node_ids,
+            filter_sensitive=filter_sensitive,
+            permissions=permissions,
+        )
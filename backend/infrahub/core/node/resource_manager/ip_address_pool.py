@@ -11,7 +11,7 @@ from infrahub.core.query.resource_manager import (
     IPAddressPoolSetReserved,
 )
 from infrahub.exceptions import PoolExhaustedError, ValidationError
-from infrahub.pools.address import get_available
+from infrahub.pools.address import IPAddressAllocator
 
 from .. import Node
 
@@ -78,10 +78,17 @@ class CoreIPAddressPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: Optional[int] = None) -> IPAddressType:
-        # Measure utilization of all prefixes identified as resources
+        addresses = await self.get_next_addresses(db=db, prefixlen=prefixlen, count=1)
+        return addresses[0]
+
+    async def get_next_addresses(
+        self, db: InfrahubDatabase, count: int, prefixlen: Optional[int] = None
+    ) -> list[IPAddressType]:
+        """Find the next `count` available addresses, across all the prefixes identified as resources."""
         resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
         ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
 
+        next_addresses: list[IPAddressType] = []
         for resource in resources.values():
             ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
             prefix_length = prefixlen or ip_prefix.prefixlen
@@ -93,14 +100,16 @@ class CoreIPAddressPool(Node):
                 db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
             )
 
-            available = get_available(
+            allocator = IPAddressAllocator(
                 network=ip_prefix,
                 addresses=[ip.address for ip in addresses],
                 is_pool=resource.is_pool.value,  # type: ignore[attr-defined]
             )
-
-            if available:
-                next_address = available.iter_cidrs()[0]
-                return ipaddress.ip_interface(f"{next_address.ip}/{prefix_length}")
+            next_addresses.extend(
+                ipaddress.ip_interface(f"{address}/{prefix_length}")
+                for address in allocator.get(count=count - len(next_addresses))
+            )
+            if len(next_addresses) == count:
+                return next_addresses
 
         raise PoolExhaustedError("There are no more addresses available in this pool.")
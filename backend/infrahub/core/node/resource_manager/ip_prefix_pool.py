@@ -10,7 +10,7 @@ from infrahub.core.query.resource_manager import (
     PrefixPoolGetReserved,
     PrefixPoolSetReserved,
 )
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.prefix import prefix_pool_cache
 
 from .. import Node
 
@@ -95,13 +95,13 @@ class CoreIPPrefixPool(Node):
                 branch_agnostic=True,
             )
 
-            pool = PrefixPool(resource.prefix.value)  # type: ignore[attr-defined]
-            for subnet in subnets:
-                pool.reserve(subnet=str(subnet.prefix))
-
             try:
-                next_available = pool.get(prefixlen=prefixlen)
-                return next_available
+                return prefix_pool_cache.allocate(
+                    key=(self.id, self._branch.name, resource.id),
+                    network=resource.prefix.value,  # type: ignore[attr-defined]
+                    subnets=[str(subnet.prefix) for subnet in subnets],
+                    prefixlen=prefixlen,
+                )
             except IndexError:
                 continue
 
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from infrahub.core.query.resource_manager import NumberPoolGetReserved, NumberPoolGetUsed, NumberPoolSetReserved
+from infrahub_sdk.uuidt import UUIDT
+
+from infrahub.core.query.resource_manager import (
+    NumberPoolGetFree,
+    NumberPoolGetReservations,
+    NumberPoolSetReservations,
+)
 from infrahub.exceptions import PoolExhaustedError
 
 from .. import Node
@@ -21,46 +27,72 @@ class CoreNumberPool(Node):
         identifier: Optional[str] = None,
     ) -> int:
         identifier = identifier or node.get_id()
-        # Check if there is already a resource allocated with this identifier
-        # if not, pull all existing prefixes and allocated the next available
+        numbers = await self.get_resources(db=db, branch=branch, identifiers=[identifier])
+        return numbers[0]
+
+    async def get_resources(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        count: Optional[int] = None,
+        identifiers: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Allocate one number per identifier, or `count` numbers with new identifiers, with a fixed number of queries.
+
+        The numbers already reserved for an identifier are returned as is. A reserved number is held until it's
+        assigned to a node, and is released once this node is deleted. The numbers allocated with a count can't be
+        retrieved again with their identifiers, they are held the same way until they are assigned.
+        """
+        if identifiers is None:
+            if count is None:
+                raise ValueError("A count or a list of identifiers must be provided to allocate numbers")
+            identifiers = [str(UUIDT()) for _ in range(count)]
+        elif count is not None and count != len(identifiers):
+            raise ValueError(f"The count ({count}) doesn't match the number of identifiers ({len(identifiers)})")
+
+        # Check if there are already numbers allocated with these identifiers
         # TODO add support for branch, if the node is reserved with this id in another branch we should return an error
-        query_get = await NumberPoolGetReserved.init(db=db, branch=branch, pool_id=self.id, identifier=identifier)
+        query_get = await NumberPoolGetReservations.init(db=db, branch=branch, pool_id=self.id, identifiers=identifiers)
         await query_get.execute(db=db)
-        reservation = query_get.get_reservation()
-        if reservation is not None:
-            return reservation
+        reservations = query_get.get_reservations()
 
-        # If we have not returned a value we need to find one if avaiable
-        number = await self.get_next(db=db, branch=branch)
+        # For the others we need to find the next numbers available
+        missing_identifiers = [
+            identifier for identifier in dict.fromkeys(identifiers) if identifier not in reservations
+        ]
+        if missing_identifiers:
+            numbers = await self.get_next_numbers(db=db, branch=branch, count=len(missing_identifiers))
+            new_reservations = dict(zip(missing_identifiers, numbers))
 
-        query_set = await NumberPoolSetReserved.init(
-            db=db, pool_id=self.get_id(), identifier=identifier, reserved=number
-        )
-        await query_set.execute(db=db)
+            query_set = await NumberPoolSetReservations.init(
+                db=db, pool_id=self.get_id(), reservations=new_reservations
+            )
+            await query_set.execute(db=db)
+            reservations.update(new_reservations)
 
-        return number
+        return [reservations[identifier] for identifier in identifiers]
 
     async def get_next(self, db: InfrahubDatabase, branch: Branch) -> int:
-        query = await NumberPoolGetUsed.init(db=db, branch=branch, pool=self, branch_agnostic=True)
+        numbers = await self.get_next_numbers(db=db, branch=branch, count=1)
+        return numbers[0]
+
+    async def get_next_numbers(self, db: InfrahubDatabase, branch: Branch, count: int) -> list[int]:
+        # Each free range contains at least one number
+        query = await NumberPoolGetFree.init(db=db, branch=branch, pool=self, branch_agnostic=True, limit=count)
         await query.execute(db=db)
-        taken = [result.get_as_optional_type("av.value", return_type=int) for result in query.results]
-        next_number = find_next_free(
-            start=self.start_range.value,  # type: ignore[attr-defined]
-            end=self.end_range.value,  # type: ignore[attr-defined]
-            taken=taken,
-        )
-        if next_number is None:
+        numbers = find_next_free(free_ranges=query.get_free_ranges(), count=count)
+        if len(numbers) < count:
             raise PoolExhaustedError("There are no more addresses available in this pool.")
 
-        return next_number
-
+        return numbers
 
-def find_next_free(start: int, end: int, taken: list[int | None]) -> Optional[int]:
-    used_numbers = [number for number in taken if number is not None]
-    used_set = set(used_numbers)
 
-    for num in range(start, end + 1):
-        if num not in used_set:
-            return num
+def find_next_free(free_ranges: list[tuple[int, int]], count: int = 1) -> list[int]:
+    """Return the first `count` numbers of the free ranges, fewer if the ranges don't contain enough numbers."""
+    numbers: list[int] = []
+    for range_start, range_end in sorted(free_ranges):
+        numbers.extend(range(range_start, min(range_end, range_start + count - len(numbers) - 1) + 1))
+        if len(numbers) >= count:
+            break
 
-    return None
+    return numbers
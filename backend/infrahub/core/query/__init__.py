@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Iterator, Optional, TypeVar, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -558,27 +558,56 @@ class Query(ABC):
         return self
 
     async def query_with_size_limit(self, db: InfrahubDatabase) -> list[Record]:
-        query_limit = config.SETTINGS.database.query_size_limit
-        offset = 0
+        """Execute the query once and read all its records, pulling at most query_size_limit records at once."""
         results: list[Record] = []
-        remaining = True
-        while remaining:
-            offset_results, metadata = await db.execute_query_with_metadata(
-                query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
-                name=self.name,
-                context=self.get_context(),
-            )
-            if "stats" in metadata:
-                self.stats.add(metadata.get("stats"))
-            results.extend(offset_results)
-            offset += query_limit
-
-            if len(offset_results) < query_limit:
-                remaining = False
+        async for records in self._stream_records(db=db):
+            results.extend(records)
 
         return results
 
+    async def stream(self, db: InfrahubDatabase, fetch_size: Optional[int] = None) -> AsyncIterator[QueryResult]:
+        """Execute a READ query once and return its results as they are read from the database.
+
+        Unlike execute(), the results are not stored in self.results and are not sorted by branch score,
+        the memory used remains bounded by the fetch_size, itself capped by query_size_limit.
+        """
+        if self.type == QueryType.WRITE:
+            raise TypeError("Unable to stream the results of a Write query.")
+        if self.type != QueryType.READ:
+            raise ValueError(f"unknown value for {self.type}")
+
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        has_results = False
+        async for records in self._stream_records(db=db, fetch_size=fetch_size):
+            has_results = True
+            for record in records:
+                yield QueryResult(data=record, labels=self.return_labels)
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query=self.get_query(), params=self.params)
+
+        self.has_been_executed = True
+
+    async def _stream_records(
+        self, db: InfrahubDatabase, fetch_size: Optional[int] = None
+    ) -> AsyncIterator[list[Record]]:
+        query_size_limit = config.SETTINGS.database.query_size_limit
+        metadata: dict[str, Any] = {}
+        async for records in db.stream_query(
+            query=self.get_query(),
+            params=self.params,
+            name=self.name,
+            context=self.get_context(),
+            fetch_size=min(fetch_size or query_size_limit, query_size_limit),
+            metadata=metadata,
+        ):
+            yield records
+
+        if "stats" in metadata:
+            self.stats.add(metadata.get("stats"))
+
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
         OFFSET and LIMIT are automatically excluded when counting.
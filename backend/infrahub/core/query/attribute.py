@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from infrahub.core.constants import AttributeDBNodeType
 from infrahub.core.constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSHIP_TO_VALUE_LABEL
 from infrahub.core.constants.schema import FlagProperty, NodeProperty
 from infrahub.core.query import Query, QueryNode, QueryRel, QueryType
@@ -37,123 +36,6 @@ class AttributeQuery(Query):
         super().__init__(**kwargs)
 
 
-class AttributeUpdateValueQuery(AttributeQuery):
-    name = "attribute_update_value"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        content = self.attr.to_db()
-        self.params.update(self.attr.to_db())
-
-        prop_list = [f"{key}: ${key}" for key in content.keys()]
-
-        labels = ["AttributeValue"]
-        node_type = self.attr.get_db_node_type()
-        if node_type == AttributeDBNodeType.IPHOST:
-            labels.append("AttributeIPHost")
-        elif node_type == AttributeDBNodeType.IPNETWORK:
-            labels.append("AttributeIPNetwork")
-
-        query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (av:%(labels)s { %(props)s } )
-        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(av)
-        """ % {"rel_label": self.attr._rel_to_value_label, "labels": ":".join(labels), "props": ", ".join(prop_list)}
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "av", "r"]
-
-
-class AttributeUpdateFlagQuery(AttributeQuery):
-    name = "attribute_update_flag"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    def __init__(
-        self,
-        flag_name: str,
-        **kwargs: Any,
-    ) -> None:
-        SUPPORTED_FLAGS = ["is_visible", "is_protected"]
-
-        if flag_name not in SUPPORTED_FLAGS:
-            raise ValueError(f"Only {SUPPORTED_FLAGS} are supported for now.")
-
-        self.flag_name = flag_name
-
-        super().__init__(**kwargs)
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["flag_value"] = getattr(self.attr, self.flag_name)
-        self.params["flag_type"] = self.attr.get_kind()
-
-        query = """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MERGE (flag:Boolean { value: $flag_value })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(flag)
-        """ % self.flag_name.upper()
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "flag", "r"]
-
-
-class AttributeUpdateNodePropertyQuery(AttributeQuery):
-    name = "attribute_update_node_property"
-    type: QueryType = QueryType.WRITE
-
-    raise_error_if_empty: bool = True
-
-    def __init__(
-        self,
-        prop_name: str,
-        prop_id: str,
-        **kwargs: Any,
-    ):
-        self.prop_name = prop_name
-        self.prop_id = prop_id
-
-        super().__init__(**kwargs)
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
-        at = self.at or self.attr.at
-
-        self.params["attr_uuid"] = self.attr.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["at"] = at.to_string()
-        self.params["prop_name"] = self.prop_name
-        self.params["prop_id"] = self.prop_id
-
-        rel_name = f"HAS_{self.prop_name.upper()}"
-
-        query = (
-            """
-        MATCH (a:Attribute { uuid: $attr_uuid })
-        MATCH (np:Node { uuid: $prop_id })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(np)
-        """
-            % rel_name
-        )
-
-        self.add_to_query(query)
-        self.return_labels = ["a", "np", "r"]
-
-
 class AttributeGetQuery(AttributeQuery):
     name = "attribute_get"
     type: QueryType = QueryType.READ
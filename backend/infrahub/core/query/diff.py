@@ -531,6 +531,7 @@ class DiffAllPathsQuery(DiffQuery):
         branch_support: list[BranchSupportType] | None = None,
         current_node_field_specifiers: list[tuple[str, str]] | None = None,
         new_node_field_specifiers: list[tuple[str, str]] | None = None,
+        changed_node_uuids: list[str] | None = None,
         **kwargs: Any,
     ):
         self.base_branch = base_branch
@@ -538,6 +539,8 @@ class DiffAllPathsQuery(DiffQuery):
         self.branch_support = branch_support or [BranchSupportType.AWARE]
         self.current_node_field_specifiers = current_node_field_specifiers
         self.new_node_field_specifiers = new_node_field_specifiers
+        # Optional list of the only nodes that can have changed on the branch during the timeframe
+        self.changed_node_uuids = changed_node_uuids
 
         super().__init__(**kwargs)
 
@@ -554,6 +557,7 @@ class DiffAllPathsQuery(DiffQuery):
                 "branch_support": [item.value for item in self.branch_support],
                 "new_node_field_specifiers": self.new_node_field_specifiers,
                 "current_node_field_specifiers": self.current_node_field_specifiers,
+                "changed_node_uuids": self.changed_node_uuids,
             }
         )
         query = """
@@ -575,6 +579,7 @@ CALL {
         // -------------------------------------
         MATCH (q:Root)<-[diff_rel:IS_PART_OF {branch: $branch_name}]-(p:Node)
         WHERE (node_ids_list IS NULL OR p.uuid IN node_ids_list)
+        AND ($changed_node_uuids IS NULL OR p.uuid IN $changed_node_uuids)
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
@@ -654,6 +659,7 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:HAS_ATTRIBUTE {branch: $branch_name}]->(q:Attribute)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND ($changed_node_uuids IS NULL OR p.uuid IN $changed_node_uuids)
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -670,6 +676,7 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:IS_RELATED {branch: $branch_name}]-(q:Relationship)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND ($changed_node_uuids IS NULL OR p.uuid IN $changed_node_uuids)
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -766,6 +773,7 @@ CALL {
         // -------------------------------------
         MATCH diff_rel_path = (root:Root)<-[r_root:IS_PART_OF]-(n:Node)-[r_node]-(p)-[diff_rel {branch: $branch_name}]->(q)
         WHERE (node_field_specifiers_list IS NULL OR [n.uuid, p.name] IN node_field_specifiers_list)
+        AND ($changed_node_uuids IS NULL OR n.uuid IN $changed_node_uuids)
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         // exclude attributes and relationships under added/removed nodes, attrs, and rels b/c they are covered above
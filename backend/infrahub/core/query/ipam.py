@@ -2,20 +2,23 @@ from __future__ import annotations
 
 import ipaddress
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional, Union
 
-from infrahub.core.constants import InfrahubKind
+from infrahub_sdk.uuidt import UUIDT
+
+from infrahub.core.constants import InfrahubKind, RelationshipStatus
 from infrahub.core.ipam.constants import AllIPTypes, IPAddressType, IPNetworkType
 from infrahub.core.registry import registry
 from infrahub.core.utils import convert_ip_to_binary_str
 
-from . import Query
+from . import Query, QueryType
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.schema import RelationshipSchema
     from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
@@ -36,6 +39,30 @@ class IPAddressData:
     address: IPAddressType
 
 
+@dataclass
+class IPNodeTreeData:
+    id: str
+    kind: str
+    ip_value: AllIPTypes
+    current_parent_id: Optional[str]
+
+
+@dataclass
+class IPNodeParentUpdate:
+    node_id: str
+    current_parent_id: Optional[str]
+    new_parent_id: Optional[str]
+
+
+@dataclass
+class PrefixUtilizationData:
+    """Space used by the children of a prefix, per branch of the children."""
+
+    prefix_id: str
+    used_prefix_space: dict[str, int]
+    used_addresses: dict[str, int]
+
+
 def _get_namespace_id(
     namespace: Optional[Union[Node, str]] = None,
 ) -> str:
@@ -245,12 +272,12 @@ async def get_ip_addresses(
 class IPPrefixUtilization(Query):
     name: str = "ipprefix_utilization_prefix"
 
-    def __init__(self, ip_prefixes: list[str], **kwargs):
+    def __init__(self, ip_prefixes: list[Union[Node, str]], **kwargs):
         self.ip_prefixes = ip_prefixes
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        self.params["ids"] = [p.get_id() for p in self.ip_prefixes]
+        self.params["ids"] = [p if isinstance(p, str) else p.get_id() for p in self.ip_prefixes]
         self.params["time_at"] = self.at.to_string()
 
         def rel_filter(rel_name: str) -> str:
@@ -573,3 +600,385 @@ class IPPrefixReconcileQuery(Query):
 
     def get_calculated_children_uuids(self) -> list[str]:
         return self._get_uuids_from_query_list("new_children")
+
+
+class IPNamespaceTreeQuery(Query):
+    """Get all the prefixes and addresses of a namespace with their value and their current parent."""
+
+    name: str = "ip_namespace_tree"
+
+    def __init__(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        **kwargs,
+    ):
+        self.namespace_id = _get_namespace_id(namespace)
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["namespace_id"] = self.namespace_id
+        self.params["ip_address_kind"] = InfrahubKind.IPADDRESS
+        self.params["ip_prefix_attribute_kind"] = PREFIX_ATTRIBUTE_LABEL
+        self.params["ip_address_attribute_kind"] = ADDRESS_ATTRIBUTE_LABEL
+
+        query = """
+        // Get all the IP nodes of the namespace
+        MATCH (ip_namespace:%(namespace_kind)s {uuid: $namespace_id})-[r:IS_PART_OF]->(:Root)
+        WHERE %(branch_filter)s
+        WITH DISTINCT ip_namespace
+        MATCH ns_path = (ip_namespace)-[:IS_RELATED]-(ns_rel:Relationship)-[:IS_RELATED]-(ip_node:Node)
+        WHERE ns_rel.name IN ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+        AND all(r IN relationships(ns_path) WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH DISTINCT ip_node
+        // Get the latest value of each IP node
+        CALL {
+            WITH ip_node
+            MATCH (ip_node)-[har:HAS_ATTRIBUTE]->(a:Attribute)-[hvr:HAS_VALUE]->(av:AttributeValue)
+            WHERE a.name IN ["prefix", "address"]
+            AND any(attr_kind IN [$ip_prefix_attribute_kind, $ip_address_attribute_kind] WHERE attr_kind IN labels(av))
+            AND all(r IN [har, hvr] WHERE (%(branch_filter)s))
+            WITH
+                av,
+                (har.status = "active" AND hvr.status = "active") AS is_active,
+                har.branch_level + hvr.branch_level AS branch_level,
+                har.from AS har_from,
+                hvr.from AS hvr_from
+            ORDER BY branch_level DESC, har_from DESC, hvr_from DESC
+            LIMIT 1
+            RETURN av, is_active
+        }
+        WITH ip_node, av
+        WHERE is_active = TRUE
+        // Get the current parent of each IP node, if it exists
+        OPTIONAL MATCH prefix_parent_path = (ip_node)-[:IS_RELATED]->(:Relationship {name: "parent__child"})-[:IS_RELATED]->(prefix_parent:%(ip_prefix_kind)s)
+        WHERE all(r IN relationships(prefix_parent_path) WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH ip_node, av, head(collect(prefix_parent.uuid)) AS prefix_parent_uuid
+        OPTIONAL MATCH address_parent_path = (ip_node)-[:IS_RELATED]-(:Relationship {name: "ip_prefix__ip_address"})-[:IS_RELATED]-(address_parent:%(ip_prefix_kind)s)
+        WHERE $ip_address_kind IN labels(ip_node)
+        AND all(r IN relationships(address_parent_path) WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH ip_node, av, prefix_parent_uuid, head(collect(address_parent.uuid)) AS address_parent_uuid
+        WITH
+            ip_node.uuid AS node_uuid,
+            ip_node.kind AS node_kind,
+            av.value AS ip_value,
+            $ip_address_kind IN labels(ip_node) AS is_address,
+            coalesce(prefix_parent_uuid, address_parent_uuid) AS current_parent_uuid
+        """ % {
+            "branch_filter": branch_filter,
+            "namespace_kind": InfrahubKind.IPNAMESPACE,
+            "ip_prefix_kind": InfrahubKind.IPPREFIX,
+        }
+        self.add_to_query(query)
+        self.return_labels = ["node_uuid", "node_kind", "ip_value", "is_address", "current_parent_uuid"]
+
+    async def stream_nodes(self, db: InfrahubDatabase) -> AsyncIterator[IPNodeTreeData]:
+        """Execute the query and return the IP nodes of the namespace as they are read from the database."""
+        async for result in self.stream(db=db):
+            ip_value = result.get_as_type("ip_value", return_type=str)
+            yield IPNodeTreeData(
+                id=result.get_as_type("node_uuid", return_type=str),
+                kind=result.get_as_type("node_kind", return_type=str),
+                ip_value=ipaddress.ip_interface(ip_value)
+                if result.get_as_type("is_address", return_type=bool)
+                else ipaddress.ip_network(ip_value),
+                current_parent_id=result.get_as_optional_type("current_parent_uuid", return_type=str),
+            )
+
+
+class IPNodeParentUpdateQuery(Query):
+    """Move multiple IP nodes of the same kind under their new parent in a single query.
+
+    The relationships with the current parents are deleted, the relationships with the new parents are created
+    and the attribute is_top_level of the prefixes is updated if its value has changed.
+    """
+
+    name: str = "ip_node_parent_update"
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    def __init__(self, rel_schema: RelationshipSchema, updates: list[IPNodeParentUpdate], is_prefix: bool, **kwargs):
+        self.rel_schema = rel_schema
+        self.updates = updates
+        self.is_prefix = is_prefix
+        super().__init__(**kwargs)
+
+    def _get_rel_prop(self, status: RelationshipStatus) -> dict[str, Any]:
+        rel_prop: dict[str, Any] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": status.value,
+            "from": self.at.to_string(),
+        }
+        if self.rel_schema.hierarchical:
+            rel_prop["hierarchy"] = self.rel_schema.hierarchical
+        return rel_prop
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        edge_filter, edge_params = self.branch.get_query_filter_path(at=self.at.to_string(), variable_name="edge")
+        self.params.update(branch_params)
+        self.params.update(edge_params)
+        self.params["branch"] = self.branch.name
+        self.params["at"] = self.at.to_string()
+        self.params["rel_identifier"] = self.rel_schema.identifier
+        self.params["branch_support"] = self.rel_schema.branch.value
+        self.params["rel_prop"] = self._get_rel_prop(status=RelationshipStatus.ACTIVE)
+        self.params["deleted_rel_prop"] = self._get_rel_prop(status=RelationshipStatus.DELETED)
+        self.params["value_rel_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": RelationshipStatus.ACTIVE.value,
+            "from": self.at.to_string(),
+        }
+        updates = []
+        for update in self.updates:
+            is_moved = update.current_parent_id != update.new_parent_id
+            updates.append(
+                {
+                    "node_id": update.node_id,
+                    "current_parent_id": update.current_parent_id if is_moved else None,
+                    "new_parent_id": update.new_parent_id if is_moved else None,
+                    "rel_uuid": str(UUIDT()),
+                    "is_top_level": update.new_parent_id is None,
+                }
+            )
+        self.params["updates"] = updates
+
+        arrows = self.rel_schema.get_query_arrows()
+        path_str = (
+            f"{arrows.left.start}[:IS_RELATED]{arrows.left.end}(rl:Relationship){arrows.right.start}"
+            f"[:IS_RELATED]{arrows.right.end}"
+        )
+        r1 = f"{arrows.left.start}[:IS_RELATED $%(rel_prop)s ]{arrows.left.end}"
+        r2 = f"{arrows.right.start}[:IS_RELATED $%(rel_prop)s ]{arrows.right.end}"
+
+        property_queries = []
+        for property_type in ["IS_VISIBLE", "IS_PROTECTED", "HAS_OWNER", "HAS_SOURCE"]:
+            property_queries.append(
+                """
+                CALL {
+                    WITH rl
+                    MATCH (rl)-[edge:%(property_type)s]->(property)
+                    WHERE %(edge_filter)s AND edge.status = "active"
+                    WITH rl, edge, property
+                    ORDER BY edge.branch_level DESC, edge.from DESC
+                    LIMIT 1
+                    CREATE (rl)-[:%(property_type)s $deleted_rel_prop]->(property)
+                    WITH edge
+                    WHERE edge.branch = $branch
+                    SET edge.to = $at
+                }
+                """
+                % {"property_type": property_type, "edge_filter": edge_filter}
+            )
+
+        query = """
+        UNWIND $updates AS item
+        MATCH (n:Node { uuid: item.node_id })
+        // Delete the relationship with the current parent
+        CALL {
+            WITH n, item
+            MATCH path = (n)%(path)s(current_parent:Node { uuid: item.current_parent_id })
+            WHERE rl.name = $rel_identifier
+            AND all(r IN relationships(path) WHERE (%(branch_filter)s))
+            WITH
+                n,
+                rl,
+                current_parent,
+                relationships(path) AS rels,
+                reduce(br_lvl = 0, r IN relationships(path) | br_lvl + r.branch_level) AS branch_level,
+                %(froms)s AS froms
+            ORDER BY branch_level DESC, froms[-1] DESC, froms[-2] DESC
+            LIMIT 1
+            WITH n, rl, current_parent, rels
+            WHERE all(r IN rels WHERE r.status = "active")
+            CREATE (n)%(deleted_r1)s(rl)
+            CREATE (rl)%(deleted_r2)s(current_parent)
+            WITH rl
+            %(property_queries)s
+        }
+        // Create the relationship with the new parent
+        CALL {
+            WITH n, item
+            MATCH (new_parent:Node { uuid: item.new_parent_id })
+            CREATE (rl:Relationship { uuid: item.rel_uuid, name: $rel_identifier, branch_support: $branch_support })
+            CREATE (n)%(r1)s(rl)
+            CREATE (rl)%(r2)s(new_parent)
+            MERGE (is_protected:Boolean { value: false })
+            MERGE (is_visible:Boolean { value: true })
+            CREATE (rl)-[:IS_PROTECTED $rel_prop ]->(is_protected)
+            CREATE (rl)-[:IS_VISIBLE $rel_prop ]->(is_visible)
+        }
+        """ % {
+            "path": path_str,
+            "branch_filter": branch_filter,
+            "froms": db.render_list_comprehension(items="relationships(path)", item_name="from"),
+            "deleted_r1": r1 % {"rel_prop": "deleted_rel_prop"},
+            "deleted_r2": r2 % {"rel_prop": "deleted_rel_prop"},
+            "r1": r1 % {"rel_prop": "rel_prop"},
+            "r2": r2 % {"rel_prop": "rel_prop"},
+            "property_queries": "\n".join(property_queries),
+        }
+        self.add_to_query(query)
+
+        if not self.is_prefix:
+            return
+
+        query = """
+        // Change the value of is_top_level if needed
+        CALL {
+            WITH n, item
+            MATCH (n)-[har:HAS_ATTRIBUTE]->(a:Attribute { name: "is_top_level" })-[hvr:HAS_VALUE]->(av:AttributeValue)
+            WHERE all(r IN [har, hvr] WHERE (%(branch_filter)s))
+            WITH item, a, hvr, av
+            ORDER BY hvr.branch_level DESC, hvr.from DESC
+            LIMIT 1
+            WITH item, a, hvr, av
+            WHERE hvr.status = "active" AND av.value <> item.is_top_level
+            MERGE (new_av:AttributeValue { value: item.is_top_level, is_default: false })
+            CREATE (a)-[:HAS_VALUE $value_rel_prop ]->(new_av)
+            WITH hvr
+            WHERE hvr.branch = $branch
+            SET hvr.to = $at
+        }
+        """ % {"branch_filter": branch_filter}
+        self.add_to_query(query)
+
+
+class PrefixUtilizationGetQuery(Query):
+    """Get the stored utilization summaries of some prefixes."""
+
+    name: str = "prefix_utilization_get"
+
+    def __init__(self, prefix_ids: list[str], **kwargs):
+        self.prefix_ids = prefix_ids
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["prefix_ids"] = self.prefix_ids
+        query = """
+        MATCH (summary:PrefixUtilization)
+        WHERE summary.prefix_uuid IN $prefix_ids
+        WITH
+            summary.prefix_uuid AS prefix_uuid,
+            summary.branch_names AS branch_names,
+            summary.used_prefix_spaces AS used_prefix_spaces,
+            summary.used_addresses AS used_addresses
+        """
+        self.add_to_query(query)
+        self.return_labels = ["prefix_uuid", "branch_names", "used_prefix_spaces", "used_addresses"]
+
+    def get_summaries(self) -> dict[str, PrefixUtilizationData]:
+        summaries: dict[str, PrefixUtilizationData] = {}
+        for result in self.get_results():
+            prefix_id = result.get_as_type("prefix_uuid", return_type=str)
+            branch_names = result.get_as_type("branch_names", return_type=list)
+            # The used space of IPv6 prefixes doesn't fit in a 64 bits integer, it is stored as a string
+            used_prefix_spaces = result.get_as_type("used_prefix_spaces", return_type=list)
+            used_addresses = result.get_as_type("used_addresses", return_type=list)
+            summaries[prefix_id] = PrefixUtilizationData(
+                prefix_id=prefix_id,
+                used_prefix_space={
+                    str(branch_name): int(space) for branch_name, space in zip(branch_names, used_prefix_spaces)
+                },
+                used_addresses={
+                    str(branch_name): int(count) for branch_name, count in zip(branch_names, used_addresses)
+                },
+            )
+        return summaries
+
+
+class PrefixUtilizationSetQuery(Query):
+    """Replace the stored utilization summaries of some prefixes."""
+
+    name: str = "prefix_utilization_set"
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    def __init__(self, summaries: list[PrefixUtilizationData], **kwargs):
+        self.summaries = summaries
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        summaries_params = []
+        for summary in self.summaries:
+            branch_names = sorted(summary.used_prefix_space.keys() | summary.used_addresses.keys())
+            summaries_params.append(
+                {
+                    "prefix_uuid": summary.prefix_id,
+                    "branch_names": branch_names,
+                    "used_prefix_spaces": [str(summary.used_prefix_space.get(name, 0)) for name in branch_names],
+                    "used_addresses": [summary.used_addresses.get(name, 0) for name in branch_names],
+                }
+            )
+        self.params["summaries"] = summaries_params
+        self.params["at"] = self.at.to_string()
+        query = """
+        UNWIND $summaries AS summary_details
+        MERGE (summary:PrefixUtilization {prefix_uuid: summary_details.prefix_uuid})
+        SET summary.branch_names = summary_details.branch_names,
+            summary.used_prefix_spaces = summary_details.used_prefix_spaces,
+            summary.used_addresses = summary_details.used_addresses,
+            summary.updated_at = $at
+        """
+        self.add_to_query(query)
+
+
+class PrefixUtilizationDeleteQuery(Query):
+    """Delete the stored utilization summaries of some prefixes, or all of them if no prefix is provided."""
+
+    name: str = "prefix_utilization_delete"
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    def __init__(self, prefix_ids: Optional[list[str]] = None, **kwargs):
+        self.prefix_ids = prefix_ids
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        query = "MATCH (summary:PrefixUtilization)"
+        if self.prefix_ids is not None:
+            self.params["prefix_ids"] = self.prefix_ids
+            query += " WHERE summary.prefix_uuid IN $prefix_ids"
+        self.add_to_query(query)
+        self.add_to_query("DELETE summary")
+
+
+class PrefixUtilizationDeleteBranchQuery(Query):
+    """Remove the used space of the children of a branch from all the stored utilization summaries."""
+
+    name: str = "prefix_utilization_delete_branch"
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["branch_name"] = self.branch.name
+        query = """
+        MATCH (summary:PrefixUtilization)
+        WHERE $branch_name IN summary.branch_names
+        WITH summary, [idx IN range(0, size(summary.branch_names) - 1) WHERE summary.branch_names[idx] <> $branch_name] AS indexes
+        SET summary.branch_names = [idx IN indexes | summary.branch_names[idx]],
+            summary.used_prefix_spaces = [idx IN indexes | summary.used_prefix_spaces[idx]],
+            summary.used_addresses = [idx IN indexes | summary.used_addresses[idx]]
+        """
+        self.add_to_query(query)
+
+
+class IPPrefixGetUuidsQuery(Query):
+    """Get the UUIDs of all the IP prefixes, in all the branches."""
+
+    name: str = "ip_prefix_get_uuids"
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        query = """
+        MATCH (pfx:%(ip_prefix_kind)s)
+        WITH DISTINCT pfx.uuid AS prefix_uuid
+        """ % {"ip_prefix_kind": InfrahubKind.IPPREFIX}
+        self.add_to_query(query)
+        self.return_labels = ["prefix_uuid"]
+        self.order_by = ["prefix_uuid"]
+
+    def get_prefix_uuids(self) -> list[str]:
+        return [result.get_as_type("prefix_uuid", return_type=str) for result in self.get_results()]
@@ -17,7 +17,7 @@ from infrahub.exceptions import QueryError
 if TYPE_CHECKING:
     from neo4j.graph import Node as Neo4jNode
 
-    from infrahub.core.attribute import AttributeCreateData, BaseAttribute
+    from infrahub.core.attribute import AttributeCreateData, AttributeUpdateData, BaseAttribute
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
     from infrahub.core.relationship import RelationshipCreateData, RelationshipManager
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from infrahub.core.schema.attribute_schema import AttributeSchema
     from infrahub.core.schema.profile_schema import ProfileSchema
     from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 # pylint: disable=consider-using-f-string,redefined-builtin,too-many-lines
@@ -115,95 +116,82 @@ class NodeQuery(Query):
         super().__init__(**kwargs)
 
 
-class NodeCreateAllQuery(NodeQuery):
-    name = "node_create_all"
-
-    type: QueryType = QueryType.WRITE
+async def get_node_create_params(db: InfrahubDatabase, node: Node, branch: Branch, at: Timestamp) -> dict[str, Any]:
+    """Build the parameters required to create a node, its attributes and its relationships."""
+    attributes: list[AttributeCreateData] = []
+    attributes_iphost: list[AttributeCreateData] = []
+    attributes_ipnetwork: list[AttributeCreateData] = []
 
-    raise_error_if_empty: bool = True
-
-    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
-        at = self.at or self.node._at
-        self.params["uuid"] = self.node.id
-        self.params["branch"] = self.branch.name
-        self.params["branch_level"] = self.branch.hierarchy_level
-        self.params["kind"] = self.node.get_kind()
-        self.params["branch_support"] = self.node._schema.branch
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
 
-        attributes: list[AttributeCreateData] = []
-        attributes_iphost: list[AttributeCreateData] = []
-        attributes_ipnetwork: list[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
-
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: list[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.model_dump() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.model_dump() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.model_dump() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: list[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "attrs": [attr.model_dump() for attr in attributes],
+        "attrs_iphost": [attr.model_dump() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.model_dump() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [
             rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
+        ],
+        "rels_in": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "node_branch_prop": {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
             "status": "active",
             "from": at.to_string(),
-        }
+        },
+    }
 
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
 
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
+def get_node_create_subquery(source: str) -> str:
+    """Generate the part of the query creating the attributes and the relationships of the node `n`.
 
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+    The list of attributes and relationships are read from `source`, either a parameter prefix (`$`)
+    or a map variable (`node.`) that contains the parameters generated by `get_node_create_params`.
+    """
+    rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
 
-        query = """
-        MATCH (root:Root)
-        CREATE (n:Node:%(labels)s $node_prop )
-        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
-        WITH distinct n
-        FOREACH ( attr IN $attrs |
+    iphost_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+    }
+    iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
+
+    ipnetwork_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+        # "num_addresses": "attr.content.num_addresses",
+    }
+    ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+
+    return """
+        FOREACH ( attr IN %(source)sattrs |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
@@ -221,7 +209,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_iphost |
+        FOREACH ( attr IN %(source)sattrs_iphost |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
@@ -239,7 +227,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( attr IN $attrs_ipnetwork |
+        FOREACH ( attr IN %(source)sattrs_ipnetwork |
             CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
             CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
             MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
@@ -257,7 +245,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_bidir |
+        FOREACH ( rel IN %(source)srels_bidir |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -275,7 +263,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_out |
+        FOREACH ( rel IN %(source)srels_out |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
@@ -293,7 +281,7 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
-        FOREACH ( rel IN $rels_in |
+        FOREACH ( rel IN %(source)srels_in |
             MERGE (d:Node { uuid: rel.destination_id })
             CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
             CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
@@ -311,13 +299,41 @@ class NodeCreateAllQuery(NodeQuery):
                 CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
             )
         )
+    """ % {
+        "source": source,
+        "rel_prop": rel_prop_str,
+        "iphost_prop": ", ".join(iphost_prop_list),
+        "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+    }
+
+
+class NodeCreateAllQuery(NodeQuery):
+    name = "node_create_all"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        at = self.at or self.node._at
+        self.params["uuid"] = self.node.id
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["kind"] = self.node.get_kind()
+        self.params["branch_support"] = self.node._schema.branch
+        self.params.update(await get_node_create_params(db=db, node=self.node, branch=self.branch, at=at))
+
+        query = """
+        MATCH (root:Root)
+        CREATE (n:Node:%(labels)s $node_prop )
+        CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
+        WITH distinct n
+        %(create_subquery)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "create_subquery": get_node_create_subquery(source="$"),
         }
 
         self.params["at"] = at.to_string()
@@ -348,6 +364,199 @@ class NodeCreateAllQuery(NodeQuery):
         return data
 
 
+class NodeCreateManyQuery(Query):
+    """Create multiple nodes of the same kind, with their attributes and their relationships, in a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: list[Node], **kwargs: Any) -> None:
+        if not nodes:
+            raise ValueError("At least one node must be provided")
+        kinds = {node.get_kind() for node in nodes}
+        if len(kinds) > 1:
+            raise ValueError(f"All the nodes must be of the same kind, found {', '.join(sorted(kinds))}")
+
+        self.nodes = nodes
+        kwargs.setdefault("branch", nodes[0].get_branch_based_on_support_type())
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["nodes"] = [
+            await get_node_create_params(db=db, node=node, branch=self.branch, at=self.at) for node in self.nodes
+        ]
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node
+        CREATE (n:Node:%(labels)s {
+            uuid: node.node_prop.uuid,
+            kind: node.node_prop.kind,
+            namespace: node.node_prop.namespace,
+            branch_support: node.node_prop.branch_support
+        })
+        CREATE (n)-[r:IS_PART_OF {
+            branch: node.node_branch_prop.branch,
+            branch_level: node.node_branch_prop.branch_level,
+            status: node.node_branch_prop.status,
+            from: node.node_branch_prop.from
+        }]->(root)
+        WITH distinct n, node
+        %(create_subquery)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "create_subquery": get_node_create_subquery(source="node."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> dict[str, tuple[str, dict[str, tuple[str, str]]]]:
+        """Return the database ID of each node and the IDs of its attributes and relationships, indexed by node UUID."""
+        data: dict[str, tuple[str, dict[str, tuple[str, str]]]] = {}
+        for result in self.get_results():
+            node = result.get_node("n")
+            if node["uuid"] not in data:
+                data[node["uuid"]] = (node.element_id, {})
+
+            rel_node = result.get("rn")
+            if "Relationship" in rel_node.labels:
+                peer = result.get("rv")
+                name = f"{rel_node.get('name')}::{peer.get('uuid')}"
+            elif "Attribute" in rel_node.labels:
+                name = rel_node.get("name")
+            data[node["uuid"]][1][name] = (rel_node["uuid"], rel_node.element_id)
+
+        return data
+
+
+class NodeUpdateAllQuery(NodeQuery):
+    """Update the values, the flags and the node properties of multiple attributes of a node in a single query.
+
+    The existing edges on the same branch are closed and new edges are created for all the changes.
+    """
+
+    name = "node_update_all"
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, attributes: list[AttributeUpdateData], **kwargs: Any) -> None:
+        self.attributes = attributes
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        at = self.at or self.node._at
+        self.params["at"] = at.to_string()
+        self.params["uuid"] = self.node.id
+
+        attrs_value: list[dict[str, Any]] = []
+        attrs_value_iphost: list[dict[str, Any]] = []
+        attrs_value_ipnetwork: list[dict[str, Any]] = []
+        attrs_flag: dict[str, list[dict[str, Any]]] = {"is_visible": [], "is_protected": []}
+        attrs_node_prop: dict[str, list[dict[str, Any]]] = {"source": [], "owner": []}
+        rel_ids_to_update: list[str] = []
+
+        for attr in self.attributes:
+            attr_info = {"uuid": attr.uuid, "branch": attr.branch, "branch_level": attr.branch_level}
+
+            if attr.content is not None:
+                if attr.node_type == AttributeDBNodeType.IPHOST:
+                    attrs_value_iphost.append({**attr_info, "content": attr.content})
+                elif attr.node_type == AttributeDBNodeType.IPNETWORK:
+                    attrs_value_ipnetwork.append({**attr_info, "content": attr.content})
+                else:
+                    attrs_value.append({**attr_info, "content": attr.content})
+
+            for flag_name, flag_value in attr.flag_properties.items():
+                attrs_flag[flag_name].append({**attr_info, "value": flag_value})
+
+            for prop_name, prop_id in attr.node_properties.items():
+                attrs_node_prop[prop_name].append({**attr_info, "peer_id": prop_id})
+
+            rel_ids_to_update.extend(attr.rel_ids_to_update)
+
+        self.params["attrs_value"] = attrs_value
+        self.params["attrs_value_iphost"] = attrs_value_iphost
+        self.params["attrs_value_ipnetwork"] = attrs_value_ipnetwork
+        self.params["attrs_is_visible"] = attrs_flag["is_visible"]
+        self.params["attrs_is_protected"] = attrs_flag["is_protected"]
+        self.params["attrs_source"] = attrs_node_prop["source"]
+        self.params["attrs_owner"] = attrs_node_prop["owner"]
+        self.params["rel_ids_to_update"] = [db.to_database_id(rel_id) for rel_id in rel_ids_to_update]
+
+        rel_prop_str = '{ branch: attr.branch, branch_level: attr.branch_level, status: "active", from: $at }'
+
+        ip_prop = {
+            "value": "attr.content.value",
+            "is_default": "attr.content.is_default",
+            "binary_address": "attr.content.binary_address",
+            "version": "attr.content.version",
+            "prefixlen": "attr.content.prefixlen",
+        }
+        ip_prop_list = [f"{key}: {value}" for key, value in ip_prop.items()]
+
+        query = """
+        MATCH (n:Node { uuid: $uuid })
+        OPTIONAL MATCH ()-[r]->()
+        WHERE %(id_func)s(r) IN $rel_ids_to_update
+        WITH n, collect(r) AS rels_to_update
+        FOREACH ( r IN rels_to_update | SET r.to = $at )
+        FOREACH ( attr IN $attrs_value |
+            MERGE (a:Attribute { uuid: attr.uuid })
+            MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
+            CREATE (a)-[:HAS_VALUE %(rel_prop)s ]->(av)
+        )
+        FOREACH ( attr IN $attrs_value_iphost |
+            MERGE (a:Attribute { uuid: attr.uuid })
+            MERGE (av:AttributeValue:AttributeIPHost { %(ip_prop)s })
+            CREATE (a)-[:HAS_VALUE %(rel_prop)s ]->(av)
+        )
+        FOREACH ( attr IN $attrs_value_ipnetwork |
+            MERGE (a:Attribute { uuid: attr.uuid })
+            MERGE (av:AttributeValue:AttributeIPNetwork { %(ip_prop)s })
+            CREATE (a)-[:HAS_VALUE %(rel_prop)s ]->(av)
+        )
+        FOREACH ( attr IN $attrs_is_visible |
+            MERGE (a:Attribute { uuid: attr.uuid })
+            MERGE (flag:Boolean { value: attr.value })
+            CREATE (a)-[:IS_VISIBLE %(rel_prop)s ]->(flag)
+        )
+        FOREACH ( attr IN $attrs_is_protected |
+            MERGE (a:Attribute { uuid: attr.uuid })
+            MERGE (flag:Boolean { value: attr.value })
+            CREATE (a)-[:IS_PROTECTED %(rel_prop)s ]->(flag)
+        )
+        WITH n
+        CALL {
+            WITH n
+            UNWIND $attrs_source AS attr
+            MATCH (a:Attribute { uuid: attr.uuid })
+            MATCH (peer:Node { uuid: attr.peer_id })
+            CREATE (a)-[:HAS_SOURCE %(rel_prop)s ]->(peer)
+        }
+        CALL {
+            WITH n
+            UNWIND $attrs_owner AS attr
+            MATCH (a:Attribute { uuid: attr.uuid })
+            MATCH (peer:Node { uuid: attr.peer_id })
+            CREATE (a)-[:HAS_OWNER %(rel_prop)s ]->(peer)
+        }
+        """ % {
+            "id_func": db.get_id_function_name(),
+            "rel_prop": rel_prop_str,
+            "ip_prop": ", ".join(ip_prop_list),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n"]
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -513,6 +722,14 @@ class NodeListGetAttributeQuery(Query):
 
         return attrs_by_node
 
+    def get_results_by_attribute_name(self, node_id: str) -> dict[str, tuple[AttributeFromDB, QueryResult]]:
+        results: dict[str, tuple[AttributeFromDB, QueryResult]] = {}
+        for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
+            if result.get_node("n").get("uuid") == node_id:
+                results[result.get_node("a").get("name")] = (self._extract_attribute_data(result=result), result)
+
+        return results
+
     def get_result_by_id_and_name(self, node_id: str, attr_name: str) -> tuple[AttributeFromDB, QueryResult]:
         for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
             if result.get_node("n").get("uuid") == node_id and result.get_node("a").get("name") == attr_name:
@@ -754,11 +971,17 @@ class NodeGetListQuery(Query):
     name = "node_get_list"
 
     def __init__(
-        self, schema: NodeSchema, filters: Optional[dict] = None, partial_match: bool = False, **kwargs: Any
+        self,
+        schema: NodeSchema,
+        filters: Optional[dict] = None,
+        partial_match: bool = False,
+        include_count: bool = False,
+        **kwargs: Any,
     ) -> None:
         self.schema = schema
         self.filters = filters
         self.partial_match = partial_match
+        self.include_count = include_count
         self._variables_to_track = ["n", "rb"]
         self._validate_filters()
 
@@ -791,6 +1014,19 @@ class NodeGetListQuery(Query):
         return self._variables_to_track
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        await self._add_list_query(db=db)
+
+        if self.include_count:
+            self._add_page_with_count()
+            self.return_labels = [
+                "position",
+                "n.uuid",
+                "rb.branch",
+                f"{db.get_id_function_name()}(rb) as rb_id",
+                "count",
+            ]
+
+    async def _add_list_query(self, db: InfrahubDatabase) -> None:
         self.order_by = []
 
         self.return_labels = ["n.uuid", "rb.branch", f"{db.get_id_function_name()}(rb) as rb_id"]
@@ -859,6 +1095,30 @@ class NodeGetListQuery(Query):
             self.order_by.append(far.node_value_query_variable)
         self.order_by.append("n.uuid")
 
+    def _add_page_with_count(self) -> None:
+        """Select the requested page of the ordered nodes along with the total number of nodes matching the filters.
+
+        The matches are collected once, the count is the size of the list and the page is a slice of it.
+        Cypher has no window function, the position of each node in the page is kept to preserve the order.
+        """
+        self.add_to_query("WITH *")
+        if self.order_by:
+            self.add_to_query("ORDER BY " + ",".join(self.order_by))
+
+        page_start = self.offset or 0
+        page_end = str(page_start + self.limit) if self.limit else "size(matches)"
+        query = """
+        WITH collect([n, rb]) AS matches
+        WITH size(matches) AS count, matches[%(page_start)s..%(page_end)s] AS page
+        // Keep one row without node when the page is empty to return the count
+        UNWIND CASE WHEN size(page) = 0 THEN [null] ELSE range(0, size(page) - 1) END AS position
+        WITH count, position, page[position][0] AS n, page[position][1] AS rb
+        """ % {"page_start": page_start, "page_end": page_end}
+        self.add_to_query(query)
+
+        self.order_by = ["position"]
+        self.insert_limit = False
+
     async def _add_node_filter_attributes(
         self,
         db: InfrahubDatabase,
@@ -1143,7 +1403,104 @@ class NodeGetListQuery(Query):
         return list(field_requirements_map.values())
 
     def get_node_ids(self) -> list[str]:
-        return [str(result.get("n.uuid")) for result in self.get_results()]
+        return [str(result.get("n.uuid")) for result in self.get_results() if result.get("n.uuid")]
+
+    def get_count(self) -> int:
+        if not self.include_count:
+            raise ValueError("The query must be initialized with include_count to return the count")
+        if not self.results:
+            return 0
+        return int(self.results[0].get("count"))
+
+
+class NodeGetListWithInfoQuery(NodeGetListQuery):
+    """Get the page of nodes matching some filters with the information needed to load them.
+
+    This query combines NodeGetListQuery and NodeListGetInfoQuery in a single statement, the filters are evaluated,
+    the nodes are ordered and paginated then the profiles of the nodes of the page are collected.
+    If include_count is set, the total number of nodes matching the filters is returned as well.
+    """
+
+    name = "node_get_list_with_info"
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        await self._add_list_query(db=db)
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(
+            at=self.at, branch_agnostic=self.branch_agnostic
+        )
+        self.params.update(branch_params)
+
+        if self.include_count:
+            self._add_page_with_count()
+        else:
+            self._add_page()
+
+        query = """
+        OPTIONAL MATCH profile_path = (n)-[:IS_RELATED]->(profile_r:Relationship)<-[:IS_RELATED]-(profile:Node)-[:IS_PART_OF]->(:Root)
+        WHERE profile_r.name = "node__profile"
+        AND profile.namespace = "Profile"
+        AND all(r in relationships(profile_path) WHERE %(branch_filter)s and r.status = "active")
+        """ % {"branch_filter": branch_filter}
+        self.add_to_query(query)
+
+        self.return_labels = ["position", "n", "rb", "collect(profile.uuid) as profile_uuids"]
+        if self.include_count:
+            self.return_labels.append("count")
+
+    def _add_page(self) -> None:
+        """Select the requested page of the ordered nodes, keeping the position of each node to preserve the order."""
+        self.add_to_query("WITH *")
+        if self.order_by:
+            self.add_to_query("ORDER BY " + ",".join(self.order_by))
+
+        query = """
+        %(skip)s
+        %(limit)s
+        WITH collect([n, rb]) AS page
+        UNWIND range(0, size(page) - 1) AS position
+        WITH position, page[position][0] AS n, page[position][1] AS rb
+        """ % {
+            "skip": f"SKIP {self.offset}" if self.offset else "",
+            "limit": f"LIMIT {self.limit}" if self.limit else "",
+        }
+        self.add_to_query(query)
+
+        self.order_by = ["position"]
+        self.insert_limit = False
+
+    async def get_nodes(self, db: InfrahubDatabase, duplicate: bool = False) -> AsyncIterator[NodeToProcess]:
+        """Return the nodes of the page as NodeToProcess, in order."""
+        node_uuids: set[str] = set()
+        # The results are read in the order of the query, get_results() would order them by branch
+        for result in self.results:
+            node = result.get("n")
+            if not node or node.get("uuid") in node_uuids:
+                continue
+            node_uuids.add(node.get("uuid"))
+            schema = find_node_schema(db=db, node=node, branch=self.branch, duplicate=duplicate)
+            node_branch = self.branch
+            if self.branch_agnostic:
+                node_branch = result.get_rel("rb").get("branch")
+            yield NodeToProcess(
+                schema=schema,
+                node_id=node.element_id,
+                node_uuid=node.get("uuid"),
+                profile_uuids=[str(puuid) for puuid in result.get("profile_uuids")],
+                updated_at=result.get_rel("rb").get("from"),
+                branch=node_branch,
+                labels=list(node.labels),
+            )
+
+    def get_profile_ids_by_node_id(self) -> dict[str, list[str]]:
+        profile_id_map: dict[str, list[str]] = {}
+        for result in self.results:
+            node = result.get("n")
+            profile_ids = result.get("profile_uuids")
+            if not node or not profile_ids:
+                continue
+            profile_id_map.setdefault(node.get("uuid"), []).extend(str(profile_id) for profile_id in profile_ids)
+        return profile_id_map
 
 
 class NodeGetHierarchyQuery(Query):
@@ -145,23 +145,23 @@ class NumberPoolGetAllocated(Query):
         self.order_by = ["av.value"]
 
 
-class NumberPoolGetReserved(Query):
-    name: str = "numberpool_get_reserved"
+class NumberPoolGetReservations(Query):
+    name: str = "numberpool_get_reservations"
 
     def __init__(
         self,
         pool_id: str,
-        identifier: str,
+        identifiers: list[str],
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool_id = pool_id
-        self.identifier = identifier
+        self.identifiers = identifiers
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool_id
-        self.params["identifier"] = self.identifier
+        self.params["identifiers"] = self.identifiers
 
         branch_filter, branch_params = self.branch.get_query_filter_path(
             at=self.at.to_string(), branch_agnostic=self.branch_agnostic
@@ -172,22 +172,30 @@ class NumberPoolGetReserved(Query):
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })-[r:IS_RESERVED]->(reservation:AttributeValue)
         WHERE
-            r.identifier = $identifier
+            r.identifier IN $identifiers
             AND
             %(branch_filter)s
         """ % {"branch_filter": branch_filter, "number_pool": InfrahubKind.NUMBERPOOL}
         self.add_to_query(query)
-        self.return_labels = ["reservation.value"]
+        self.return_labels = ["r.identifier", "reservation.value"]
+
+    def get_reservations(self) -> dict[str, int]:
+        reservations: dict[str, int] = {}
+        for result in self.get_results():
+            value = result.get_as_optional_type("reservation.value", return_type=int)
+            if value is not None:
+                reservations[result.get_as_type("r.identifier", return_type=str)] = value
+        return reservations
 
-    def get_reservation(self) -> int | None:
-        result = self.get_result()
-        if result:
-            return result.get_as_optional_type("reservation.value", return_type=int)
-        return None
 
+class NumberPoolGetFree(Query):
+    """Find the ranges of numbers that are not used within a pool, starting with the lowest number.
 
-class NumberPoolGetUsed(Query):
-    name: str = "number_pool_get_used"
+    A number is used when it's assigned to a node or when it's reserved and not assigned yet.
+    The gaps between the used numbers are computed by the database, only the first `limit` ranges are returned.
+    """
+
+    name: str = "number_pool_get_free"
 
     def __init__(
         self,
@@ -214,46 +222,65 @@ class NumberPoolGetUsed(Query):
         MATCH (pool:%(number_pool)s { uuid: $pool_id })
         CALL {
             WITH pool
-            MATCH (pool)-[res:IS_RESERVED]->(av:AttributeValue)<-[hv:HAS_VALUE]-(attr:Attribute)
+            MATCH (pool)-[res:IS_RESERVED]->(av:AttributeValue)
             WHERE
-                attr.name = $attribute_name
-                AND
                 toInteger(av.value) >= $start_range and toInteger(av.value) <= $end_range
                 AND
-                all(r in [res, hv] WHERE (%(branch_filter)s))
-            RETURN av, (res.status = "active" AND hv.status = "active") AS is_active
+                all(r in [res] WHERE (%(branch_filter)s))
+            OPTIONAL MATCH (av)<-[hv:HAS_VALUE]-(attr:Attribute)
+            WHERE
+                attr.name = $attribute_name
+                AND
+                all(r in [hv] WHERE (%(branch_filter)s))
+            // A reservation without value is held until it's assigned to a node
+            RETURN av, (res.status = "active" AND (hv IS NULL OR hv.status = "active")) AS is_active
         }
         WITH av, is_active
         WHERE is_active = TRUE
+        WITH DISTINCT toInteger(av.value) AS used_number
+        ORDER BY used_number
+        WITH collect(used_number) AS used_numbers
+        WITH [$start_range - 1] + used_numbers + [$end_range + 1] AS bounds
+        UNWIND range(0, size(bounds) - 2) AS idx
+        WITH bounds[idx] + 1 AS range_start, bounds[idx + 1] - 1 AS range_end
+        WHERE range_start <= range_end
         """ % {
             "branch_filter": branch_filter,
             "number_pool": InfrahubKind.NUMBERPOOL,
         }
         self.add_to_query(query)
-        self.return_labels = ["av.value"]
-        self.order_by = ["av.value"]
+        self.return_labels = ["range_start", "range_end"]
+        self.order_by = ["range_start"]
+
+    def get_free_ranges(self) -> list[tuple[int, int]]:
+        return [
+            (
+                result.get_as_type("range_start", return_type=int),
+                result.get_as_type("range_end", return_type=int),
+            )
+            for result in self.get_results()
+        ]
 
 
-class NumberPoolSetReserved(Query):
-    name: str = "numberpool_set_reserved"
+class NumberPoolSetReservations(Query):
+    name: str = "numberpool_set_reservations"
 
     def __init__(
         self,
         pool_id: str,
-        reserved: int,
-        identifier: str,
+        reservations: dict[str, int],
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool_id = pool_id
-        self.reserved = reserved
-        self.identifier = identifier
+        self.reservations = reservations
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool_id
-        self.params["reserved"] = self.reserved
-        self.params["identifier"] = self.identifier
+        self.params["reservations"] = [
+            {"identifier": identifier, "reserved": reserved} for identifier, reserved in self.reservations.items()
+        ]
 
         global_branch = registry.get_global_branch()
         self.params["rel_prop"] = {
@@ -261,13 +288,14 @@ class NumberPoolSetReserved(Query):
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
-            "identifier": self.identifier,
         }
 
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })
-        MERGE (value:AttributeValue { value: $reserved, is_default: false })
+        UNWIND $reservations AS reservation
+        MERGE (value:AttributeValue { value: reservation.reserved, is_default: false })
         CREATE (pool)-[rel:IS_RESERVED $rel_prop]->(value)
+        SET rel.identifier = reservation.identifier
         """ % {"number_pool": InfrahubKind.NUMBERPOOL}
 
         self.add_to_query(query)
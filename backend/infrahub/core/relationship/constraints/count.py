@@ -1,3 +1,4 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -86,3 +87,71 @@ class RelationshipCountConstraint(RelationshipManagerConstraintInterface):
                     f"Node {node.uuid} has {count_per_peer[node.uuid] - 1} peers "
                     f"for {relm.schema.identifier}, no fewer than {node.min_count} allowed",
                 )
+
+    async def check_many(self, relms: list[RelationshipManager], node_schema: MainSchemaTypes) -> None:
+        """Validate the same relationship on multiple nodes with a single count query.
+
+        The number of peers added or removed by all the nodes are aggregated before being compared with the limits.
+        """
+        if not relms:
+            return
+
+        branch = await registry.get_branch(db=self.db) if not self.branch else self.branch
+        rel_schema = relms[0].schema
+
+        peer_schema = registry.schema.get(name=rel_schema.peer, branch=branch)
+        peer_rels = [
+            peer_rel
+            for peer_rel in peer_schema.get_relationships_by_identifier(id=rel_schema.get_identifier())
+            if rel_schema.direction != peer_rel.direction or peer_rel.direction == RelationshipDirection.BIDIR
+        ]
+        if not peer_rels:
+            return
+
+        added_per_peer: dict[str, int] = defaultdict(int)
+        removed_per_peer: dict[str, int] = defaultdict(int)
+        for relm in relms:
+            await relm.resolve(db=self.db)
+            update_details = await relm.fetch_relationship_ids(db=self.db, force_refresh=False)
+            for peer_id in update_details.peer_ids_present_local_only:
+                added_per_peer[peer_id] += 1
+            for peer_id in update_details.peer_ids_present_database_only:
+                removed_per_peer[peer_id] += 1
+
+        nodes_to_validate: list[NodeToValidate] = []
+        for peer_rel in peer_rels:
+            for peer_id in added_per_peer:
+                if peer_rel.max_count:
+                    nodes_to_validate.append(
+                        NodeToValidate(uuid=peer_id, max_count=peer_rel.max_count, cardinality=peer_rel.cardinality)
+                    )
+            for peer_id in removed_per_peer:
+                if peer_rel.min_count:
+                    nodes_to_validate.append(
+                        NodeToValidate(uuid=peer_id, min_count=peer_rel.min_count, cardinality=peer_rel.cardinality)
+                    )
+        if not nodes_to_validate:
+            return
+
+        query = await RelationshipCountPerNodeQuery.init(
+            db=self.db,
+            node_ids=[node.uuid for node in nodes_to_validate],
+            identifier=rel_schema.identifier,
+            direction=rel_schema.direction.neighbor_direction,
+            branch=branch,
+        )
+        await query.execute(db=self.db)
+        count_per_peer = await query.get_count_per_peer()
+
+        for node in nodes_to_validate:
+            nbr_peers = count_per_peer[node.uuid] + added_per_peer[node.uuid] - removed_per_peer[node.uuid]
+            if node.max_count and nbr_peers > node.max_count:
+                raise ValidationError(
+                    f"Node {node.uuid} has {nbr_peers} peers "
+                    f"for {rel_schema.identifier}, maximum of {node.max_count} allowed",
+                )
+            if node.min_count and nbr_peers < node.min_count:
+                raise ValidationError(
+                    f"Node {node.uuid} has {nbr_peers} peers "
+                    f"for {rel_schema.identifier}, no fewer than {node.min_count} allowed",
+                )
@@ -8,3 +8,8 @@ from ..model import RelationshipManager
 class RelationshipManagerConstraintInterface(ABC):
     @abstractmethod
     async def check(self, relm: RelationshipManager, node_schema: MainSchemaTypes) -> None: ...
+
+    async def check_many(self, relms: list[RelationshipManager], node_schema: MainSchemaTypes) -> None:
+        """Validate the same relationship on multiple nodes of the same kind, by default one node at a time."""
+        for relm in relms:
+            await self.check(relm=relm, node_schema=node_schema)
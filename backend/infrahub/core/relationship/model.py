@@ -23,6 +23,7 @@ from pydantic import BaseModel, Field
 
 from infrahub.core import registry
 from infrahub.core.constants import BranchSupportType, InfrahubKind
+from infrahub.core.diff.query.changed_nodes import track_changed_nodes
 from infrahub.core.property import (
     FlagPropertyMixin,
     NodePropertyData,
@@ -347,6 +348,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
 
         self.db_id = result.get("rl").element_id
         self.id = result.get("rl").get("uuid")
+        await track_changed_nodes(db=db, branch=self.branch, node_ids=[node.id, peer.id], at=create_at)
 
     async def update(
         self,
@@ -380,6 +382,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
             at=update_at,
         )
         await query.execute(db=db)
+        await track_changed_nodes(db=db, branch=self.branch, node_ids=[node.id, str(data.peer_id)], at=update_at)
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
         delete_at = Timestamp(at)
@@ -410,6 +413,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
             db=db, rel=self, source_id=node.id, destination_id=peer.id, branch=branch, at=delete_at
         )
         await delete_query.execute(db=db)
+        await track_changed_nodes(db=db, branch=self.branch, node_ids=[node.id, peer.id], at=delete_at)
 
     async def resolve(self, db: InfrahubDatabase) -> None:
         """Resolve the peer of the relationship."""
@@ -425,7 +429,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
                 await self.set_peer(value=peer)
 
         if not self.peer_id and self.peer_hfid:
-            peer_schema = db.schema.get(name=self.schema.peer, branch=self.branch)
+            peer_schema = db.schema.get(name=self.schema.peer, branch=self.branch, duplicate=False)
             kind = (
                 self.data["kind"]
                 if isinstance(self.data, dict) and "kind" in self.data and peer_schema.is_generic_schema
@@ -716,6 +720,9 @@ class RelationshipManager:
         self._relationship_id_details: Optional[RelationshipUpdateDetails] = None
         self.has_fetched_relationships: bool = False
 
+        # Peers and properties of the relationships the last time they were synchronized with the database
+        self._db_state: Optional[dict[Optional[str], int]] = None
+
     @classmethod
     async def init(
         cls,
@@ -894,8 +901,6 @@ class RelationshipManager:
         if not force_refresh and self._relationship_id_details is not None:
             return self._relationship_id_details
 
-        current_peer_ids = [rel.get_peer_id() for rel in self._relationships]
-
         query = await RelationshipGetPeerQuery.init(
             db=db,
             source=self.node,
@@ -905,7 +910,43 @@ class RelationshipManager:
         )
         await query.execute(db=db)
 
-        peers_database: dict = {str(peer.peer_id): peer for peer in query.get_peers()}
+        return self._set_relationship_id_details(peers_database={str(peer.peer_id): peer for peer in query.get_peers()})
+
+    @classmethod
+    async def fetch_relationship_ids_many(
+        cls,
+        db: InfrahubDatabase,
+        relms: list[RelationshipManager],
+        at: Optional[Timestamp] = None,
+    ) -> None:
+        """Refresh the relationship ids of the same relationship on multiple nodes of the same kind.
+
+        The peers of all the existing nodes are retrieved with a single query,
+        the nodes that haven't been created yet don't have any peer in the database and are not queried.
+        """
+        peers_per_node: dict[str, dict[str, RelationshipPeerData]] = {relm.node.id: {} for relm in relms}
+        existing_relms = [relm for relm in relms if relm.node._existing]
+
+        if existing_relms:
+            relm = existing_relms[0]
+            query = await RelationshipGetPeerQuery.init(
+                db=db,
+                source_ids=[item.node.id for item in existing_relms],
+                source_kind=relm.node.get_kind(),
+                at=at or relm.at,
+                rel=relm.rel_class(schema=relm.schema, branch=relm.branch, node=relm.node),
+            )
+            await query.execute(db=db)
+            for peer in query.get_peers():
+                peers_per_node[str(peer.source_id)][str(peer.peer_id)] = peer
+
+        for relm in relms:
+            relm._set_relationship_id_details(peers_database=peers_per_node[relm.node.id])
+
+    def _set_relationship_id_details(
+        self, peers_database: dict[str, RelationshipPeerData]
+    ) -> RelationshipUpdateDetails:
+        current_peer_ids = [rel.get_peer_id() for rel in self._relationships]
         peer_ids = list(peers_database.keys())
 
         # Calculate which peer should be added or removed
@@ -949,6 +990,24 @@ class RelationshipManager:
         for peer_id in details.peer_ids_present_local_only:
             await self.remove(peer_id=peer_id, db=db)
 
+        self._db_state = self._get_state()
+
+    def _get_state(self) -> dict[Optional[str], int]:
+        return {rel.peer_id: hash(rel) for rel in self._relationships}
+
+    def has_changed(self) -> bool:
+        """Indicate if the relationships have been modified since they have been fetched from the database.
+
+        Relationships that have never been fetched nor modified can't have changed.
+        """
+        if not self.has_fetched_relationships:
+            return False
+
+        if self._db_state is None:
+            return True
+
+        return self._db_state != self._get_state()
+
     async def get(self, db: InfrahubDatabase) -> Union[Relationship, list[Relationship]]:
         rels = await self.get_relationships(db=db)
 
@@ -1087,6 +1146,10 @@ class RelationshipManager:
         remove_at = Timestamp(at)
         branch = self.get_branch_based_on_support_type()
 
+        await track_changed_nodes(
+            db=db, branch=self.branch, node_ids=[self.node.id, str(peer_data.peer_id)], at=remove_at
+        )
+
         # - Update the existing relationship if we are on the same branch
         rel_ids_per_branch = peer_data.rel_ids_per_branch()
         if branch.name in rel_ids_per_branch:
@@ -1141,6 +1204,8 @@ class RelationshipManager:
                         db=db,
                     )
 
+        self._db_state = self._get_state()
+
         return self
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
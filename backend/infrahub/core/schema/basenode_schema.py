@@ -394,7 +394,7 @@ class BaseNodeSchema(GeneratedBaseNodeSchema):  # pylint: disable=too-many-publi
         if relationship_piece:
             relationship_schema = self.get_relationship(name=path_parts[0])
             schema_path.relationship_schema = relationship_schema
-            schema_path.related_schema = schema.get(name=relationship_schema.peer, duplicate=True)
+            schema_path.related_schema = schema.get(name=relationship_schema.peer, duplicate=False)
 
         if attribute_piece:
             schema_to_check = schema_path.related_schema or self
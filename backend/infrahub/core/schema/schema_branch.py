@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import hashlib
 from collections import defaultdict
 from itertools import chain
@@ -236,15 +235,21 @@ class SchemaBranch:
         return result
 
     def duplicate(self, name: Optional[str] = None) -> SchemaBranch:
-        """Duplicate the current object but conserve the same cache."""
-        return self.__class__(name=name, data=copy.deepcopy(self.to_dict()), cache=self._cache)
+        """Duplicate the current object but conserve the same cache.
+
+        The schema objects in the cache are read-only, only the mapping between the names and the hashes needs to be copied.
+        """
+        data = {key: dict(value) for key, value in self.to_dict().items()}
+        return self.__class__(name=name, data=data, cache=self._cache)
 
     def set(self, name: str, schema: MainSchemaTypes) -> str:
         """Store a NodeSchema or GenericSchema associated with a specific name.
 
-        The object will be stored in the internal cache based on its hash value.
+        The object will be stored in the internal cache based on its hash value and it will become read-only,
+        use `mutable_copy()` to get a version of the schema that can be modified.
         If a schema with the same name already exist, it will be replaced
         """
+        schema.freeze()
         schema_hash = schema.get_hash()
         if schema_hash not in self._cache:
             self._cache[schema_hash] = schema
@@ -261,10 +266,10 @@ class SchemaBranch:
     def get(self, name: str, duplicate: bool = True) -> MainSchemaTypes:
         """Access a specific NodeSchema or GenericSchema, defined by its kind.
 
-        To ensure that no-one will ever change an object in the cache,
-        by default the function always returns a copy of the object, not the object itself
+        The objects in the cache are read-only, by default the function returns a copy
+        of the object that can be modified, not the object itself.
 
-        If duplicate is set to false, the real object will be returned.
+        If duplicate is set to false, the real object will be returned, this should be preferred for read only access.
         """
         key = None
         if name in self.nodes:
@@ -443,7 +448,7 @@ class SchemaBranch:
                 new_item.update(item)
                 self.set(name=item.kind, schema=new_item)
             except SchemaNotFoundError:
-                self.set(name=item.kind, schema=item)
+                self.set(name=item.kind, schema=item.duplicate())
 
         for node_extension in schema.extensions.nodes:
             new_item = self.get(name=node_extension.kind)
@@ -714,7 +719,9 @@ class SchemaBranch:
 
                 if len(generic_display_labels) == 1:
                     # Only assign node display labels if a single generic has them defined
+                    node_schema = self.get(name=name, duplicate=True)
                     node_schema.display_labels = generic_display_labels[0]
+                    self.set(name=name, schema=node_schema)
 
     def validate_order_by(self) -> None:
         for name in self.all_names:
@@ -1015,11 +1022,11 @@ class SchemaBranch:
         for name in self.all_names:
             node = self.get(name=name, duplicate=False)
 
-            attributes = [attr for attr in node.attributes if attr.kind == "Dropdown"]
-            if not attributes:
+            if not any(attr.kind == "Dropdown" for attr in node.attributes):
                 continue
 
             node = node.duplicate()
+            attributes = [attr for attr in node.attributes if attr.kind == "Dropdown"]
             changed = False
 
             for attr in attributes:
@@ -1135,6 +1142,7 @@ class SchemaBranch:
                     elif schema_attribute_path.is_type_relationship:
                         uniqueness_constraints.append(schema_attribute_path.relationship_schema.name)
 
+                node = self.get(name=name, duplicate=True)
                 node.uniqueness_constraints = [uniqueness_constraints]
                 self.set(name=node.kind, schema=node)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Optional, TypeVar, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -113,7 +113,7 @@ class DatabaseSchemaManager:
     ) -> dict[str, MainSchemaTypes]:
         branch_name = get_branch_name(branch=branch)
         if branch_name not in self._db._schemas:
-            return registry.schema.get_full(branch=branch)
+            return registry.schema.get_full(branch=branch, duplicate=duplicate)
         return self._db._schemas[branch_name].get_all(duplicate=duplicate)
 
     async def get_full_safe(
@@ -318,34 +318,7 @@ class InfrahubDatabase:
             if name:
                 span.set_attribute("query_name", name)
 
-            runtime = Neo4jRuntime.UNDEFINED
-
-            try:
-                query_config = self.queries_names_to_config[name]
-                if self.db_type == DatabaseType.NEO4J:
-                    runtime = self.queries_names_to_config[name].neo4j_runtime
-                    if runtime not in [Neo4jRuntime.DEFAULT, Neo4jRuntime.UNDEFINED]:
-                        query = f"CYPHER runtime = {runtime.value}\n" + query
-                if query_config.profile_memory:
-                    query = "PROFILE\n" + query
-            except KeyError:
-                pass  # No specific config for this query
-
-            labels = {
-                "type": self._session_mode.value,
-                "query": name,
-                "runtime": runtime.value,
-                "context1": "",
-                "context2": "",
-            }
-            if context:
-                labels.update(
-                    {
-                        f"context{idx + 1}": f"{key}__{value}"
-                        for idx, (key, value) in enumerate(context.items())
-                        if idx <= 1
-                    }
-                )
+            query, labels = self._prepare_query(query=query, name=name, context=context)
 
             with QUERY_EXECUTION_METRICS.labels(**labels).time():
                 response = await self.run_query(query=query, params=params, name=name)
@@ -354,6 +327,70 @@ class InfrahubDatabase:
                 results = [item async for item in response]
                 return results, response._metadata or {}
 
+    async def stream_query(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        name: str = "undefined",
+        context: dict[str, str] | None = None,
+        fetch_size: int = 1_000,
+        metadata: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[Record]]:
+        """Execute a query once and return its records in chunks of at most fetch_size records.
+
+        The records are pulled from the database as the chunks are consumed,
+        the metadata of the query are added to the metadata dict provided once all the records have been read.
+        """
+        with trace.get_tracer(__name__).start_as_current_span("stream_db_query") as span:
+            span.set_attribute("query", query)
+            if name:
+                span.set_attribute("query_name", name)
+
+            query, labels = self._prepare_query(query=query, name=name, context=context)
+
+            with QUERY_EXECUTION_METRICS.labels(**labels).time():
+                response = await self.run_query(query=query, params=params, name=name)
+                if response is None:
+                    return
+
+                while records := await response.fetch(fetch_size):
+                    yield records
+
+                if metadata is not None:
+                    await response.consume()
+                    metadata.update(response._metadata or {})
+
+    def _prepare_query(
+        self, query: str, name: str, context: dict[str, str] | None = None
+    ) -> tuple[str, dict[str, str]]:
+        """Apply the configuration defined for this query and generate the labels for the metrics."""
+        runtime = Neo4jRuntime.UNDEFINED
+
+        try:
+            query_config = self.queries_names_to_config[name]
+            if self.db_type == DatabaseType.NEO4J:
+                runtime = self.queries_names_to_config[name].neo4j_runtime
+                if runtime not in [Neo4jRuntime.DEFAULT, Neo4jRuntime.UNDEFINED]:
+                    query = f"CYPHER runtime = {runtime.value}\n" + query
+            if query_config.profile_memory:
+                query = "PROFILE\n" + query
+        except KeyError:
+            pass  # No specific config for this query
+
+        labels = {
+            "type": self._session_mode.value,
+            "query": name,
+            "runtime": runtime.value,
+            "context1": "",
+            "context2": "",
+        }
+        if context:
+            labels.update(
+                {f"context{idx + 1}": f"{key}__{value}" for idx, (key, value) in enumerate(context.items()) if idx <= 1}
+            )
+
+        return query, labels
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> AsyncResult:
@@ -1,3 +1,4 @@
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.diff.merger.merger import DiffMerger
 from infrahub.core.diff.merger.serializer import DiffMergeSerializer
@@ -14,5 +15,7 @@ class DiffMergerDependency(DependencyBuilder[DiffMerger]):
             source_branch=context.branch,
             destination_branch=registry.get_branch_from_registry(),
             diff_repository=DiffRepositoryDependency.build(context=context),
-            serializer=DiffMergeSerializer(db=context.db, max_batch_size=100),
+            serializer=DiffMergeSerializer(
+                db=context.db, max_batch_size=config.SETTINGS.database.diff_merge_batch_size
+            ),
         )
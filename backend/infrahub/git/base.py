@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -336,8 +337,8 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         self.directory_temp.mkdir(parents=True)
 
         try:
-            repo = Repo.clone_from(self.location, self.directory_default)
-            repo.git.checkout(checkout_ref or self.default_branch)
+            repo = await asyncio.to_thread(Repo.clone_from, self.location, self.directory_default)
+            await asyncio.to_thread(repo.git.checkout, checkout_ref or self.default_branch)
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc)
 
@@ -581,12 +582,35 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
 
         repo = self.get_git_repo_main()
         try:
-            repo.remotes.origin.fetch()
+            await asyncio.to_thread(repo.remotes.origin.fetch)
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc)
 
         return True
 
+    async def has_remote_changes(self) -> bool:
+        """Indicate if the remote origin has some commits that are not present locally yet.
+
+        Only the references of the remote branches are listed, which is much cheaper than a fetch.
+        """
+        if not self.has_origin:
+            return False
+
+        repo = self.get_git_repo_main()
+        try:
+            output = await asyncio.to_thread(repo.git.ls_remote, "--heads", "origin")
+        except GitCommandError as exc:
+            self._raise_enriched_error(error=exc)
+
+        tracking_refs = {ref.remote_head: ref.commit.hexsha for ref in repo.remotes.origin.refs}
+        for line in output.splitlines():
+            commit, ref = line.split("\t")
+            if tracking_refs.get(ref.removeprefix("refs/heads/")) != commit:
+                return True
+
+        new_branches, updated_branches = await self.compare_local_remote()
+        return bool(new_branches or updated_branches)
+
     async def compare_local_remote(self) -> tuple[list[str], list[str]]:
         """
         Returns:
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import importlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import jinja2
+
+from infrahub.git.base import extract_repo_file_information
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CommitResources:
+    """Templates and Python classes loaded from a repository at a given commit.
+
+    The content of a commit never changes, so the Jinja2 environment doesn't need to check if the templates have been
+    modified on disk and each template is only compiled once.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.jinja2_environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(searchpath=directory),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self.classes: dict[tuple[str, str], type[Any]] = {}
+
+    def get_python_class(self, file_path: str, class_name: str, repository_directory: Path) -> type[Any]:
+        """Return a class defined in a Python file of the commit, the module is only imported once."""
+        if (file_path, class_name) not in self.classes:
+            file_info = extract_repo_file_information(
+                full_filename=self.directory / file_path,
+                repo_directory=repository_directory,
+                worktree_directory=self.directory,
+            )
+            module = importlib.import_module(file_info.module_name)
+            self.classes[file_path, class_name] = getattr(module, class_name)
+
+        return self.classes[file_path, class_name]
+
+
+class CommitResourcesCache:
+    """LRU cache of the resources loaded from the repositories, indexed by the ID of the repository and the commit."""
+
+    def __init__(self, max_size: int = 32) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], CommitResources] = OrderedDict()
+
+    def get(self, repository_id: str, commit: str, directory: Path) -> CommitResources:
+        key = (repository_id, commit)
+        if key in self._entries and self._entries[key].directory == directory:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        resources = CommitResources(directory=directory)
+        self._entries[key] = resources
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return resources
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+commit_resources_cache = CommitResourcesCache()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import importlib
 import os
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
+from urllib.parse import urlencode
 
-import jinja2
+import httpx
 import ujson
 import yaml
 from infrahub_sdk import InfrahubClient  # noqa: TCH002
@@ -29,26 +31,31 @@ from infrahub_sdk.schema import (
     InfrahubPythonTransformConfig,
     InfrahubRepositoryConfig,
 )
-from infrahub_sdk.utils import compare_lists
+from infrahub_sdk.types import HTTPMethod
+from infrahub_sdk.utils import compare_lists, decode_json
 from infrahub_sdk.yaml import SchemaFile
 from pydantic import BaseModel, Field
 from pydantic import ValidationError as PydanticValidationError
 
 from infrahub.core.constants import InfrahubKind, RepositorySyncStatus
 from infrahub.events.repository_action import CommitUpdatedEvent
-from infrahub.exceptions import CheckError, TransformError
+from infrahub.exceptions import CheckError, GraphQLQueryError, TransformError
 from infrahub.git.base import InfrahubRepositoryBase, extract_repo_file_information
+from infrahub.git.cache import commit_resources_cache
+from infrahub.git.transform_pool import CLIENT_CONFIG_FIELDS, TransformPoolError, transform_pool
 from infrahub.log import get_logger
 
 if TYPE_CHECKING:
     import types
 
+    import jinja2
     from infrahub_sdk.checks import InfrahubCheck
     from infrahub_sdk.node import InfrahubNode
     from infrahub_sdk.schema import InfrahubRepositoryArtifactDefinitionConfig
     from infrahub_sdk.transforms import InfrahubTransform
 
-    from infrahub.git.models import RequestArtifactGenerate
+    from infrahub.git.cache import CommitResources
+    from infrahub.git.models import RequestArtifactGenerate, RequestArtifactsGenerate
     from infrahub.message_bus import messages
 
 # pylint: disable=too-many-lines
@@ -118,6 +125,29 @@ class TransformPythonInformation(BaseModel):
     """Timeout for the function."""
 
 
+async def post_api_request(
+    client: InfrahubClient, url: str, payload: dict, headers: dict[str, str], timeout: int
+) -> httpx.Response:
+    """Send a POST request to an endpoint of the API not covered by the SDK, with the credentials of the client.
+
+    Like the requests of the SDK, the request goes through the requester configured on the client if there is one,
+    otherwise it's sent with the TLS and proxy settings of the client.
+    """
+    await client.login()
+    headers = {**(client.headers or {}), **headers}
+
+    if client.config.requester:
+        return await client.config.requester(
+            url=url, method=HTTPMethod.POST, headers=headers, timeout=timeout, payload=payload
+        )
+
+    async with httpx.AsyncClient(
+        proxy=client.config.proxy,
+        verify=client.config.tls_ca_file or not client.config.tls_insecure,
+    ) as http_client:
+        return await http_client.post(url=url, json=payload, headers=headers, timeout=timeout)
+
+
 class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=too-many-public-methods
     """
     This class provides interfaces to read and process information from .infrahub.yml files and can perform
@@ -1115,15 +1145,56 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         await self.import_python_transforms(branch_name=branch_name, commit=commit, config_file=config_file)
         await self.import_generator_definitions(branch_name=branch_name, commit=commit, config_file=config_file)
 
-    async def render_jinja2_template(self, commit: str, location: str, data: dict) -> str:
+    async def render_jinja2_template(
+        self, commit: str, location: str, data: dict, timeout: Optional[int] = None
+    ) -> str:
+        if not transform_pool.is_enabled:
+            template = self.load_jinja2_template(commit=commit, location=location)
+            return self._render_jinja2_template(template=template, commit=commit, location=location, data=data)
+
+        commit_worktree = self.get_commit_worktree(commit=commit)
+        self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
+
+        try:
+            return await transform_pool.render_jinja2_template(
+                repository_id=str(self.id),
+                commit=commit,
+                directory=commit_worktree.directory,
+                location=location,
+                data=data,
+                timeout=timeout,
+            )
+        except TransformPoolError as exc:
+            log.error(exc.message, repository=self.name, commit=commit, location=location)
+            raise TransformError(
+                repository_name=self.name, commit=commit, location=location, message=exc.message
+            ) from exc
+
+    def load_jinja2_template(self, commit: str, location: str) -> jinja2.Template:
+        """Load a Jinja2 template of the repository, to render it once per set of data."""
         commit_worktree = self.get_commit_worktree(commit=commit)
 
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
         try:
-            templateLoader = jinja2.FileSystemLoader(searchpath=commit_worktree.directory)
-            templateEnv = jinja2.Environment(loader=templateLoader, trim_blocks=True, lstrip_blocks=True)
-            template = templateEnv.get_template(location)
+            resources = self._get_commit_resources(commit=commit, directory=commit_worktree.directory)
+            return resources.jinja2_environment.get_template(location)
+        except Exception as exc:
+            log.error(str(exc), exc_info=True, repository=self.name, commit=commit, location=location)
+            raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
+
+    def _get_commit_resources(self, commit: str, directory: Path) -> CommitResources:
+        return commit_resources_cache.get(repository_id=str(self.id), commit=commit, directory=directory)
+
+    def _load_python_class(self, commit: str, directory: Path, file_path: str, class_name: str) -> type[Any]:
+        """Return a class defined in a Python file of the repository, the module is only imported once per commit."""
+        resources = self._get_commit_resources(commit=commit, directory=directory)
+        return resources.get_python_class(
+            file_path=file_path, class_name=class_name, repository_directory=self.directory_root
+        )
+
+    def _render_jinja2_template(self, template: jinja2.Template, commit: str, location: str, data: dict) -> str:
+        try:
             return template.render(**data)
         except Exception as exc:
             log.error(str(exc), exc_info=True, repository=self.name, commit=commit, location=location)
@@ -1149,16 +1220,10 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             sys.path.append(str(self.directory_root))
 
         try:
-            file_info = extract_repo_file_information(
-                full_filename=commit_worktree.directory / location,
-                repo_directory=self.directory_root,
-                worktree_directory=commit_worktree.directory,
+            check_class: type[InfrahubCheck] = self._load_python_class(
+                commit=commit, directory=commit_worktree.directory, file_path=location, class_name=class_name
             )
 
-            module = importlib.import_module(file_info.module_name)
-
-            check_class: type[InfrahubCheck] = getattr(module, class_name)
-
             check = check_class(
                 root_directory=commit_worktree.directory, branch=branch_name, client=client, params=params
             )
@@ -1202,9 +1267,80 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             ) from exc
 
     async def execute_python_transform(
-        self, branch_name: str, commit: str, location: str, client: InfrahubClient, data: Optional[dict] = None
+        self,
+        branch_name: str,
+        commit: str,
+        location: str,
+        client: InfrahubClient,
+        data: Optional[dict] = None,
+        timeout: Optional[int] = None,
     ) -> Any:
-        """Execute A Python Transform stored in the repository."""
+        """Execute A Python Transform stored in the repository.
+
+        When the transform pool is enabled, the transform is executed in one of its processes with a client using the
+        same settings and credentials. A client with a custom requester can't be shared with another process, the
+        transform is then executed within the worker.
+        """
+        if transform_pool.is_enabled and not client.config.requester:
+            return await self._execute_python_transform_in_pool(
+                branch_name=branch_name, commit=commit, location=location, client=client, data=data, timeout=timeout
+            )
+
+        transform = self.load_python_transform(branch_name=branch_name, commit=commit, location=location, client=client)
+        return await self._run_python_transform(
+            transform=transform, branch_name=branch_name, commit=commit, location=location, data=data
+        )
+
+    async def _execute_python_transform_in_pool(
+        self,
+        branch_name: str,
+        commit: str,
+        location: str,
+        client: InfrahubClient,
+        data: Optional[dict] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        if "::" not in location:
+            raise ValueError("Transformation location not valid, it must contains a double colons (::)")
+
+        commit_worktree = self.get_commit_worktree(commit=commit)
+        self.validate_location(
+            commit=commit, worktree_directory=commit_worktree.directory, file_path=location.split("::")[0]
+        )
+
+        try:
+            return await transform_pool.run_python_transform(
+                repository_id=str(self.id),
+                commit=commit,
+                directory=commit_worktree.directory,
+                repository_directory=self.directory_root,
+                location=location,
+                branch_name=branch_name,
+                client_config=client.config.model_dump(include=CLIENT_CONFIG_FIELDS),
+                data=data,
+                timeout=timeout,
+            )
+        except TransformPoolError as exc:
+            log.error(exc.message, repository=self.name, branch=branch_name, commit=commit, location=location)
+            raise TransformError(
+                repository_name=self.name, commit=commit, location=location, message=exc.message
+            ) from exc
+
+    async def _run_python_transform(
+        self, transform: InfrahubTransform, branch_name: str, commit: str, location: str, data: Optional[dict] = None
+    ) -> Any:
+        try:
+            return await transform.run(data=data)
+        except Exception as exc:
+            log.critical(
+                str(exc), exc_info=True, repository=self.name, branch=branch_name, commit=commit, location=location
+            )
+            raise TransformError(repository_name=self.name, commit=commit, location=location, message=str(exc)) from exc
+
+    def load_python_transform(
+        self, branch_name: str, commit: str, location: str, client: InfrahubClient
+    ) -> InfrahubTransform:
+        """Load a Python Transform of the repository, to run it once per set of data."""
 
         if "::" not in location:
             raise ValueError("Transformation location not valid, it must contains a double colons (::)")
@@ -1227,18 +1363,11 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             sys.path.append(str(self.directory_root))
 
         try:
-            file_info = extract_repo_file_information(
-                full_filename=commit_worktree.directory / file_path,
-                repo_directory=self.directory_root,
-                worktree_directory=commit_worktree.directory,
+            transform_class: type[InfrahubTransform] = self._load_python_class(
+                commit=commit, directory=commit_worktree.directory, file_path=file_path, class_name=class_name
             )
 
-            module = importlib.import_module(file_info.module_name)
-
-            transform_class: type[InfrahubTransform] = getattr(module, class_name)
-
-            transform = transform_class(root_directory=commit_worktree.directory, branch=branch_name, client=client)
-            return await transform.run(data=data)
+            return transform_class(root_directory=commit_worktree.directory, branch=branch_name, client=client)
 
         except ModuleNotFoundError as exc:
             error_msg = f"Unable to load the transform file {location}"
@@ -1283,7 +1412,10 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
 
         if transformation.typename == InfrahubKind.TRANSFORMJINJA2:
             artifact_content = await self.render_jinja2_template(
-                commit=commit, location=transformation.template_path.value, data=response
+                commit=commit,
+                location=transformation.template_path.value,
+                data=response,
+                timeout=transformation.timeout.value,
             )
         elif transformation.typename == InfrahubKind.TRANSFORMPYTHON:
             transformation_location = f"{transformation.file_path.value}::{transformation.class_name.value}"
@@ -1293,29 +1425,12 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
                 location=transformation_location,
                 data=response,
                 client=self.sdk,
+                timeout=transformation.timeout.value,
             )
 
-        if definition.content_type.value == "application/json":
-            artifact_content_str = ujson.dumps(artifact_content, indent=2)
-        elif definition.content_type.value == "text/plain":
-            artifact_content_str = artifact_content
-
-        checksum = hashlib.md5(bytes(artifact_content_str, encoding="utf-8"), usedforsecurity=False).hexdigest()
-
-        if artifact.checksum.value == checksum:
-            return ArtifactGenerateResult(
-                changed=False, checksum=checksum, storage_id=artifact.storage_id.value, artifact_id=artifact.id
-            )
-
-        resp = await self.sdk.object_store.upload(content=artifact_content_str, tracker="artifact-upload-content")
-        storage_id = resp["identifier"]
-
-        artifact.checksum.value = checksum
-        artifact.storage_id.value = storage_id
-        artifact.status.value = "Ready"
-        await artifact.save()
-
-        return ArtifactGenerateResult(changed=True, checksum=checksum, storage_id=storage_id, artifact_id=artifact.id)
+        return await self._save_artifact_content(
+            artifact=artifact, content=artifact_content, content_type=definition.content_type.value
+        )
 
     async def render_artifact(
         self, artifact: CoreArtifact, message: Union[messages.CheckArtifactCreate, RequestArtifactGenerate]
@@ -1332,7 +1447,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
 
         if message.transform_type == InfrahubKind.TRANSFORMJINJA2:
             artifact_content = await self.render_jinja2_template(
-                commit=message.commit, location=message.transform_location, data=response
+                commit=message.commit, location=message.transform_location, data=response, timeout=message.timeout
             )
         elif message.transform_type == InfrahubKind.TRANSFORMPYTHON:
             artifact_content = await self.execute_python_transform(
@@ -1341,12 +1456,164 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
                 location=message.transform_location,
                 data=response,
                 client=self.sdk,
+                timeout=message.timeout,
             )
 
-        if message.content_type == "application/json":
-            artifact_content_str = ujson.dumps(artifact_content, indent=2)
-        elif message.content_type == "text/plain":
-            artifact_content_str = artifact_content
+        return await self._save_artifact_content(
+            artifact=artifact, content=artifact_content, content_type=message.content_type
+        )
+
+    async def render_artifacts(
+        self, artifacts: list[CoreArtifact], message: RequestArtifactsGenerate
+    ) -> list[Union[ArtifactGenerateResult, Exception]]:
+        """Render the artifacts of several targets of the same artifact definition.
+
+        The data of all the targets is collected with a single request and the transform is only loaded once.
+        The result of each artifact is returned in the same order, as an exception if its generation failed.
+        """
+        responses = await self.query_gql_query_batch(
+            name=message.query,
+            variables=[target.variables for target in message.targets],
+            subscribers=[[artifact.id] for artifact in artifacts],
+            update_group=True,
+            tracker="artifact-query-graphql-data",
+            branch_name=message.branch_name,
+            timeout=message.timeout,
+        )
+
+        if transform_pool.is_enabled:
+            contents = await asyncio.gather(
+                *[self._render_artifact_response(message=message, response=response) for response in responses],
+                return_exceptions=True,
+            )
+        else:
+            contents = await self._render_artifact_responses(message=message, responses=responses)
+
+        results: list[Union[ArtifactGenerateResult, Exception]] = []
+        for artifact, content in zip(artifacts, contents):
+            if isinstance(content, Exception):
+                results.append(content)
+                continue
+            try:
+                results.append(
+                    await self._save_artifact_content(
+                        artifact=artifact, content=content, content_type=message.content_type
+                    )
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                results.append(exc)
+
+        return results
+
+    async def _render_artifact_response(self, message: RequestArtifactsGenerate, response: dict) -> Any:
+        """Render the content of an artifact in the transform pool, the targets are rendered in parallel."""
+        if "errors" in response:
+            raise GraphQLQueryError(errors=response["errors"])
+
+        if message.transform_type == InfrahubKind.TRANSFORMJINJA2:
+            return await self.render_jinja2_template(
+                commit=message.commit, location=message.transform_location, data=response, timeout=message.timeout
+            )
+        return await self.execute_python_transform(
+            branch_name=message.branch_name,
+            commit=message.commit,
+            location=message.transform_location,
+            data=response,
+            client=self.sdk,
+            timeout=message.timeout,
+        )
+
+    async def _render_artifact_responses(
+        self, message: RequestArtifactsGenerate, responses: list[dict]
+    ) -> list[Union[Any, Exception]]:
+        """Render the content of the artifacts within the worker, the transform is only loaded once."""
+        template: Optional[jinja2.Template] = None
+        transform: Optional[InfrahubTransform] = None
+        if message.transform_type == InfrahubKind.TRANSFORMJINJA2:
+            template = self.load_jinja2_template(commit=message.commit, location=message.transform_location)
+        elif message.transform_type == InfrahubKind.TRANSFORMPYTHON:
+            transform = self.load_python_transform(
+                branch_name=message.branch_name,
+                commit=message.commit,
+                location=message.transform_location,
+                client=self.sdk,
+            )
+
+        contents: list[Union[Any, Exception]] = []
+        for response in responses:
+            try:
+                if "errors" in response:
+                    raise GraphQLQueryError(errors=response["errors"])
+
+                if template:
+                    contents.append(
+                        self._render_jinja2_template(
+                            template=template, commit=message.commit, location=message.transform_location, data=response
+                        )
+                    )
+                elif transform:
+                    contents.append(
+                        await self._run_python_transform(
+                            transform=transform,
+                            branch_name=message.branch_name,
+                            commit=message.commit,
+                            location=message.transform_location,
+                            data=response,
+                        )
+                    )
+                else:
+                    raise ValueError(f"Unsupported transform type {message.transform_type}")
+            except Exception as exc:  # pylint: disable=broad-except
+                contents.append(exc)
+
+        return contents
+
+    async def query_gql_query_batch(
+        self,
+        name: str,
+        variables: list[dict],
+        subscribers: list[list[str]],
+        update_group: bool,
+        branch_name: str,
+        timeout: Optional[int] = None,
+        tracker: Optional[str] = None,
+    ) -> list[dict]:
+        """Execute a stored GraphQL query once per set of variables with a single request, like query_gql_query.
+
+        The queries of the batch are executed one after the other, the timeout applies to each query so the timeout of
+        the request is scaled by the size of the batch.
+        """
+        url = f"{self.sdk.address}/api/query/{name}/batch?" + urlencode(
+            {"branch": branch_name, "update_group": str(update_group).lower()}
+        )
+        headers: dict[str, str] = {}
+        if self.sdk.insert_tracker and tracker:
+            headers["X-Infrahub-Tracker"] = tracker
+
+        payload = {
+            "items": [
+                {"variables": item_variables, "subscribers": item_subscribers}
+                for item_variables, item_subscribers in zip(variables, subscribers)
+            ]
+        }
+        resp = await post_api_request(
+            client=self.sdk,
+            url=url,
+            payload=payload,
+            headers=headers,
+            timeout=(timeout or self.sdk.default_timeout) * max(len(variables), 1),
+        )
+        resp.raise_for_status()
+
+        return decode_json(response=resp)["results"]
+
+    async def _save_artifact_content(
+        self, artifact: CoreArtifact, content: Any, content_type: str
+    ) -> ArtifactGenerateResult:
+        if content_type == "application/json":
+            artifact_content_str = ujson.dumps(content, indent=2)
+        elif content_type == "text/plain":
+            artifact_content_str = content
 
         checksum = hashlib.md5(bytes(artifact_content_str, encoding="utf-8"), usedforsecurity=False).hexdigest()
 
@@ -35,6 +35,38 @@ class RequestArtifactGenerate(BaseModel):
     variables: dict = Field(..., description="Input variables when generating the artifact")
 
 
+class ArtifactGenerateTarget(BaseModel):
+    """Target of an artifact generated as part of a batch"""
+
+    target_id: str = Field(..., description="The ID of the target object for this artifact")
+    target_name: str = Field(..., description="Name of the artifact target")
+    artifact_id: Optional[str] = Field(default=None, description="The id of the artifact if it previously existed")
+    variables: dict = Field(..., description="Input variables when generating the artifact")
+
+
+class RequestArtifactsGenerate(BaseModel):
+    """Runs to generate the artifacts of an artifact definition for a batch of targets"""
+
+    artifact_name: str = Field(..., description="Name of the artifact")
+    artifact_definition: str = Field(..., description="The the ID of the artifact definition")
+    commit: str = Field(..., description="The commit to target")
+    content_type: str = Field(..., description="Content type of the artifact")
+    transform_type: str = Field(..., description="The type of transform associated with this artifact")
+    transform_location: str = Field(..., description="The transforms location within the repository")
+    repository_id: str = Field(..., description="The unique ID of the Repository")
+    repository_name: str = Field(..., description="The name of the Repository")
+    repository_kind: str = Field(..., description="The kind of the Repository")
+    branch_name: str = Field(..., description="The branch where the check is run")
+    query: str = Field(..., description="The name of the query to use when collecting data")
+    timeout: int = Field(..., description="Timeout for requests used to generate this artifact")
+    targets: list[ArtifactGenerateTarget] = Field(..., description="The targets to generate an artifact for")
+
+    def get_target_requests(self) -> list[RequestArtifactGenerate]:
+        """Return the request to generate the artifact of each target."""
+        common = self.model_dump(exclude={"targets"})
+        return [RequestArtifactGenerate(**common, **target.model_dump()) for target in self.targets]
+
+
 class GitRepositoryAdd(BaseModel):
     """Clone and sync an external repository after creation."""
 
@@ -97,15 +97,17 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
 
         return True
 
-    async def sync(self, staging_branch: str | None = None) -> None:
+    async def sync(self, staging_branch: str | None = None, fetch: bool = True) -> None:
         """Synchronize the repository with its remote origin and with the database.
 
         By default the sync will focus only on the branches pulled from origin that have some differences with the local one.
+        The fetch can be skipped if the latest updates have already been fetched from the remote origin.
         """
 
         log.info("Starting the synchronization.", repository=self.name)
 
-        await self.fetch()
+        if fetch:
+            await self.fetch()
 
         new_branches, updated_branches = await self.compare_local_remote()
 
@@ -1,6 +1,8 @@
+import asyncio
 from datetime import timedelta
 
 from infrahub_sdk import InfrahubClient
+from infrahub_sdk.data import RepositoryData
 from prefect import flow, task
 from prefect.automations import AutomationCore
 from prefect.client.orchestration import get_client
@@ -9,22 +11,27 @@ from prefect.events.actions import RunDeployment
 from prefect.events.schemas.automations import EventTrigger, Posture
 from prefect.logging import get_run_logger
 
-from infrahub import lock
+from infrahub import config, lock
 from infrahub.core.constants import InfrahubKind, RepositoryInternalStatus
 from infrahub.core.protocols import CoreRepository
 from infrahub.core.registry import registry
 from infrahub.exceptions import RepositoryError
 from infrahub.message_bus import Meta, messages
-from infrahub.services import services
+from infrahub.services import InfrahubServices, services
 from infrahub.worker import WORKER_IDENTITY
 from infrahub.workflows.catalogue import COMPUTED_ATTRIBUTE_SETUP_PYTHON
 
 from ..log import get_log_data, get_logger
 from ..tasks.artifact import define_artifact
-from ..workflows.catalogue import REQUEST_ARTIFACT_DEFINITION_GENERATE, REQUEST_ARTIFACT_GENERATE
+from ..workflows.catalogue import (
+    REQUEST_ARTIFACT_DEFINITION_GENERATE,
+    REQUEST_ARTIFACT_GENERATE,
+    REQUEST_ARTIFACTS_GENERATE,
+)
 from ..workflows.utils import add_branch_tag
 from .constants import AUTOMATION_NAME
 from .models import (
+    ArtifactGenerateTarget,
     GitDiffNamesOnly,
     GitDiffNamesOnlyResponse,
     GitRepositoryAdd,
@@ -34,6 +41,7 @@ from .models import (
     GitRepositoryPullReadOnly,
     RequestArtifactDefinitionGenerate,
     RequestArtifactGenerate,
+    RequestArtifactsGenerate,
 )
 from .repository import InfrahubReadOnlyRepository, InfrahubRepository, get_initialized_repo
 
@@ -139,17 +147,45 @@ async def sync_remote_repositories() -> None:
     branches = await service.client.branch.all()
     repositories = await service.client.get_list_repositories(branches=branches, kind=InfrahubKind.REPOSITORY)
 
-    for repo_name, repository_data in repositories.items():
-        active_internal_status = RepositoryInternalStatus.ACTIVE.value
-        default_internal_status = repository_data.branch_info[registry.default_branch].internal_status
-        staging_branch = None
-        if default_internal_status != RepositoryInternalStatus.ACTIVE.value:
-            active_internal_status = RepositoryInternalStatus.STAGING.value
-            staging_branch = repository_data.get_staging_branch()
+    # The repositories are fetched in parallel but their objects are imported one repository at a time
+    fetch_semaphore = asyncio.Semaphore(config.SETTINGS.git.sync_concurrency)
+    import_lock = asyncio.Lock()
+    results = await asyncio.gather(
+        *[
+            sync_remote_repository(
+                service=service,
+                repo_name=repo_name,
+                repository_data=repository_data,
+                fetch_semaphore=fetch_semaphore,
+                import_lock=import_lock,
+            )
+            for repo_name, repository_data in repositories.items()
+        ],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
-        infrahub_branch = staging_branch or registry.default_branch
 
-        async with lock.registry.get(name=repo_name, namespace="repository"):
+async def sync_remote_repository(
+    service: InfrahubServices,
+    repo_name: str,
+    repository_data: RepositoryData,
+    fetch_semaphore: asyncio.Semaphore,
+    import_lock: asyncio.Lock,
+) -> None:
+    active_internal_status = RepositoryInternalStatus.ACTIVE.value
+    default_internal_status = repository_data.branch_info[registry.default_branch].internal_status
+    staging_branch = None
+    if default_internal_status != RepositoryInternalStatus.ACTIVE.value:
+        active_internal_status = RepositoryInternalStatus.STAGING.value
+        staging_branch = repository_data.get_staging_branch()
+
+    infrahub_branch = staging_branch or registry.default_branch
+
+    async with lock.registry.get(name=repo_name, namespace="repository"):
+        async with fetch_semaphore:
             init_failed = False
             try:
                 repo = await InfrahubRepository.init(
@@ -176,15 +212,26 @@ async def sync_remote_repositories() -> None:
                         internal_status=active_internal_status,
                         default_branch_name=repository_data.repository.default_branch.value,
                     )
-                    await repo.import_objects_from_files(
-                        git_branch_name=registry.default_branch, infrahub_branch_name=infrahub_branch
-                    )
                 except RepositoryError as exc:
                     log.info(exc.message)
-                    continue
+                    return
 
             try:
-                await repo.sync(staging_branch=staging_branch)
+                if not init_failed and not await repo.has_remote_changes():
+                    log.debug("No changes on the remote repository", repository=repo_name)
+                    return
+                await repo.fetch()
+            except RepositoryError as exc:
+                log.info(exc.message)
+                return
+
+        async with import_lock:
+            try:
+                if init_failed:
+                    await repo.import_objects_from_files(
+                        git_branch_name=registry.default_branch, infrahub_branch_name=infrahub_branch
+                    )
+                await repo.sync(staging_branch=staging_branch, fetch=False)
                 # Tell workers to fetch to stay in sync
                 message = messages.RefreshGitFetch(
                     meta=Meta(initiator_id=WORKER_IDENTITY, request_id=get_log_data().get("request_id", "")),
@@ -266,6 +313,60 @@ async def generate_artifact(model: RequestArtifactGenerate) -> None:
         await artifact.save()
 
 
+@flow(name="artifacts-generate", flow_run_name="Generate artifacts {model.artifact_name}")
+async def generate_artifacts(model: RequestArtifactsGenerate) -> None:
+    service = services.service
+
+    await add_branch_tag(branch_name=model.branch_name)
+
+    repo = await get_initialized_repo(
+        repository_id=model.repository_id,
+        name=model.repository_name,
+        service=service,
+        repository_kind=model.repository_kind,
+    )
+
+    # The existing artifacts are fetched at once, only the missing ones are looked up or created one by one
+    target_requests = model.get_target_requests()
+    existing_artifact_ids = [request.artifact_id for request in target_requests if request.artifact_id]
+    existing_artifacts = {}
+    if existing_artifact_ids:
+        existing_artifacts = {
+            artifact.id: artifact
+            for artifact in await service.client.filters(
+                kind=InfrahubKind.ARTIFACT, ids=existing_artifact_ids, branch=model.branch_name
+            )
+        }
+
+    artifacts = []
+    for target_request in target_requests:
+        artifact = existing_artifacts.get(target_request.artifact_id or "")
+        if not artifact:
+            artifact = await define_artifact(message=target_request, service=service)
+        artifacts.append(artifact)
+
+    try:
+        results = await repo.render_artifacts(artifacts=artifacts, message=model)
+    except Exception as exc:  # pylint: disable=broad-except
+        results = [exc] * len(artifacts)
+
+    for artifact, target_request, result in zip(artifacts, target_requests, results):
+        if isinstance(result, Exception):
+            log.error("Failed to generate artifact", error=result, exc_info=result, target=target_request.target_name)
+            artifact.status.value = "Error"
+            await artifact.save()
+            continue
+
+        log.debug(
+            "Generated artifact",
+            name=model.artifact_name,
+            changed=result.changed,
+            checksum=result.checksum,
+            artifact_id=result.artifact_id,
+            storage_id=result.storage_id,
+        )
+
+
 @flow(name="request_artifact_definitions_generate", flow_run_name="Generate artifacts")
 async def generate_request_artifact_definition(model: RequestArtifactDefinitionGenerate) -> None:
     service = services.service
@@ -310,15 +411,26 @@ async def generate_request_artifact_definition(model: RequestArtifactDefinitionG
     elif transform.typename == InfrahubKind.TRANSFORMPYTHON:
         transform_location = f"{transform.file_path.value}::{transform.class_name.value}"
 
+    targets: list[ArtifactGenerateTarget] = []
     for relationship in group.members.peers:
         member = relationship.peer
         artifact_id = artifacts_by_member.get(member.id)
         if model.limit and artifact_id not in model.limit:
             continue
 
-        request_artifact_generate_model = RequestArtifactGenerate(
+        targets.append(
+            ArtifactGenerateTarget(
+                artifact_id=artifact_id,
+                variables=member.extract(params=artifact_definition.parameters.value),
+                target_id=member.id,
+                target_name=member.display_label,
+            )
+        )
+
+    batch_size = config.SETTINGS.git.artifact_batch_size
+    for index in range(0, len(targets), batch_size):
+        request_artifacts_generate_model = RequestArtifactsGenerate(
             artifact_name=artifact_definition.name.value,
-            artifact_id=artifact_id,
             artifact_definition=model.artifact_definition,
             commit=repository.commit.value,
             content_type=artifact_definition.content_type.value,
@@ -329,15 +441,19 @@ async def generate_request_artifact_definition(model: RequestArtifactDefinitionG
             repository_kind=repository.get_kind(),
             branch_name=model.branch,
             query=query.name.value,
-            variables=member.extract(params=artifact_definition.parameters.value),
-            target_id=member.id,
-            target_name=member.display_label,
             timeout=transform.timeout.value,
+            targets=targets[index : index + batch_size],
         )
 
-        await service.workflow.submit_workflow(
-            workflow=REQUEST_ARTIFACT_GENERATE, parameters={"model": request_artifact_generate_model}
-        )
+        if batch_size == 1:
+            await service.workflow.submit_workflow(
+                workflow=REQUEST_ARTIFACT_GENERATE,
+                parameters={"model": request_artifacts_generate_model.get_target_requests()[0]},
+            )
+        else:
+            await service.workflow.submit_workflow(
+                workflow=REQUEST_ARTIFACTS_GENERATE, parameters={"model": request_artifacts_generate_model}
+            )
 
 
 @flow(name="git-repository-pull-read-only", flow_run_name="Pull latest commit on {model.repository_name}")
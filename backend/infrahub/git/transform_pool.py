@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from infrahub_sdk import Config, InfrahubClient
+
+from infrahub import config
+from infrahub.git.cache import commit_resources_cache
+from infrahub.log import get_logger
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnContext, SpawnProcess
+
+log = get_logger()
+
+# Settings of the SDK client passed to the processes of the pool, including its credentials
+CLIENT_CONFIG_FIELDS = {
+    "address",
+    "api_token",
+    "username",
+    "password",
+    "default_branch",
+    "insert_tracker",
+    "timeout",
+    "proxy",
+    "tls_insecure",
+    "tls_ca_file",
+}
+
+
+class TransformPoolError(Exception):
+    """Error raised while rendering a transform in a process of the pool."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+def _render_jinja2_template(repository_id: str, commit: str, directory: str, location: str, data: dict) -> str:
+    resources = commit_resources_cache.get(repository_id=repository_id, commit=commit, directory=Path(directory))
+    try:
+        template = resources.jinja2_environment.get_template(location)
+        return template.render(**data)
+    except Exception as exc:
+        raise TransformPoolError(message=str(exc)) from exc
+
+
+def _run_python_transform(
+    repository_id: str,
+    commit: str,
+    directory: str,
+    repository_directory: str,
+    location: str,
+    branch_name: str,
+    client_config: dict[str, Any],
+    data: Optional[dict],
+) -> Any:
+    file_path, class_name = location.split("::")
+
+    if repository_directory not in sys.path:
+        sys.path.append(repository_directory)
+
+    resources = commit_resources_cache.get(repository_id=repository_id, commit=commit, directory=Path(directory))
+    try:
+        transform_class = resources.get_python_class(
+            file_path=file_path, class_name=class_name, repository_directory=Path(repository_directory)
+        )
+    except ModuleNotFoundError as exc:
+        raise TransformPoolError(message=f"Unable to load the transform file {location}") from exc
+    except AttributeError as exc:
+        raise TransformPoolError(message=f"Unable to find the class {class_name} in {location}") from exc
+
+    try:
+        transform = transform_class(
+            root_directory=directory, branch=branch_name, client=InfrahubClient(config=Config(**client_config))
+        )
+        return asyncio.run(transform.run(data=data))
+    except Exception as exc:
+        raise TransformPoolError(message=str(exc)) from exc
+
+
+TRANSFORM_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "jinja2": _render_jinja2_template,
+    "python": _run_python_transform,
+}
+
+
+def _serve(connection: Connection) -> None:
+    """Render the transforms received from the parent process until the connection is closed."""
+    connection.send((True, None))
+    while True:
+        try:
+            function_name, kwargs = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+
+        try:
+            connection.send((True, TRANSFORM_FUNCTIONS[function_name](**kwargs)))
+        except TransformPoolError as exc:
+            connection.send((False, exc.message))
+        except Exception as exc:  # pylint: disable=broad-except
+            connection.send((False, str(exc)))
+
+
+class TransformWorker:
+    """Process of the pool, started in advance with the Python modules already imported."""
+
+    def __init__(self, context: SpawnContext) -> None:
+        self.connection, child_connection = context.Pipe()
+        self.process: SpawnProcess = context.Process(target=_serve, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+
+    def wait_ready(self) -> None:
+        """Wait until the process has imported the modules, so it's not counted in the timeout of the transform."""
+        if not self.ready:
+            self.connection.recv()
+            self.ready = True
+
+    def stop(self) -> None:
+        self.connection.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+
+class TransformPool:
+    """Pool of processes to render the Jinja2 templates and the Python transforms outside of the event loop.
+
+    Each process renders one transform at a time, when a transform exceeds its timeout the process
+    is terminated and replaced by a new one without impacting the other transforms in progress.
+    """
+
+    def __init__(self) -> None:
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: list[TransformWorker] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def size(self) -> int:
+        return config.SETTINGS.git.transform_workers
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.size > 0
+
+    def start(self) -> None:
+        """Start the processes of the pool, if it's enabled, so they are ready when the first transform arrives."""
+        while len(self._idle_workers) < self.size:
+            self._idle_workers.append(TransformWorker(context=self._context))
+
+    def shutdown(self) -> None:
+        for worker in self._idle_workers:
+            worker.stop()
+        self._idle_workers = []
+        self._semaphore = None
+
+    def _replace(self, worker: TransformWorker) -> None:
+        log.warning(f"Replacing the transform process {worker.process.pid}")
+        worker.stop()
+        self._idle_workers.append(TransformWorker(context=self._context))
+
+    async def render_jinja2_template(
+        self, repository_id: str, commit: str, directory: Path, location: str, data: dict, timeout: Optional[int]
+    ) -> str:
+        return await self._execute(
+            function_name="jinja2",
+            kwargs={
+                "repository_id": repository_id,
+                "commit": commit,
+                "directory": str(directory),
+                "location": location,
+                "data": data,
+            },
+            timeout=timeout,
+        )
+
+    async def run_python_transform(
+        self,
+        repository_id: str,
+        commit: str,
+        directory: Path,
+        repository_directory: Path,
+        location: str,
+        branch_name: str,
+        client_config: dict[str, Any],
+        data: Optional[dict],
+        timeout: Optional[int],
+    ) -> Any:
+        return await self._execute(
+            function_name="python",
+            kwargs={
+                "repository_id": repository_id,
+                "commit": commit,
+                "directory": str(directory),
+                "repository_directory": str(repository_directory),
+                "location": location,
+                "branch_name": branch_name,
+                "client_config": client_config,
+                "data": data,
+            },
+            timeout=timeout,
+        )
+
+    async def _execute(self, function_name: str, kwargs: dict[str, Any], timeout: Optional[int]) -> Any:
+        if not self._semaphore:
+            self._semaphore = asyncio.Semaphore(self.size)
+
+        async with self._semaphore:
+            worker = self._idle_workers.pop() if self._idle_workers else TransformWorker(context=self._context)
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, worker.wait_ready)
+                await loop.run_in_executor(None, worker.connection.send, (function_name, kwargs))
+                success, result = await asyncio.wait_for(
+                    loop.run_in_executor(None, worker.connection.recv), timeout=timeout
+                )
+            except asyncio.TimeoutError as exc:
+                self._replace(worker=worker)
+                raise TransformPoolError(message=f"Transform not completed within {timeout} seconds") from exc
+            except (EOFError, OSError) as exc:
+                self._replace(worker=worker)
+                raise TransformPoolError(message="The transform process exited unexpectedly") from exc
+            except BaseException:
+                self._replace(worker=worker)
+                raise
+
+            self._idle_workers.append(worker)
+
+        if not success:
+            raise TransformPoolError(message=result)
+        return result
+
+
+transform_pool = TransformPool()
@@ -1,6 +1,21 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from inspect import isawaitable
 from typing import Any, Optional
 
-from graphql import GraphQLSchema, OperationType
+from graphql import (
+    DocumentNode,
+    ExecutionContext,
+    ExecutionResult,
+    GraphQLError,
+    GraphQLSchema,
+    Middleware,
+    OperationType,
+    execute,
+    parse,
+    validate_schema,
+)
 from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
@@ -8,26 +23,91 @@ from infrahub.core.branch import Branch
 from infrahub.graphql.utils import extract_schema_models
 
 
+@dataclass
+class GraphQLQueryAnalysis:
+    """Result of the analysis of a query, it only depends on the query and on the schema it's executed against."""
+
+    document: DocumentNode
+    is_validated: bool = False
+    validation_errors: Optional[list[GraphQLError]] = None
+    fields: Optional[dict[str, Any]] = None
+    models_in_use: Optional[set[str]] = None
+
+
+class GraphQLQueryAnalysisCache:
+    """LRU cache of the analysis of the queries, indexed by the hash of the query and the hash of the schema."""
+
+    def __init__(self, max_size: int = 512) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], GraphQLQueryAnalysis] = OrderedDict()
+
+    def get(self, query: str, schema_hash: str) -> GraphQLQueryAnalysis:
+        key = (hashlib.sha256(query.encode(), usedforsecurity=False).hexdigest(), schema_hash)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        analysis = GraphQLQueryAnalysis(document=parse(query))
+        self._entries[key] = analysis
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return analysis
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+query_analysis_cache = GraphQLQueryAnalysisCache()
+
+
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
-    def __init__(
+    def __init__(  # pylint: disable=super-init-not-called
         self,
         query: str,
         query_variables: Optional[dict[str, Any]] = None,
         schema: Optional[GraphQLSchema] = None,
         operation_name: Optional[str] = None,
         branch: Optional[Branch] = None,
+        schema_hash: Optional[str] = None,
     ) -> None:
+        """Analyze a query, if the hash of the schema is provided the analysis is shared by all requests using the same query."""
         self.branch: Optional[Branch] = branch
         self.operation_name: Optional[str] = operation_name
         self.query_variables: dict[str, Any] = query_variables or {}
-        super().__init__(query=query, schema=schema)
+        self.query: str = query
+        self.schema: Optional[GraphQLSchema] = schema
+        if schema and schema_hash:
+            self.analysis = query_analysis_cache.get(query=query, schema_hash=schema_hash)
+        else:
+            self.analysis = GraphQLQueryAnalysis(document=parse(query))
+        self.document: DocumentNode = self.analysis.document
+        self._fields: Optional[dict] = None
 
     @property
     def operation_names(self) -> list[str]:
         return [operation.name for operation in self.operations if operation.name is not None]
 
+    @property
+    def is_valid(self) -> tuple[bool, Optional[list[GraphQLError]]]:
+        if self.schema is None:
+            return super().is_valid
+
+        if not self.analysis.is_validated:
+            _, self.analysis.validation_errors = super().is_valid
+            self.analysis.is_validated = True
+
+        return not self.analysis.validation_errors, self.analysis.validation_errors
+
+    async def get_fields(self) -> dict[str, Any]:
+        if self.analysis.fields is None:
+            self.analysis.fields = await super().get_fields()
+        return self.analysis.fields
+
     async def get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if self.analysis.models_in_use is not None:
+            return self.analysis.models_in_use
+
         graphql_types = set()
         models = set()
 
@@ -57,4 +137,41 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
             except ValueError:
                 continue
 
+        self.analysis.models_in_use = models
         return models
+
+    async def execute(
+        self,
+        context_value: Any,
+        root_value: Any = None,
+        middleware: Optional[Middleware] = None,
+        execution_context_class: Optional[type[ExecutionContext]] = None,
+    ) -> ExecutionResult:
+        """Execute the query, reusing the document and the result of the validation of the analysis.
+
+        This is equivalent to `graphql.graphql` without parsing and validating the query again.
+        """
+        if not self.schema:
+            raise ValueError("Schema must be provided to execute the query.")
+
+        schema_validation_errors = validate_schema(self.schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        valid, errors = self.is_valid
+        if not valid:
+            return ExecutionResult(data=None, errors=errors)
+
+        result = execute(
+            schema=self.schema,
+            document=self.document,
+            root_value=root_value,
+            context_value=context_value,
+            variable_values=self.query_variables,
+            operation_name=self.operation_name,
+            middleware=middleware,
+            execution_context_class=execution_context_class,
+        )
+        if isawaitable(result):
+            return await result
+        return result
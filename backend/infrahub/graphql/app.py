@@ -23,32 +23,35 @@ import ujson
 from graphql import (
     ExecutionContext,
     ExecutionResult,
+    FieldNode,
     GraphQLError,
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
     parse,
     subscribe,
     validate,
 )
 from graphql.error.graphql_error import format_error
+from graphql.execution.values import get_argument_values
 from graphql.utilities import (
     get_operation_ast,
 )
 from opentelemetry import trace
 from starlette.datastructures import UploadFile
 from starlette.requests import ClientDisconnect, HTTPConnection, Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from infrahub import config
 from infrahub.api.dependencies import api_key_scheme, cookie_auth_scheme, jwt_scheme
 from infrahub.auth import AccountSession, authentication_token
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
 from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
-from infrahub.graphql.initialization import GraphqlParams, prepare_graphql_params
+from infrahub.graphql.initialization import GraphqlParams, GraphqlStreamPage, prepare_graphql_params
+from infrahub.graphql.resolver import default_paginated_list_resolver
 from infrahub.log import get_logger
 
 from .metrics import (
@@ -89,6 +92,8 @@ GQL_ERROR = "error"
 GQL_START = "start"
 GQL_STOP = "stop"
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 ContextValue = Union[Any, Callable[[HTTPConnection], Any]]
 RootValue = Any
 
@@ -182,7 +187,7 @@ class InfrahubGraphQLApp:
 
     async def _handle_http_request(
         self, request: Request, db: InfrahubDatabase, branch: Branch, account_session: AccountSession
-    ) -> JSONResponse:
+    ) -> Response:
         if request.app.state.response_delay:
             self.logger.info(f"Adding response delay of {request.app.state.response_delay} seconds")
             time.sleep(request.app.state.response_delay)
@@ -213,6 +218,7 @@ class InfrahubGraphQLApp:
             schema=graphql_params.schema,
             operation_name=operation_name,
             branch=branch,
+            schema_hash=graphql_params.schema_hash,
         )
         await self._evaluate_permissions(
             db=db,
@@ -238,18 +244,34 @@ class InfrahubGraphQLApp:
 
         labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
 
+        stream_field = self._get_stream_field(request=request, query=analyzed_query)
+        if stream_field:
+            offset, limit = self._get_stream_pagination(query=analyzed_query, field=stream_field)
+            if limit is not None and limit < 1:
+                return JSONResponse(
+                    {"errors": ["The limit of a streamed query must be greater than 0"]}, status_code=400
+                )
+            return StreamingResponse(
+                self._stream_paginated_query(
+                    query=analyzed_query,
+                    query_parameters=graphql_params,
+                    field=stream_field,
+                    offset=offset,
+                    limit=limit,
+                    labels=labels,
+                ),
+                media_type=NDJSON_MEDIA_TYPE,
+                background=graphql_params.context.background,
+            )
+
         with trace.get_tracer(__name__).start_as_current_span("execute_graphql") as span:
             span.set_attributes(labels)
 
             with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
+                result = await analyzed_query.execute(
                     context_value=graphql_params.context,
                     root_value=self.root_value,
                     middleware=self.middleware,
-                    variable_values=variable_values,
-                    operation_name=operation_name,
                     execution_context_class=self.execution_context_class,
                 )
 
@@ -266,20 +288,125 @@ class InfrahubGraphQLApp:
             background=graphql_params.context.background,
         )
 
-        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.render(response)))
-        GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await analyzed_query.calculate_depth())
-        GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await analyzed_query.calculate_height())
-        # GRAPHQL_QUERY_VARS_METRICS.labels(**labels).observe(len(analyzed_query.variables))
-        GRAPHQL_TOP_LEVEL_QUERIES_METRICS.labels(**labels).observe(analyzed_query.nbr_queries)
+        await self._observe_query_metrics(
+            query=analyzed_query,
+            query_parameters=graphql_params,
+            labels=labels,
+            response_size=len(json_response.render(response)),
+        )
+
+        return json_response
+
+    @staticmethod
+    async def _observe_query_metrics(
+        query: InfrahubGraphQLQueryAnalyzer, query_parameters: GraphqlParams, labels: dict[str, Any], response_size: int
+    ) -> None:
+        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(response_size)
+        GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await query.calculate_depth())
+        GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await query.calculate_height())
+        # GRAPHQL_QUERY_VARS_METRICS.labels(**labels).observe(len(query.variables))
+        GRAPHQL_TOP_LEVEL_QUERIES_METRICS.labels(**labels).observe(query.nbr_queries)
         GRAPHQL_QUERY_OBJECTS_METRICS.labels(**labels).observe(
-            len(await analyzed_query.get_models_in_use(types=graphql_params.context.types))
+            len(await query.get_models_in_use(types=query_parameters.context.types))
         )
 
-        valid, errors = analyzed_query.is_valid
+        valid, errors = query.is_valid
         if not valid:
             GRAPHQL_QUERY_ERRORS_METRICS.labels(**labels).observe(len(errors))
 
-        return json_response
+    @staticmethod
+    def _get_stream_field(request: Request, query: InfrahubGraphQLQueryAnalyzer) -> Optional[FieldNode]:
+        """Return the field to stream if the client accepts NDJSON and the query only contains a paginated list query."""
+        if NDJSON_MEDIA_TYPE not in request.headers.get("Accept", "") or not query.schema:
+            return None
+
+        valid, _ = query.is_valid
+        if not valid or len(query.operations) != 1 or query.contains_mutation:
+            return None
+
+        operation = get_operation_ast(query.document, query.operation_name)
+        if not operation or operation.operation != OperationType.QUERY:
+            return None
+
+        selections = operation.selection_set.selections
+        if len(selections) != 1 or not isinstance(selections[0], FieldNode):
+            return None
+
+        field_definition = (
+            query.schema.query_type.fields.get(selections[0].name.value) if query.schema.query_type else None
+        )
+        if not field_definition or field_definition.resolve is not default_paginated_list_resolver:
+            return None
+
+        return selections[0]
+
+    @staticmethod
+    def _get_stream_pagination(query: InfrahubGraphQLQueryAnalyzer, field: FieldNode) -> tuple[int, Optional[int]]:
+        """Return the offset and the limit requested for the streamed field."""
+        query_type = cast("GraphQLSchema", query.schema).query_type
+        arguments = get_argument_values(
+            query_type.fields[field.name.value],  # type: ignore[union-attr]
+            field,
+            query.query_variables,
+        )
+        return arguments.get("offset") or 0, arguments.get("limit")
+
+    async def _stream_paginated_query(
+        self,
+        query: InfrahubGraphQLQueryAnalyzer,
+        query_parameters: GraphqlParams,
+        field: FieldNode,
+        offset: int,
+        limit: Optional[int],
+        labels: dict[str, Any],
+    ) -> AsyncGenerator[str, None]:
+        """Execute a paginated list query by pages of nodes and return the response of each page on its own line.
+
+        Each line is a complete GraphQL response containing the edges of one page, the count is only included in the
+        first one. Only one page is held in memory at once, whatever the number of nodes requested.
+        """
+        response_key = field.alias.value if field.alias else field.name.value
+        page_size = config.SETTINGS.api.graphql_stream_page_size
+
+        nbr_nodes = 0
+        response_size = 0
+        with trace.get_tracer(__name__).start_as_current_span("execute_graphql") as span:
+            span.set_attributes(labels)
+
+            while limit is None or nbr_nodes < limit:
+                page_limit = page_size if limit is None else min(page_size, limit - nbr_nodes)
+                query_parameters.context.stream_page = GraphqlStreamPage(
+                    offset=offset + nbr_nodes, limit=page_limit, include_count=nbr_nodes == 0
+                )
+                query_parameters.context.related_node_ids = set()
+
+                with GRAPHQL_DURATION_METRICS.labels(**labels).time():
+                    result = await query.execute(
+                        context_value=query_parameters.context,
+                        root_value=self.root_value,
+                        middleware=self.middleware,
+                        execution_context_class=self.execution_context_class,
+                    )
+
+                response: dict[str, Any] = {"data": result.data}
+                if result.errors:
+                    for error in result.errors:
+                        if error.original_error:
+                            self._log_error(error=error.original_error)
+                    response["errors"] = [self.error_formatter(error) for error in result.errors]
+
+                line = ujson.dumps(response) + "\n"
+                response_size += len(line)
+                yield line
+
+                page = (result.data or {}).get(response_key)
+                if result.errors or not page or len(page.get("edges") or []) < page_limit:
+                    break
+                nbr_nodes += page_limit
+
+        await self._observe_query_metrics(
+            query=query, query_parameters=query_parameters, labels=labels, response_size=response_size
+        )
 
     def _set_labels(self, request: Request, branch: Branch, query: InfrahubGraphQLQueryAnalyzer) -> dict[str, Any]:
         return {
@@ -52,6 +52,8 @@ class ObjectPermissionChecker(GraphQLQueryPermissionCheckerInterface):
                         # Require both create and update for Upsert mutations
                         actions.add("create")
                         actions.add("update")
+                    elif query_action == "createmany":
+                        actions.add("create")
                     else:
                         actions.add(query_action)
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from starlette.background import BackgroundTasks
@@ -9,6 +9,7 @@ from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError
 
+from .loaders.peers import PeerRelationshipsDataLoader, QueryPeerParams
 from .manager import GraphQLSchemaManager
 
 if TYPE_CHECKING:
@@ -25,6 +26,16 @@ if TYPE_CHECKING:
 class GraphqlParams:
     schema: GraphQLSchema
     context: GraphqlContext
+    schema_hash: Optional[str] = None
+
+
+@dataclass
+class GraphqlStreamPage:
+    """Page of a streamed paginated query, it replaces the offset and the limit requested by the query."""
+
+    offset: int
+    limit: int
+    include_count: bool = True
 
 
 @dataclass
@@ -33,11 +44,21 @@ class GraphqlContext:
     branch: Branch
     types: dict
     at: Optional[Timestamp] = None
+    requested_at: Optional[Timestamp] = None
     related_node_ids: Optional[set] = None
     service: Optional[InfrahubServices] = None
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    peer_loaders: dict[str, PeerRelationshipsDataLoader] = field(default_factory=dict)
+    stream_page: Optional[GraphqlStreamPage] = None
+
+    def get_peers_loader(self, query_params: QueryPeerParams) -> PeerRelationshipsDataLoader:
+        """Return the loader shared by all the resolvers querying the peers of the same relationship with the same parameters."""
+        key = query_params.key
+        if key not in self.peer_loaders:
+            self.peer_loaders[key] = PeerRelationshipsDataLoader(db=self.db, query_params=query_params)
+        return self.peer_loaders[key]
 
     @property
     def active_account_session(self) -> AccountSession:
@@ -81,12 +102,19 @@ def prepare_graphql_params(
     if request and not service:
         service = request.app.state.service
 
+    # Only the full schema is cached and can be identified by the hash of the schema of the branch
+    schema_hash = None
+    if all((include_query, include_mutation, include_subscription, include_types)):
+        schema_hash = GraphQLSchemaManager.get_schema_hash_for_branch(branch=branch)
+
     return GraphqlParams(
         schema=gql_schema,
+        schema_hash=schema_hash,
         context=GraphqlContext(
             db=db,
             branch=branch,
             at=Timestamp(at),
+            requested_at=Timestamp(at) if at else None,
             types=gqlm.get_graphql_types(),
             related_node_ids=set(),
             background=BackgroundTasks(),
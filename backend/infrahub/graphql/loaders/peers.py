@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+import ujson
+
+from infrahub.core.manager import NodeManager
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.relationship import Relationship
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class QueryPeerParams:
+    branch: Branch
+    source_kind: str
+    schema: RelationshipSchema
+    filters: dict[str, Any] = field(default_factory=dict)
+    fields: Optional[dict] = None
+    at: Optional[Timestamp] = None
+    branch_agnostic: bool = False
+
+    @property
+    def key(self) -> str:
+        """Identify all the requests that can be resolved together with a single query."""
+        return "|".join(
+            [
+                self.branch.name,
+                self.at.to_string() if self.at else "",
+                self.source_kind,
+                self.schema.name,
+                self.schema.get_identifier(),
+                str(self.branch_agnostic),
+                ujson.dumps(self.filters, sort_keys=True, default=str),
+                ujson.dumps(self.fields or {}, sort_keys=True, default=str),
+            ]
+        )
+
+
+class PeerRelationshipsDataLoader:
+    """Collect the node ids requested for a given relationship during the same iteration of the event loop
+    and query the peers of all of them with a single query.
+
+    Results are not kept once a batch has been resolved, the loader only deduplicates the ids within a batch
+    to ensure that a mutation executed within the same request can't return stale data.
+    """
+
+    def __init__(self, db: InfrahubDatabase, query_params: QueryPeerParams) -> None:
+        self.db = db
+        self.query_params = query_params
+        self._queue: list[str] = []
+        self._pending: dict[str, asyncio.Future[list[Relationship]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, node_id: str) -> list[Relationship]:
+        if node_id not in self._pending:
+            loop = asyncio.get_running_loop()
+            self._pending[node_id] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(node_id)
+
+        return await self._pending[node_id]
+
+    def _dispatch(self) -> None:
+        node_ids, self._queue = self._queue, []
+        futures = {node_id: self._pending.pop(node_id) for node_id in node_ids}
+        task = asyncio.ensure_future(self._resolve(futures=futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, futures: dict[str, asyncio.Future[list[Relationship]]]) -> None:
+        try:
+            peers_by_node_id = await self.batch_load(node_ids=list(futures.keys()))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for node_id, future in futures.items():
+            if not future.done():
+                future.set_result(peers_by_node_id.get(node_id, []))
+
+    async def batch_load(self, node_ids: list[str]) -> dict[str, list[Relationship]]:
+        async with self.db.start_session() as db:
+            peer_rels = await NodeManager.query_peers(
+                db=db,
+                ids=node_ids,
+                source_kind=self.query_params.source_kind,
+                schema=self.query_params.schema,
+                filters=self.query_params.filters,
+                fields=self.query_params.fields,
+                at=self.query_params.at,
+                branch=self.query_params.branch,
+                branch_agnostic=self.query_params.branch_agnostic,
+                fetch_peers=True,
+            )
+
+        peers_by_node_id: dict[str, list[Relationship]] = defaultdict(list)
+        for rel in peer_rels:
+            peers_by_node_id[rel.node_id].append(rel)
+        return peers_by_node_id
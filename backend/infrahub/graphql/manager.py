@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
@@ -85,6 +86,7 @@ class GraphqlMutations:
     update: type[InfrahubMutation]
     upsert: type[InfrahubMutation]
     delete: type[InfrahubMutation]
+    create_many: Optional[type[InfrahubMutation]] = None
 
 
 def get_attr_kind(node_schema: MainSchemaTypes, attr_schema: AttributeSchema) -> str:
@@ -104,10 +106,12 @@ class BranchDetails:
 class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
     _extra_types: dict[str, GraphQLTypes] = {}
     _branch_details_by_name: dict[str, BranchDetails] = {}
+    _manager_by_schema_hash: dict[str, GraphQLSchemaManager] = {}
 
     @classmethod
     def clear_cache(cls) -> None:
         cls._branch_details_by_name = {}
+        cls._manager_by_schema_hash = {}
 
     @classmethod
     def _cache_branch(
@@ -118,13 +122,24 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 schema_hash = branch.schema_hash.main
             else:
                 schema_hash = schema_branch.get_hash()
+        # The branches with the same schema share the same manager and the GraphQL schema it generated
+        gql_manager = cls._manager_by_schema_hash.get(schema_hash)
+        if not gql_manager:
+            gql_manager = cls(schema=schema_branch)
+            cls._manager_by_schema_hash[schema_hash] = gql_manager
+
         branch_details = BranchDetails(
             branch_name=branch.name,
             schema_changed_at=Timestamp(branch.schema_changed_at) if branch.schema_changed_at else Timestamp(),
             schema_hash=schema_hash,
-            gql_manager=cls(schema=schema_branch),
+            gql_manager=gql_manager,
         )
         cls._branch_details_by_name[branch.name] = branch_details
+
+        used_schema_hashes = {details.schema_hash for details in cls._branch_details_by_name.values()}
+        for unused_schema_hash in set(cls._manager_by_schema_hash.keys()) - used_schema_hashes:
+            del cls._manager_by_schema_hash[unused_schema_hash]
+
         return branch_details
 
     @classmethod
@@ -150,6 +165,32 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return cached_branch_details.gql_manager
 
+    @classmethod
+    async def warm_up_branch(cls, branch: Branch, schema_branch: SchemaBranch) -> None:
+        """Generate the GraphQL schema of a branch ahead of its first request, if no branch with the same schema has done it.
+
+        The schema is generated in a thread by a new manager, to not block the event loop. The manager is only shared
+        with the requests once its schema is complete, as generating it isn't safe to run concurrently with them.
+        """
+        schema_hash = branch.schema_hash.main if branch.schema_hash else schema_branch.get_hash()
+        if schema_hash not in cls._manager_by_schema_hash:
+            gql_manager = await asyncio.to_thread(cls._generate_manager, schema_branch=schema_branch)
+            cls._manager_by_schema_hash.setdefault(schema_hash, gql_manager)
+        cls.get_manager_for_branch(branch=branch, schema_branch=schema_branch)
+
+    @classmethod
+    def _generate_manager(cls, schema_branch: SchemaBranch) -> GraphQLSchemaManager:
+        gql_manager = cls(schema=schema_branch)
+        gql_manager.get_graphql_schema()
+        return gql_manager
+
+    @classmethod
+    def get_schema_hash_for_branch(cls, branch: Branch) -> str | None:
+        """Return the hash of the schema used to generate the GraphQL schema currently cached for this branch."""
+        if branch_details := cls._branch_details_by_name.get(branch.name):
+            return branch_details.schema_hash
+        return None
+
     def __init__(self, schema: SchemaBranch) -> None:
         self.schema = schema
 
@@ -514,6 +555,8 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 class_attrs[f"{node_schema.kind}Update"] = mutations.update.Field()
                 class_attrs[f"{node_schema.kind}Upsert"] = mutations.upsert.Field()
                 class_attrs[f"{node_schema.kind}Delete"] = mutations.delete.Field()
+                if mutations.create_many:
+                    class_attrs[f"{node_schema.kind}CreateMany"] = mutations.create_many.Field()
 
             elif (
                 isinstance(node_schema, GenericSchema)
@@ -648,7 +691,20 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         self.set_type(name=upsert._meta.name, graphql_type=upsert)
         self.set_type(name=delete._meta.name, graphql_type=delete)
 
-        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+        # Objects with a dedicated mutation class may require some extra processing during the creation,
+        # the bulk creation is only available for the objects relying on the default or the IPAM mutations
+        create_many = None
+        if isinstance(schema, NodeSchema) and base_class in (
+            InfrahubMutation,
+            InfrahubIPAddressMutation,
+            InfrahubIPPrefixMutation,
+        ):
+            create_many = self.generate_graphql_mutation_create_many(
+                schema=schema, base_class=base_class, input_type=graphql_mutation_create_input
+            )
+            self.set_type(name=create_many._meta.name, graphql_type=create_many)
+
+        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete, create_many=create_many)
 
     def generate_graphql_mutation_create_input(
         self, schema: Union[NodeSchema, ProfileSchema]
@@ -803,6 +859,33 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return type(name, (base_class,), main_attrs)
 
+    def generate_graphql_mutation_create_many(
+        self,
+        schema: NodeSchema,
+        input_type: type[graphene.InputObjectType],
+        base_class: type[InfrahubMutation] = InfrahubMutation,
+    ) -> type[InfrahubMutation]:
+        """Generate a GraphQL Mutation to CREATE multiple objects at once based on the specified NodeSchema."""
+        name = f"{schema.kind}CreateMany"
+
+        object_type = self.generate_graphql_object(schema=schema)
+
+        main_attrs: dict[str, Any] = {
+            "ok": graphene.Boolean(),
+            "count": graphene.Int(),
+            "objects": graphene.List(graphene.NonNull(object_type)),
+        }
+
+        meta_attrs: dict[str, Any] = {"schema": schema, "name": name, "description": schema.description}
+        main_attrs["Meta"] = type("Meta", (object,), meta_attrs)
+
+        args_attrs = {
+            "data": graphene.List(graphene.NonNull(input_type), required=True),
+        }
+        main_attrs["Arguments"] = type("Arguments", (object,), args_attrs)
+
+        return type(name, (base_class,), main_attrs)
+
     def generate_graphql_mutation_update(
         self,
         schema: MainSchemaTypes,
@@ -8,6 +8,7 @@ from typing_extensions import Self
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
+from infrahub.core.ipam.model import IpamNodeDetails
 from infrahub.core.ipam.reconciler import IpamReconciler
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -117,6 +118,37 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
 
         return reconciled_address, result
 
+    @classmethod
+    @retry_db_transaction(name="ipaddress_create_many")
+    async def mutate_create_many_objects(
+        cls,
+        data: list[InputObjectType],
+        db: InfrahubDatabase,
+        branch: Branch,
+    ) -> list[Node]:
+        namespace_ids = [await validate_namespace(db=db, data=item) for item in data]
+
+        async with db.start_transaction() as dbt:
+            addresses = await super().mutate_create_many_objects(data=data, db=dbt, branch=branch)
+            reconciler = IpamReconciler(db=dbt, branch=branch)
+            await reconciler.reconcile_many(
+                ipam_node_details=[
+                    IpamNodeDetails(
+                        node_uuid=address.get_id(),
+                        is_address=True,
+                        is_delete=False,
+                        namespace_id=namespace_id,
+                        ip_value=address.address.value,
+                    )
+                    for address, namespace_id in zip(addresses, namespace_ids)
+                ]
+            )
+            reconciled_addresses = await NodeManager.get_many(
+                db=dbt, branch=branch, ids=[address.get_id() for address in addresses]
+            )
+
+        return [reconciled_addresses[address.get_id()] for address in addresses]
+
     @classmethod
     @retry_db_transaction(name="ipaddress_update")
     async def mutate_update(
@@ -227,6 +259,37 @@ class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
 
         return reconciled_prefix, result
 
+    @classmethod
+    @retry_db_transaction(name="ipprefix_create_many")
+    async def mutate_create_many_objects(
+        cls,
+        data: list[InputObjectType],
+        db: InfrahubDatabase,
+        branch: Branch,
+    ) -> list[Node]:
+        namespace_ids = [await validate_namespace(db=db, data=item) for item in data]
+
+        async with db.start_transaction() as dbt:
+            prefixes = await super().mutate_create_many_objects(data=data, db=dbt, branch=branch)
+            reconciler = IpamReconciler(db=dbt, branch=branch)
+            await reconciler.reconcile_many(
+                ipam_node_details=[
+                    IpamNodeDetails(
+                        node_uuid=prefix.get_id(),
+                        is_address=False,
+                        is_delete=False,
+                        namespace_id=namespace_id,
+                        ip_value=prefix.prefix.value,
+                    )
+                    for prefix, namespace_id in zip(prefixes, namespace_ids)
+                ]
+            )
+            reconciled_prefixes = await NodeManager.get_many(
+                db=dbt, branch=branch, ids=[prefix.get_id() for prefix in prefixes]
+            )
+
+        return [reconciled_prefixes[prefix.get_id()] for prefix in prefixes]
+
     @classmethod
     @retry_db_transaction(name="ipprefix_update")
     async def mutate_update(
@@ -26,6 +26,7 @@ from infrahub.dependencies.registry import get_component_registry
 from infrahub.events import EventMeta, NodeMutatedEvent
 from infrahub.exceptions import ValidationError
 from infrahub.log import get_log_data, get_logger
+from infrahub.permissions.cache import invalidate_permissions_cache, is_permission_node
 from infrahub.worker import WORKER_IDENTITY
 
 from .node_getter.by_default_filter import MutationNodeGetterByDefaultFilter
@@ -59,11 +60,15 @@ class InfrahubMutationMixin:
         context: GraphqlContext = info.context
 
         obj = None
+        objs: list[Node] = []
         mutation = None
         action = MutationAction.UNDEFINED
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
-        if "Create" in cls.__name__:
+        if cls.__name__.endswith("CreateMany"):
+            objs, mutation = await cls.mutate_create_many(info=info, branch=context.branch, data=data, **kwargs)
+            action = MutationAction.ADDED
+        elif "Create" in cls.__name__:
             obj, mutation = await cls.mutate_create(info=info, branch=context.branch, data=data, **kwargs)
             action = MutationAction.ADDED
         elif "Update" in cls.__name__:
@@ -94,22 +99,26 @@ class InfrahubMutationMixin:
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
 
+        if any(is_permission_node(node=mutated_obj) for mutated_obj in objs or [obj]):
+            await invalidate_permissions_cache()
+
         if config.SETTINGS.broker.enable and context.background:
             log_data = get_log_data()
             request_id = log_data.get("request_id", "")
 
-            graphql_payload = await obj.to_graphql(db=context.db, filter_sensitive=True)
+            for mutated_obj in objs or [obj]:
+                graphql_payload = await mutated_obj.to_graphql(db=context.db, filter_sensitive=True)
 
-            event = NodeMutatedEvent(
-                branch=context.branch.name,
-                kind=obj._schema.kind,
-                node_id=obj.id,
-                data=graphql_payload,
-                action=action,
-                meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
-            )
+                event = NodeMutatedEvent(
+                    branch=context.branch.name,
+                    kind=mutated_obj._schema.kind,
+                    node_id=mutated_obj.id,
+                    data=graphql_payload,
+                    action=action,
+                    meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+                )
 
-            context.background.add_task(context.service.event.send, event)
+                context.background.add_task(context.service.event.send, event)
 
         return mutation
 
@@ -193,6 +202,68 @@ class InfrahubMutationMixin:
             result["object"] = await obj.to_graphql(db=db, fields=fields.get("object", {}))
         return cls(**result)
 
+    @classmethod
+    async def mutate_create_many(
+        cls,
+        info: GraphQLResolveInfo,
+        data: list[InputObjectType],
+        branch: Branch,
+        database: Optional[InfrahubDatabase] = None,
+    ) -> tuple[list[Node], Self]:
+        context: GraphqlContext = info.context
+        db = database or context.db
+        objs = await cls.mutate_create_many_objects(data=data, db=db, branch=branch)
+
+        fields = await extract_fields(info.field_nodes[0].selection_set)
+        result: dict[str, Any] = {"ok": True, "count": len(objs)}
+        if "objects" in fields:
+            result["objects"] = [await obj.to_graphql(db=db, fields=fields.get("objects", {})) for obj in objs]
+        return objs, cls(**result)
+
+    @classmethod
+    @retry_db_transaction(name="object_create_many")
+    async def mutate_create_many_objects(
+        cls,
+        data: list[InputObjectType],
+        db: InfrahubDatabase,
+        branch: Branch,
+    ) -> list[Node]:
+        """Create multiple objects of the same kind.
+
+        All the objects are validated together before being created with a single query,
+        if one of them is invalid none of them is created.
+        """
+        component_registry = get_component_registry()
+        node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=branch)
+        node_class = Node
+        if cls._meta.schema.kind in registry.node:
+            node_class = registry.node[cls._meta.schema.kind]
+
+        try:
+            objs: list[Node] = []
+            fields_to_validate: set[str] = set()
+            for item in data:
+                obj = await node_class.init(db=db, schema=cls._meta.schema, branch=branch)
+                await obj.new(db=db, **item)
+                fields_to_validate.update(item)
+                objs.append(obj)
+
+            await node_constraint_runner.check_many(nodes=objs, field_filters=list(fields_to_validate))
+            if db.is_transaction:
+                await NodeManager.create_many(db=db, nodes=objs)
+            else:
+                async with db.start_transaction() as dbt:
+                    await NodeManager.create_many(db=dbt, nodes=objs)
+
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        for index, obj in enumerate(objs):
+            if await cls._get_profile_ids(db=db, obj=obj):
+                objs[index] = await cls._refresh_for_profile_update(db=db, branch=branch, obj=obj)
+
+        return objs
+
     @classmethod
     @retry_db_transaction(name="object_update")
     async def mutate_update(
@@ -285,7 +356,7 @@ class InfrahubMutationMixin:
         context: GraphqlContext = info.context
         db = database or context.db
 
-        node_schema = db.schema.get(name=schema_name, branch=branch)
+        node_schema = db.schema.get(name=schema_name, branch=branch, duplicate=False)
 
         node = None
         for getter in node_getters:
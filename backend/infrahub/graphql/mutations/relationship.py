@@ -14,6 +14,7 @@ from infrahub.core.query.relationship import (
 from infrahub.core.relationship import Relationship
 from infrahub.database import retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, ValidationError
+from infrahub.permissions.cache import invalidate_permissions_cache, is_permission_node
 
 from ..types import RelatedNodeInput
 
@@ -131,6 +132,9 @@ class RelationshipMixin:
                         await rel.load(db=db, data=existing_peers[node_data.get("id")])
                         await rel.delete(db=db)
 
+        if is_permission_node(node=source) or any(is_permission_node(node=node) for node in nodes.values()):
+            await invalidate_permissions_cache()
+
         return cls(ok=True)
 
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from graphene import Boolean, Field, InputField, InputObjectType, Int, Mutation, String
+from graphene import BigInt, Boolean, Field, InputField, InputObjectType, Int, List, Mutation, NonNull, String
 from graphene.types.generic import GenericScalar
 from typing_extensions import Self
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from infrahub.core.node import Node
     from infrahub.core.node.resource_manager.ip_address_pool import CoreIPAddressPool
     from infrahub.core.node.resource_manager.ip_prefix_pool import CoreIPPrefixPool
+    from infrahub.core.node.resource_manager.number_pool import CoreNumberPool
     from infrahub.database import InfrahubDatabase
 
     from ..initialization import GraphqlContext
@@ -50,6 +51,15 @@ class IPAddressPoolGetResourceInput(InputObjectType):
     )
 
 
+class NumberPoolGetResourcesInput(InputObjectType):
+    id = InputField(String(required=False), description="ID of the pool to allocate from")
+    hfid = InputField(String(required=False), description="HFID of the pool to allocate from")
+    identifiers = InputField(
+        List(NonNull(String)), required=False, description="Identifiers for the allocated numbers, one per number"
+    )
+    count = InputField(Int(required=False), description="Quantity of numbers to allocate without identifiers")
+
+
 class IPPrefixPoolGetResource(Mutation):
     class Arguments:
         data = IPPrefixPoolGetResourceInput(required=True)
@@ -148,6 +158,42 @@ class IPAddressPoolGetResource(Mutation):
         return cls(**result)
 
 
+class NumberPoolGetResources(Mutation):
+    class Arguments:
+        data = NumberPoolGetResourcesInput(required=True)
+
+    ok = Boolean()
+    numbers = List(NonNull(BigInt))
+
+    @classmethod
+    async def mutate(
+        cls,
+        root: dict,  # pylint: disable=unused-argument
+        info: GraphQLResolveInfo,
+        data: dict[str, Any],
+    ) -> Self:
+        context: GraphqlContext = info.context
+
+        identifiers = data.get("identifiers", None)
+        count = data.get("count", None)
+        if identifiers is None and count is None:
+            raise ValidationError(input_value="Either identifiers or count must be provided")
+        if identifiers is not None and count is not None and count != len(identifiers):
+            raise ValidationError(input_value="count must match the number of identifiers")
+
+        obj: CoreNumberPool = await registry.manager.find_object(
+            db=context.db,
+            kind=InfrahubKind.NUMBERPOOL,
+            id=data.get("id"),
+            hfid=data.get("hfid"),
+            branch=context.branch,
+        )
+        async with context.db.start_transaction() as dbt:
+            numbers = await obj.get_resources(db=dbt, branch=context.branch, count=count, identifiers=identifiers)
+
+        return cls(ok=True, numbers=numbers)
+
+
 class InfrahubNumberPoolMutation(InfrahubMutationMixin, Mutation):
     @classmethod
     def __init_subclass_with_meta__(  # pylint: disable=arguments-differ
@@ -9,8 +9,8 @@ from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.query.ipam import get_ip_addresses, get_subnets
 from infrahub.exceptions import NodeNotFoundError, ValidationError
-from infrahub.pools.address import get_available
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.address import IPAddressAllocator
+from infrahub.pools.prefix import prefix_pool_cache
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
@@ -51,18 +51,17 @@ class IPAddressGetNextAvailable(ObjectType):
             branch=context.branch,
         )
 
-        available = get_available(
+        allocator = IPAddressAllocator(
             network=ip_prefix,
             addresses=[ip.address for ip in addresses],
             is_pool=prefix.is_pool.value,  # type: ignore[attr-defined]
         )
 
+        available = allocator.get()
         if not available:
             raise IndexError("No addresses available in prefix")
 
-        next_address = available.iter_cidrs()[0]
-
-        return {"address": f"{next_address.ip}/{prefix_length}"}
+        return {"address": f"{available[0]}/{prefix_length}"}
 
 
 class IPPrefixGetNextAvailable(ObjectType):
@@ -92,9 +91,11 @@ class IPPrefixGetNextAvailable(ObjectType):
             branch=context.branch,
         )
 
-        pool = PrefixPool(prefix.prefix.value)  # type: ignore[attr-defined]
-        for subnet in subnets:
-            pool.reserve(subnet=str(subnet.prefix))
+        pool = prefix_pool_cache.get(
+            key=(prefix.id, context.branch.name),
+            network=prefix.prefix.value,  # type: ignore[attr-defined]
+            subnets=[str(subnet.prefix) for subnet in subnets],
+        )
 
         next_available = pool.get(prefixlen=prefix_length)
         return {"prefix": str(next_available)}
@@ -182,7 +182,10 @@ class PoolUtilization(ObjectType):
         except SchemaNotFoundError:
             pass
 
-        utilization_getter = PrefixUtilizationGetter(db=db, ip_prefixes=list(resources_map.values()), at=context.at)
+        # The stored summaries can only be used when the client didn't request a specific time
+        utilization_getter = PrefixUtilizationGetter(
+            db=db, ip_prefixes=list(resources_map.values()), at=context.requested_at
+        )
         fields = await extract_fields_first_node(info=info)
         response: dict[str, Any] = {}
         total_utilization = None
@@ -9,6 +9,7 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 from infrahub.exceptions import NodeNotFoundError
 
+from .loaders.peers import QueryPeerParams
 from .parser import extract_selection
 from .permissions import get_permissions
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
@@ -92,20 +93,18 @@ async def default_resolver(*args: Any, **kwargs) -> dict | list[dict] | None:
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+    query_params = QueryPeerParams(
+        branch=context.branch,
+        source_kind=node_schema.kind,
+        schema=node_rel,
+        filters=filters,
+        fields=fields,
+        at=context.at,
+        branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+    )
+    objs = await context.get_peers_loader(query_params=query_params).load(parent["id"])
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -139,6 +138,11 @@ async def default_paginated_list_resolver(
     fields = await extract_selection(info.field_nodes[0], schema=schema)
 
     context: GraphqlContext = info.context
+    include_count = "count" in fields
+    if context.stream_page:
+        offset, limit = context.stream_page.offset, context.stream_page.limit
+        include_count = include_count and context.stream_page.include_count
+
     async with context.db.start_session() as db:
         response: dict[str, Any] = {"edges": []}
         filters = {
@@ -159,35 +163,36 @@ async def default_paginated_list_resolver(
                     permission_set = edge["node"]
 
         objs = []
-        if edges or "hfid" in filters:
-            objs = await NodeManager.query(
+        query_args: dict[str, Any] = {
+            "db": db,
+            "schema": schema,
+            "filters": filters or None,
+            "fields": node_fields,
+            "at": context.at,
+            "branch": context.branch,
+            "limit": limit,
+            "offset": offset,
+            "account": context.account_session,
+            "include_source": True,
+            "include_owner": True,
+            "partial_match": partial_match,
+            "read_only": True,
+        }
+        if (edges or "hfid" in filters) and include_count:
+            # The page and the total count are returned by the same query to evaluate the filters only once
+            objs, response["count"] = await NodeManager.query_with_count(**query_args)
+        elif edges or "hfid" in filters:
+            objs = await NodeManager.query(**query_args)
+        elif include_count:
+            response["count"] = await NodeManager.count(
                 db=db,
                 schema=schema,
-                filters=filters or None,
-                fields=node_fields,
+                filters=filters,
                 at=context.at,
                 branch=context.branch,
-                limit=limit,
-                offset=offset,
-                account=context.account_session,
-                include_source=True,
-                include_owner=True,
                 partial_match=partial_match,
             )
 
-        if "count" in fields:
-            if filters.get("hfid"):
-                response["count"] = len(objs)
-            else:
-                response["count"] = await NodeManager.count(
-                    db=db,
-                    schema=schema,
-                    filters=filters,
-                    at=context.at,
-                    branch=context.branch,
-                    partial_match=partial_match,
-                )
-
         if objs:
             objects = [
                 {
@@ -237,23 +242,21 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
 
     response: dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+    query_params = QueryPeerParams(
+        branch=context.branch,
+        source_kind=node_schema.kind,
+        schema=node_rel,
+        filters=filters,
+        fields=node_fields,
+        at=context.at,
+        branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+    )
+    objs = await context.get_peers_loader(query_params=query_params).load(parent["id"])
 
-        if not objs:
-            return response
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -302,6 +305,23 @@ async def many_relationship_resolver(
 
     source_kind = node_schema.kind
 
+    # Without pagination, the peers of all the nodes at the same level of the query can be fetched together
+    batch_peers = bool(node_fields) and not (include_descendants or offset or limit)
+    objs = []
+    if batch_peers:
+        query_params = QueryPeerParams(
+            branch=context.branch,
+            source_kind=source_kind,
+            schema=node_rel,
+            filters=filters,
+            fields=node_fields,
+            at=context.at,
+            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+        )
+        objs = await context.get_peers_loader(query_params=query_params).load(parent["id"])
+        if "count" in fields:
+            response["count"] = len(objs)
+
     async with context.db.start_session() as db:
         ids = [parent["id"]]
         if include_descendants:
@@ -319,7 +339,7 @@ async def many_relationship_resolver(
             descendants_ids = list(query.get_peer_ids())
             ids.extend(descendants_ids)
 
-        if "count" in fields:
+        if "count" in fields and not batch_peers:
             response["count"] = await NodeManager.count_peers(
                 db=db,
                 ids=ids,
@@ -334,20 +354,21 @@ async def many_relationship_resolver(
         if not node_fields:
             return response
 
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=ids,
-            source_kind=source_kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            offset=offset,
-            limit=limit,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+        if not batch_peers:
+            objs = await NodeManager.query_peers(
+                db=db,
+                ids=ids,
+                source_kind=source_kind,
+                schema=node_rel,
+                filters=filters,
+                fields=node_fields,
+                offset=offset,
+                limit=limit,
+                at=context.at,
+                branch=context.branch,
+                branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+                fetch_peers=True,
+            )
 
         if not objs:
             return response
@@ -27,7 +27,7 @@ from .mutations.repository import (
     ProcessRepository,
     ValidateRepositoryConnectivity,
 )
-from .mutations.resource_manager import IPAddressPoolGetResource, IPPrefixPoolGetResource
+from .mutations.resource_manager import IPAddressPoolGetResource, IPPrefixPoolGetResource, NumberPoolGetResources
 from .mutations.schema import (
     SchemaDropdownAdd,
     SchemaDropdownRemove,
@@ -88,6 +88,7 @@ class InfrahubBaseMutation(ObjectType):
 
     IPPrefixPoolGetResource = IPPrefixPoolGetResource.Field()
     IPAddressPoolGetResource = IPAddressPoolGetResource.Field()
+    NumberPoolGetResources = NumberPoolGetResources.Field()
 
     BranchCreate = BranchCreate.Field()
     BranchDelete = BranchDelete.Field()
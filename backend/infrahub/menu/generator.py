@@ -6,7 +6,7 @@ from infrahub.core import registry
 from infrahub.core.protocols import CoreMenuItem
 from infrahub.log import get_logger
 from infrahub.permissions.constants import AssignedPermissions
-from infrahub.permissions.local_backend import LocalPermissionBackend
+from infrahub.permissions.local_backend import get_local_permission_backend
 
 from .constants import FULL_DEFAULT_MENU
 from .models import MenuDict, MenuItemDict
@@ -29,7 +29,7 @@ async def generate_restricted_menu(
     menu = await generate_menu(db=db, branch=branch, menu_items=menu_items)
 
     permissions = AssignedPermissions(global_permissions=[], object_permissions=[])
-    perm_backend = LocalPermissionBackend()
+    perm_backend = get_local_permission_backend()
 
     if account:
         permissions = await perm_backend.load_permissions(db=db, account_session=account, branch=branch)
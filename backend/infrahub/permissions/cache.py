@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Optional
+
+import ujson
+
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.constants import InfrahubKind
+from infrahub.message_bus.types import KVTTL
+from infrahub.services import services
+
+if TYPE_CHECKING:
+    from infrahub.core.node import Node
+    from infrahub.permissions.constants import AssignedPermissions
+
+PERMISSIONS_VERSION_KEY = "permissions:version"
+PERMISSIONS_ACCOUNT_KEY_PREFIX = "permissions:account"
+
+# Kinds of nodes that are part of the graph used to compute the permissions of an account
+PERMISSION_KINDS = {
+    InfrahubKind.GENERICACCOUNT,
+    InfrahubKind.ACCOUNTGROUP,
+    InfrahubKind.ACCOUNTROLE,
+    InfrahubKind.BASEPERMISSION,
+}
+
+
+def is_permission_node(node: Node) -> bool:
+    """Indicate if a change to this node can modify the permissions assigned to an account."""
+    return not PERMISSION_KINDS.isdisjoint(node.get_labels())
+
+
+class PermissionCache:
+    """Cache the permissions assigned to an account on a given branch.
+
+    Entries are stored in a local LRU and in the shared cache, to be reused by the other workers, both with a TTL.
+    All keys include the version of the permission graph, kept in the shared cache. A new version is generated every
+    time a node that is part of this graph is modified, which makes all existing entries unreachable.
+
+    The version must be read once before fetching the permissions and used to store them, so that permissions
+    fetched while the graph is modified are stored under the previous version. Without a shared cache, the version
+    can't be shared with the other workers and nothing is cached.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: KVTTL = KVTTL.FIVE_MINUTES) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, AssignedPermissions]] = OrderedDict()
+
+    @staticmethod
+    def _serialize(permissions: AssignedPermissions) -> str:
+        return ujson.dumps(
+            {
+                "global_permissions": [asdict(permission) for permission in permissions["global_permissions"]],
+                "object_permissions": [asdict(permission) for permission in permissions["object_permissions"]],
+            }
+        )
+
+    @staticmethod
+    def _deserialize(value: str) -> AssignedPermissions:
+        data = ujson.loads(value)
+        return {
+            "global_permissions": [GlobalPermission(**item) for item in data["global_permissions"]],
+            "object_permissions": [ObjectPermission(**item) for item in data["object_permissions"]],
+        }
+
+    @staticmethod
+    async def get_version() -> Optional[str]:
+        """Return the current version of the permission graph, or None if no shared cache is configured."""
+        try:
+            version = await services.service.cache.get(key=PERMISSIONS_VERSION_KEY)
+            if version is None:
+                # A missing version must not match the entries stored before it was evicted
+                await services.service.cache.set(key=PERMISSIONS_VERSION_KEY, value=str(uuid.uuid4()), not_exists=True)
+                version = await services.service.cache.get(key=PERMISSIONS_VERSION_KEY)
+        except NotImplementedError:
+            return None
+        return version
+
+    async def get(self, account_id: str, branch_name: str, version: Optional[str]) -> Optional[AssignedPermissions]:
+        if version is None:
+            return None
+        key = (account_id, branch_name, version)
+
+        if key in self._entries:
+            expires_at, permissions = self._entries[key]
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return permissions
+            del self._entries[key]
+
+        value = await services.service.cache.get(key=self._get_shared_key(*key))
+        if value is None:
+            return None
+
+        permissions = self._deserialize(value=value)
+        self._store_local(key=key, permissions=permissions)
+        return permissions
+
+    async def set(
+        self, account_id: str, branch_name: str, version: Optional[str], permissions: AssignedPermissions
+    ) -> None:
+        if version is None:
+            return
+        key = (account_id, branch_name, version)
+        self._store_local(key=key, permissions=permissions)
+        await services.service.cache.set(
+            key=self._get_shared_key(*key), value=self._serialize(permissions=permissions), expires=self.ttl
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store_local(self, key: tuple[str, str, str], permissions: AssignedPermissions) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl.value, permissions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _get_shared_key(account_id: str, branch_name: str, version: str) -> str:
+        return f"{PERMISSIONS_ACCOUNT_KEY_PREFIX}:{version}:{branch_name}:{account_id}"
+
+
+async def invalidate_permissions_cache() -> None:
+    """Generate a new version of the permission graph, to invalidate the permissions cached by all workers."""
+    try:
+        await services.service.cache.set(key=PERMISSIONS_VERSION_KEY, value=str(uuid.uuid4()))
+    except NotImplementedError:
+        pass
@@ -3,14 +3,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from infrahub import config
+from infrahub.core import registry
 from infrahub.core.account import GlobalPermission, ObjectPermission, fetch_permissions, fetch_role_permissions
 from infrahub.core.constants import GlobalPermissions, PermissionDecision
 from infrahub.core.manager import NodeManager
 from infrahub.core.protocols import CoreAccountRole
+from infrahub.permissions.cache import PermissionCache
 from infrahub.permissions.constants import PermissionDecisionFlag
 
 from .backend import PermissionBackend
 
+ANONYMOUS_ACCOUNT_ID = "anonymous"
+
 if TYPE_CHECKING:
     from infrahub.auth import AccountSession
     from infrahub.core.branch import Branch
@@ -22,6 +26,9 @@ class LocalPermissionBackend(PermissionBackend):
     wildcard_values = ["*"]
     wildcard_actions = ["any"]
 
+    def __init__(self) -> None:
+        self.cache = PermissionCache()
+
     def _compute_specificity(self, permission: ObjectPermission) -> int:
         specificity = 0
         if permission.namespace not in self.wildcard_values:
@@ -88,6 +95,19 @@ class LocalPermissionBackend(PermissionBackend):
 
     async def load_permissions(
         self, db: InfrahubDatabase, account_session: AccountSession, branch: Branch
+    ) -> AssignedPermissions:
+        account_id = account_session.account_id if account_session.authenticated else ANONYMOUS_ACCOUNT_ID
+        # The version is read before fetching, an invalidation happening in the meantime makes these permissions stale
+        version = await self.cache.get_version()
+        if permissions := await self.cache.get(account_id=account_id, branch_name=branch.name, version=version):
+            return permissions
+
+        permissions = await self._fetch_permissions(db=db, account_session=account_session, branch=branch)
+        await self.cache.set(account_id=account_id, branch_name=branch.name, version=version, permissions=permissions)
+        return permissions
+
+    async def _fetch_permissions(
+        self, db: InfrahubDatabase, account_session: AccountSession, branch: Branch
     ) -> AssignedPermissions:
         if not account_session.authenticated:
             anonymous_permissions: AssignedPermissions = {"global_permissions": [], "object_permissions": []}
@@ -133,3 +153,11 @@ class LocalPermissionBackend(PermissionBackend):
             )
             or is_super_admin
         )
+
+
+def get_local_permission_backend() -> LocalPermissionBackend:
+    """Return the LocalPermissionBackend of the registry to share its cache, or a new one if it isn't configured."""
+    for permission_backend in registry.permission_backends:
+        if isinstance(permission_backend, LocalPermissionBackend):
+            return permission_backend
+    return LocalPermissionBackend()
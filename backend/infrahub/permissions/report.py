@@ -7,7 +7,7 @@ from infrahub.core.account import GlobalPermission
 from infrahub.core.constants import GLOBAL_BRANCH_NAME, GlobalPermissions, InfrahubKind, PermissionDecision
 from infrahub.core.schema.node_schema import NodeSchema
 from infrahub.permissions.constants import AssignedPermissions, BranchRelativePermissionDecision, PermissionDecisionFlag
-from infrahub.permissions.local_backend import LocalPermissionBackend
+from infrahub.permissions.local_backend import get_local_permission_backend
 
 if TYPE_CHECKING:
     from infrahub.auth import AccountSession
@@ -77,7 +77,7 @@ def get_permission_report(  # noqa: PLR0911
 async def report_schema_permissions(
     db: InfrahubDatabase, schemas: list[MainSchemaTypes], account_session: AccountSession, branch: Branch
 ) -> list[KindPermissions]:
-    perm_backend = LocalPermissionBackend()
+    perm_backend = get_local_permission_backend()
     permissions = await perm_backend.load_permissions(db=db, account_session=account_session, branch=branch)
 
     global_permission_report: dict[GlobalPermissions, bool] = {}
@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Union
+
+import numpy as np
 from netaddr import IPNetwork, IPSet
 
-from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
+if TYPE_CHECKING:
+    import ipaddress
+
+    from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
 
 
 def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_pool: bool) -> IPSet:
@@ -14,3 +22,56 @@ def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_poo
             reserved.append(IPNetwork(f"{str(network.broadcast_address)}/{network.max_prefixlen}"))
 
     return pool - IPSet(reserved)
+
+
+class IPAddressAllocator:
+    """Find the available addresses of a network, starting with the lowest one.
+
+    The used addresses are stored as a sorted array of offsets from the network address, the available addresses are
+    found with a binary search over the number of free addresses before each used one. The offsets of networks bigger
+    than a /64 don't fit in 64 bits, they are stored as Python integers.
+    """
+
+    def __init__(self, network: IPNetworkType, addresses: Iterable[IPAddressType], is_pool: bool) -> None:
+        self.network = network
+        self._network_address = int(network.network_address)
+        self._dtype: type = np.uint64 if network.max_prefixlen - network.prefixlen <= 64 else object
+
+        # If the network is not a pool the network address and the broadcast address in case of IPv4 are not available
+        self.first = 0 if is_pool else 1
+        self.last = network.num_addresses - 1
+        if not is_pool and network.version == 4:
+            self.last -= 1
+
+        offsets = [int(address.ip) - self._network_address for address in addresses]
+        self._used = np.unique(
+            np.array([offset for offset in offsets if self.first <= offset <= self.last], dtype=self._dtype)
+        )
+
+    @property
+    def nbr_available(self) -> int:
+        return max(self.last - self.first + 1 - len(self._used), 0)
+
+    def _to_dtype(self, value: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        if isinstance(value, np.ndarray):
+            return value.astype(self._dtype)
+        return self._dtype(value) if self._dtype is not object else value
+
+    def get(self, count: int = 1) -> list[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+        """Return the next `count` available addresses, or less if there are not enough, and mark them as used."""
+        count = min(count, self.nbr_available)
+        if count <= 0:
+            return []
+
+        # The number of free addresses before each used address is increasing,
+        # the Nth free address comes after all used addresses with at most N free addresses before them
+        positions = np.arange(len(self._used), dtype=self._dtype)
+        free_before = self._used - self._to_dtype(self.first) - positions
+        indexes = np.arange(count, dtype=self._dtype)
+        nbr_used_before = self._to_dtype(np.searchsorted(free_before, indexes, side="right"))
+        offsets = self._to_dtype(self.first) + indexes + nbr_used_before
+
+        self._used = np.union1d(self._used, offsets).astype(self._dtype)
+
+        address_class = type(self.network.network_address)
+        return [address_class(self._network_address + int(offset)) for offset in offsets]
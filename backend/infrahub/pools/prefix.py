@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import copy
+import heapq
 import ipaddress
 from collections import OrderedDict, defaultdict
 from ipaddress import IPv4Network, IPv6Network
-from typing import Optional, Union
+from typing import Hashable, Iterable, Optional, Union
 
 
 class PrefixPool:
     """
     Class to automatically manage Prefixes and help to carve out sub-prefixes
+
+    The free space is tracked like a buddy allocator, for each prefix length the network addresses of the free blocks
+    are stored as integers, in a heap to find the first free block in logarithmic time and in a set for direct lookups.
     """
 
     def __init__(self, network: str) -> None:
@@ -16,18 +21,58 @@ class PrefixPool:
 
         # Define biggest and smallest possible masks
         self.mask_biggest = self.network.prefixlen + 1
-        if self.network.version == 4:
-            self.mask_smallest = 32
-        else:
-            self.mask_smallest = 128
+        self.mask_smallest = self.network.max_prefixlen
 
-        self.available_subnets = defaultdict(list)
+        # Entries removed from the sets are removed lazily from the heaps
+        self._free_heaps: dict[int, list[int]] = defaultdict(list)
+        self._free_sets: dict[int, set[int]] = defaultdict(set)
         self.sub_by_key: dict[str, Optional[str]] = OrderedDict()
         self.sub_by_id: dict[str, str] = OrderedDict()
 
         # Save the top level available subnet
-        for subnet in list(self.network.subnets(new_prefix=self.mask_biggest)):
-            self.available_subnets[self.mask_biggest].append(str(subnet))
+        if self.mask_biggest <= self.mask_smallest:
+            network_address = int(self.network.network_address)
+            self._add_free(prefixlen=self.mask_biggest, address=network_address)
+            self._add_free(prefixlen=self.mask_biggest, address=network_address + self._block_size(self.mask_biggest))
+
+    @property
+    def available_subnets(self) -> dict[int, list[str]]:
+        """Available subnets per prefix length, ordered by network address."""
+        subnets: dict[int, list[str]] = defaultdict(list)
+        for prefixlen in range(self.mask_biggest, self.mask_smallest + 1):
+            subnets[prefixlen] = [
+                str(self._to_network(prefixlen=prefixlen, address=address))
+                for address in sorted(self._free_sets[prefixlen])
+            ]
+        return subnets
+
+    def _block_size(self, prefixlen: int) -> int:
+        return 1 << (self.mask_smallest - prefixlen)
+
+    def _to_network(self, prefixlen: int, address: int) -> Union[IPv4Network, IPv6Network]:
+        return self.network.__class__((address, prefixlen))
+
+    def _add_free(self, prefixlen: int, address: int) -> None:
+        if address in self._free_sets[prefixlen]:
+            return
+        self._free_sets[prefixlen].add(address)
+        heapq.heappush(self._free_heaps[prefixlen], address)
+
+    def _remove_free(self, prefixlen: int, address: int) -> bool:
+        if address not in self._free_sets[prefixlen]:
+            return False
+        self._free_sets[prefixlen].discard(address)
+        return True
+
+    def _first_free(self, prefixlen: int) -> Optional[int]:
+        heap = self._free_heaps[prefixlen]
+        free_set = self._free_sets[prefixlen]
+        while heap and heap[0] not in free_set:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def copy(self) -> PrefixPool:
+        return copy.deepcopy(self)
 
     def reserve(self, subnet: str, identifier: Optional[str] = None) -> bool:
         """
@@ -43,42 +88,40 @@ class PrefixPool:
         if sub.supernet(new_prefix=self.network.prefixlen) != self.network:
             raise ValueError(f"{subnet} is not part of this network")
 
+        subnet_key = str(sub)
+
         # Check first if this ID as already done a reservation
         if identifier and identifier in self.sub_by_id.keys():
-            if self.sub_by_id[identifier] == str(sub):
+            if self.sub_by_id[identifier] == subnet_key:
                 return True
             raise ValueError(
                 f"this identifier ({identifier}) is already used but for a different resource ({self.sub_by_id[identifier]})"
             )
 
-        if identifier and str(sub) in self.sub_by_key.keys():
+        if identifier and subnet_key in self.sub_by_key.keys():
             raise ValueError(f"this subnet is already reserved but not with this identifier ({identifier})")
 
-        if str(sub) in self.sub_by_key.keys():
+        if subnet_key in self.sub_by_key.keys():
             self.remove_subnet_from_available_list(sub)
             return True
 
         # Check if the subnet itself is available
         # if available reserve and return
-        if subnet in self.available_subnets[sub.prefixlen]:
+        sub_address = int(sub.network_address)
+        if self._remove_free(prefixlen=sub.prefixlen, address=sub_address):
+            self.sub_by_key[subnet_key] = identifier
             if identifier:
-                self.sub_by_id[identifier] = subnet
-                self.sub_by_key[subnet] = identifier
-            else:
-                self.sub_by_key[subnet] = None
-
-            self.remove_subnet_from_available_list(sub)
+                self.sub_by_id[identifier] = subnet_key
             return True
 
         # If not reserved already, check if the subnet is available
         # start at sublen and check all available subnet
         # increase 1 by 1 until we find the closer supernet available
         # break it down and keep track of the other available subnets
-
         for sublen in range(sub.prefixlen - 1, self.network.prefixlen, -1):
-            supernet = sub.supernet(new_prefix=sublen)
-            if str(supernet) in self.available_subnets[sublen]:
-                self.split_supernet(supernet=supernet, subnet=sub)
+            supernet_address = sub_address & ~(self._block_size(sublen) - 1)
+            if supernet_address in self._free_sets[sublen]:
+                self.split_supernet(supernet=self._to_network(prefixlen=sublen, address=supernet_address), subnet=sub)
                 return self.reserve(subnet=subnet, identifier=identifier)
 
         return False
@@ -94,29 +137,25 @@ class PrefixPool:
                 return net
             raise ValueError()
 
-        if len(self.available_subnets[clean_prefixlen]) != 0:
-            sub = self.available_subnets[clean_prefixlen][0]
-            self.reserve(subnet=sub, identifier=identifier)
-            return ipaddress.ip_network(sub)
-
         # if a subnet of this size is not available
         # we need to find the closest subnet available and split it
-        for i in range(clean_prefixlen - 1, self.mask_biggest - 1, -1):
-            if len(self.available_subnets[i]) != 0:
-                supernet = ipaddress.ip_network(self.available_subnets[i][0])
+        for i in range(clean_prefixlen, self.mask_biggest - 1, -1):
+            address = self._first_free(prefixlen=i)
+            if address is None:
+                continue
+            next_sub = self._to_network(prefixlen=clean_prefixlen, address=address)
+            if i != clean_prefixlen:
                 # supernet available, will split it
-                subs = supernet.subnets(new_prefix=clean_prefixlen)
-                next_sub: Union[IPv4Network, IPv6Network] = next(subs)  # type: ignore[assignment]
-                self.split_supernet(supernet=supernet, subnet=next_sub)
-                self.reserve(subnet=str(next_sub), identifier=identifier)
-                return next_sub
+                self.split_supernet(supernet=self._to_network(prefixlen=i, address=address), subnet=next_sub)
+            self.reserve(subnet=str(next_sub), identifier=identifier)
+            return next_sub
 
         raise IndexError("No More subnet available")
 
     def get_nbr_available_subnets(self) -> dict[int, int]:
         tmp = {}
         for i in range(self.mask_biggest, self.mask_smallest + 1):
-            tmp[i] = len(self.available_subnets[i])
+            tmp[i] = len(self._free_sets[i])
 
         return tmp
 
@@ -138,37 +177,73 @@ class PrefixPool:
 
         # TODO ensure subnet is small than supernet
         # TODO ensure that subnet is part of supernet
-        parent_net = supernet
+        subnet_address = int(subnet.network_address)
+        parent_address = int(supernet.network_address)
         for i in range(supernet.prefixlen + 1, subnet.prefixlen + 1):
-            tmp_net: list[Union[IPv4Network, IPv6Network]] = list(parent_net.subnets(new_prefix=i))
-
-            if i == subnet.prefixlen:
-                for net in tmp_net:
-                    self.available_subnets[i].append(str(net))
+            half_size = self._block_size(i)
+            if subnet_address >= parent_address + half_size:
+                self._add_free(prefixlen=i, address=parent_address)
+                parent_address += half_size
             else:
-                if subnet.subnet_of(other=tmp_net[0]):  # type: ignore[arg-type]
-                    parent = 0
-                    other = 1
-                else:
-                    parent = 1
-                    other = 0
-
-                parent_net = tmp_net[parent]
-                self.available_subnets[i].append(str(tmp_net[other]))
+                self._add_free(prefixlen=i, address=parent_address + half_size)
 
+        self._add_free(prefixlen=subnet.prefixlen, address=parent_address)
         self.remove_subnet_from_available_list(supernet)
 
     def remove_subnet_from_available_list(self, subnet: Union[IPv4Network, IPv6Network]) -> None:
         """Remove a subnet from the list of available Subnet."""
-        try:
-            idx = self.available_subnets[subnet.prefixlen].index(str(subnet))
-            del self.available_subnets[subnet.prefixlen][idx]
-        except ValueError:
-            # Already removed
-            pass
-
-        # if idx:
-        #     return True
-        # except:
-        #     log.warn("Unable to remove %s from list of available subnets" % str(subnet))
-        #     return False
+        self._remove_free(prefixlen=subnet.prefixlen, address=int(subnet.network_address))
+
+
+class PrefixPoolCache:
+    """LRU of PrefixPool with their existing subnets already reserved.
+
+    A pool is reused as long as the existing subnets are the same as the ones it was built from, the subnets allocated
+    from the cached pool are added to them so that the pool remains valid once these subnets have been created.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[set[str], PrefixPool]] = OrderedDict()
+
+    def _get_pool(self, key: Hashable, network: str, subnets: Iterable[str]) -> tuple[set[str], PrefixPool]:
+        subnets = set(subnets)
+
+        if key in self._entries:
+            cached_subnets, pool = self._entries[key]
+            if cached_subnets == subnets and pool.network == ipaddress.ip_network(network):
+                self._entries.move_to_end(key)
+                return cached_subnets, pool
+
+        pool = PrefixPool(network)
+        for subnet in subnets:
+            pool.reserve(subnet=subnet)
+
+        self._entries[key] = (subnets, pool)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return subnets, pool
+
+    def get(self, key: Hashable, network: str, subnets: Iterable[str]) -> PrefixPool:
+        """Return a copy of the pool for this network with all the subnets reserved, it can be modified freely."""
+        _, pool = self._get_pool(key=key, network=network, subnets=subnets)
+        return pool.copy()
+
+    def allocate(
+        self, key: Hashable, network: str, subnets: Iterable[str], prefixlen: int
+    ) -> Union[IPv4Network, IPv6Network]:
+        """Return the next available subnet of the pool for this network and reserve it in the cached pool.
+
+        If the subnet allocated isn't created, the existing subnets won't match anymore and the pool will be rebuilt.
+        """
+        cached_subnets, pool = self._get_pool(key=key, network=network, subnets=subnets)
+        next_available = pool.get(prefixlen=prefixlen)
+        cached_subnets.add(str(next_available))
+        return next_available
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+prefix_pool_cache = PrefixPoolCache()
@@ -26,6 +26,7 @@ class NATSCache(InfrahubCache):
             self._tokenize_key_name("workers:schema_hash:branch:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:active:"): KVTTL.FIFTEEN,
             self._tokenize_key_name("workers:worker:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("permissions:account:"): KVTTL.FIVE_MINUTES,
         }
 
     async def initialize(self, service: InfrahubServices) -> None:
@@ -1,5 +1,11 @@
+import hashlib
+import io
+import os
 import tempfile
-from typing import Any, BinaryIO
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional
 
 import botocore.exceptions
 import fastapi_storages
@@ -8,6 +14,8 @@ from typing_extensions import Self
 from infrahub.config import StorageSettings
 from infrahub.exceptions import NodeNotFoundError
 
+STORAGE_CHUNK_SIZE = 64 * 1024
+
 
 class InfrahubS3ObjectStorage(fastapi_storages.S3Storage):
     def __init__(self, **kwargs: Any) -> None:
@@ -27,6 +35,147 @@ class InfrahubS3ObjectStorage(fastapi_storages.S3Storage):
 fastapi_storages.InfrahubS3ObjectStorage = InfrahubS3ObjectStorage
 
 
+def get_content_identifier(content: bytes) -> str:
+    """Return the identifier of an object stored by content, derived from its checksum."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def iterate_file(f: BinaryIO, chunk_size: int = STORAGE_CHUNK_SIZE) -> Iterator[bytes]:
+    with f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+class StorageMemoryCache:
+    """LRU cache of the content of the objects, bounded by their total size in bytes.
+
+    The objects larger than an eighth of the cache are not kept, to avoid evicting all the other objects at once.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def accepts(self, size: int) -> bool:
+        return size <= self.max_size // 8
+
+    def get(self, identifier: str) -> Optional[bytes]:
+        with self._lock:
+            if identifier not in self._entries:
+                return None
+            self._entries.move_to_end(identifier)
+            return self._entries[identifier]
+
+    def set(self, identifier: str, content: bytes) -> None:
+        if not self.accepts(len(content)):
+            return
+
+        with self._lock:
+            if identifier in self._entries:
+                self.size -= len(self._entries.pop(identifier))
+            self._entries[identifier] = content
+            self.size += len(content)
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class StorageDiskCache:
+    """LRU cache of the objects in a local directory, to avoid downloading them again from a remote storage.
+
+    The files are touched on each hit, so the order of eviction is preserved across restarts.
+    The directory can be shared by several processes: it is scanned again on each write, so the maximum
+    size accounts for the files written by all of them, and a file can disappear at any time.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._scan()
+
+    def _scan(self) -> None:
+        """Load the files present in the directory, from the least to the most recently used."""
+        files = []
+        for item in os.scandir(self.path):
+            if not item.is_file() or item.name.startswith("."):
+                continue
+            try:
+                files.append((item.name, item.stat()))
+            except FileNotFoundError:
+                continue
+
+        self._entries.clear()
+        self.size = 0
+        for name, stat in sorted(files, key=lambda file: file[1].st_mtime_ns):
+            self._entries[name] = stat.st_size
+            self.size += stat.st_size
+
+    def _forget(self, identifier: str) -> None:
+        with self._lock:
+            self.size -= self._entries.pop(identifier, 0)
+
+    def get(self, identifier: str) -> Optional[Path]:
+        with self._lock:
+            if identifier not in self._entries:
+                return None
+            self._entries.move_to_end(identifier)
+
+        path = self.path / identifier
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(identifier)
+            return None
+        return path
+
+    def open(self, identifier: str) -> Optional[BinaryIO]:
+        """Open a cached object, return None if it isn't cached or if it has been evicted since the lookup."""
+        path = self.get(identifier)
+        if not path:
+            return None
+        try:
+            return path.open("rb")
+        except FileNotFoundError:
+            self._forget(identifier)
+            return None
+
+    def set(self, identifier: str, f: BinaryIO) -> Optional[Path]:
+        if Path(identifier).name != identifier:
+            return None
+
+        with tempfile.NamedTemporaryFile(dir=self.path, prefix=".", delete=False) as output:
+            while chunk := f.read(STORAGE_CHUNK_SIZE):
+                output.write(chunk)
+        temporary_path = Path(output.name)
+        size = temporary_path.stat().st_size
+        if size > self.max_size:
+            temporary_path.unlink()
+            return None
+
+        path = temporary_path.replace(self.path / identifier)
+
+        with self._lock:
+            # The other processes sharing the directory might have added or evicted some files since the last write
+            self._scan()
+            while self.size > self.max_size:
+                evicted, evicted_size = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                (self.path / evicted).unlink(missing_ok=True)
+
+        return path
+
+
 class InfrahubObjectStorage:
     _settings: StorageSettings
     _storage: fastapi_storages.base.BaseStorage
@@ -39,20 +188,75 @@ class InfrahubObjectStorage:
         driver_settings = getattr(self._settings, self._settings.driver.value.lower())
         self._storage = driver(**driver_settings.model_dump(by_alias=True))
 
+        self._memory_cache = StorageMemoryCache(max_size=self._settings.cache_memory_size)
+        self._disk_cache: Optional[StorageDiskCache] = None
+        if self._settings.cache_path:
+            self._disk_cache = StorageDiskCache(path=self._settings.cache_path, max_size=self._settings.cache_disk_size)
+
     @classmethod
     async def init(cls, settings: StorageSettings) -> Self:
         return cls(settings)
 
     def store(self, identifier: str, content: bytes) -> None:
-        with tempfile.NamedTemporaryFile() as f:
-            f.write(content)
-            self._storage.write(f, identifier)
+        self._storage.write(io.BytesIO(content), identifier)
+        self._memory_cache.set(identifier=identifier, content=content)
 
-    def retrieve(self, identifier: str) -> str:
+    def store_content(self, content: bytes) -> str:
+        """Store an object under an identifier derived from its content, an identical object is only stored once."""
+        identifier = get_content_identifier(content)
+        if not self.exists(identifier=identifier):
+            self.store(identifier=identifier, content=content)
+        return identifier
+
+    def exists(self, identifier: str) -> bool:
+        if self._memory_cache.get(identifier) is not None:
+            return True
         try:
-            with self._storage.open(identifier) as f:
-                return f.read().decode()
+            self._storage.get_size(identifier)
+            return True
+        except (FileNotFoundError, botocore.exceptions.ClientError):
+            return False
+
+    def open(self, identifier: str) -> BinaryIO:
+        """Open an object, from the caches if possible since the objects are never modified once stored."""
+        content = self._memory_cache.get(identifier)
+        if content is not None:
+            return io.BytesIO(content)
+
+        cached_file = self._disk_cache.open(identifier) if self._disk_cache else None
+        if cached_file:
+            f: BinaryIO = cached_file
+        else:
+            f = self._open_from_storage(identifier=identifier)
+            if self._disk_cache:
+                with f:
+                    cached_path = self._disk_cache.set(identifier=identifier, f=f)
+                cached_file = self._disk_cache.open(identifier) if cached_path else None
+                f = cached_file or self._open_from_storage(identifier=identifier)
+
+        if self._memory_cache.accepts(os.fstat(f.fileno()).st_size):
+            with f:
+                content = f.read()
+            self._memory_cache.set(identifier=identifier, content=content)
+            return io.BytesIO(content)
+
+        return f
+
+    def _open_from_storage(self, identifier: str) -> BinaryIO:
+        try:
+            return self._storage.open(identifier)
         except (FileNotFoundError, botocore.exceptions.ClientError):
             raise NodeNotFoundError(  # pylint: disable=raise-missing-from
                 node_type="StorageObject", identifier=identifier
             )
+
+    def retrieve(self, identifier: str) -> str:
+        with self.open(identifier=identifier) as f:
+            return f.read().decode()
+
+    def stream(self, identifier: str) -> Iterator[bytes]:
+        """Return the content of an object by chunks.
+
+        The object is opened immediately, so a missing object raises a NodeNotFoundError before the response starts.
+        """
+        return iterate_file(self.open(identifier=identifier))
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
-from jinja2 import TemplateSyntaxError, meta, nodes
+from jinja2 import Template, TemplateSyntaxError, meta, nodes
 from jinja2.sandbox import SandboxedEnvironment
 
 ALLOWED_FILTERS = [
@@ -35,6 +35,7 @@ class MacroDefinition:
         self.env = SandboxedEnvironment()
         self._filters: list[str] = []
         self._variables: list[str] = []
+        self._compiled_template: Optional[Template] = None
         self.template = self._parse_template()
 
     def _parse_template(self) -> nodes.Template:
@@ -57,8 +58,9 @@ class MacroDefinition:
         return template
 
     def render(self, variables: dict[str, Any]) -> str:
-        template = self.env.from_string(self.macro)
-        return template.render(variables)
+        if self._compiled_template is None:
+            self._compiled_template = self.env.from_string(self.macro)
+        return self._compiled_template.render(variables)
 
     @property
     def filters(self) -> list[str]:
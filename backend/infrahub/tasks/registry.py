@@ -18,10 +18,13 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
     If a branch is already present with a different value for the hash
     We pull the new schema from the database and we update the registry.
     """
+    # pylint: disable=import-outside-toplevel
+    from infrahub.graphql.manager import GraphQLSchemaManager
 
     async with lock.registry.local_schema_lock():
         branches = await registry.branch_object.get_list(db=db)
         active_branches = [branch.name for branch in branches]
+        updated_branches: list[Branch] = []
         for new_branch in branches:
             if new_branch.name in registry.branch:
                 branch_registry: Branch = registry.branch[new_branch.name]
@@ -39,11 +42,13 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
                     registry.branch[new_branch.name] = new_branch
 
                     await registry.schema.load_schema(db=db, branch=new_branch)
+                    updated_branches.append(new_branch)
 
             else:
                 registry.branch[new_branch.name] = new_branch
                 log.info("New branch detected, pulling schema", branch=new_branch.name, worker=WORKER_IDENTITY)
                 await registry.schema.load_schema(db=db, branch=new_branch)
+                updated_branches.append(new_branch)
 
         for branch_name in list(registry.branch.keys()):
             if branch_name not in active_branches:
@@ -51,3 +56,10 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
                 log.info(
                     f"Removed branch {branch_name!r} from the registry", branch=branch_name, worker=WORKER_IDENTITY
                 )
+
+        schema_branches = [(branch, registry.schema.get_schema_branch(name=branch.name)) for branch in updated_branches]
+
+    # Generate the GraphQL schema of the new schemas now, instead of during the first request using them,
+    # once the lock is released so the other tasks waiting for the registry are not delayed
+    for branch, schema_branch in schema_branches:
+        await GraphQLSchemaManager.warm_up_branch(branch=branch, schema_branch=schema_branch)
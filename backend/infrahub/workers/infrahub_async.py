@@ -21,6 +21,7 @@ from infrahub.core.initialization import initialization
 from infrahub.database import InfrahubDatabase, get_db
 from infrahub.dependencies.registry import build_component_registry
 from infrahub.git import initialize_repositories_directory
+from infrahub.git.transform_pool import transform_pool
 from infrahub.lock import initialize_lock
 from infrahub.services import InfrahubServices, services
 from infrahub.services.adapters.cache import InfrahubCache
@@ -114,6 +115,8 @@ class InfrahubWorkerAsync(BaseWorker):
             await service.component.refresh_schema_hash()
 
         initialize_repositories_directory()
+        transform_pool.start()
+        self._exit_stack.callback(transform_pool.shutdown)
         build_component_registry()
         self._logger.info("Worker initialization completed .. ")
 
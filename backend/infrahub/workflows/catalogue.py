@@ -90,6 +90,13 @@ REQUEST_ARTIFACT_GENERATE = WorkflowDefinition(
     function="generate_artifact",
 )
 
+REQUEST_ARTIFACTS_GENERATE = WorkflowDefinition(
+    name="artifacts-generate",
+    type=WorkflowType.INTERNAL,
+    module="infrahub.git.tasks",
+    function="generate_artifacts",
+)
+
 REQUEST_ARTIFACT_DEFINITION_GENERATE = WorkflowDefinition(
     name="request_artifact_definitions_generate",
     type=WorkflowType.INTERNAL,
@@ -361,6 +368,7 @@ workflows = [
     PROCESS_COMPUTED_MACRO,
     PROPOSED_CHANGE_MERGE,
     QUERY_COMPUTED_ATTRIBUTE_TRANSFORM_TARGETS,
+    REQUEST_ARTIFACTS_GENERATE,
     REQUEST_ARTIFACT_DEFINITION_GENERATE,
     REQUEST_ARTIFACT_GENERATE,
     REQUEST_DIFF_REFRESH,
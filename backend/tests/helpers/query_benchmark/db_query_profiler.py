@@ -2,7 +2,7 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import Any, List, Optional, Self, Type
+from typing import Any, AsyncIterator, List, Optional, Self, Type
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -148,6 +148,40 @@ class InfrahubDatabaseProfiler(InfrahubDatabase):
 
         return response, metadata
 
+    async def stream_query(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        name: str = "undefined",
+        context: dict[str, str] | None = None,
+        fetch_size: int = 1_000,
+        metadata: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[Record]]:
+        if not self.profiling_enabled:
+            async for records in super().stream_query(
+                query=query, params=params, name=name, context=context, fetch_size=fetch_size, metadata=metadata
+            ):
+                yield records
+            return
+
+        # Streamed queries are measured as a whole, including the time spent consuming the records
+        time_start = time.time()
+        async for records in super().stream_query(
+            query=query, params=params, name=name, context=context, fetch_size=fetch_size, metadata=metadata
+        ):
+            yield records
+        duration_time = time.time() - time_start
+
+        self.measurements.append(
+            QueryMeasurement(
+                duration=duration_time,
+                memory=None,
+                query_name=str(name),
+                start_time=time_start,
+                nb_elements_loaded=self.nb_elements_loaded,
+            )
+        )
+
     def profile(self, profile_memory: bool) -> Self:
         """
         This method allows to enable profiling of a InfrahubDatabaseProfiler instance
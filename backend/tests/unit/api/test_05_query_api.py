@@ -185,6 +185,29 @@ async def test_query_endpoint_post_with_params(
     assert sorted(result_per_name.keys()) == ["John"]
 
 
+async def test_query_endpoint_batch(
+    db: InfrahubDatabase,
+    client: TestClient,
+    admin_headers,
+    default_branch,
+    car_person_data,
+    base_authentication,
+):
+    payload = {"items": [{"variables": {"person": "John"}}, {"variables": {"person": "Jane"}}, {"variables": {}}]}
+
+    # Must execute in a with block to execute the startup/shutdown events
+    with client:
+        response = client.post("/api/query/query02/batch", headers=admin_headers, json=payload)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 3
+
+    for result, name in zip(results[:2], ["John", "Jane"]):
+        assert [edge["node"]["name"]["value"] for edge in result["data"]["TestPerson"]["edges"]] == [name]
+    assert "errors" in results[2]
+
+
 async def test_query_endpoint_branch1(
     db: InfrahubDatabase,
     client: TestClient,
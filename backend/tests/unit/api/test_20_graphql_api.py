@@ -1,5 +1,7 @@
 import pytest
+import ujson
 
+from infrahub import config
 from infrahub.core.branch import Branch
 from infrahub.core.initialization import create_branch
 from infrahub.core.timestamp import Timestamp
@@ -48,6 +50,49 @@ async def test_graphql_endpoint(
     assert len(result_per_name["Jane"]["node"]["cars"]["edges"]) == 1
 
 
+async def test_graphql_endpoint_stream(
+    db: InfrahubDatabase, client, admin_headers, default_branch: Branch, create_test_admin, car_person_data, monkeypatch
+):
+    monkeypatch.setattr(config.SETTINGS.api, "graphql_stream_page_size", 1)
+
+    query = """
+    query {
+        TestPerson {
+            count
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    # Must execute in a with block to execute the startup/shutdown events
+    with client:
+        response = client.post(
+            "/graphql", json={"query": query}, headers={**admin_headers, "Accept": "application/x-ndjson"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    pages = [ujson.loads(line)["data"]["TestPerson"] for line in response.text.splitlines()]
+
+    assert [page.get("count") for page in pages] == [2, None, None]
+    assert sorted(edge["node"]["name"]["value"] for page in pages for edge in page["edges"]) == ["Jane", "John"]
+
+    with client:
+        response = client.post(
+            "/graphql",
+            json={"query": query.replace("TestPerson {", "TestPerson(limit: 0) {")},
+            headers={**admin_headers, "Accept": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 400
+
+
 async def test_graphql_endpoint_with_timestamp(
     db: InfrahubDatabase, client, admin_headers, default_branch: Branch, create_test_admin, car_person_data
 ):
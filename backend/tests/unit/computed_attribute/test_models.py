@@ -9,7 +9,7 @@ from infrahub.computed_attribute.constants import (
     QUERY_AUTOMATION_NAME,
     QUERY_AUTOMATION_NAME_PREFIX,
 )
-from infrahub.computed_attribute.models import ComputedAttributeAutomations
+from infrahub.computed_attribute.models import ComputedAttributeAutomations, Jinja2ComputedAttributeQuery
 
 
 def generate_automation(
@@ -52,3 +52,39 @@ async def test_load_from_prefect():
     query_obj = ComputedAttributeAutomations.from_prefect(automations=automations, prefix=QUERY_AUTOMATION_NAME_PREFIX)
     assert not query_obj.has(identifier="AAAAA", scope="default")
     assert query_obj.has(identifier="CCCCC", scope="default")
+
+
+def test_jinja2_query():
+    query = Jinja2ComputedAttributeQuery(
+        kind="TestPerson",
+        attribute_name="description",
+        variables=["name__value", "owner__name__value", "owner__height__value"],
+        filters={"ids": ["e5a3ec55-4fa8-4b2d-b1fe-0db9c1fe2c4f"]},
+    )
+
+    rendered_query = query.render()
+    assert 'TestPerson(offset: $offset, limit: $limit, ids: ["e5a3ec55-4fa8-4b2d-b1fe-0db9c1fe2c4f"])' in rendered_query
+    assert "count" in rendered_query
+    assert " ".join(rendered_query.split()).endswith(
+        "node { id description { value } name { value } owner { node { name { value } height { value } } } } } } }"
+    )
+
+    node = {
+        "id": "e5a3ec55-4fa8-4b2d-b1fe-0db9c1fe2c4f",
+        "description": {"value": "old"},
+        "name": {"value": "John"},
+        "owner": {"node": {"name": {"value": "Jane"}, "height": {"value": 170}}},
+    }
+    assert query.get_current_value(node=node) == "old"
+    assert query.get_variable_values(node=node) == {
+        "name__value": "John",
+        "owner__name__value": "Jane",
+        "owner__height__value": 170,
+    }
+
+    node["owner"] = None
+    assert query.get_variable_values(node=node) == {
+        "name__value": "John",
+        "owner__name__value": "",
+        "owner__height__value": "",
+    }
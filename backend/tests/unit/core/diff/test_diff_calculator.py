@@ -2618,3 +2618,37 @@ async def test_diff_unchanged_included_when_not_first_diff(
     assert property_diff.new_value == "Little Alfred"
     assert property_diff.action is DiffAction.UPDATED
     assert branch_before_change < property_diff.changed_at < branch_after_change
+
+
+async def test_diff_limited_to_changed_nodes(
+    db: InfrahubDatabase, default_branch: Branch, car_accord_main, person_alfred_main, person_john_main
+):
+    branch = await create_branch(db=db, branch_name="branch")
+    alfred_branch = await NodeManager.get_one(db=db, branch=branch, id=person_alfred_main.id)
+    alfred_branch.name.value = "Little Alfred"
+    await alfred_branch.save(db=db)
+    from_time = Timestamp()
+    car_branch = await NodeManager.get_one(db=db, branch=branch, id=car_accord_main.id)
+    car_branch.color.value = "BLURPLE"
+    await car_branch.save(db=db)
+
+    diff_calculator = DiffCalculator(db=db)
+    assert await diff_calculator.get_changed_node_uuids(diff_branch=default_branch, from_time=from_time) is None
+    changed_node_uuids = await diff_calculator.get_changed_node_uuids(diff_branch=branch, from_time=from_time)
+    assert changed_node_uuids == {car_accord_main.id}
+
+    calculated_diffs = await diff_calculator.calculate_diff(
+        base_branch=default_branch,
+        diff_branch=branch,
+        from_time=from_time,
+        to_time=Timestamp(),
+        include_unchanged=False,
+        changed_node_uuids=changed_node_uuids,
+    )
+
+    branch_root_path = calculated_diffs.diff_branch_diff
+    assert len(branch_root_path.nodes) == 1
+    node_diff = branch_root_path.nodes[0]
+    assert node_diff.uuid == car_accord_main.id
+    assert node_diff.action is DiffAction.UPDATED
+    assert {attribute_diff.name for attribute_diff in node_diff.attributes} == {"color"}
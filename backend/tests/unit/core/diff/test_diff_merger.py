@@ -1,3 +1,5 @@
+from dataclasses import replace
+from typing import Any, AsyncGenerator
 from unittest.mock import AsyncMock, call
 from uuid import uuid4
 
@@ -43,6 +45,14 @@ class TestMergeDiff:
     def mock_diff_repository(self) -> DiffRepository:
         return AsyncMock(spec=DiffRepository)
 
+    def _mock_diff(self, mock_diff_repository: DiffRepository, diff_root: EnrichedDiffRoot) -> None:
+        async def get_one_in_batches(**kwargs: Any) -> AsyncGenerator[EnrichedDiffRoot, None]:
+            yield diff_root
+
+        mock_diff_repository.get_empty_roots.return_value = [diff_root]
+        mock_diff_repository.get_cardinality_one_conflicts.return_value = []
+        mock_diff_repository.get_one_in_batches.side_effect = get_one_in_batches
+
     @pytest.fixture
     def diff_merger(
         self,
@@ -326,20 +336,24 @@ class TestMergeDiff:
         check_idempotent: bool,
     ):
         empty_diff_root.nodes = {added_person_node_diff}
-        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        self._mock_diff(mock_diff_repository=mock_diff_repository, diff_root=empty_diff_root)
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
         if check_idempotent:
             await diff_merger.merge_graph(at=at)
 
-        expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+        expected_calls = [
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                batch_size=diff_merger.serializer.max_batch_size,
+                base_branch_name=default_branch.name,
+            ),
         ]
         if check_idempotent:
-            expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+            expected_calls *= 2
+        assert mock_diff_repository.get_one_in_batches.call_args_list == expected_calls
 
         retrieved_node = await NodeManager.get_one(
             db=db, id=person_node_branch.id, branch=default_branch, include_owner=True, include_source=True
@@ -380,20 +394,24 @@ class TestMergeDiff:
         person_branch = await NodeManager.get_one(db=db, branch=source_branch, id=person_node_main.id)
         await person_branch.delete(db=db)
         empty_diff_root.nodes = {deleted_person_node_diff}
-        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        self._mock_diff(mock_diff_repository=mock_diff_repository, diff_root=empty_diff_root)
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
         if check_idempotent:
             await diff_merger.merge_graph(at=at)
 
-        expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+        expected_calls = [
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                batch_size=diff_merger.serializer.max_batch_size,
+                base_branch_name=default_branch.name,
+            ),
         ]
         if check_idempotent:
-            expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+            expected_calls *= 2
+        assert mock_diff_repository.get_one_in_batches.call_args_list == expected_calls
 
         with pytest.raises(NodeNotFoundError):
             await NodeManager.get_one(db=db, branch=default_branch, id=person_node_main.id, raise_on_error=True)
@@ -433,14 +451,16 @@ class TestMergeDiff:
         )
         deleted_node_diff.conflict = node_conflict
         empty_diff_root.nodes = {deleted_node_diff}
-        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        self._mock_diff(mock_diff_repository=mock_diff_repository, diff_root=empty_diff_root)
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
 
-        mock_diff_repository.get_one.assert_awaited_once_with(
-            diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid
+        mock_diff_repository.get_one_in_batches.assert_called_once_with(
+            diff_branch_name=source_branch.name,
+            diff_id=empty_diff_root.uuid,
+            batch_size=diff_merger.serializer.max_batch_size,
+            base_branch_name=default_branch.name,
         )
         if expect_deleted:
             with pytest.raises(NodeNotFoundError):
@@ -654,20 +674,24 @@ class TestMergeDiff:
         await car_branch.save(db=db)
 
         empty_diff_root.nodes = {updated_person_node_diff, updated_car_diff}
-        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        self._mock_diff(mock_diff_repository=mock_diff_repository, diff_root=empty_diff_root)
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
         if check_idempotent:
             await diff_merger.merge_graph(at=at)
 
-        expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+        expected_calls = [
+            call(
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                batch_size=diff_merger.serializer.max_batch_size,
+                base_branch_name=default_branch.name,
+            ),
         ]
         if check_idempotent:
-            expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+            expected_calls *= 2
+        assert mock_diff_repository.get_one_in_batches.call_args_list == expected_calls
         updated_person = await NodeManager.get_one(
             db=db, branch=default_branch, id=person_node_main.id, include_owner=True
         )
@@ -708,3 +732,31 @@ class TestMergeDiff:
         assert owner_prop.id == car_node_main2.id
         source_prop = await owner_rel.get_source(db=db)
         assert source_prop.id == person_node_main2.id
+
+
+async def test_serialize_diff_batches_same_as_full_diff():
+    serializer = DiffMergeSerializer(db=AsyncMock(spec=InfrahubDatabase), max_batch_size=2)
+    diff_root = EnrichedRootFactory.build(diff_branch_name="source", base_branch_name="main")
+    diff_root.nodes = {
+        EnrichedNodeFactory.build(action=DiffAction.ADDED, conflict=None, attributes=set(), relationships=set())
+        for _ in range(5)
+    }
+    full_batches = [batch async for batch in serializer.serialize_diff(diff=diff_root)]
+
+    nodes = list(diff_root.nodes)
+
+    async def get_diff_batches() -> AsyncGenerator[EnrichedDiffRoot, None]:
+        for index in range(0, len(nodes), 3):
+            yield replace(diff_root, nodes=set(nodes[index : index + 3]))
+
+    streamed_batches = [
+        batch
+        async for batch in serializer.serialize_diff_batches(
+            diff_batches=get_diff_batches(), cardinality_one_conflicts=[]
+        )
+    ]
+
+    assert [len(node_diffs) for node_diffs, _ in streamed_batches] == [2, 2, 1]
+    assert {node_diff["uuid"] for node_diffs, _ in streamed_batches for node_diff in node_diffs} == {
+        node_diff["uuid"] for node_diffs, _ in full_batches for node_diff in node_diffs
+    }
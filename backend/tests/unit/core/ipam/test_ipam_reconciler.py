@@ -5,6 +5,7 @@ import pytest
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.initialization import create_ipam_namespace, get_default_ipnamespace
+from infrahub.core.ipam.model import IpamNodeDetails
 from infrahub.core.ipam.reconciler import IpamReconciler
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -251,3 +252,64 @@ async def test_ipprefix_reconciler_prefix_value_update(db: InfrahubDatabase, def
         child_parent_rels = await child.ip_prefix.get_relationships(db=db)
         assert len(child_parent_rels) == 1
         assert child_parent_rels[0].peer_id == updated_prefix.id
+
+
+async def test_reconcile_many(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    namespace = ip_dataset_01["ns1"]
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace)
+    await new_prefix.save(db=db)
+    new_top_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_top_prefix.new(db=db, prefix="192.168.0.0/16", ip_namespace=namespace)
+    await new_top_prefix.save(db=db)
+    net_143 = ip_dataset_01["net143"]
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=new_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value="10.10.0.0/18",
+            ),
+            IpamNodeDetails(
+                node_uuid=new_top_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value="192.168.0.0/16",
+            ),
+            IpamNodeDetails(
+                node_uuid=net_143.id,
+                is_address=False,
+                is_delete=True,
+                namespace_id=namespace.id,
+                ip_value="10.10.1.0/27",
+            ),
+        ]
+    )
+
+    # check new prefixes
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_prefix.id)
+    assert updated_prefix.is_top_level.value is False
+    updated_prefix_parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in updated_prefix_parent_rels] == [ip_dataset_01["net140"].id]
+    expected_child_prefix_ids = {ip_dataset_01["net142"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id}
+    updated_prefix_child_rels = await updated_prefix.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_prefix_child_rels} == expected_child_prefix_ids
+    updated_address_child_rels = await updated_prefix.ip_addresses.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_address_child_rels} == {ip_dataset_01["address10"].id}
+    updated_top_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_top_prefix.id)
+    assert updated_top_prefix.is_top_level.value is True
+
+    # check deleted prefix
+    assert await NodeManager.get_one(db=db, branch=default_branch, id=net_143.id) is None
+    address_11 = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["address11"].id)
+    address_11_prefix_rels = await address_11.ip_prefix.get_relationships(db=db)
+    assert [rel.peer_id for rel in address_11_prefix_rels] == [ip_dataset_01["net142"].id]
@@ -0,0 +1,33 @@
+import ipaddress
+
+from infrahub.core.ipam.tree import IPPrefixTree
+
+
+def test_prefix_tree_get_parent():
+    tree = IPPrefixTree()
+    tree.add(node_uuid="net146", prefix=ipaddress.ip_network("10.0.0.0/8"))
+    tree.add(node_uuid="net140", prefix=ipaddress.ip_network("10.10.0.0/16"))
+    tree.add(node_uuid="net142", prefix=ipaddress.ip_network("10.10.1.0/24"))
+    tree.add(node_uuid="net161", prefix=ipaddress.ip_network("2001:db8::/48"))
+
+    assert tree.get_parent(ipaddress.ip_network("10.0.0.0/8")) is None
+    assert tree.get_parent(ipaddress.ip_network("10.10.0.0/16")) == "net146"
+    assert tree.get_parent(ipaddress.ip_network("10.10.1.0/24")) == "net140"
+    assert tree.get_parent(ipaddress.ip_network("10.10.1.0/27")) == "net142"
+    assert tree.get_parent(ipaddress.ip_network("10.10.2.0/24")) == "net140"
+    assert tree.get_parent(ipaddress.ip_network("192.168.0.0/24")) is None
+    assert tree.get_parent(ipaddress.ip_network("2001:db8::/64")) == "net161"
+
+    # An address can belong to a prefix of the same length
+    assert tree.get_parent(ipaddress.ip_interface("10.10.1.1")) == "net142"
+    assert tree.get_parent(ipaddress.ip_interface("10.10.1.1/24")) == "net142"
+    assert tree.get_parent(ipaddress.ip_interface("10.10.1.1/16")) == "net140"
+
+
+def test_prefix_tree_duplicate_prefixes():
+    tree = IPPrefixTree()
+    tree.add(node_uuid="b", prefix=ipaddress.ip_network("10.0.0.0/8"))
+    tree.add(node_uuid="a", prefix=ipaddress.ip_network("10.0.0.0/8"))
+
+    assert tree.get_parent(ipaddress.ip_network("10.0.0.0/8")) is None
+    assert tree.get_parent(ipaddress.ip_network("10.1.0.0/16")) == "a"
@@ -1,6 +1,17 @@
+import ipaddress
+
 from infrahub.core.branch import Branch
 from infrahub.core.ipam.constants import PrefixMemberType
-from infrahub.core.ipam.utilization import PrefixUtilizationGetter
+from infrahub.core.ipam.utilization import (
+    PrefixChildDetails,
+    PrefixUtilizationGetter,
+    add_child_to_summary,
+    apply_summary_delta,
+    summarize_children,
+    update_prefix_utilization,
+)
+from infrahub.core.query.ipam import PrefixUtilizationData, PrefixUtilizationGetQuery
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 
@@ -24,3 +35,88 @@ async def test_use_percentage_no_prefixes(db: InfrahubDatabase, default_branch:
     percentage = await utilization.get_use_percentage()
 
     assert percentage == 0.0
+
+
+async def test_use_percentage_from_summary(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    net140 = ip_dataset_01["net140"]
+    net240 = ip_dataset_01["net240"]
+    await update_prefix_utilization(db=db, prefix_ids=[net140.id, net240.id])
+
+    query = await PrefixUtilizationGetQuery.init(db=db, prefix_ids=[net140.id, net240.id])
+    await query.execute(db=db)
+    assert set(query.get_summaries().keys()) == {net140.id, net240.id}
+
+    for prefix in (net140, net240):
+        for branch_names in (None, [default_branch.name]):
+            from_summary = PrefixUtilizationGetter(db=db, ip_prefixes=[prefix])
+            from_children = PrefixUtilizationGetter(db=db, ip_prefixes=[prefix], at=Timestamp())
+            assert await from_summary.get_use_percentage(
+                branch_names=branch_names
+            ) == await from_children.get_use_percentage(branch_names=branch_names)
+
+
+def test_summarize_children():
+    children_by_branch = {
+        "main": [
+            PrefixChildDetails(child_type=PrefixMemberType.PREFIX, prefixlen=24, ip_value="10.0.0.0/24"),
+            PrefixChildDetails(child_type=PrefixMemberType.PREFIX, prefixlen=25, ip_value="10.0.1.0/25"),
+            PrefixChildDetails(child_type=PrefixMemberType.ADDRESS, prefixlen=16, ip_value="10.0.2.1/16"),
+        ],
+        "branch1": [
+            PrefixChildDetails(child_type=PrefixMemberType.PREFIX, prefixlen=48, ip_value="2001:db8::/48"),
+        ],
+    }
+
+    summary = summarize_children(prefix_id="prefix1", children_by_branch=children_by_branch)
+
+    assert summary.prefix_id == "prefix1"
+    assert summary.used_prefix_space == {"main": 384, "branch1": 2**80}
+    assert summary.used_addresses == {"main": 1, "branch1": 0}
+
+
+async def test_update_prefix_utilization_with_delta(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    net140 = ip_dataset_01["net140"]
+    net240 = ip_dataset_01["net240"]
+    await update_prefix_utilization(db=db, prefix_ids=[net140.id])
+    query = await PrefixUtilizationGetQuery.init(db=db, prefix_ids=[net140.id])
+    await query.execute(db=db)
+    summary = query.get_summaries()[net140.id]
+
+    delta = PrefixUtilizationData(prefix_id=net140.id, used_prefix_space={}, used_addresses={})
+    add_child_to_summary(
+        summary=delta, branch_name=default_branch.name, ip_value=ipaddress.ip_network("2001:db8::/64"), count=1
+    )
+    add_child_to_summary(
+        summary=delta, branch_name=default_branch.name, ip_value=ipaddress.ip_interface("2001:db8::1/64"), count=-1
+    )
+    # A prefix without summary is computed from its children instead
+    no_summary_delta = PrefixUtilizationData(prefix_id=net240.id, used_prefix_space={"main": 1}, used_addresses={})
+    await update_prefix_utilization(db=db, deltas=[delta, no_summary_delta])
+
+    query = await PrefixUtilizationGetQuery.init(db=db, prefix_ids=[net140.id, net240.id])
+    await query.execute(db=db)
+    summaries = query.get_summaries()
+    assert summaries[net140.id].used_prefix_space[default_branch.name] == (
+        summary.used_prefix_space.get(default_branch.name, 0) + 2**64
+    )
+    assert summaries[net140.id].used_addresses[default_branch.name] == (
+        summary.used_addresses.get(default_branch.name, 0) - 1
+    )
+    from_summary = PrefixUtilizationGetter(db=db, ip_prefixes=[net240])
+    from_children = PrefixUtilizationGetter(db=db, ip_prefixes=[net240], at=Timestamp())
+    assert await from_summary.get_use_percentage() == await from_children.get_use_percentage()
+
+
+def test_apply_summary_delta():
+    summary = PrefixUtilizationData(
+        prefix_id="prefix1", used_prefix_space={"main": 512, "branch1": 256}, used_addresses={"main": 3}
+    )
+    delta = PrefixUtilizationData(prefix_id="prefix1", used_prefix_space={"main": 0}, used_addresses={})
+    add_child_to_summary(summary=delta, branch_name="main", ip_value=ipaddress.ip_network("10.0.0.0/24"), count=-1)
+    add_child_to_summary(summary=delta, branch_name="main", ip_value=ipaddress.ip_interface("10.0.1.1/24"), count=1)
+    add_child_to_summary(summary=delta, branch_name="branch2", ip_value=ipaddress.ip_network("10.0.2.0/25"), count=1)
+
+    apply_summary_delta(summary=summary, delta=delta)
+
+    assert summary.used_prefix_space == {"main": 256, "branch1": 256, "branch2": 128}
+    assert summary.used_addresses == {"main": 4}
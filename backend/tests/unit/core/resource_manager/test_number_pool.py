@@ -1,8 +1,13 @@
+import pytest
+
+from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.initialization import initialize_registry
 from infrahub.core.node import Node
+from infrahub.core.node.resource_manager.number_pool import CoreNumberPool, find_next_free
 from infrahub.core.schema import SchemaRoot
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import PoolExhaustedError
 from tests.helpers.schema import TICKET, load_schema
 
 
@@ -31,3 +36,57 @@ async def test_allocate_from_number_pool(db: InfrahubDatabase, default_branch: B
     await recreated_ticket2.new(db=db, title="ticket2", ticket_id={"from_pool": {"id": np1.id}})
     await recreated_ticket2.save(db=db)
     assert recreated_ticket2.ticket_id.value == 2
+
+
+async def test_allocate_many_from_number_pool(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+
+    ticket1 = await Node.init(db=db, schema=TICKET.kind)
+    await ticket1.new(db=db, title="ticket1", ticket_id=2)
+    await ticket1.save(db=db)
+    ticket2 = await Node.init(db=db, schema=TICKET.kind)
+    await ticket2.new(db=db, title="ticket2", ticket_id={"from_pool": {"id": np1.id}})
+    await ticket2.save(db=db)
+    assert ticket2.ticket_id.value == 1
+
+    pool = await registry.manager.get_one(db=db, id=np1.id, kind=CoreNumberPool)
+    numbers = await pool.get_resources(db=db, branch=default_branch, identifiers=["first", "second", "third"])
+    assert numbers == [2, 3, 4]
+
+    # Reservations are returned as is for known identifiers
+    assert await pool.get_resources(db=db, branch=default_branch, identifiers=["third", "first"]) == [4, 2]
+
+    # Reserved numbers are held until they are assigned to a node
+    numbers = await pool.get_resources(db=db, branch=default_branch, identifiers=["fourth", "fifth"])
+    assert numbers == [5, 6]
+
+    assert await pool.get_resources(db=db, branch=default_branch, identifiers=["7", "8"]) == [7, 8]
+    assert await pool.get_resources(db=db, branch=default_branch, count=2) == [9, 10]
+    with pytest.raises(PoolExhaustedError):
+        await pool.get_resources(db=db, branch=default_branch, count=1)
+
+    with pytest.raises(ValueError):
+        await pool.get_resources(db=db, branch=default_branch)
+    with pytest.raises(ValueError):
+        await pool.get_resources(db=db, branch=default_branch, count=2, identifiers=["first"])
+
+
+@pytest.mark.parametrize(
+    "free_ranges,count,expected",
+    [
+        ([(1, 10)], 1, [1]),
+        ([(1, 10)], 3, [1, 2, 3]),
+        ([(5, 5), (1, 2), (8, 20)], 5, [1, 2, 5, 8, 9]),
+        ([(1, 2)], 3, [1, 2]),
+        ([], 1, []),
+    ],
+)
+def test_find_next_free(free_ranges: list[tuple[int, int]], count: int, expected: list[int]):
+    assert find_next_free(free_ranges=free_ranges, count=count) == expected
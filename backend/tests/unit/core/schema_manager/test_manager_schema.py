@@ -80,6 +80,40 @@ async def test_schema_branch_get(default_branch: Branch):
     assert schema11 == schema
 
 
+async def test_schema_branch_get_read_only():
+    SCHEMA = {
+        "name": "Criticality",
+        "namespace": "Builtin",
+        "attributes": [
+            {"name": "name", "kind": "Text", "unique": True},
+        ],
+    }
+    schema_branch = SchemaBranch(cache={}, name="test")
+    schema_branch.set(name="BuiltinCriticality", schema=NodeSchema(**SCHEMA))
+
+    shared = schema_branch.get(name="BuiltinCriticality", duplicate=False)
+    assert shared.is_frozen
+    assert shared.attributes[0].is_frozen
+    assert shared is schema_branch.get(name="BuiltinCriticality", duplicate=False)
+
+    with pytest.raises(TypeError, match="mutable_copy"):
+        shared.label = "New label"
+    with pytest.raises(TypeError, match="mutable_copy"):
+        shared.attributes[0].unique = False
+
+    editable = schema_branch.get(name="BuiltinCriticality")
+    assert not editable.is_frozen
+    assert not editable.attributes[0].is_frozen
+    editable.label = "New label"
+    editable.attributes[0].unique = False
+    assert shared.label != "New label"
+    assert shared.attributes[0].unique is True
+
+    schema_branch.set(name="BuiltinCriticality", schema=editable)
+    assert editable.is_frozen
+    assert schema_branch.get(name="BuiltinCriticality", duplicate=False).label == "New label"
+
+
 async def test_schema_branch_load_schema_initial(schema_all_in_one):
     schema = SchemaBranch(cache={}, name="test")
     schema.load_schema(schema=SchemaRoot(**schema_all_in_one))
@@ -5,6 +5,7 @@ from infrahub.core.branch import Branch
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager, identify_node_class
 from infrahub.core.node import Node
+from infrahub.core.node.read_only import ReadOnlyNode
 from infrahub.core.query.node import NodeToProcess
 from infrahub.core.registry import registry
 from infrahub.core.schema import NodeSchema
@@ -371,6 +372,74 @@ async def test_query_no_filter(
     assert len(nodes) == 3
 
 
+async def test_query_with_count(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    criticality_schema: NodeSchema,
+    criticality_low: Node,
+    criticality_medium: Node,
+    criticality_high: Node,
+):
+    all_nodes = await NodeManager.query(db=db, schema=criticality_schema)
+
+    nodes, count = await NodeManager.query_with_count(db=db, schema=criticality_schema, limit=2)
+    assert count == 3
+    assert [node.id for node in nodes] == [node.id for node in all_nodes[:2]]
+
+    nodes, count = await NodeManager.query_with_count(db=db, schema=criticality_schema, limit=2, offset=2)
+    assert count == 3
+    assert [node.id for node in nodes] == [all_nodes[2].id]
+
+    nodes, count = await NodeManager.query_with_count(
+        db=db, schema=criticality_schema, filters={"color__value": "#333333"}, limit=1
+    )
+    assert count == 2
+    assert len(nodes) == 1
+
+    nodes, count = await NodeManager.query_with_count(db=db, schema=criticality_schema, offset=5)
+    assert count == 3
+    assert nodes == []
+
+
+async def test_query_read_only(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    criticality_schema: NodeSchema,
+    criticality_low: Node,
+    criticality_medium: Node,
+):
+    attribute_fields = {"value": None, "is_default": None, "is_protected": None, "updated_at": None, "__typename": None}
+    fields = {
+        "id": None,
+        "display_label": None,
+        "__typename": None,
+        "name": attribute_fields,
+        "label": attribute_fields,
+        "level": attribute_fields,
+        "mylist": attribute_fields,
+        "json_default": attribute_fields,
+        "color": attribute_fields,
+        "status": {"value": None},
+    }
+    nodes = await NodeManager.query(db=db, schema=criticality_schema, fields=fields)
+    read_only_nodes = await NodeManager.query(db=db, schema=criticality_schema, fields=fields, read_only=True)
+
+    assert all(isinstance(node, ReadOnlyNode) for node in read_only_nodes)
+    assert not hasattr(read_only_nodes[0], "__dict__")
+    assert [await node.to_graphql(db=db, fields=fields) for node in read_only_nodes] == [
+        await node.to_graphql(db=db, fields=fields) for node in nodes
+    ]
+
+    # The properties computed by the attribute classes require a complete node
+    fields["status"] = {"value": None, "color": None, "description": None}
+    nodes = await NodeManager.query(db=db, schema=criticality_schema, fields=fields, read_only=True)
+    assert all(not isinstance(node, ReadOnlyNode) for node in nodes)
+
+    # Without the requested fields, the nodes can't be projected
+    nodes = await NodeManager.query(db=db, schema=criticality_schema, read_only=True)
+    assert all(not isinstance(node, ReadOnlyNode) for node in nodes)
+
+
 async def test_query_protocol(
     db: InfrahubDatabase,
     default_branch: Branch,
@@ -530,6 +599,39 @@ async def test_identify_node_class(db: InfrahubDatabase, car_schema, default_bra
     assert identify_node_class(node=node) == Car
 
 
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    nodes = []
+    for name, level in [("low", 4), ("medium", 3), ("high", 1)]:
+        node = await Node.init(db=db, schema=criticality_schema)
+        await node.new(db=db, name=name, level=level)
+        nodes.append(node)
+
+    await NodeManager.create_many(db=db, nodes=nodes)
+
+    for node in nodes:
+        assert node._existing is True
+        assert node.db_id
+        assert node.name.id
+
+    objs = await NodeManager.get_many(db=db, ids=[node.id for node in nodes])
+    assert sorted((obj.name.value, obj.level.value) for obj in objs.values()) == [
+        ("high", 1),
+        ("low", 4),
+        ("medium", 3),
+    ]
+    assert objs[nodes[0].id].color.value == "#444444"
+    assert objs[nodes[0].id].color.is_default is True
+
+
+async def test_create_many_existing_node(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    node = await Node.init(db=db, schema=criticality_schema)
+    await node.new(db=db, name="low", level=4)
+    await node.save(db=db)
+
+    with pytest.raises(ValueError, match="already exists in the database"):
+        await NodeManager.create_many(db=db, nodes=[node])
+
+
 # ------------------------------------------------------------------------
 # WITH BRANCH
 # ------------------------------------------------------------------------
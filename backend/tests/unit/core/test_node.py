@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from infrahub_sdk.uuidt import UUIDT
 
@@ -7,6 +9,7 @@ from infrahub.core.constants import BranchSupportType, InfrahubKind
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.query.node import NodeUpdateAllQuery
 from infrahub.core.schema import NodeSchema, SchemaRoot
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import count_relationships, get_paths_between_nodes
@@ -718,6 +721,72 @@ async def test_node_update_local_attrs(db: InfrahubDatabase, default_branch: Bra
     assert await count_relationships(db=db) == nbr_rels
 
 
+async def test_node_update_multiple_attrs_single_query(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj2.name.has_changed() is False
+    assert obj2.level.has_changed() is False
+
+    obj2.name.value = "high"
+    obj2.level.value = 1
+    obj2.is_true.is_protected = True
+    assert obj2.name.has_changed() is True
+    assert obj2.is_false.has_changed() is False
+
+    with patch.object(NodeUpdateAllQuery, "execute", autospec=True, side_effect=NodeUpdateAllQuery.execute) as execute:
+        await obj2.save(db=db)
+    assert execute.call_count == 1
+
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.name.value == "high"
+    assert obj3.level.value == 1
+    assert obj3.is_true.is_protected is True
+
+    # A node without any modification shouldn't generate any write query
+    with patch.object(NodeUpdateAllQuery, "execute", autospec=True, side_effect=NodeUpdateAllQuery.execute) as execute:
+        await obj3.save(db=db)
+    assert execute.call_count == 0
+
+
+async def test_node_update_attr_has_changed_without_side_effect(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj2.color.is_default is True
+    obj2.color.value = "#ffffff"
+    assert obj2.color.has_changed() is True
+    assert obj2.color.is_default is True
+
+    await obj2.save(db=db)
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.color.value == "#ffffff"
+    assert obj3.color.is_default is False
+
+
+async def test_node_update_only_fields(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    obj2.name.value = "high"
+    obj2.level.value = 1
+    await obj2.save(db=db, fields=["name"])
+
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.name.value == "high"
+    assert obj3.level.value == 4
+
+
 async def test_node_update_local_attrs_with_flags(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
     fields_to_query = {"name": True, "level": True}
     obj1 = await Node.init(db=db, schema=criticality_schema)
@@ -749,6 +818,22 @@ async def test_node_update_local_attrs_with_source(
     assert obj3.name.source_id == second_account.id
 
 
+async def test_node_update_local_attrs_with_unknown_source(
+    db: InfrahubDatabase, default_branch: Branch, criticality_schema, first_account
+):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4, _source=first_account)
+    await obj1.save(db=db)
+
+    unknown_id = str(UUIDT())
+    obj2 = await NodeManager.get_one(id=obj1.id, include_source=True, db=db)
+    obj2.name.source = unknown_id
+    await obj2.save(db=db)
+
+    results = await db.execute_query(query="MATCH (n:Node { uuid: $uuid }) RETURN n", params={"uuid": unknown_id})
+    assert not results
+
+
 async def test_update_related_node(db: InfrahubDatabase, default_branch, data_schema):
     """
     This test has been written to troubleshoot a specific issue
@@ -11,7 +11,7 @@ from infrahub.core.constants import (
 )
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.node import NodeGetListQuery
+from infrahub.core.query.node import NodeGetListQuery, NodeGetListWithInfoQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import SchemaRoot
 from infrahub.core.schema.relationship_schema import RelationshipSchema
@@ -849,3 +849,45 @@ async def test_query_NodeGetListQuery_pagination_order_by(
     assert len(node_ids) == 20
     # Validate that the order_by clause hasn't changed on the test schema which would defeat the purpose of this test
     assert widget_schema.order_by == ["name__value"]
+
+
+async def test_query_NodeGetListWithInfoQuery(
+    db: InfrahubDatabase, person_john_main, person_jim_main, person_albert_main, person_alfred_main, branch: Branch
+):
+    person_schema = registry.schema.get(name="TestPerson", branch=branch)
+    person_schema.order_by = ["height__value", "name__value"]
+    query = await NodeGetListQuery.init(db=db, branch=branch, schema=person_schema)
+    await query.execute(db=db)
+    all_ids = query.get_node_ids()
+
+    for offset in range(0, 5, 2):
+        query = await NodeGetListWithInfoQuery.init(
+            db=db, branch=branch, schema=person_schema, limit=2, offset=offset, include_count=True
+        )
+        await query.execute(db=db)
+        nodes = [node async for node in query.get_nodes(db=db)]
+
+        assert [node.node_uuid for node in nodes] == all_ids[offset : offset + 2]
+        assert all(node.schema and node.schema.kind == "TestPerson" for node in nodes)
+        assert query.get_count() == len(all_ids)
+
+
+async def test_query_NodeGetListWithInfoQuery_profiles(
+    db: InfrahubDatabase, person_john_main, person_jim_main, branch: Branch
+):
+    profile_schema = registry.schema.get("ProfileTestPerson", branch=branch, duplicate=False)
+    person_profile = await Node.init(db=db, schema=profile_schema, branch=branch)
+    await person_profile.new(db=db, profile_name="person_profile_1", height=172, profile_priority=1001)
+    await person_profile.save(db=db)
+    person = await NodeManager.get_one(db=db, id=person_john_main.id, branch=branch)
+    await person.profiles.update(data=[person_profile], db=db)
+    await person.save(db=db)
+
+    person_schema = registry.schema.get(name="TestPerson", branch=branch)
+    query = await NodeGetListWithInfoQuery.init(
+        db=db, branch=branch, schema=person_schema, filters={"name__value": person_john_main.name.value}
+    )
+    await query.execute(db=db)
+
+    assert [node.node_uuid async for node in query.get_nodes(db=db)] == [person_john_main.id]
+    assert query.get_profile_ids_by_node_id() == {person_john_main.id: [person_profile.id]}
@@ -1,6 +1,7 @@
 import pendulum
 import pytest
 
+from infrahub import config
 from infrahub.core.query import (
     Query,
     QueryNode,
@@ -145,6 +146,35 @@ async def test_query_count(db: InfrahubDatabase, simple_dataset_01):
     assert await query.count(db=db) == 3
 
 
+async def test_query_stream(db: InfrahubDatabase, simple_dataset_01, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 2)
+
+    query = await Query01.init(db=db)
+    results = [result async for result in query.stream(db=db)]
+
+    assert query.has_been_executed is True
+    assert query.results == []
+    assert len(results) == 3
+    assert {result.get("av").get("value") for result in results} == {"volt", "accord", 5}
+
+
+async def test_query_stream_write(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query02.init(db=db)
+
+    with pytest.raises(TypeError):
+        async for _ in query.stream(db=db):
+            pass
+
+
+async def test_query_with_size_limit(db: InfrahubDatabase, simple_dataset_01, monkeypatch):
+    monkeypatch.setattr(config.SETTINGS.database, "query_size_limit", 2)
+
+    query = await Query01.init(db=db)
+    await query.execute(db=db)
+
+    assert query.num_of_results == 3
+
+
 async def test_query_result_getters(neo4j_factory):
     time0 = pendulum.now(tz="UTC")
 
@@ -294,3 +294,37 @@ async def test_many_add(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
     assert len(paths) == 2
+
+
+async def test_fetch_relationship_ids_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    car_accord_main: Node,
+    car_volt_main: Node,
+    car_camry_main: Node,
+    person_john_main: Node,
+    person_jane_main: Node,
+):
+    john = await registry.manager.get_one(db=db, id=person_john_main.id, branch=default_branch)
+    await john.cars.update(db=db, data=[car_accord_main, car_camry_main])
+    jane = await registry.manager.get_one(db=db, id=person_jane_main.id, branch=default_branch)
+    alfred = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await alfred.new(db=db, name="Alfred", height=160, cars=[car_volt_main.id])
+
+    await RelationshipManager.fetch_relationship_ids_many(db=db, relms=[john.cars, jane.cars, alfred.cars])
+
+    john_details = await john.cars.fetch_relationship_ids(db=db, force_refresh=False)
+    assert sorted(john_details.peer_ids_present_both) == [car_accord_main.id]
+    assert john_details.peer_ids_present_local_only == [car_camry_main.id]
+    assert john_details.peer_ids_present_database_only == [car_volt_main.id]
+
+    jane_details = await jane.cars.fetch_relationship_ids(db=db, force_refresh=False)
+    assert jane_details.peer_ids_present_both == [car_camry_main.id]
+    assert not jane_details.peer_ids_present_local_only
+    assert not jane_details.peer_ids_present_database_only
+
+    alfred_details = await alfred.cars.fetch_relationship_ids(db=db, force_refresh=False)
+    assert alfred_details.peer_ids_present_local_only == [car_volt_main.id]
+    assert not alfred_details.peer_ids_present_both
+    assert not alfred_details.peer_ids_present_database_only
+    assert not alfred_details.peers_database
@@ -14,6 +14,7 @@ from infrahub.core.constants import InfrahubKind
 from infrahub.exceptions import (
     CheckError,
     CommitNotFoundError,
+    GraphQLQueryError,
     RepositoryError,
     RepositoryFileNotFoundError,
     TransformError,
@@ -23,11 +24,13 @@ from infrahub.git.base import (
     RepoFileInformation,
     extract_repo_file_information,
 )
+from infrahub.git.cache import commit_resources_cache
 from infrahub.git.constants import BRANCHES_DIRECTORY_NAME, COMMITS_DIRECTORY_NAME, TEMPORARY_DIRECTORY_NAME
 from infrahub.git.integrator import (
     ArtifactGenerateResult,
     CheckDefinitionInformation,
 )
+from infrahub.git.models import ArtifactGenerateTarget, RequestArtifactsGenerate
 from infrahub.git.worktree import Worktree
 from infrahub.utils import find_first_file_in_directory
 from tests.conftest import TestHelper
@@ -427,6 +430,18 @@ async def test_sync_updated_branch(git_repo_04: InfrahubRepository):
     assert repo.get_commit_value(branch_name="branch01") == str(commit)
 
 
+async def test_has_remote_changes(git_repo_04: InfrahubRepository):
+    repo = git_repo_04
+
+    assert await repo.has_remote_changes() is True
+
+    await repo.fetch()
+    assert await repo.has_remote_changes() is True
+
+    await repo.sync(fetch=False)
+    assert await repo.has_remote_changes() is False
+
+
 async def test_render_jinja2_template_success(git_repo_jinja: InfrahubRepository):
     repo = git_repo_jinja
 
@@ -671,6 +686,85 @@ async def test_artifact_generate_jinja2_new(
     assert result == expected_data
 
 
+async def test_render_artifacts_jinja2(
+    client: InfrahubClient,
+    git_repo_jinja_w_client: InfrahubRepository,
+    artifact_node_01: InfrahubNode,
+    artifact_node_02: InfrahubNode,
+    httpx_mock: HTTPXMock,
+    mock_update_artifact: HTTPXMock,
+    mock_upload_content: HTTPXMock,
+):
+    repo = git_repo_jinja_w_client
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+
+    batch_response = {
+        "results": [
+            {"data": {"items": ["consilium", "potum", "album", "magnum"]}},
+            {"errors": [{"message": "GraphQLQuery query03: invalid"}]},
+        ]
+    }
+    httpx_mock.add_response(
+        method="POST", json=batch_response, match_headers={"X-Infrahub-Tracker": "artifact-query-graphql-data"}
+    )
+
+    message = RequestArtifactsGenerate(
+        artifact_name="myartifact",
+        artifact_definition="c4908d78-7b24-45e2-9252-96d0fb3e2c78",
+        commit=commit_main,
+        content_type="text/plain",
+        transform_type=InfrahubKind.TRANSFORMJINJA2,
+        transform_location="template01.tpl.j2",
+        repository_id=str(repo.id),
+        repository_name=repo.name,
+        repository_kind=InfrahubKind.REPOSITORY,
+        branch_name="main",
+        query="query03",
+        timeout=10,
+        targets=[
+            ArtifactGenerateTarget(target_id="car01", target_name="car01", variables={"name": "car01"}),
+            ArtifactGenerateTarget(target_id="car02", target_name="car02", variables={"name": "car02"}),
+        ],
+    )
+
+    results = await repo.render_artifacts(artifacts=[artifact_node_01, artifact_node_02], message=message)
+
+    assert results[0] == ArtifactGenerateResult(
+        changed=True,
+        checksum="5032217684d0e0b61d93c8611bffcd8a",
+        storage_id="ee04f134-a68c-4158-a3c8-3ba5e9cc0c9a",
+        artifact_id=artifact_node_01.id,
+    )
+    assert isinstance(results[1], GraphQLQueryError)
+
+
+async def test_load_jinja2_template_cached(git_repo_jinja: InfrahubRepository):
+    repo = git_repo_jinja
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+
+    template = repo.load_jinja2_template(commit=commit_main, location="template01.tpl.j2")
+    assert repo.load_jinja2_template(commit=commit_main, location="template01.tpl.j2") is template
+
+
+async def test_load_python_transform_cached(client: InfrahubClient, git_repo_transforms: InfrahubRepository):
+    repo = git_repo_transforms
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+
+    transform01 = repo.load_python_transform(
+        branch_name="main", commit=commit_main, location="transform01.py::Transform01", client=client
+    )
+    transform02 = repo.load_python_transform(
+        branch_name="main", commit=commit_main, location="transform01.py::Transform01", client=client
+    )
+    assert transform01 is not transform02
+    assert type(transform01) is type(transform02)
+
+    resources = commit_resources_cache.get(
+        repository_id=str(repo.id), commit=commit_main, directory=repo.get_commit_worktree(commit=commit_main).directory
+    )
+    assert list(resources.classes.keys()) == [("transform01.py", "Transform01")]
+
+
 async def test_execute_python_transform_file_missing(client: InfrahubClient, git_repo_transforms: InfrahubRepository):
     repo = git_repo_transforms
     commit_main = repo.get_commit_value(branch_name="main", remote=False)
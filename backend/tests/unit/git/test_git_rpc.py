@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from infrahub_sdk import Config, InfrahubClient
 from infrahub_sdk.uuidt import UUIDT
 from typing_extensions import Self
@@ -18,7 +19,12 @@ from infrahub.git.models import (
     GitRepositoryPullReadOnly,
 )
 from infrahub.git.repository import InfrahubReadOnlyRepository
-from infrahub.git.tasks import add_git_repository, add_git_repository_read_only, pull_read_only
+from infrahub.git.tasks import (
+    add_git_repository,
+    add_git_repository_read_only,
+    pull_read_only,
+    sync_remote_repositories,
+)
 from infrahub.lock import InfrahubLockRegistry
 from infrahub.message_bus.messages import RefreshGitFetch
 from infrahub.services import InfrahubServices, services
@@ -335,3 +341,63 @@ class TestPullReadOnly:
 
         assert len(self.recorder.messages) > 0
         assert isinstance(self.recorder.messages[0], RefreshGitFetch)
+
+
+class TestSyncRemoteRepositories:
+    def setup_method(self):
+        self.client = AsyncMock(spec=InfrahubClient)
+        self.client.branch = AsyncMock()
+        self.original_services = services.service
+        self.recorder = BusSimulator()
+        services.service = InfrahubServices(client=self.client, message_bus=self.recorder)
+        registry_patcher = patch("infrahub.git.tasks.registry")
+        registry_patcher.start().default_branch = "main"
+        lock_patcher = patch("infrahub.git.tasks.lock")
+        self.mock_infra_lock = lock_patcher.start()
+        self.mock_infra_lock.registry = AsyncMock(spec=InfrahubLockRegistry)
+        repo_class_patcher = patch("infrahub.git.tasks.InfrahubRepository", spec=InfrahubRepository)
+        self.mock_repo_class = repo_class_patcher.start()
+        self.mock_repos: dict[str, AsyncMock] = {}
+        self.mock_repo_class.init.side_effect = lambda **kwargs: self.mock_repos[kwargs["name"]]
+
+    def teardown_method(self):
+        patch.stopall()
+        services.service = self.original_services
+
+    def add_repository(self, name: str) -> AsyncMock:
+        repository_data = MagicMock()
+        repository_data.repository.id = str(UUIDT())
+        repository_data.repository.name.value = name
+        repository_data.repository.location.value = f"/remote/{name}"
+        repository_data.repository.default_branch.value = "main"
+        repository_data.repository.get_kind.return_value = InfrahubKind.REPOSITORY
+        repository_data.branch_info = {"main": MagicMock(internal_status=RepositoryInternalStatus.ACTIVE.value)}
+        self.client.get_list_repositories.return_value[name] = repository_data
+
+        mock_repo = AsyncMock(spec=InfrahubRepository)
+        mock_repo.has_remote_changes.return_value = True
+        self.mock_repos[name] = mock_repo
+        return mock_repo
+
+    async def test_failing_and_unchanged_repositories_dont_stop_the_others(self):
+        self.client.get_list_repositories.return_value = {}
+        unreachable_repo = self.add_repository(name="unreachable")
+        unreachable_repo.fetch.side_effect = RepositoryError("unreachable", "unable to fetch")
+        unchanged_repo = self.add_repository(name="unchanged")
+        unchanged_repo.has_remote_changes.return_value = False
+        crashing_repo = self.add_repository(name="crashing")
+        crashing_repo.sync.side_effect = ValueError("unexpected error")
+        changed_repo = self.add_repository(name="changed")
+
+        with pytest.raises(ValueError, match="unexpected error"):
+            await sync_remote_repositories()
+
+        unreachable_repo.sync.assert_not_awaited()
+        unchanged_repo.fetch.assert_not_awaited()
+        unchanged_repo.sync.assert_not_awaited()
+        changed_repo.fetch.assert_awaited_once_with()
+        changed_repo.sync.assert_awaited_once_with(staging_branch=None, fetch=False)
+
+        assert len(self.recorder.messages) == 1
+        assert isinstance(self.recorder.messages[0], RefreshGitFetch)
+        assert self.recorder.messages[0].repository_name == "changed"
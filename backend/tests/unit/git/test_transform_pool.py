@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from infrahub import config
+from infrahub.git.transform_pool import TransformPoolError, transform_pool
+
+TRANSFORM = """
+import time
+
+from infrahub_sdk.transforms import InfrahubTransform
+
+
+class SlowTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data: dict):
+        time.sleep(data.get("sleep", 0))
+        return {str(key).upper(): value for key, value in data.items()}
+
+
+class TokenTransform(InfrahubTransform):
+    query = "my_query"
+
+    def transform(self, data: dict):
+        return {"token": self.client.config.api_token}
+"""
+
+
+@pytest.fixture
+def enable_transform_pool():
+    original = config.SETTINGS.git.transform_workers
+    config.SETTINGS.git.transform_workers = 1
+    transform_pool.start()
+    yield transform_pool
+    transform_pool.shutdown()
+    config.SETTINGS.git.transform_workers = original
+
+
+@pytest.fixture
+def commit_directory(tmp_path: Path) -> Path:
+    directory = tmp_path / "repo01" / "commits" / "abcdef"
+    directory.mkdir(parents=True)
+    (directory / "template01.j2").write_text("{% for item in data['items'] %}{{ item }}\n{% endfor %}")
+    (directory / "transform01.py").write_text(TRANSFORM)
+    return directory
+
+
+async def test_transform_pool(enable_transform_pool, commit_directory: Path, tmp_path: Path):
+    rendered = await transform_pool.render_jinja2_template(
+        repository_id="repo01",
+        commit="abcdef",
+        directory=commit_directory,
+        location="template01.j2",
+        data={"data": {"items": ["consilium", "potum"]}},
+        timeout=10,
+    )
+    assert rendered == "consilium\npotum\n"
+
+    params = {
+        "repository_id": "repo01",
+        "commit": "abcdef",
+        "directory": commit_directory,
+        "repository_directory": tmp_path,
+        "branch_name": "main",
+        "client_config": {"address": "http://mock", "api_token": "secret"},
+    }
+    result = await transform_pool.run_python_transform(
+        location="transform01.py::SlowTransform", data={"name": "car01"}, timeout=10, **params
+    )
+    assert result == {"NAME": "car01"}
+
+    # The client of the transform uses the credentials of the worker
+    result = await transform_pool.run_python_transform(
+        location="transform01.py::TokenTransform", data={"name": "car01"}, timeout=10, **params
+    )
+    assert result == {"token": "secret"}
+
+    with pytest.raises(TransformPoolError) as exc:
+        await transform_pool.run_python_transform(
+            location="transform01.py::MissingTransform", data={"name": "car01"}, timeout=10, **params
+        )
+    assert exc.value.message == "Unable to find the class MissingTransform in transform01.py::MissingTransform"
+
+    with pytest.raises(TransformPoolError) as exc:
+        await transform_pool.run_python_transform(
+            location="transform01.py::SlowTransform", data={"sleep": 30}, timeout=1, **params
+        )
+    assert exc.value.message == "Transform not completed within 1 seconds"
+
+    # The process that timed out has been replaced
+    result = await transform_pool.run_python_transform(
+        location="transform01.py::SlowTransform", data={"name": "car02"}, timeout=30, **params
+    )
+    assert result == {"NAME": "car02"}
@@ -318,6 +318,64 @@ async def test_ipprefix_create(
     assert not result.data["IpamIPPrefix"]["edges"][0]["node"]["is_top_level"]["value"]
 
 
+async def test_ipprefix_create_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_core_models_schema: SchemaBranch,
+    register_ipam_schema: SchemaBranch,
+):
+    """Make sure the prefixes created together are reconciled with each other."""
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+
+    supernet = ipaddress.ip_network("2001:db8::/32")
+    networks = list(supernet.subnets(new_prefix=36))[:2]
+    query = """
+    mutation CreatePrefixes($data: [IpamIPPrefixCreateInput!]!) {
+        IpamIPPrefixCreateMany(data: $data) {
+            ok
+            count
+            objects {
+                prefix {
+                    value
+                }
+                is_top_level {
+                    value
+                }
+            }
+        }
+    }
+    """
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        variable_values={"data": [{"prefix": {"value": str(prefix)}} for prefix in networks + [supernet]]},
+    )
+
+    assert not result.errors
+    assert result.data["IpamIPPrefixCreateMany"]["count"] == 3
+    assert [obj["is_top_level"]["value"] for obj in result.data["IpamIPPrefixCreateMany"]["objects"]] == [
+        False,
+        False,
+        True,
+    ]
+
+    result = await graphql(
+        schema=gql_params.schema,
+        source=GET_IPPREFIX,
+        context_value=gql_params.context,
+        variable_values={"prefix": str(supernet)},
+    )
+
+    assert not result.errors
+    assert len(result.data["IpamIPPrefix"]["edges"]) == 1
+    assert not result.data["IpamIPPrefix"]["edges"][0]["node"]["parent"]["node"]
+    assert sorted(
+        edge["node"]["prefix"]["value"] for edge in result.data["IpamIPPrefix"]["edges"][0]["node"]["children"]["edges"]
+    ) == [str(network) for network in networks]
+
+
 async def test_ipprefix_create_with_ipnamespace(
     db: InfrahubDatabase,
     default_branch: Branch,
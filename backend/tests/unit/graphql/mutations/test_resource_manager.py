@@ -812,3 +812,70 @@ async def test_test_number_pool_update(db: InfrahubDatabase, default_branch: Bra
     assert "start_range can't be larger than end_range" in str(update_invalid_range.errors[0])
     assert update_ok.data
     assert not update_ok.errors
+
+
+async def test_number_pool_get_resources(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+
+    create_ok = await graphql(
+        schema=gql_params.schema,
+        source=CREATE_NUMBER_POOL,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={
+            "name": "pool1",
+            "node": "TestingTicket",
+            "node_attribute": "ticket_id",
+            "start_range": 1,
+            "end_range": 10,
+        },
+    )
+    pool_id = create_ok.data["CoreNumberPoolCreate"]["object"]["id"]
+
+    query = """
+    mutation GetNumbers($id: String!, $identifiers: [String!], $count: Int) {
+        NumberPoolGetResources(data: {id: $id, identifiers: $identifiers, count: $count}) {
+            ok
+            numbers
+        }
+    }
+    """
+
+    with_identifiers = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"id": pool_id, "identifiers": ["first", "second"]},
+    )
+    same_identifiers = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"id": pool_id, "identifiers": ["second", "first"]},
+    )
+    with_count = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"id": pool_id, "count": 3},
+    )
+    missing_input = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"id": pool_id},
+    )
+
+    assert not with_identifiers.errors
+    assert with_identifiers.data["NumberPoolGetResources"] == {"ok": True, "numbers": [1, 2]}
+    assert not same_identifiers.errors
+    assert same_identifiers.data["NumberPoolGetResources"]["numbers"] == [2, 1]
+    assert not with_count.errors
+    assert with_count.data["NumberPoolGetResources"]["numbers"] == [3, 4, 5]
+    assert missing_input.errors
+    assert "Either identifiers or count must be provided" in str(missing_input.errors[0])
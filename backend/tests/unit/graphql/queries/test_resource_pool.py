@@ -10,8 +10,10 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.node.resource_manager.ip_address_pool import CoreIPAddressPool
 from infrahub.core.node.resource_manager.ip_prefix_pool import CoreIPPrefixPool
+from infrahub.core.query.ipam import PrefixUtilizationData, PrefixUtilizationSetQuery
 from infrahub.core.schema import SchemaRoot
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
 from tests.helpers.schema import TICKET, load_schema
@@ -631,6 +633,50 @@ async def test_read_resources_in_pool_new_schema_in_branch(
     }
 
 
+async def test_prefix_pool_utilization_from_summary(db: InfrahubDatabase, default_branch: Branch, prefix_pools_02):
+    ipv4_prefix_pool = prefix_pools_02["ipv4_prefix_pool"]
+    ipv4_prefix_resource = prefix_pools_02["ipv4_prefix_resource"]
+
+    # A summary that doesn't match the children of the prefix, to identify where the utilization comes from
+    summary = PrefixUtilizationData(
+        prefix_id=ipv4_prefix_resource.id, used_prefix_space={default_branch.name: 64}, used_addresses={}
+    )
+    query = await PrefixUtilizationSetQuery.init(db=db, summaries=[summary])
+    await query.execute(db=db)
+
+    utilization_query = """
+    query GET_RESOURCE_POOL_UTILIZATION($pool_id: String!) {
+        InfrahubResourcePoolUtilization(pool_id: $pool_id) {
+            utilization
+            utilization_default_branch
+        }
+    }
+    """
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=utilization_query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"pool_id": ipv4_prefix_pool.id},
+    )
+    assert not result.errors
+    assert result.data["InfrahubResourcePoolUtilization"] == {"utilization": 25.0, "utilization_default_branch": 25.0}
+
+    # The summaries only describe the current state, a specific time is computed from the children
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch, at=Timestamp())
+    result = await graphql(
+        schema=gql_params.schema,
+        source=utilization_query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"pool_id": ipv4_prefix_pool.id},
+    )
+    assert not result.errors
+    assert result.data["InfrahubResourcePoolUtilization"] == {"utilization": 0.0, "utilization_default_branch": 0.0}
+
+
 async def test_read_resources_in_pool_with_branch_with_mutations(
     db: InfrahubDatabase, default_branch: Branch, prefix_pools_02
 ):
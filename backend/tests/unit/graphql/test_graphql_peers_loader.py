@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from graphql import graphql
+
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.initialization import prepare_graphql_params
+
+
+async def test_query_peers_batched(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    person_john_main: Node,
+    person_jane_main: Node,
+    car_accord_main: Node,
+    car_volt_main: Node,
+    car_camry_main: Node,
+    car_yaris_main: Node,
+):
+    query = """
+    query {
+        TestCar {
+            edges {
+                node {
+                    name { value }
+                    owner {
+                        node {
+                            name { value }
+                        }
+                    }
+                }
+            }
+        }
+        TestPerson {
+            edges {
+                node {
+                    name { value }
+                    cars {
+                        count
+                        edges {
+                            node {
+                                name { value }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+
+    with patch.object(NodeManager, "query_peers", wraps=NodeManager.query_peers) as query_peers:
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={},
+        )
+
+    assert result.errors is None
+    assert result.data
+
+    # One query for the owner of all the cars and one for the cars of all the persons
+    assert query_peers.call_count == 2
+
+    owners = {
+        edge["node"]["name"]["value"]: edge["node"]["owner"]["node"]["name"]["value"]
+        for edge in result.data["TestCar"]["edges"]
+    }
+    assert owners == {"accord": "John", "volt": "John", "camry": "Jane", "yaris": "Jane"}
+
+    cars = {
+        edge["node"]["name"]["value"]: sorted(car["node"]["name"]["value"] for car in edge["node"]["cars"]["edges"])
+        for edge in result.data["TestPerson"]["edges"]
+    }
+    assert cars == {"John": ["accord", "volt"], "Jane": ["camry", "yaris"]}
+    assert {edge["node"]["cars"]["count"] for edge in result.data["TestPerson"]["edges"]} == {2}
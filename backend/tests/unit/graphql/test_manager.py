@@ -287,7 +287,7 @@ async def test_branch_caching_hit(
     assert manager1 is manager2
 
 
-@pytest.mark.parametrize("schema_changed_at_new,schema_hash_updated", [(True, False), (False, True), (True, True)])
+@pytest.mark.parametrize("schema_changed_at_new,schema_hash_updated", [(False, True), (True, True)])
 async def test_branch_caching_miss(
     db: InfrahubDatabase,
     default_branch: Branch,
@@ -309,3 +309,19 @@ async def test_branch_caching_miss(
     manager2 = GraphQLSchemaManager.get_manager_for_branch(branch=same_branch, schema_branch=schema_branch)
 
     assert manager1 is not manager2
+
+
+async def test_branch_caching_shared_by_schema_hash(
+    db: InfrahubDatabase, default_branch: Branch, data_schema, car_person_schema_generics
+):
+    default_branch.update_schema_hash()
+    other_branch = default_branch.model_copy(update={"name": "branch2"})
+    other_branch.schema_changed_at = Timestamp().to_string()
+    schema_branch = registry.schema.get_schema_branch(default_branch.name)
+
+    await GraphQLSchemaManager.warm_up_branch(branch=default_branch, schema_branch=schema_branch)
+    manager1 = GraphQLSchemaManager.get_manager_for_branch(branch=default_branch, schema_branch=schema_branch)
+    manager2 = GraphQLSchemaManager.get_manager_for_branch(branch=other_branch, schema_branch=schema_branch.duplicate())
+
+    assert manager1 is manager2
+    assert manager1._full_graphql_schema is not None
@@ -0,0 +1,128 @@
+from graphql import graphql
+
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.initialization import prepare_graphql_params
+
+
+async def test_create_many_objects(db: InfrahubDatabase, default_branch, car_person_schema):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "John"}, height: {value: 182}},
+            {name: { value: "Jane"}, height: {value: 170}},
+            {name: { value: "Jack"}}
+        ]) {
+            ok
+            count
+            objects {
+                id
+                name {
+                    value
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestPersonCreateMany"]["ok"] is True
+    assert result.data["TestPersonCreateMany"]["count"] == 3
+    assert [obj["name"]["value"] for obj in result.data["TestPersonCreateMany"]["objects"]] == ["John", "Jane", "Jack"]
+
+    persons = await NodeManager.query(db=db, schema="TestPerson")
+    assert sorted(person.name.value for person in persons) == ["Jack", "Jane", "John"]
+    heights = {person.name.value: person.height.value for person in persons}
+    assert heights == {"John": 182, "Jane": 170, "Jack": None}
+
+
+async def test_create_many_objects_with_relationships(db: InfrahubDatabase, default_branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John")
+    await person.save(db=db)
+
+    query = """
+    mutation {
+        TestCarCreateMany(data: [
+            {name: { value: "accord"}, nbr_seats: {value: 5}, is_electric: {value: false}, owner: {id: "%(person_id)s"}},
+            {name: { value: "volt"}, nbr_seats: {value: 4}, is_electric: {value: true}, owner: {id: "%(person_id)s"}}
+        ]) {
+            ok
+            count
+        }
+    }
+    """ % {"person_id": person.id}
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestCarCreateMany"]["count"] == 2
+
+    cars = await NodeManager.query(db=db, schema="TestCar", prefetch_relationships=True)
+    assert len(cars) == 2
+    for car in cars:
+        owner = await car.owner.get_peer(db=db)
+        assert owner.id == person.id
+
+
+async def test_create_many_objects_duplicate_in_list(db: InfrahubDatabase, default_branch, car_person_schema):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [{name: { value: "John"}}, {name: { value: "John"}}]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "Multiple objects are using the same value: name: John" in result.errors[0].message
+    assert await NodeManager.count(db=db, schema="TestPerson") == 0
+
+
+async def test_create_many_objects_duplicate_in_database(db: InfrahubDatabase, default_branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John")
+    await person.save(db=db)
+
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [{name: { value: "Jane"}}, {name: { value: "John"}}]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "An object already exist with this value: name: John" in result.errors[0].message
+    assert await NodeManager.count(db=db, schema="TestPerson") == 1
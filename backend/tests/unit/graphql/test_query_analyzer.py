@@ -1,9 +1,9 @@
-from graphql import DocumentNode, GraphQLSchema
+from graphql import DocumentNode, GraphQLSchema, build_schema
 
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import GraphQLQueryAnalysisCache, InfrahubGraphQLQueryAnalyzer, query_analysis_cache
 from infrahub.graphql.initialization import prepare_graphql_params
 
 
@@ -104,3 +104,43 @@ async def test_get_models_in_use(
         "TestGazCar",
         "TestPerson",
     }
+
+
+def test_analysis_cache():
+    cache = GraphQLQueryAnalysisCache(max_size=2)
+
+    analysis1 = cache.get(query="query { one }", schema_hash="hash1")
+    assert cache.get(query="query { one }", schema_hash="hash1") is analysis1
+    assert cache.get(query="query { one }", schema_hash="hash2") is not analysis1
+
+    cache.get(query="query { two }", schema_hash="hash1")
+    assert cache.get(query="query { one }", schema_hash="hash1") is not analysis1
+
+
+async def test_analyzer_shared_analysis():
+    schema = build_schema("type Query { name(prefix: String): String }")
+    root_value = {"name": lambda info, prefix="": f"{prefix}infrahub"}
+    query = "query MyQuery($prefix: String) { name(prefix: $prefix) }"
+
+    try:
+        gqa1 = InfrahubGraphQLQueryAnalyzer(query=query, schema=schema, schema_hash="abcdef")
+        assert gqa1.is_valid == (True, None)
+        assert await gqa1.calculate_height() == 1
+
+        gqa2 = InfrahubGraphQLQueryAnalyzer(
+            query=query, query_variables={"prefix": "my-"}, schema=schema, schema_hash="abcdef"
+        )
+        assert gqa2.document is gqa1.document
+        assert gqa2.analysis.is_validated
+        assert gqa2.analysis.fields == {"name": None}
+
+        result = await gqa2.execute(context_value=None, root_value=root_value)
+        assert result.data == {"name": "my-infrahub"}
+        assert not result.errors
+
+        gqa3 = InfrahubGraphQLQueryAnalyzer(query="query { unknown }", schema=schema, schema_hash="abcdef")
+        result = await gqa3.execute(context_value=None)
+        assert result.data is None
+        assert result.errors
+    finally:
+        query_analysis_cache.clear()
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+from infrahub.core import registry
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.constants import GlobalPermissions, PermissionAction, PermissionDecision
+from infrahub.permissions.cache import PermissionCache, invalidate_permissions_cache
+from infrahub.permissions.constants import AssignedPermissions
+from infrahub.permissions.local_backend import LocalPermissionBackend, get_local_permission_backend
+from infrahub.services import InfrahubServices
+from tests.adapters.cache import MemoryCache
+from tests.helpers.utils import init_global_service
+
+PERMISSIONS: AssignedPermissions = {
+    "global_permissions": [
+        GlobalPermission(action=GlobalPermissions.SUPER_ADMIN.value, decision=PermissionDecision.ALLOW_ALL.value)
+    ],
+    "object_permissions": [
+        ObjectPermission(
+            namespace="*", name="*", action=PermissionAction.ANY.value, decision=PermissionDecision.ALLOW_ALL.value
+        )
+    ],
+}
+
+
+async def test_cache_shared_between_workers():
+    with init_global_service(InfrahubServices(cache=MemoryCache())):
+        worker1 = PermissionCache()
+        worker2 = PermissionCache()
+        version = await worker1.get_version()
+        assert version
+        assert await worker2.get_version() == version
+
+        assert await worker1.get(account_id="account1", branch_name="main", version=version) is None
+        await worker1.set(account_id="account1", branch_name="main", version=version, permissions=PERMISSIONS)
+
+        assert await worker1.get(account_id="account1", branch_name="main", version=version) is PERMISSIONS
+        assert await worker2.get(account_id="account1", branch_name="main", version=version) == PERMISSIONS
+        assert await worker2.get(account_id="account1", branch_name="branch2", version=version) is None
+        assert await worker2.get(account_id="account2", branch_name="main", version=version) is None
+
+        await invalidate_permissions_cache()
+
+        version = await worker2.get_version()
+        assert await worker1.get(account_id="account1", branch_name="main", version=version) is None
+        assert await worker2.get(account_id="account1", branch_name="main", version=version) is None
+
+
+async def test_cache_invalidated_during_fetch():
+    with init_global_service(InfrahubServices(cache=MemoryCache())):
+        cache = PermissionCache()
+        version = await cache.get_version()
+
+        # The permission graph is modified while the permissions are fetched from the database
+        await invalidate_permissions_cache()
+        await cache.set(account_id="account1", branch_name="main", version=version, permissions=PERMISSIONS)
+
+        assert await cache.get(account_id="account1", branch_name="main", version=await cache.get_version()) is None
+
+
+async def test_cache_lru():
+    with init_global_service(InfrahubServices(cache=MemoryCache())):
+        cache = PermissionCache(max_size=1)
+        version = await cache.get_version()
+
+        await cache.set(account_id="account1", branch_name="main", version=version, permissions=PERMISSIONS)
+        await cache.set(account_id="account2", branch_name="main", version=version, permissions=PERMISSIONS)
+        assert len(cache._entries) == 1
+        assert await cache.get(account_id="account2", branch_name="main", version=version) is PERMISSIONS
+
+
+async def test_cache_without_shared_cache():
+    with init_global_service(InfrahubServices()):
+        cache = PermissionCache()
+        version = await cache.get_version()
+        assert version is None
+
+        # The invalidations couldn't reach the other workers, nothing is cached
+        await cache.set(account_id="account1", branch_name="main", version=version, permissions=PERMISSIONS)
+        assert await cache.get(account_id="account1", branch_name="main", version=version) is None
+
+
+def test_get_local_permission_backend_from_registry():
+    local_backend = LocalPermissionBackend()
+    with patch.object(registry, "permission_backends", [local_backend]):
+        assert get_local_permission_backend() is local_backend
+
+    with patch.object(registry, "permission_backends", []):
+        assert isinstance(get_local_permission_backend(), LocalPermissionBackend)
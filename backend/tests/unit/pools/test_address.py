@@ -1,8 +1,8 @@
-from ipaddress import ip_interface, ip_network
+from ipaddress import ip_address, ip_interface, ip_network
 
 from netaddr import IPNetwork
 
-from infrahub.pools.address import get_available
+from infrahub.pools.address import IPAddressAllocator, get_available
 
 
 def test_get_available():
@@ -27,3 +27,40 @@ def test_get_available_full():
     addresses = [ip_interface("10.16.18.1/30"), ip_interface("10.16.18.2/30")]
     available = get_available(network=network, addresses=addresses, is_pool=False)
     assert len(available) == 0
+
+
+def test_allocator():
+    network = ip_network("10.16.18.0/29")
+    addresses = [ip_interface("10.16.18.1/29"), ip_interface("10.16.18.3/29")]
+    allocator = IPAddressAllocator(network=network, addresses=addresses, is_pool=False)
+    assert allocator.nbr_available == 4
+    assert allocator.get() == [ip_address("10.16.18.2")]
+    assert allocator.get(count=2) == [ip_address("10.16.18.4"), ip_address("10.16.18.5")]
+    assert allocator.get(count=2) == [ip_address("10.16.18.6")]
+    assert allocator.get() == []
+
+
+def test_allocator_pool():
+    network = ip_network("10.16.18.0/30")
+    addresses = [ip_interface("10.16.18.1/30")]
+    allocator = IPAddressAllocator(network=network, addresses=addresses, is_pool=True)
+    assert allocator.get(count=3) == [ip_address("10.16.18.0"), ip_address("10.16.18.2"), ip_address("10.16.18.3")]
+
+
+def test_allocator_busy_network():
+    network = ip_network("10.16.0.0/16")
+    addresses = [ip_interface(f"10.16.{index // 256}.{index % 256}/16") for index in range(1, 60000) if index != 40000]
+    allocator = IPAddressAllocator(network=network, addresses=addresses, is_pool=False)
+    assert allocator.get(count=2) == [ip_address("10.16.156.64"), ip_address("10.16.234.96")]
+
+
+def test_allocator_ipv6():
+    network = ip_network("2001:db8::/64")
+    addresses = [ip_interface("2001:db8::1/64"), ip_interface("2001:db8::2/64")]
+    allocator = IPAddressAllocator(network=network, addresses=addresses, is_pool=False)
+    assert allocator.get(count=2) == [ip_address("2001:db8::3"), ip_address("2001:db8::4")]
+
+    # The offsets within a /48 don't fit in 64 bits
+    network = ip_network("2001:db8::/48")
+    allocator = IPAddressAllocator(network=network, addresses=addresses, is_pool=False)
+    assert allocator.get() == [ip_address("2001:db8::3")]
@@ -2,7 +2,7 @@ import ipaddress
 
 import pytest
 
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.prefix import PrefixPool, PrefixPoolCache
 
 
 def test_init_v4():
@@ -146,3 +146,65 @@ def test_reserve_with_owner():
     assert sub.reserve("192.192.1.0/24", identifier="second") is True
 
     assert str(sub.get(prefixlen=24)) == "192.192.2.0/24"
+
+
+def test_get_links_from_busy_pool():
+    sub = PrefixPool("10.0.0.0/16")
+    for index in range(0, 2**16, 4):
+        assert sub.reserve(str(ipaddress.ip_network((0x0A000000 + index, 31)))) is True
+
+    assert str(sub.get(prefixlen=31)) == "10.0.0.2/31"
+    assert str(sub.get(prefixlen=31)) == "10.0.0.6/31"
+    assert sub.get_nbr_available_subnets()[31] == 2**14 - 2
+    with pytest.raises(IndexError):
+        sub.get(prefixlen=30)
+
+
+def test_reserve_inside_reserved_subnet():
+    sub = PrefixPool("192.168.0.0/16")
+
+    assert sub.reserve("192.168.0.0/24") is True
+    assert sub.reserve("192.168.0.0/25") is False
+    assert str(sub.get(prefixlen=25)) == "192.168.1.0/25"
+
+
+def test_get_subnet_v6():
+    sub = PrefixPool("2001:db8::/32")
+
+    assert sub.reserve("2001:db8::/48") is True
+    assert str(sub.get(prefixlen=48)) == "2001:db8:1::/48"
+    assert str(sub.get(prefixlen=127)) == "2001:db8:2::/127"
+
+
+def test_pool_cache():
+    cache = PrefixPoolCache(max_size=1)
+
+    pool = cache.get(key="pool1", network="192.168.0.0/16", subnets=["192.168.0.0/24"])
+    assert str(pool.get(prefixlen=24)) == "192.168.1.0/24"
+
+    # The pool returned is a copy, the allocation above is not visible from the cache
+    pool = cache.get(key="pool1", network="192.168.0.0/16", subnets=["192.168.0.0/24"])
+    assert str(pool.get(prefixlen=24)) == "192.168.1.0/24"
+
+    pool = cache.get(key="pool1", network="192.168.0.0/16", subnets=["192.168.0.0/24", "192.168.1.0/24"])
+    assert str(pool.get(prefixlen=24)) == "192.168.2.0/24"
+
+    cache.get(key="pool2", network="10.0.0.0/8", subnets=[])
+    assert len(cache._entries) == 1
+
+
+def test_pool_cache_allocate():
+    cache = PrefixPoolCache()
+
+    assert str(cache.allocate(key="pool1", network="10.0.0.0/24", subnets=[], prefixlen=31)) == "10.0.0.0/31"
+    cached_pool = cache._entries["pool1"][1]
+
+    # Once the allocated subnet exists, the cached pool is still valid and reused
+    subnet = cache.allocate(key="pool1", network="10.0.0.0/24", subnets=["10.0.0.0/31"], prefixlen=31)
+    assert str(subnet) == "10.0.0.2/31"
+    assert cache._entries["pool1"][1] is cached_pool
+
+    # If an allocated subnet hasn't been created, the pool is rebuilt from the existing subnets
+    subnet = cache.allocate(key="pool1", network="10.0.0.0/24", subnets=["10.0.0.0/31"], prefixlen=31)
+    assert str(subnet) == "10.0.0.2/31"
+    assert cache._entries["pool1"][1] is not cached_pool
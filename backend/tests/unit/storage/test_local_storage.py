@@ -1,3 +1,4 @@
+import io
 import os
 from pathlib import Path
 
@@ -7,7 +8,7 @@ from infrahub_sdk.uuidt import UUIDT
 
 from infrahub import config
 from infrahub.exceptions import NodeNotFoundError
-from infrahub.storage import InfrahubObjectStorage
+from infrahub.storage import InfrahubObjectStorage, StorageDiskCache, StorageMemoryCache, get_content_identifier
 
 
 async def test_init_local(helper, local_storage_dir: str, file1_in_storage: str):
@@ -51,3 +52,90 @@ async def test_store_file(
     file1 = Path(os.path.join(local_storage_dir, identifier))
     assert file1.exists()
     assert file1.read_bytes() == content_file1
+
+
+async def test_store_content(helper, local_storage_dir: str):
+    storage = await InfrahubObjectStorage.init(settings=config.SETTINGS.storage)
+
+    identifier = storage.store_content(content=b"interface Ethernet1")
+    assert identifier == get_content_identifier(content=b"interface Ethernet1")
+    assert storage.store_content(content=b"interface Ethernet1") == identifier
+    assert storage.store_content(content=b"interface Ethernet2") != identifier
+    assert sorted(os.listdir(local_storage_dir)) == sorted(
+        [identifier, get_content_identifier(content=b"interface Ethernet2")]
+    )
+
+    # The content is served from the memory cache once stored
+    Path(os.path.join(local_storage_dir, identifier)).unlink()
+    assert storage.retrieve(identifier=identifier) == "interface Ethernet1"
+    assert b"".join(storage.stream(identifier=identifier)) == b"interface Ethernet1"
+
+
+async def test_retrieve_file_disk_cache(helper, local_storage_dir: str, file1_in_storage: str, tmp_path: Path):
+    settings = config.SETTINGS.storage.model_copy(
+        update={"cache_memory_size": 0, "cache_path": str(tmp_path / "cache"), "cache_disk_size": 1024 * 1024}
+    )
+    storage = await InfrahubObjectStorage.init(settings=settings)
+
+    content = storage.retrieve(identifier=file1_in_storage)
+    assert (tmp_path / "cache" / file1_in_storage).read_text() == content
+
+    Path(os.path.join(local_storage_dir, file1_in_storage)).unlink()
+    assert storage.retrieve(identifier=file1_in_storage) == content
+
+
+def test_storage_memory_cache():
+    cache = StorageMemoryCache(max_size=80)
+
+    cache.set(identifier="object1", content=b"1" * 10)
+    cache.set(identifier="object2", content=b"2" * 10)
+    cache.set(identifier="large", content=b"3" * 11)
+    assert cache.get(identifier="large") is None
+
+    assert cache.get(identifier="object1") == b"1" * 10
+    for index in range(3, 10):
+        cache.set(identifier=f"object{index}", content=str(index).encode() * 10)
+
+    assert cache.size == 80
+    assert cache.get(identifier="object1") == b"1" * 10
+    assert cache.get(identifier="object2") is None
+
+
+def test_storage_disk_cache(tmp_path: Path):
+    cache = StorageDiskCache(path=str(tmp_path), max_size=20)
+
+    cache.set(identifier="object1", f=io.BytesIO(b"1" * 10))
+    cache.set(identifier="object2", f=io.BytesIO(b"2" * 10))
+    assert cache.get(identifier="object1") == tmp_path / "object1"
+
+    cache.set(identifier="object3", f=io.BytesIO(b"3" * 10))
+    assert cache.get(identifier="object2") is None
+    assert sorted(os.listdir(tmp_path)) == ["object1", "object3"]
+
+    assert cache.set(identifier="../object4", f=io.BytesIO(b"4")) is None
+
+    reloaded_cache = StorageDiskCache(path=str(tmp_path), max_size=20)
+    assert reloaded_cache.size == 20
+
+
+def test_storage_disk_cache_evicted_file(tmp_path: Path):
+    cache = StorageDiskCache(path=str(tmp_path), max_size=20)
+    cache.set(identifier="object1", f=io.BytesIO(b"0123456789"))
+
+    (tmp_path / "object1").unlink()
+    assert cache.open("object1") is None
+    assert cache.size == 0
+
+
+def test_storage_disk_cache_shared_directory(tmp_path: Path):
+    cache1 = StorageDiskCache(path=str(tmp_path), max_size=20)
+    cache2 = StorageDiskCache(path=str(tmp_path), max_size=20)
+
+    cache1.set(identifier="object1", f=io.BytesIO(b"0123456789"))
+    cache2.set(identifier="object2", f=io.BytesIO(b"0123456789"))
+    cache1.set(identifier="object3", f=io.BytesIO(b"0123456789"))
+
+    assert sorted(os.listdir(tmp_path)) == ["object2", "object3"]
+    assert cache1.size == 20
+    with cache1.open("object2") as f:
+        assert f.read() == b"0123456789"